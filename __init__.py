@@ -1,2 +1,13 @@
 """Simple Python init script to allow inclusion of this entire directory."""
-from darm import Darm, disasm_armv7, disasm_thumb, disasm_thumb2
+from darm import Darm, LazyDarm, disasm_armv7, disasm_thumb, disasm_thumb2
+from darm import DecodeCache
+from darm import Disassembly, disasm_buffer, disasm_array, iter_disasm
+from darm import disasm_columns
+from darm import PackedDarm, disasm_packed, scan, search
+from darm import Segment, classify
+from darm import Block, Edge, Xref, XrefIndex
+from darm import disasm_buffer_parallel, render_listing
+from darm import M_ARMV7, M_THUMB, REGION_DATA
+from darm import EDGE_FALLTHROUGH, EDGE_BRANCH, EDGE_CONDITIONAL, EDGE_CALL
+from darm import CFG_NONE
+from darm import XREF_BRANCH, XREF_CALL, XREF_ADDRESS, XREF_LOAD
@@ -0,0 +1,4019 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+#include <stdio.h>
+#include <stdint.h>
+#include "armv7-tbl.h"
+darm_enctype_t armv7_instr_types[] = {
+    T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_SM, T_ARM_CMP_OP, T_ARM_BRNCHMISC, T_ARM_CMP_OP,
+    T_ARM_SM, T_ARM_CMP_OP, T_ARM_MISC, T_ARM_CMP_OP, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_DST_SRC, T_ARM_DST_SRC, T_ARM_ARITH_SHIFT,
+    T_ARM_ARITH_SHIFT, T_ARM_MISC, T_ARM_MISC, T_ARM_ARITH_IMM,
+    T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM,
+    T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM,
+    T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM,
+    T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_MOV_IMM,
+    T_ARM_CMP_IMM, T_ARM_OPLESS, T_ARM_CMP_IMM, T_ARM_MOV_IMM, T_ARM_CMP_IMM,
+    T_INVLD, T_ARM_CMP_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_MOV_IMM,
+    T_ARM_MOV_IMM, T_ARM_ARITH_IMM, T_ARM_ARITH_IMM, T_ARM_MOV_IMM,
+    T_ARM_MOV_IMM, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_ARM_PAS, T_ARM_PAS, T_ARM_PAS, T_INVLD,
+    T_ARM_PAS, T_ARM_PAS, T_ARM_PAS, T_ARM_MISC, T_INVLD, T_INVLD,
+    T_ARM_BITREV, T_INVLD, T_INVLD, T_INVLD, T_ARM_BITREV, T_ARM_SM, T_INVLD,
+    T_INVLD, T_INVLD, T_ARM_SM, T_ARM_SM, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_ARM_BITS, T_ARM_BITS, T_ARM_BITS, T_ARM_BITS, T_ARM_BITS, T_ARM_UDF,
+    T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS,
+    T_ARM_LDSTREGS, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_ARM_LDSTREGS,
+    T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS, T_ARM_LDSTREGS,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR,
+    T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR,
+    T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_MVCR, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC,
+    T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC, T_ARM_BRNCHSC
+};
+
+darm_instr_t armv7_instr_labels[] = {
+    I_AND, I_AND, I_EOR, I_EOR, I_SUB, I_SUB, I_RSB, I_RSB, I_ADD, I_ADD,
+    I_ADC, I_ADC, I_SBC, I_SBC, I_RSC, I_RSC, I_SMLA, I_TST, I_SMULW, I_TEQ,
+    I_SMLAL, I_CMP, I_SMC, I_CMN, I_ORR, I_ORR, I_STREXD, I_RRX, I_BIC, I_BIC,
+    I_MVN, I_MVN, I_AND, I_AND, I_EOR, I_EOR, I_SUB, I_SUB, I_RSB, I_RSB,
+    I_ADD, I_ADD, I_ADC, I_ADC, I_SBC, I_SBC, I_RSC, I_RSC, I_MOVW, I_TST,
+    I_YIELD, I_TEQ, I_MOVT, I_CMP, I_INVLD, I_CMN, I_ORR, I_ORR, I_MOV, I_MOV,
+    I_BIC, I_BIC, I_MVN, I_MVN, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_SSUB8, I_QSUB8, I_SHSUB8, I_INVLD,
+    I_USUB8, I_UQSUB8, I_UHSUB8, I_SEL, I_INVLD, I_INVLD, I_REV16, I_INVLD,
+    I_INVLD, I_INVLD, I_REVSH, I_SMUSD, I_INVLD, I_INVLD, I_INVLD, I_SMLSLD,
+    I_SMMUL, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_SBFX, I_SBFX, I_BFI, I_BFI,
+    I_UBFX, I_UDF, I_STMDA, I_LDMDA, I_STMDA, I_LDMDA, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_STM, I_LDM, I_STM, I_LDM, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_STMDB, I_LDMDB, I_STMDB, I_LDMDB, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_STMIB, I_LDMIB, I_STMIB, I_LDMIB, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B,
+    I_B, I_B, I_B, I_BL, I_BL, I_BL, I_BL, I_BL, I_BL, I_BL, I_BL, I_BL, I_BL,
+    I_BL, I_BL, I_BL, I_BL, I_BL, I_BL, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_MCR, I_MRC, I_MCR, I_MRC, I_MCR,
+    I_MRC, I_MCR, I_MRC, I_MCR, I_MRC, I_MCR, I_MRC, I_MCR, I_MRC, I_MCR,
+    I_MRC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC,
+    I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC, I_SVC
+};
+
+darm_instr_t type_shift_instr_lookup[] = {
+    I_LSL, I_LSL, I_LSR, I_LSR, I_ASR, I_ASR, I_ROR, I_ROR, I_LSL, I_INVLD,
+    I_LSR, I_INVLD, I_ASR, I_INVLD, I_ROR, I_INVLD
+};
+
+const darm_encoding_t armv7_encodings[254] = {
+    {0x0fe00000, 0x02a00000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // ADC
+    {0x0fe00010, 0x00a00000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // ADC
+    {0x0fe00090, 0x00a00010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // ADC
+    {0x0fe00000, 0x02800000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // ADD
+    {0x0fe00010, 0x00800000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // ADD
+    {0x0fe00090, 0x00800010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // ADD
+    {0x0fff0000, 0x028f0000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // ADR
+    {0x0fff0000, 0x024f0000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // ADR
+    {0x0fe00000, 0x02000000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // AND
+    {0x0fe00010, 0x00000000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // AND
+    {0x0fe00090, 0x00000010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // AND
+    {0x0fe00070, 0x01a00040, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // ASR
+    {0x0fe000f0, 0x01a00050, 4, {140, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // ASR
+    {0x0f000000, 0x0a000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // B
+    {0x0fe0007f, 0x07c0001f, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // BFC
+    {0x0fe00070, 0x07c00010, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // BFI
+    {0x0fe00000, 0x03c00000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // BIC
+    {0x0fe00010, 0x01c00000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // BIC
+    {0x0fe00090, 0x01c00010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // BIC
+    {0x0ff000f0, 0x01200070, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // BKPT
+    {0x0f000000, 0x0b000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // BL
+    {0xfe000000, 0xfa000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // BLX
+    {0x0ff000f0, 0x01200030, 4, {0, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // BLX
+    {0x0ff000f0, 0x01200010, 4, {0, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // BX
+    {0x0ff000f0, 0x01200020, 4, {0, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // BXJ
+    {0x0f000010, 0x0e000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // CDP
+    {0xff000010, 0xfe000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // CDP2
+    {0xfff000f0, 0xf5700010, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // CLREX
+    {0x0ff000f0, 0x01600010, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // CLZ
+    {0x0ff00000, 0x03700000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // CMN
+    {0x0ff00010, 0x01700000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // CMN
+    {0x0ff00090, 0x01700010, 4, {0, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // CMN
+    {0x0ff00000, 0x03500000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // CMP
+    {0x0ff00010, 0x01500000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // CMP
+    {0x0ff00090, 0x01500010, 4, {0, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // CMP
+    {0x0fff00f0, 0x032000f0, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // DBG
+    {0xfff000f0, 0xf5700050, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // DMB
+    {0xfff000f0, 0xf5700040, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // DSB
+    {0x0fe00000, 0x02200000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // EOR
+    {0x0fe00010, 0x00200000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // EOR
+    {0x0fe00090, 0x00200010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // EOR
+    {0xfff000f0, 0xf5700060, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ISB
+    {0x0e100000, 0x0c100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // LDC
+    {0xfe100000, 0xfc100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // LDC2
+    {0x0fd00000, 0x08900000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // LDM
+    {0x0fd00000, 0x08100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // LDMDA
+    {0x0fd00000, 0x09100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // LDMDB
+    {0x0fd00000, 0x09900000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // LDMIB
+    {0x0e500000, 0x04100000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDR
+    {0x0e500010, 0x06100000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDR
+    {0x0e500000, 0x04500000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRB
+    {0x0e500010, 0x06500000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRB
+    {0x0f700000, 0x04700000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRBT
+    {0x0f700010, 0x06700000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRBT
+    {0x0e5000f0, 0x004000d0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRD
+    {0x0e5000f0, 0x000000d0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRD
+    {0x0ff000f0, 0x01900090, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDREX
+    {0x0ff000f0, 0x01d00090, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDREXB
+    {0x0ff000f0, 0x01b00090, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDREXD
+    {0x0ff000f0, 0x01f00090, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDREXH
+    {0x0e5000f0, 0x005000b0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRH
+    {0x0e5000f0, 0x001000b0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRH
+    {0x0f7000f0, 0x007000b0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRHT
+    {0x0f7000f0, 0x003000b0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRHT
+    {0x0e5000f0, 0x005000d0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRSB
+    {0x0e5000f0, 0x001000d0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRSB
+    {0x0f7000f0, 0x007000d0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRSBT
+    {0x0f7000f0, 0x003000d0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRSBT
+    {0x0e5000f0, 0x005000f0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRSH
+    {0x0e5000f0, 0x001000f0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRSH
+    {0x0f7000f0, 0x007000f0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRSHT
+    {0x0f7000f0, 0x003000f0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRSHT
+    {0x0f700000, 0x04300000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // LDRT
+    {0x0f700010, 0x06300000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // LDRT
+    {0x0fe00070, 0x01a00000, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // LSL
+    {0x0fe000f0, 0x01a00010, 4, {140, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // LSL
+    {0x0fe00070, 0x01a00020, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // LSR
+    {0x0fe000f0, 0x01a00030, 4, {140, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // LSR
+    {0x0f100010, 0x0e000010, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 156}}, // MCR
+    {0xff100010, 0xfe000010, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // MCR2
+    {0x0ff00000, 0x0c400000, 4, {0, 0, 0, 0, 140, 144, 0, 0, 0, 156}}, // MCRR
+    {0xfff00000, 0xfc400000, 4, {0, 0, 0, 0, 140, 144, 0, 0, 0, 0}}, // MCRR2
+    {0x0fe000f0, 0x00200090, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // MLA
+    {0x0ff000f0, 0x00600090, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // MLS
+    {0x0fe00000, 0x03a00000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MOV
+    {0x0fe00ff0, 0x01a00000, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // MOV
+    {0x0ff00000, 0x03400000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MOVT
+    {0x0ff00000, 0x03000000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MOVW
+    {0x0f100010, 0x0e100010, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 156}}, // MRC
+    {0xff100010, 0xfe100010, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // MRC2
+    {0x0ff00000, 0x0c500000, 4, {0, 0, 0, 0, 140, 144, 0, 0, 0, 156}}, // MRRC
+    {0xfff00000, 0xfc500000, 4, {0, 0, 0, 0, 140, 144, 0, 0, 0, 0}}, // MRRC2
+    {0x0ff000f0, 0x01000000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MRS
+    {0x0fb000f0, 0x01000000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MRS
+    {0x0ff30000, 0x03200000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MSR
+    {0x0ff300f0, 0x01200000, 4, {0, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // MSR
+    {0x0fe000f0, 0x00000090, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // MUL
+    {0x0fe00000, 0x03e00000, 4, {140, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // MVN
+    {0x0fe00010, 0x01e00000, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // MVN
+    {0x0fe00090, 0x01e00010, 4, {140, 0, 128, 0, 0, 0, 0, 0, 136, 156}}, // MVN
+    {0x0ff00007, 0x03200000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // NOP
+    {0x0fe00000, 0x03800000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // ORR
+    {0x0fe00010, 0x01800000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // ORR
+    {0x0fe00090, 0x01800010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // ORR
+    {0x0ff00030, 0x06800010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // PKH
+    {0xff300000, 0xf5100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xff300010, 0xf7100000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xff300000, 0xf5100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLDW
+    {0xff300010, 0xf7100000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLDW
+    {0xff700000, 0xf4500000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0xff700010, 0xf6500000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0x0fff0000, 0x08bd0000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // POP
+    {0x0fff0fff, 0x049d0004, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 156}}, // POP
+    {0x0fff0000, 0x092d0000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // PUSH
+    {0x0fff0fff, 0x052d0004, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 156}}, // PUSH
+    {0x0ff000f0, 0x01000050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QADD
+    {0x0ff000f0, 0x06200010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QADD16
+    {0x0ff000f0, 0x06200090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QADD8
+    {0x0ff000f0, 0x06200030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QASX
+    {0x0ff000f0, 0x01400050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QDADD
+    {0x0ff000f0, 0x01600050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QDSUB
+    {0x0ff000f0, 0x06200050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QSAX
+    {0x0ff000f0, 0x01200050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QSUB
+    {0x0ff000f0, 0x06200070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QSUB16
+    {0x0ff000f0, 0x062000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // QSUB8
+    {0x0ff000f0, 0x06f00030, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // RBIT
+    {0x0ff000f0, 0x06b00030, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // REV
+    {0x0ff000f0, 0x06b000b0, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // REV16
+    {0x0ff000f0, 0x06f000b0, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // REVSH
+    {0x0fe00070, 0x01a00060, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // ROR
+    {0x0fe000f0, 0x01a00070, 4, {140, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // ROR
+    {0x0fe00ff0, 0x01a00060, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // RRX
+    {0x0fe00000, 0x02600000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // RSB
+    {0x0fe00010, 0x00600000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // RSB
+    {0x0fe00090, 0x00600010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // RSB
+    {0x0fe00000, 0x02e00000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // RSC
+    {0x0fe00010, 0x00e00000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // RSC
+    {0x0fe00090, 0x00e00010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // RSC
+    {0x0ff000f0, 0x06100010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SADD16
+    {0x0ff000f0, 0x06100090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SADD8
+    {0x0ff000f0, 0x06100030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SASX
+    {0x0fe00000, 0x02c00000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // SBC
+    {0x0fe00010, 0x00c00000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SBC
+    {0x0fe00090, 0x00c00010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // SBC
+    {0x0fe00070, 0x07a00050, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // SBFX
+    {0x0ff000f0, 0x068000b0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SEL
+    {0xfff100f0, 0xf1010000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SETEND
+    {0x0ff00007, 0x03200004, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // SEV
+    {0x0ff000f0, 0x06300010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHADD16
+    {0x0ff000f0, 0x06300090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHADD8
+    {0x0ff000f0, 0x06300030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHASX
+    {0x0ff000f0, 0x06300050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHSAX
+    {0x0ff000f0, 0x06300070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHSUB16
+    {0x0ff000f0, 0x063000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SHSUB8
+    {0x0ff000f0, 0x01600070, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // SMC
+    {0x0ff00010, 0x01000000, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMLA
+    {0x0ff000d0, 0x07000010, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMLAD
+    {0x0fe00070, 0x00e00010, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // SMLAL
+    {0x0ff00010, 0x01400000, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // SMLAL
+    {0x0ff000d0, 0x07400010, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // SMLALD
+    {0x0ff000b0, 0x01200080, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMLAW
+    {0x0ff000d0, 0x07000050, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMLSD
+    {0x0ff000d0, 0x07400050, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // SMLSLD
+    {0x0ff000d0, 0x07500010, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMMLA
+    {0x0ff000d0, 0x075000d0, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // SMMLS
+    {0x0ff0f0d0, 0x0750f010, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // SMMUL
+    {0x0ff0f0d0, 0x0700f010, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // SMUAD
+    {0x0ff00090, 0x01600080, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // SMUL
+    {0x0fe000f0, 0x00c00090, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // SMULL
+    {0x0ff000b0, 0x012000a0, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // SMULW
+    {0x0ff000d0, 0x07000050, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // SMUSD
+    {0x0fe00030, 0x06a00010, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // SSAT
+    {0x0ff000f0, 0x06a00030, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // SSAT16
+    {0x0ff000f0, 0x06100050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SSAX
+    {0x0ff000f0, 0x06100070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SSUB16
+    {0x0ff000f0, 0x061000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SSUB8
+    {0x0e100000, 0x0c000000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // STC
+    {0xfe100000, 0xfc000000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // STC2
+    {0x0fd00000, 0x08800000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // STM
+    {0x0fd00000, 0x08000000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // STMDA
+    {0x0fd00000, 0x09000000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // STMDB
+    {0x0fd00000, 0x09800000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // STMIB
+    {0x0e500000, 0x04000000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STR
+    {0x0e500010, 0x06000000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STR
+    {0x0e500000, 0x04400000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRB
+    {0x0e500010, 0x06400000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRB
+    {0x0f700000, 0x04600000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRBT
+    {0x0f700010, 0x06600000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRBT
+    {0x0e5000f0, 0x004000f0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRD
+    {0x0e5000f0, 0x000000f0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRD
+    {0x0ff000f0, 0x01800090, 4, {140, 144, 0, 0, 128, 0, 0, 0, 0, 156}}, // STREX
+    {0x0ff000f0, 0x01c00090, 4, {140, 144, 0, 0, 128, 0, 0, 0, 0, 156}}, // STREXB
+    {0x0ff000f0, 0x01a00090, 4, {140, 144, 0, 0, 128, 0, 0, 0, 0, 156}}, // STREXD
+    {0x0ff000f0, 0x01e00090, 4, {140, 144, 0, 0, 128, 0, 0, 0, 0, 156}}, // STREXH
+    {0x0e5000f0, 0x004000b0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRH
+    {0x0e5000f0, 0x000000b0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRH
+    {0x0f7000f0, 0x006000b0, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRHT
+    {0x0f7000f0, 0x002000b0, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRHT
+    {0x0f700000, 0x04200000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 156}}, // STRT
+    {0x0f700010, 0x06200000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 156}}, // STRT
+    {0x0fe00000, 0x02400000, 4, {140, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // SUB
+    {0x0fe00010, 0x00400000, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SUB
+    {0x0fe00090, 0x00400010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // SUB
+    {0x0f000000, 0x0f000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // SVC
+    {0x0ff000f0, 0x01000090, 4, {0, 144, 0, 0, 140, 128, 0, 0, 0, 156}}, // SWP
+    {0x0ff000f0, 0x01400090, 4, {0, 144, 0, 0, 140, 128, 0, 0, 0, 156}}, // SWPB
+    {0x0ff000f0, 0x06a00070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTAB
+    {0x0ff000f0, 0x06800070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTAB16
+    {0x0ff000f0, 0x06b00070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTAH
+    {0x0fff00f0, 0x06af0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTB
+    {0x0fff00f0, 0x068f0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTB16
+    {0x0fff00f0, 0x06bf0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // SXTH
+    {0x0ff00000, 0x03300000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // TEQ
+    {0x0ff00010, 0x01300000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // TEQ
+    {0x0ff00090, 0x01300010, 4, {0, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // TEQ
+    {0x0ff00000, 0x03100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 156}}, // TST
+    {0x0ff00010, 0x01100000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // TST
+    {0x0ff00090, 0x01100010, 4, {0, 144, 128, 0, 0, 0, 0, 0, 136, 156}}, // TST
+    {0x0ff000f0, 0x06500010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UADD16
+    {0x0ff000f0, 0x06500090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UADD8
+    {0x0ff000f0, 0x06500030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UASX
+    {0x0fe00070, 0x07e00050, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // UBFX
+    {0x0ff00000, 0x07f00000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // UDF
+    {0x0ff000f0, 0x06700010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHADD16
+    {0x0ff000f0, 0x06700090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHADD8
+    {0x0ff000f0, 0x06700030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHASX
+    {0x0ff000f0, 0x06700050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHSAX
+    {0x0ff000f0, 0x06700070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHSUB16
+    {0x0ff000f0, 0x067000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UHSUB8
+    {0x0ff000f0, 0x00400090, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // UMAAL
+    {0x0fe000f0, 0x00a00090, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // UMLAL
+    {0x0fe000f0, 0x00800090, 4, {0, 128, 136, 0, 0, 0, 144, 140, 0, 156}}, // UMULL
+    {0x0ff000f0, 0x06600010, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQADD16
+    {0x0ff000f0, 0x06600090, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQADD8
+    {0x0ff000f0, 0x06600030, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQASX
+    {0x0ff000f0, 0x06600050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQSAX
+    {0x0ff000f0, 0x06600070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQSUB16
+    {0x0ff000f0, 0x066000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UQSUB8
+    {0x0ff0f0f0, 0x0780f010, 4, {144, 128, 136, 0, 0, 0, 0, 0, 0, 156}}, // USAD8
+    {0x0ff000f0, 0x07800010, 4, {144, 128, 136, 140, 0, 0, 0, 0, 0, 156}}, // USADA8
+    {0x0fe00030, 0x06e00010, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // USAT
+    {0x0ff000f0, 0x06e00030, 4, {140, 128, 0, 0, 0, 0, 0, 0, 0, 156}}, // USAT16
+    {0x0ff000f0, 0x06500050, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // USAX
+    {0x0ff000f0, 0x06500070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // USUB16
+    {0x0ff000f0, 0x065000f0, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // USUB8
+    {0x0ff000f0, 0x06e00070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTAB
+    {0x0ff000f0, 0x06c00070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTAB16
+    {0x0ff000f0, 0x06f00070, 4, {140, 144, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTAH
+    {0x0fff00f0, 0x06ef0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTB
+    {0x0fff00f0, 0x06cf0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTB16
+    {0x0fff00f0, 0x06ff0070, 4, {140, 0, 128, 0, 0, 0, 0, 0, 0, 156}}, // UXTH
+    {0x0ff00007, 0x03200002, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // WFE
+    {0x0ff00007, 0x03200003, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // WFI
+    {0x0ff00007, 0x03200001, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 156}}, // YIELD
+};
+
+const uint16_t armv7_encodings_index[] = {
+    0, 0, 3, 6, 6, 8, 11, 13, 14, 15, 16, 19, 20, 21, 23, 24, 25, 25, 25, 26,
+    27, 27, 28, 29, 32, 35, 35, 35, 36, 37, 38, 38, 41, 41, 41, 41, 41, 42,
+    42, 43, 44, 45, 46, 47, 48, 50, 52, 54, 56, 57, 58, 59, 60, 62, 64, 66,
+    68, 70, 72, 74, 74, 76, 78, 79, 80, 81, 82, 83, 84, 86, 87, 88, 89, 90,
+    91, 92, 94, 96, 97, 100, 100, 101, 101, 104, 105, 107, 109, 111, 113, 115,
+    116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 129,
+    131, 132, 135, 138, 139, 140, 141, 144, 145, 145, 146, 147, 148, 149, 150,
+    151, 152, 153, 154, 155, 156, 156, 156, 157, 159, 159, 159, 160, 160, 160,
+    160, 160, 161, 162, 163, 164, 165, 166, 167, 168, 168, 168, 169, 169, 169,
+    170, 171, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 184,
+    186, 188, 190, 191, 192, 193, 194, 196, 198, 200, 203, 203, 204, 205, 206,
+    207, 208, 209, 210, 211, 212, 212, 212, 215, 218, 219, 220, 221, 222, 223,
+    223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237,
+    238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251, 251,
+    251, 251, 251, 251, 251, 251, 251, 252, 253, 254
+};
+
+darm_instr_t type_brnchmisc_instr_lookup[] = {
+    I_MSR, I_BX, I_BXJ, I_BLX, I_INVLD, I_QSUB, I_INVLD, I_BKPT, I_SMLAW,
+    I_INVLD, I_SMULW, I_INVLD, I_SMLAW, I_INVLD, I_SMULW, I_INVLD
+};
+
+darm_instr_t type_opless_instr_lookup[] = {
+    I_NOP, I_YIELD, I_WFE, I_WFI, I_SEV, I_INVLD, I_INVLD, I_INVLD
+};
+
+darm_instr_t type_uncond2_instr_lookup[] = {
+    I_INVLD, I_CLREX, I_INVLD, I_INVLD, I_DSB, I_DMB, I_ISB, I_INVLD
+};
+
+darm_instr_t type_mul_instr_lookup[] = {
+    I_MUL, I_MLA, I_UMAAL, I_MLS, I_UMULL, I_UMLAL, I_SMULL, I_SMLAL
+};
+
+darm_instr_t type_stack0_instr_lookup[] = {
+    I_STR, I_LDR, I_STRT, I_LDRT, I_STRB, I_LDRB, I_STRBT, I_LDRBT, I_STR,
+    I_LDR, I_STRT, I_LDRT, I_STRB, I_LDRB, I_STRBT, I_LDRBT, I_STR, I_LDR,
+    I_STR, I_LDR, I_STRB, I_LDRB, I_STRB, I_LDRB, I_STR, I_LDR, I_STR, I_LDR,
+    I_STRB, I_LDRB, I_STRB, I_LDRB
+};
+
+darm_instr_t type_stack1_instr_lookup[] = {
+    I_INVLD, I_INVLD, I_STRHT, I_LDRHT, I_INVLD, I_LDRSBT, I_INVLD, I_LDRSHT
+};
+
+darm_instr_t type_stack2_instr_lookup[] = {
+    I_INVLD, I_INVLD, I_STRH, I_LDRH, I_LDRD, I_LDRSB, I_STRD, I_LDRSH
+};
+
+darm_instr_t type_bits_instr_lookup[] = {
+    I_INVLD, I_SBFX, I_BFI, I_UBFX
+};
+
+darm_instr_t type_pas_instr_lookup[] = {
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_SADD16, I_SASX, I_SSAX, I_SSUB16, I_SADD8, I_INVLD, I_INVLD, I_SSUB8,
+    I_QADD16, I_QASX, I_QSAX, I_QSUB16, I_QADD8, I_INVLD, I_INVLD, I_QSUB8,
+    I_SHADD16, I_SHASX, I_SHSAX, I_SHSUB16, I_SHADD8, I_INVLD, I_INVLD,
+    I_SHSUB8, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_UADD16, I_UASX, I_USAX, I_USUB16, I_UADD8, I_INVLD, I_INVLD,
+    I_USUB8, I_UQADD16, I_UQASX, I_UQSAX, I_UQSUB16, I_UQADD8, I_INVLD,
+    I_INVLD, I_UQSUB8, I_UHADD16, I_UHASX, I_UHSAX, I_UHSUB16, I_UHADD8,
+    I_INVLD, I_INVLD, I_UHSUB8
+};
+
+darm_instr_t type_sat_instr_lookup[] = {
+    I_QADD, I_QSUB, I_QDADD, I_QDSUB
+};
+
+darm_instr_t type_sync_instr_lookup[] = {
+    I_SWP, I_INVLD, I_INVLD, I_INVLD, I_SWPB, I_INVLD, I_INVLD, I_INVLD,
+    I_STREX, I_LDREX, I_STREXD, I_LDREXD, I_STREXB, I_LDREXB, I_STREXH,
+    I_LDREXH
+};
+
+darm_instr_t type_pusr_instr_lookup[] = {
+    I_SXTAB16, I_SXTB16, I_INVLD, I_INVLD, I_SXTAB, I_SXTB, I_SXTAH, I_SXTH,
+    I_UXTAB16, I_UXTB16, I_INVLD, I_INVLD, I_UXTAB, I_UXTB, I_UXTAH, I_UXTH
+};
+
+const armv7_dispatch_t armv7_dispatch[4096] = {
+    // bits 27..20 = 0x00
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND}, {H_MUL, T_ARM_MUL, I_MUL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x01
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_AND},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND}, {H_MUL, T_ARM_MUL, I_MUL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_AND},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x02
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR}, {H_MLA, T_ARM_MUL, I_MLA},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_STACK1_REG, T_ARM_STACK1, I_STRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_INVLD, T_INVLD, I_INVLD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x03
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR}, {H_MLA, T_ARM_MUL, I_MLA},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRSBT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_EOR},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRSHT},
+    // bits 27..20 = 0x04
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_MULL, T_ARM_MUL, I_UMAAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x05
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_MUL_INVLD, T_ARM_MUL, I_UMAAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SUB},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x06
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB}, {H_MLA, T_ARM_MUL, I_MLS},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_STACK1_IMM, T_ARM_STACK1, I_STRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_INVLD, T_INVLD, I_INVLD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x07
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_MUL_INVLD, T_ARM_MUL, I_MLS},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRSBT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSB},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRSHT},
+    // bits 27..20 = 0x08
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_MULL, T_ARM_MUL, I_UMULL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x09
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_MULL, T_ARM_MUL, I_UMULL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADD},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x0a
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_MULL, T_ARM_MUL, I_UMLAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_STACK1_REG, T_ARM_STACK1, I_STRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_INVLD, T_INVLD, I_INVLD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x0b
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_MULL, T_ARM_MUL, I_UMLAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRSBT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ADC},
+    {H_STACK1_REG, T_ARM_STACK1, I_LDRSHT},
+    // bits 27..20 = 0x0c
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_MULL, T_ARM_MUL, I_SMULL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x0d
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_MULL, T_ARM_MUL, I_SMULL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_SBC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x0e
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_MULL, T_ARM_MUL, I_SMLAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_STACK1_IMM, T_ARM_STACK1, I_STRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_INVLD, T_INVLD, I_INVLD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x0f
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_MULL, T_ARM_MUL, I_SMLAL},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRHT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRSBT},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_RSC},
+    {H_STACK1_IMM, T_ARM_STACK1, I_LDRSHT},
+    // bits 27..20 = 0x10
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_SMLA, T_ARM_SM, I_SMLA},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_SMLA, T_ARM_SM, I_SMLA},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_SAT, T_ARM_SAT, I_QADD},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_SMLA, T_ARM_SM, I_SMLA},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_SWP, T_ARM_SYNC, I_SWP},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_SMLA, T_ARM_SM, I_SMLA}, {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x11
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TST},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TST},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TST},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TST},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TST},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST}, {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TST},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x12
+    {H_MSR, T_ARM_BRNCHMISC, I_MSR}, {H_BX, T_ARM_BRNCHMISC, I_BX},
+    {H_BX, T_ARM_BRNCHMISC, I_BXJ}, {H_BX, T_ARM_BRNCHMISC, I_BLX},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_SAT, T_ARM_SAT, I_QSUB},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_BKPT, T_ARM_BRNCHMISC, I_BKPT},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x13
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TEQ},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TEQ},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TEQ},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TEQ},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_TEQ},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ}, {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_TEQ},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x14
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_SMLAL, T_ARM_SM, I_SMLAL},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_SMLAL, T_ARM_SM, I_SMLAL},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_SAT, T_ARM_SAT, I_QDADD},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_SMLAL, T_ARM_SM, I_SMLAL},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_SWP, T_ARM_SYNC, I_SWPB},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_SMLAL, T_ARM_SM, I_SMLAL}, {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x15
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMP},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMP},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMP},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMP},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMP},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMP},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x16
+    {H_INVLD, T_INVLD, I_INVLD}, {H_CLZ, T_ARM_MISC, I_CLZ},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_SAT, T_ARM_SAT, I_QDSUB},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_SMC, T_ARM_MISC, I_SMC},
+    {H_SMUL, T_ARM_SM, I_SMUL}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_SMUL, T_ARM_SM, I_SMUL}, {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_SMUL, T_ARM_SM, I_SMUL}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_SMUL, T_ARM_SM, I_SMUL}, {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x17
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMN},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMN},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMN},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMN},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_CMP_OP_REG, T_ARM_CMP_OP, I_CMN},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_CMP_OP_IMM, T_ARM_CMP_OP, I_CMN},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x18
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STREX, T_ARM_SYNC, I_STREX},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x19
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_LDREX, T_ARM_SYNC, I_LDREX},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_ORR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x1a
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSL},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_LSL},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_LSR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ASR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_ASR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ROR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_ROR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSL}, {H_STREX, T_ARM_SYNC, I_STREXD},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSR},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRH},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ASR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRD},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ROR},
+    {H_STACK2_REG, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x1b
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSL},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_LSL},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_LSR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ASR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_ASR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ROR},
+    {H_DST_SRC_REG, T_ARM_DST_SRC, I_ROR},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSL}, {H_LDREX, T_ARM_SYNC, I_LDREXD},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_LSR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRH},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ASR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSB},
+    {H_DST_SRC_IMM, T_ARM_DST_SRC, I_ROR},
+    {H_STACK2_REG, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x1c
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STREX, T_ARM_SYNC, I_STREXB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x1d
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_REG, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_LDREX, T_ARM_SYNC, I_LDREXB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_ARITH_SHIFT_IMM, T_ARM_ARITH_SHIFT, I_BIC},
+    {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x1e
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STREX, T_ARM_SYNC, I_STREXH},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_STRH},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRD},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_STRD},
+    // bits 27..20 = 0x1f
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_MVN_REG, T_ARM_MISC, I_MVN},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_LDREX, T_ARM_SYNC, I_LDREXH},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRH},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRSB},
+    {H_MVN_IMM, T_ARM_MISC, I_MVN}, {H_STACK2_IMM, T_ARM_STACK2, I_LDRSH},
+    // bits 27..20 = 0x20
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    // bits 27..20 = 0x21
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_AND},
+    // bits 27..20 = 0x22
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    // bits 27..20 = 0x23
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_EOR},
+    // bits 27..20 = 0x24
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    // bits 27..20 = 0x25
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SUB},
+    // bits 27..20 = 0x26
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    // bits 27..20 = 0x27
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSB},
+    // bits 27..20 = 0x28
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    // bits 27..20 = 0x29
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADD},
+    // bits 27..20 = 0x2a
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    // bits 27..20 = 0x2b
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ADC},
+    // bits 27..20 = 0x2c
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    // bits 27..20 = 0x2d
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_SBC},
+    // bits 27..20 = 0x2e
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    // bits 27..20 = 0x2f
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_RSC},
+    // bits 27..20 = 0x30
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVW}, {H_MOVW, T_ARM_MOV_IMM, I_MOVW},
+    // bits 27..20 = 0x31
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TST}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TST},
+    // bits 27..20 = 0x32
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    {H_OPLESS, T_ARM_OPLESS, I_YIELD}, {H_OPLESS, T_ARM_OPLESS, I_YIELD},
+    // bits 27..20 = 0x33
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ}, {H_CMP_IMM, T_ARM_CMP_IMM, I_TEQ},
+    // bits 27..20 = 0x34
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    {H_MOVW, T_ARM_MOV_IMM, I_MOVT}, {H_MOVW, T_ARM_MOV_IMM, I_MOVT},
+    // bits 27..20 = 0x35
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMP},
+    // bits 27..20 = 0x36
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x37
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN}, {H_CMP_IMM, T_ARM_CMP_IMM, I_CMN},
+    // bits 27..20 = 0x38
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    // bits 27..20 = 0x39
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_ORR},
+    // bits 27..20 = 0x3a
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    // bits 27..20 = 0x3b
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MOV},
+    // bits 27..20 = 0x3c
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    // bits 27..20 = 0x3d
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    {H_ARITH_IMM, T_ARM_ARITH_IMM, I_BIC},
+    // bits 27..20 = 0x3e
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    // bits 27..20 = 0x3f
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN}, {H_MOV_IMM, T_ARM_MOV_IMM, I_MVN},
+    // bits 27..20 = 0x40
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x41
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x42
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    // bits 27..20 = 0x43
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    // bits 27..20 = 0x44
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x45
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x46
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    // bits 27..20 = 0x47
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    // bits 27..20 = 0x48
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x49
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x4a
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRT},
+    // bits 27..20 = 0x4b
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRT},
+    // bits 27..20 = 0x4c
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x4d
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x4e
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRBT},
+    // bits 27..20 = 0x4f
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRBT},
+    // bits 27..20 = 0x50
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x51
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x52
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x53
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x54
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x55
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x56
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x57
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x58
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x59
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x5a
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STR}, {H_STACK0_IMM, T_ARM_STACK0, I_STR},
+    // bits 27..20 = 0x5b
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDR}, {H_STACK0_IMM, T_ARM_STACK0, I_LDR},
+    // bits 27..20 = 0x5c
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x5d
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x5e
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_STRB},
+    // bits 27..20 = 0x5f
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    {H_STACK0_IMM, T_ARM_STACK0, I_LDRB},
+    // bits 27..20 = 0x60
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x61
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SSAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SSUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_PAS, T_ARM_PAS, I_SSUB8},
+    // bits 27..20 = 0x62
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QSAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QSUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PAS, T_ARM_PAS, I_QSUB8},
+    // bits 27..20 = 0x63
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHSAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHSUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PAS, T_ARM_PAS, I_SHSUB8},
+    // bits 27..20 = 0x64
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x65
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_UADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_UASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_USAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_USUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_UADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_PAS, T_ARM_PAS, I_USUB8},
+    // bits 27..20 = 0x66
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQSAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQSUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PAS, T_ARM_PAS, I_UQSUB8},
+    // bits 27..20 = 0x67
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHADD16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHASX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHSAX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHSUB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHADD8},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PAS, T_ARM_PAS, I_UHSUB8},
+    // bits 27..20 = 0x68
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_PKH, T_ARM_MISC, I_PKH},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SEL, T_ARM_MISC, I_SEL},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_PKH, T_ARM_MISC, I_PKH},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_PUSR, T_ARM_PUSR, I_SXTAB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_PKH, T_ARM_MISC, I_PKH},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SEL, T_ARM_MISC, I_SEL},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_PKH, T_ARM_MISC, I_PKH},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SEL, T_ARM_MISC, I_SEL},
+    // bits 27..20 = 0x69
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x6a
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_SSAT16, T_ARM_PUSR, I_SSAT16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_PUSR, T_ARM_PUSR, I_SXTAB},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRT}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x6b
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_BITREV, T_ARM_BITREV, I_REV},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_PUSR, T_ARM_PUSR, I_SXTAH},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_BITREV, T_ARM_BITREV, I_REV16},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_SSAT, T_ARM_PUSR, I_SSAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRT}, {H_BITREV, T_ARM_BITREV, I_REV16},
+    // bits 27..20 = 0x6c
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_PUSR, T_ARM_PUSR, I_UXTAB16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x6d
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x6e
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_SSAT16, T_ARM_PUSR, I_USAT16},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_PUSR, T_ARM_PUSR, I_UXTAB},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRBT}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x6f
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_BITREV, T_ARM_BITREV, I_RBIT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_PUSR, T_ARM_PUSR, I_UXTAH},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_BITREV, T_ARM_BITREV, I_REVSH},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_SSAT, T_ARM_PUSR, I_USAT},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRBT}, {H_BITREV, T_ARM_BITREV, I_REVSH},
+    // bits 27..20 = 0x70
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUAD, T_ARM_SM, I_SMUAD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUAD, T_ARM_SM, I_SMUAD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUSD, T_ARM_SM, I_SMUSD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUSD, T_ARM_SM, I_SMUSD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUAD, T_ARM_SM, I_SMUAD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUAD, T_ARM_SM, I_SMUAD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUSD, T_ARM_SM, I_SMUSD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_SMUSD, T_ARM_SM, I_SMUSD},
+    // bits 27..20 = 0x71
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x72
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x73
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x74
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLALD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLALD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLSLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLSLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLALD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLALD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLSLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_SMLSLD, T_ARM_SM, I_SMLSLD},
+    // bits 27..20 = 0x75
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMUL},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMUL},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMLS},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMLS},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMUL},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMUL},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMLS},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_SMMUL, T_ARM_SM, I_SMMLS},
+    // bits 27..20 = 0x76
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x77
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x78
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x79
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x7a
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    // bits 27..20 = 0x7b
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDR}, {H_BITS, T_ARM_BITS, I_SBFX},
+    // bits 27..20 = 0x7c
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    // bits 27..20 = 0x7d
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_BFI, T_ARM_BITS, I_BFI},
+    // bits 27..20 = 0x7e
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    {H_STACK0_REG, T_ARM_STACK0, I_STRB}, {H_BITS, T_ARM_BITS, I_UBFX},
+    // bits 27..20 = 0x7f
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    {H_STACK0_REG, T_ARM_STACK0, I_LDRB}, {H_UDF, T_ARM_UDF, I_UDF},
+    // bits 27..20 = 0x80
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    // bits 27..20 = 0x81
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    // bits 27..20 = 0x82
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDA},
+    // bits 27..20 = 0x83
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDA},
+    // bits 27..20 = 0x84
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x85
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x86
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x87
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x88
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    // bits 27..20 = 0x89
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    // bits 27..20 = 0x8a
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_STM},
+    // bits 27..20 = 0x8b
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM}, {H_LDSTREGS, T_ARM_LDSTREGS, I_LDM},
+    // bits 27..20 = 0x8c
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x8d
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x8e
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x8f
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x90
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    // bits 27..20 = 0x91
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    // bits 27..20 = 0x92
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMDB},
+    // bits 27..20 = 0x93
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMDB},
+    // bits 27..20 = 0x94
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x95
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x96
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x97
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x98
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    // bits 27..20 = 0x99
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    // bits 27..20 = 0x9a
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_STMIB},
+    // bits 27..20 = 0x9b
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    {H_LDSTREGS, T_ARM_LDSTREGS, I_LDMIB},
+    // bits 27..20 = 0x9c
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x9d
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x9e
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0x9f
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xa0
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa1
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa2
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa3
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa4
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa5
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa6
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa7
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa8
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xa9
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xaa
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xab
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xac
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xad
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xae
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xaf
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    {H_BRANCH, T_ARM_BRNCHSC, I_B}, {H_BRANCH, T_ARM_BRNCHSC, I_B},
+    // bits 27..20 = 0xb0
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb1
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb2
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb3
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb4
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb5
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb6
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb7
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb8
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xb9
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xba
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xbb
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xbc
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xbd
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xbe
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xbf
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    {H_BRANCH, T_ARM_BRNCHSC, I_BL}, {H_BRANCH, T_ARM_BRNCHSC, I_BL},
+    // bits 27..20 = 0xc0
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc1
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc2
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc3
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc4
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc5
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc6
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc7
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc8
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xc9
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xca
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xcb
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xcc
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xcd
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xce
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xcf
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd0
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd1
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd2
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd3
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd4
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd5
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd6
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd7
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd8
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xd9
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xda
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xdb
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xdc
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xdd
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xde
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xdf
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    {H_INVLD, T_INVLD, I_INVLD}, {H_INVLD, T_INVLD, I_INVLD},
+    // bits 27..20 = 0xe0
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xe1
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xe2
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xe3
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xe4
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xe5
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xe6
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xe7
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xe8
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xe9
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xea
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xeb
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xec
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xed
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xee
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MCR},
+    // bits 27..20 = 0xef
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    {H_CDP, T_ARM_MVCR, I_CDP}, {H_MCR, T_ARM_MVCR, I_MRC},
+    // bits 27..20 = 0xf0
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf1
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf2
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf3
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf4
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf5
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf6
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf7
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf8
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xf9
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xfa
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xfb
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xfc
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xfd
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xfe
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    // bits 27..20 = 0xff
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+    {H_SVC, T_ARM_BRNCHSC, I_SVC}, {H_SVC, T_ARM_BRNCHSC, I_SVC},
+};
+
+const uint8_t *armv7_format_programs[479][3] = {
+    [I_ADC] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_ADD] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_ADR] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_LABEL, FMT_END},
+    },
+    [I_AND] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_ASR] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_SHIFT, FMT_END},
+    },
+    [I_BFC] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_LSB, FMT_WIDTH, FMT_END},
+    },
+    [I_BFI] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_LSB, FMT_WIDTH, FMT_END},
+    },
+    [I_BIC] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_BKPT] = {
+        (const uint8_t[]){FMT_IMM, FMT_END},
+    },
+    [I_BLX] = {
+        (const uint8_t[]){FMT_LABEL, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_RM, FMT_END},
+    },
+    [I_BL] = {
+        (const uint8_t[]){FMT_COND, FMT_LABEL, FMT_END},
+    },
+    [I_BXJ] = {
+        (const uint8_t[]){FMT_COND, FMT_RM, FMT_END},
+    },
+    [I_BX] = {
+        (const uint8_t[]){FMT_COND, FMT_RM, FMT_END},
+    },
+    [I_B] = {
+        (const uint8_t[]){FMT_COND, FMT_LABEL, FMT_END},
+    },
+    [I_CDP2] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_CRD, FMT_CRN,
+            FMT_CRM, FMT_INVLD, FMT_OPTION, FMT_OPC1, FMT_COND,
+            FMT_RT2, FMT_INVLD, FMT_END},
+    },
+    [I_CDP] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_CRD, FMT_CRN,
+            FMT_CRM, FMT_INVLD, FMT_OPTION, FMT_OPC1, FMT_COND,
+            FMT_RT2, FMT_INVLD, FMT_END},
+    },
+    [I_CLREX] = {
+        (const uint8_t[]){FMT_END},
+    },
+    [I_CLZ] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_CMN] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_RM, FMT_SHIFT, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_CMP] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_RM, FMT_SHIFT, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_DBG] = {
+        (const uint8_t[]){FMT_COND, FMT_OPTION, FMT_END},
+    },
+    [I_DMB] = {
+        (const uint8_t[]){FMT_OPTION, FMT_END},
+    },
+    [I_DSB] = {
+        (const uint8_t[]){FMT_OPTION, FMT_END},
+    },
+    [I_EOR] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_ISB] = {
+        (const uint8_t[]){FMT_OPTION, FMT_END},
+    },
+    [I_LDC2] = {
+        (const uint8_t[]){FMT_INVLD, FMT_LSB, FMT_INVLD, FMT_COND, FMT_COPROC,
+            FMT_CRD, FMT_BASE, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM, FMT_RM,
+            FMT_INVLD, FMT_END},
+    },
+    [I_LDC] = {
+        (const uint8_t[]){FMT_INVLD, FMT_LSB, FMT_INVLD, FMT_COND, FMT_COPROC,
+            FMT_CRD, FMT_BASE, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM, FMT_RM,
+            FMT_INVLD, FMT_END},
+    },
+    [I_LDMDA] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_LDMDB] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_LDMIB] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_LDM] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_LDRBT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_LDRB] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_LDRD] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_RT2, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDREXB] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_LDREXD] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_RT2, FMT_BASE, FMT_END},
+    },
+    [I_LDREXH] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_LDREX] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_LDRHT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRH] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRSBT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRSB] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRSHT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRSH] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_LDRT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_LDR] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_LSL] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_SHIFT, FMT_END},
+    },
+    [I_LSR] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_SHIFT, FMT_END},
+    },
+    [I_MCR2] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_CRN,
+            FMT_CRM, FMT_OPC2, FMT_END},
+    },
+    [I_MCRR2] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_RT2,
+            FMT_CRM, FMT_END},
+    },
+    [I_MCRR] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_RT2,
+            FMT_CRM, FMT_END},
+    },
+    [I_MCR] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_CRN,
+            FMT_CRM, FMT_OPC2, FMT_END},
+    },
+    [I_MLA] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_MLS] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_MOVT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_IMM, FMT_END},
+    },
+    [I_MOVW] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_IMM, FMT_END},
+    },
+    [I_MOV] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_IMM, FMT_END},
+    },
+    [I_MRC2] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_CRN,
+            FMT_CRM, FMT_OPC2, FMT_END},
+    },
+    [I_MRC] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_OPC1, FMT_RT, FMT_CRN,
+            FMT_CRM, FMT_OPC2, FMT_END},
+    },
+    [I_MRRC2] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_INVLD, FMT_OPTION, FMT_OPC1,
+            FMT_COND, FMT_INVLD, FMT_RT, FMT_RT2, FMT_CRM, FMT_END},
+    },
+    [I_MRRC] = {
+        (const uint8_t[]){FMT_COND, FMT_COPROC, FMT_INVLD, FMT_OPTION, FMT_OPC1,
+            FMT_COND, FMT_INVLD, FMT_RT, FMT_RT2, FMT_CRM, FMT_END},
+    },
+    [I_MRS] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_INVLD, FMT_S, FMT_OPC1,
+            FMT_ENDIAN, FMT_COND, FMT_INVLD, FMT_REGLIST,
+            FMT_ENDIAN, FMT_INVLD, FMT_INVLD, FMT_END},
+    },
+    [I_MSR] = {
+        (const uint8_t[]){FMT_COND, FMT_INVLD, FMT_S, FMT_OPC1, FMT_ENDIAN,
+            FMT_COND, FMT_INVLD, FMT_REGLIST, FMT_ENDIAN, FMT_INVLD,
+            FMT_INVLD, FMT_RN, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_INVLD, FMT_S, FMT_OPC1, FMT_ENDIAN,
+            FMT_COND, FMT_INVLD, FMT_REGLIST, FMT_ENDIAN, FMT_INVLD,
+            FMT_INVLD, FMT_IMM, FMT_END},
+    },
+    [I_MUL] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_MVN] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_SHIFT, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_IMM, FMT_END},
+    },
+    [I_NOP] = {
+        (const uint8_t[]){FMT_COND, FMT_END},
+    },
+    [I_ORR] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_PKH] = {
+        (const uint8_t[]){FMT_TB, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_PLD] = {
+        (const uint8_t[]){FMT_COND, FMT_MEMORY, FMT_END},
+    },
+    [I_PLI] = {
+        (const uint8_t[]){FMT_MEMORY, FMT_END},
+    },
+    [I_POP] = {
+        (const uint8_t[]){FMT_COND, FMT_REGLIST, FMT_END},
+    },
+    [I_PUSH] = {
+        (const uint8_t[]){FMT_COND, FMT_REGLIST, FMT_END},
+    },
+    [I_QADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QADD] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_RN, FMT_END},
+    },
+    [I_QASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QDADD] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_RN, FMT_END},
+    },
+    [I_QDSUB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_RN, FMT_END},
+    },
+    [I_QSAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QSUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QSUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_QSUB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_RN, FMT_END},
+    },
+    [I_RBIT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_REV16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_REVSH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_REV] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_ROR] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_SHIFT, FMT_END},
+    },
+    [I_RRX] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RM, FMT_END},
+    },
+    [I_RSB] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_RSC] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_SADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SBC] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_SBFX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_LSB, FMT_WIDTH, FMT_END},
+    },
+    [I_SEL] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SETEND] = {
+        (const uint8_t[]){FMT_ENDIAN, FMT_END},
+    },
+    [I_SEV] = {
+        (const uint8_t[]){FMT_COND, FMT_END},
+    },
+    [I_SHADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SHADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SHASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SHSAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SHSUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SHSUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMC] = {
+        (const uint8_t[]){FMT_COND, FMT_IMM, FMT_END},
+    },
+    [I_SMLAD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLALD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_SMLAL] = {
+        (const uint8_t[]){FMT_XY, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_SMLAW] = {
+        (const uint8_t[]){FMT_Y, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLA] = {
+        (const uint8_t[]){FMT_XY, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA,
+            FMT_END},
+    },
+    [I_SMLSD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLSLD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_SMMLA] = {
+        (const uint8_t[]){FMT_ROUND, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA,
+            FMT_END},
+    },
+    [I_SMMLS] = {
+        (const uint8_t[]){FMT_ROUND, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA,
+            FMT_END},
+    },
+    [I_SMMUL] = {
+        (const uint8_t[]){FMT_ROUND, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMUAD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMULL] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_SMULW] = {
+        (const uint8_t[]){FMT_Y, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMUL] = {
+        (const uint8_t[]){FMT_XY, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMUSD] = {
+        (const uint8_t[]){FMT_X, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SSAT16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM,
+            FMT_RM, FMT_INVLD, FMT_RN, FMT_END},
+    },
+    [I_SSAT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM,
+            FMT_RM, FMT_INVLD, FMT_RN, FMT_SHIFT, FMT_END},
+    },
+    [I_SSAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SSUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SSUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_STC2] = {
+        (const uint8_t[]){FMT_INVLD, FMT_LSB, FMT_INVLD, FMT_COND, FMT_COPROC,
+            FMT_CRD, FMT_BASE, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM, FMT_RM,
+            FMT_INVLD, FMT_END},
+    },
+    [I_STC] = {
+        (const uint8_t[]){FMT_INVLD, FMT_LSB, FMT_INVLD, FMT_COND, FMT_COPROC,
+            FMT_CRD, FMT_BASE, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_INVLD, FMT_INVLD, FMT_IMM, FMT_RM, FMT_RM,
+            FMT_INVLD, FMT_END},
+    },
+    [I_STMDA] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_STMDB] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_STMIB] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_STM] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_WRITEBACK, FMT_REGLIST, FMT_END},
+    },
+    [I_STRBT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_STRB] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_STRD] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_RT2, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_STREXB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_STREXD] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RT, FMT_RT2, FMT_BASE, FMT_END},
+    },
+    [I_STREXH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_STREX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RT, FMT_BASE, FMT_END},
+    },
+    [I_STRHT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_STRH] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_END},
+    },
+    [I_STRT] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_STR] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_BASE, FMT_OFFSET, FMT_SHIFT,
+            FMT_END},
+    },
+    [I_SUB] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_SVC] = {
+        (const uint8_t[]){FMT_COND, FMT_IMM, FMT_END},
+    },
+    [I_SWPB] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_RT2, FMT_BASE, FMT_END},
+    },
+    [I_SWP] = {
+        (const uint8_t[]){FMT_COND, FMT_RT, FMT_RT2, FMT_BASE, FMT_END},
+    },
+    [I_SXTAB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_SXTAB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_SXTAH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_SXTB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_SXTB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_SXTH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_TEQ] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_RM, FMT_SHIFT, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_TST] = {
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_RM, FMT_SHIFT, FMT_END},
+        (const uint8_t[]){FMT_COND, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_UADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UBFX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_LSB, FMT_WIDTH, FMT_END},
+    },
+    [I_UDF] = {
+        (const uint8_t[]){FMT_COND, FMT_IMM, FMT_END},
+    },
+    [I_UHADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UHADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UHASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UHSAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UHSUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UHSUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UMAAL] = {
+        (const uint8_t[]){FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UMLAL] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_UMULL] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM,
+            FMT_END},
+    },
+    [I_UQADD16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UQADD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UQASX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UQSAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UQSUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UQSUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_USAD8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_USADA8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_USAT16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_IMM, FMT_RN, FMT_END},
+    },
+    [I_USAT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_IMM, FMT_RN, FMT_SHIFT, FMT_END},
+    },
+    [I_USAX] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_USUB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_USUB8] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_UXTAB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_UXTAB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_UXTAH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_UXTB16] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_UXTB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_UXTH] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RM, FMT_ROTATE, FMT_END},
+    },
+    [I_WFE] = {
+        (const uint8_t[]){FMT_COND, FMT_END},
+    },
+    [I_WFI] = {
+        (const uint8_t[]){FMT_COND, FMT_END},
+    },
+    [I_YIELD] = {
+        (const uint8_t[]){FMT_COND, FMT_END},
+    },
+};
@@ -0,0 +1,77 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+#ifndef __ARMV7_TBL__
+#define __ARMV7_TBL__
+#include <stdint.h>
+#include "darm-tbl.h"
+extern darm_enctype_t armv7_instr_types[256];
+extern darm_enctype_t thumb2_instr_types[256];
+extern darm_instr_t armv7_instr_labels[256];
+extern const darm_encoding_t armv7_encodings[254];
+extern const uint16_t armv7_encodings_index[355];
+extern darm_instr_t type_shift_instr_lookup[16];
+extern darm_instr_t type_brnchmisc_instr_lookup[16];
+extern darm_instr_t type_opless_instr_lookup[8];
+extern darm_instr_t type_uncond2_instr_lookup[8];
+extern darm_instr_t type_mul_instr_lookup[8];
+extern darm_instr_t type_stack0_instr_lookup[32];
+extern darm_instr_t type_stack1_instr_lookup[8];
+extern darm_instr_t type_stack2_instr_lookup[8];
+extern darm_instr_t type_bits_instr_lookup[4];
+extern darm_instr_t type_pas_instr_lookup[64];
+extern darm_instr_t type_sat_instr_lookup[4];
+extern darm_instr_t type_sync_instr_lookup[16];
+extern darm_instr_t type_pusr_instr_lookup[16];
+typedef enum _armv7_handler_t {
+    H_INVLD, H_MUL, H_MUL_INVLD, H_MLA, H_MULL, H_STACK1_REG, H_STACK1_IMM,
+    H_STACK2_REG, H_STACK2_IMM, H_SWP, H_LDREX, H_STREX, H_STACK0_IMM,
+    H_STACK0_REG, H_SAT, H_PUSR, H_SSAT, H_SSAT16, H_ARITH_SHIFT_REG,
+    H_ARITH_SHIFT_IMM, H_ARITH_IMM, H_BFI, H_BITS, H_BRANCH, H_SVC, H_BKPT,
+    H_BX, H_MSR, H_MOV_IMM, H_MOVW, H_CMP_OP_REG, H_CMP_OP_IMM, H_CMP_IMM,
+    H_OPLESS, H_DST_SRC_REG, H_DST_SRC_IMM, H_LDSTREGS, H_BITREV, H_MVN_REG,
+    H_MVN_IMM, H_SMUL, H_SMC, H_CLZ, H_SEL, H_PKH, H_SMMUL, H_SMUSD, H_SMUAD,
+    H_SMLSLD, H_SMLA, H_SMLAL, H_PAS, H_CDP, H_MCR, H_UDF, H_HANDLERCNT
+} armv7_handler_t;
+
+typedef struct _armv7_dispatch_t {
+    uint8_t handler;
+    uint8_t instr_type;
+    uint16_t instr;
+} armv7_dispatch_t;
+extern const armv7_dispatch_t armv7_dispatch[4096];
+typedef enum _darm_format_op_t {
+    FMT_END, FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_RT, FMT_RT2,
+    FMT_RDHI, FMT_RDLO, FMT_IMM, FMT_SHIFT, FMT_WRITEBACK, FMT_ENDIAN, FMT_X,
+    FMT_XY, FMT_Y, FMT_ROUND, FMT_TB, FMT_REGLIST, FMT_LSB, FMT_WIDTH,
+    FMT_OPTION, FMT_BASE, FMT_OFFSET, FMT_LABEL, FMT_MEMORY, FMT_ROTATE,
+    FMT_COPROC, FMT_OPC1, FMT_OPC2, FMT_CRN, FMT_CRM, FMT_CRD, FMT_INVLD
+} darm_format_op_t;
+
+extern const uint8_t *armv7_format_programs[479][3];
+#endif
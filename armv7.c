@@ -200,270 +200,175 @@ static int armv7_disas_uncond(darm_t *d, uint32_t w)
 
 static int armv7_disas_cond(darm_t *d, uint32_t w)
 {
-    // we first handle some exceptions for MUL, STR, and LDR-like
-    // instructions, which don't fit in the regular table (as they interfere
-    // with the other instructions)
+    // bits 20..27 and 4..7 select the instruction, or at least narrow it
+    // down far enough that only the operands have to be extracted, see
+    // armv7_dispatch_entry() in darmgen.py for the exact decoding rules
+    const armv7_dispatch_t *e =
+        &armv7_dispatch[((w >> 16) & 0xff0) | ((w >> 4) & b1111)];
 
-    // we have to check two parts of the encoded instruction, namely bits
-    // 25..27 which should be zero, and bits 4..7, of which bit 4 and bit 7
-    // should be one
-    const uint32_t mask = (b111 << 25) | (b1001 << 4);
-    if((w & mask) == (b1001 << 4)) {
+    d->instr = (darm_instr_t) e->instr;
+    d->instr_type = (darm_enctype_t) e->instr_type;
 
-        // all variants of the MUL instruction
-        if(((w >> 24) & 1) == 0 && ((w >> 4) & b1111) == b1001) {
+    switch ((armv7_handler_t) e->handler) {
+    case H_INVLD: case H_HANDLERCNT:
+        return -1;
 
-            d->instr = type_mul_instr_lookup[(w >> 21) & b111];
-            d->instr_type = T_ARM_MUL;
+    case H_MLA:
+        d->Ra = (w >> 12) & b1111;
+        // fall-through
 
-            // except for UMAAL and MLS, every variant takes the S bit
-            d->S = (w >> 20) & 1;
+    case H_MUL:
+        d->S = (w >> 20) & 1;
+        d->Rd = (w >> 16) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->Rn = w & b1111;
+        return 0;
 
-            // each variant takes Rm and Rn
-            d->Rm = (w >> 8) & b1111;
-            d->Rn = w & b1111;
+    case H_MUL_INVLD:
+        // UMAAL and MLS don't take the S bit, so these are invalid
+        d->S = B_SET;
+        d->Rm = (w >> 8) & b1111;
+        d->Rn = w & b1111;
+        return -1;
 
-            // if this is the UMAAL or MLS instruction *and* the S bit is set,
-            // then this is an invalid instruction
-            if((d->instr == I_UMAAL || d->instr == I_MLS) && d->S != 0) {
-                return -1;
-            }
+    case H_MULL:
+        d->S = (w >> 20) & 1;
+        d->RdHi = (w >> 16) & b1111;
+        d->RdLo = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->Rn = w & b1111;
+        return 0;
 
-            switch ((uint32_t) d->instr) {
-            case I_MLA: case I_MLS:
-                d->Ra = (w >> 12) & b1111;
-                // fall-through
+    case H_STACK2_REG: case H_STACK2_IMM:
+        d->W = (w >> 21) & 1;
+        // fall-through
 
-            case I_MUL:
-                d->Rd = (w >> 16) & b1111;
-                break;
+    case H_STACK1_REG: case H_STACK1_IMM:
+        d->Rn = (w >> 16) & b1111;
+        d->Rt = (w >> 12) & b1111;
+        d->P = (w >> 24) & 1;
+        d->U = (w >> 23) & 1;
 
-            case I_UMAAL: case I_UMULL: case I_UMLAL: case I_SMULL:
-            case I_SMLAL:
-                d->RdHi = (w >> 16) & b1111;
-                d->RdLo = (w >> 12) & b1111;
-                break;
-            }
-            return 0;
+        // depending on the register form we either have to extract a
+        // register or an immediate
+        if(e->handler == H_STACK1_REG || e->handler == H_STACK2_REG) {
+            d->Rm = w & b1111;
+        }
+        else {
+            // the four high bits start at bit 8, so we shift them right
+            // to their destination
+            d->imm = ((w >> 4) & b11110000) | (w & b1111);
+            d->I = B_SET;
         }
-        else if(((w >> 24) & 1) == 0 && ((w >> 5) & b11) != 0 &&
-                (w >> 21) & 1) {
+        return 0;
 
-            // the high 2 bits are represented by the 5th and 6th bit, the
-            // lower bit is represented by the 20th bit
-            uint32_t index = ((w >> 4) & b110) | ((w >> 20) & 1);
-            d->instr = type_stack1_instr_lookup[index];
-            if(d->instr == I_INVLD) return -1;
+    case H_SWP:
+        d->B = (w >> 22) & 1;
+        d->Rn = (w >> 16) & b1111;
+        d->Rt = (w >> 12) & b1111;
+        d->Rt2 = w & b1111;
+        return 0;
 
-            d->instr_type = T_ARM_STACK1;
-            d->Rn = (w >> 16) & b1111;
-            d->Rt = (w >> 12) & b1111;
-            d->P = (w >> 24) & 1;
-            d->U = (w >> 23) & 1;
+    case H_LDREX:
+        d->Rn = (w >> 16) & b1111;
+        d->Rt = (w >> 12) & b1111;
+        return 0;
 
-            // depending on the register form we either have to extract a
-            // register or an immediate
-            if(((w >> 22) & 1) == 0) {
-                d->Rm = w & b1111;
-            }
-            else {
-                // the four high bits start at bit 8, so we shift them right
-                // to their destination
-                d->imm = ((w >> 4) & b11110000) | (w & b1111);
-                d->I = B_SET;
-            }
-            return 0;
-        }
-        else if(((w >> 5) & b11) != 0 && ((w >> 20) & b10010) != b00010) {
+    case H_STREX:
+        d->Rn = (w >> 16) & b1111;
+        d->Rd = (w >> 12) & b1111;
+        d->Rt = w & b1111;
+        return 0;
 
-            // the high 2 bits are represented by the 5th and 6th bit, the
-            // lower bit is represented by the 20th bit
-            uint32_t index = ((w >> 4) & b110) | ((w >> 20) & 1);
-            d->instr = type_stack2_instr_lookup[index];
-            if(d->instr == I_INVLD) return -1;
+    case H_STACK0_REG:
+        d->Rn = (w >> 16) & b1111;
+        d->Rt = (w >> 12) & b1111;
+        d->P = (w >> 24) & 1;
+        d->U = (w >> 23) & 1;
+        d->W = (w >> 21) & 1;
+        d->shift_type = (w >> 5) & b11;
+        d->shift = (w >> 7) & b11111;
+        d->Rm = w & b1111;
+        return 0;
 
-            d->instr_type = T_ARM_STACK2;
-            d->Rn = (w >> 16) & b1111;
-            d->Rt = (w >> 12) & b1111;
-            d->P = (w >> 24) & 1;
-            d->U = (w >> 23) & 1;
-            d->W = (w >> 21) & 1;
+    case H_STACK0_IMM:
+        d->Rn = (w >> 16) & b1111;
+        d->Rt = (w >> 12) & b1111;
+        d->P = (w >> 24) & 1;
+        d->U = (w >> 23) & 1;
+        d->W = (w >> 21) & 1;
+        d->imm = w & BITMSK_12;
+        d->I = B_SET;
 
-            // depending on the register form we either have to extract a
-            // register or an immediate
-            if(((w >> 22) & 1) == 0) {
-                d->Rm = w & b1111;
-            }
-            else {
-                // the four high bits start at bit 8, so we shift them right
-                // to their destination
-                d->imm = ((w >> 4) & b11110000) | (w & b1111);
-                d->I = B_SET;
-            }
-            return 0;
+        // if Rn == SP and P = 1 and U = 0 and W = 1 and imm12 = 4 and
+        // this is a STR instruction, then this is a PUSH instruction
+        if(d->instr == I_STR && d->Rn == SP && d->P == 1 && d->U == 0 &&
+                d->W == 1 && d->imm == 4) {
+            d->instr = I_PUSH;
         }
-        // synchronization primitive instructions
-        else if(((w >> 24) & 1) == 1 && ((w >> 4) & b1111) == b1001) {
-            d->instr = type_sync_instr_lookup[(w >> 20) & b1111];
-            d->instr_type = T_ARM_SYNC;
-            d->Rn = (w >> 16) & b1111;
-            switch ((uint32_t) d->instr) {
-            case I_SWP: case I_SWPB:
-                d->B = (w >> 22) & 1;
-                d->Rt = (w >> 12) & b1111;
-                d->Rt2 = w & b1111;
-                return 0;
-
-            case I_LDREX: case I_LDREXD: case I_LDREXB: case I_LDREXH:
-                d->Rt = (w >> 12) & b1111;
-                return 0;
-
-            case I_STREX: case I_STREXD: case I_STREXB: case I_STREXH:
-                d->Rd = (w >> 12) & b1111;
-                d->Rt = w & b1111;
-                return 0;
-            }
+        // if Rn == SP and P = 0 and U = 1 and W = 0 and imm12 = 4 and
+        // this is a LDR instruction, then this is a POP instruction
+        else if(d->instr == I_LDR && d->Rn == SP && d->P == 0 &&
+                d->U == 1 && d->W == 0 && d->imm == 4) {
+            d->instr = I_POP;
         }
-    }
-    // handles the STR, STRT, LDR, LDRT, STRB, STRBT, LDRB, LDRBT stack
-    // instructions, and the media instructions
-    else if(((w >> 26) & b11) == b01) {
-
-        // if both the 25th and the 4th bit are set, then this is a media
-        // instruction, which is handled in the big switch-case statement
-        const uint32_t media_mask = (1 << 25) | (1 << 4);
-        if((w & media_mask) != media_mask) {
-            d->instr = type_stack0_instr_lookup[(w >> 20) & b11111];
-            d->instr_type = T_ARM_STACK0;
-
-            d->Rn = (w >> 16) & b1111;
-            d->Rt = (w >> 12) & b1111;
-
-            // extract some flags
-            d->P = (w >> 24) & 1;
-            d->U = (w >> 23) & 1;
-            d->W = (w >> 21) & 1;
-
-            // if the 25th bit is not set, then this instruction takes an
-            // immediate, otherwise, it takes a shifted register
-            if(((w >> 25) & 1) == 0) {
-                d->imm = w & BITMSK_12;
-                d->I = B_SET;
-            }
-            else {
-                d->shift_type = (w >> 5) & b11;
-                d->shift = (w >> 7) & b11111;
-                d->Rm = w & b1111;
-            }
+        return 0;
 
-            // if Rn == SP and P = 1 and U = 0 and W = 1 and imm12 = 4 and
-            // this is a STR instruction, then this is a PUSH instruction
-            if(d->instr == I_STR && d->Rn == SP && d->P == 1 && d->U == 0 &&
-                    d->W == 1 && d->imm == 4) {
-                d->instr = I_PUSH;
-            }
-            // if Rn == SP and P = 0 and U = 1 and W = 0 and imm12 = 4 and
-            // this is a LDR instruction, then this is a POP instruction
-            else if(d->instr == I_LDR && d->Rn == SP && d->P == 0 &&
-                    d->U == 1 && d->W == 0 && d->imm == 4) {
-                d->instr = I_POP;
-            }
-            return 0;
-        }
-    }
-    // handle saturating addition and subtraction instructions, these
-    // instructions have various masks; of bits 20..27 bit 24 is set and bits
-    // 21..22 specify which instruction this is, furthermore, bits 4..7
-    // represent the value 0b0101
-    const uint32_t mask2 = (b11111001 << 20) | (b1111 << 4);
-    if((w & mask2) == ((1 << 24) | (b0101 << 4))) {
-        d->instr = type_sat_instr_lookup[(w >> 21) & b11];
-        d->instr_type = T_ARM_SAT;
+    case H_SAT: case H_PAS:
         d->Rn = (w >> 16) & b1111;
         d->Rd = (w >> 12) & b1111;
         d->Rm = w & b1111;
         return 0;
-    }
-    // handle packing, unpacking, saturation, and reversal instructions, these
-    // instructions have the 4th bit set and bits 23..27 represent 0b01101
-    const uint32_t mask3 = (b11111 << 23) | (1 << 4);
-    if((w & mask3) == ((b01101 << 23) | (1 << 4))) {
-        // some instructions are already handled elsewhere (namely, PKH, SEL,
-        // REV, REV16, RBIT, and REVSH)
-        uint32_t op1 = (w >> 20) & b111;
-        uint32_t A = (w >> 16) & b1111;
-        uint32_t op2 = (w >> 5) & b111;
 
-        d->instr_type = T_ARM_PUSR;
-
-        // the (SX|UX)T(A)(B|H)(16) instructions
-        // op1 represents the upper three bits, and A = 0b1111 represents
-        if(op2 == b011) {
-            // the lower bit
-            d->instr = type_pusr_instr_lookup[(op1 << 1) | (A == b1111)];
-            if(d->instr != I_INVLD) {
-                d->Rd = (w >> 12) & b1111;
-                d->Rm = w & b1111;
+    case H_PUSR: {
+        // the (SX|UX)T(A)(B|H)(16) instructions, if A is 0b1111 then this
+        // is the variant without Rn operand
+        uint32_t A = (w >> 16) & b1111;
+        d->instr = type_pusr_instr_lookup[((w >> 19) & b1110) | (A == b1111)];
+        d->Rd = (w >> 12) & b1111;
+        d->Rm = w & b1111;
 
-                // rotation is shifted to the left by three, so we do this
-                // directly in our shift as well
-                d->rotate = (w >> 7) & b11000;
+        // rotation is shifted to the left by three, so we do this
+        // directly in our shift as well
+        d->rotate = (w >> 7) & b11000;
 
-                // if A is not 0b1111, then A represents the Rn operand
-                if(A != b1111) {
-                    d->Rn = A;
-                }
-                return 0;
-            }
+        // if A is not 0b1111, then A represents the Rn operand
+        if(A != b1111) {
+            d->Rn = A;
         }
+        return 0;
+    }
 
-        // SSAT
-        if((op1 & b010) == b010 && (op2 & 1) == 0) {
-            // if the upper bit is set, then it's USAT, otherwise SSAT
-            d->instr = (op1 >> 2) ? I_USAT : I_SSAT;
-            d->imm = (w >> 16) & b11111;
-            d->I = B_SET;
-            // signed saturate adds one to the immediate
-            if(d->instr == I_SSAT) {
-                d->imm++;
-            }
-            d->Rd = (w >> 12) & b1111;
-            d->shift = (w >> 7) & b11111;
-            d->shift_type = (w >> 5) & b11;
-            d->Rn = w & b1111;
-            return 0;
-        }
+    case H_SSAT:
+        // signed saturate adds one to the immediate
+        d->imm = ((w >> 16) & b11111) + (d->instr == I_SSAT);
+        d->I = B_SET;
+        d->Rd = (w >> 12) & b1111;
+        d->shift = (w >> 7) & b11111;
+        d->shift_type = (w >> 5) & b11;
+        d->Rn = w & b1111;
+        return 0;
 
-        // SSAT16 and USAT16
-        if((op1 == b010 || op1 == b110) && op2 == b001) {
-            d->instr = op1 == b010 ? I_SSAT16 : I_USAT16;
-            d->imm = (w >> 16) & b1111;
-            d->I = B_SET;
-            // signed saturate 16 adds one to the immediate
-            if(d->instr == I_SSAT16) {
-                d->imm++;
-            }
-            d->Rd = (w >> 12) & b1111;
-            d->Rn = w & b1111;
-            return 0;
-        }
-    }
+    case H_SSAT16:
+        // signed saturate 16 adds one to the immediate
+        d->imm = ((w >> 16) & b1111) + (d->instr == I_SSAT16);
+        d->I = B_SET;
+        d->Rd = (w >> 12) & b1111;
+        d->Rn = w & b1111;
+        return 0;
 
-    // the instruction label
-    d->instr = armv7_instr_labels[(w >> 20) & 0xff];
-    d->instr_type = armv7_instr_types[(w >> 20) & 0xff];
+    case H_ARITH_SHIFT_REG: case H_ARITH_SHIFT_IMM:
+        d->Rn = (w >> 16) & b1111;
+        // fall-through
 
-    // do a lookup for the type of instruction
-    switch ((uint32_t) d->instr_type) {
-    case T_ARM_ARITH_SHIFT:
+    case H_MVN_REG: case H_MVN_IMM:
         d->S = (w >> 20) & 1;
         d->Rd = (w >> 12) & b1111;
-        d->Rn = (w >> 16) & b1111;
         d->Rm = w & b1111;
         d->shift_type = (w >> 5) & b11;
 
-        // type == 1, shift with the value of the lower bits of Rs
-        if(((w >> 4) & 1) == B_SET) {
+        // shift with the value of the lower bits of Rs if bit 4 is set
+        if(e->handler == H_ARITH_SHIFT_REG || e->handler == H_MVN_REG) {
             d->Rs = (w >> 8) & b1111;
         }
         else {
@@ -471,7 +376,7 @@ static int armv7_disas_cond(darm_t *d, uint32_t w)
         }
         return 0;
 
-    case T_ARM_ARITH_IMM:
+    case H_ARITH_IMM:
         d->S = (w >> 20) & 1;
         d->Rd = (w >> 12) & b1111;
         d->Rn = (w >> 16) & b1111;
@@ -486,151 +391,132 @@ static int armv7_disas_cond(darm_t *d, uint32_t w)
         }
         return 0;
 
-    case T_ARM_BITS:
-        d->instr = type_bits_instr_lookup[(w >> 21) & b11];
-
-        d->instr_type = T_ARM_BITS;
+    case H_BFI:
         d->Rd = (w >> 12) & b1111;
         d->Rn = w & b1111;
         d->lsb = (w >> 7) & b11111;
 
-        // the bfi and bfc instructions specify the MSB, whereas the SBFX and
-        // UBFX instructions specify the width minus one
-        if(d->instr == I_BFI) {
-            d->width = ((w >> 16) & b11111) - d->lsb + 1;
+        // the bfi and bfc instructions specify the MSB
+        d->width = ((w >> 16) & b11111) - d->lsb + 1;
 
-            // if Rn is 0b1111, then this is in fact the BFC instruction
-            if(d->Rn == b1111) {
-                d->Rn = R_INVLD;
-                d->instr = I_BFC;
-            }
-        }
-        else {
-            d->width = ((w >> 16) & b11111) + 1;
+        // if Rn is 0b1111, then this is in fact the BFC instruction
+        if(d->Rn == b1111) {
+            d->Rn = R_INVLD;
+            d->instr = I_BFC;
         }
         return 0;
 
-    case T_ARM_BRNCHSC:
+    case H_BITS:
+        // the SBFX and UBFX instructions specify the width minus one
+        d->Rd = (w >> 12) & b1111;
+        d->Rn = w & b1111;
+        d->lsb = (w >> 7) & b11111;
+        d->width = ((w >> 16) & b11111) + 1;
+        return 0;
+
+    case H_BRANCH:
         d->imm = w & BITMSK_24;
         d->I = B_SET;
 
-        // if the instruction is B or BL, then we have to sign-extend it and
-        // multiply it with four
-        if(d->instr != I_SVC) {
-            // check if the highest bit of the imm24 is set, if so, we
-            // manually sign-extend the integer
-            if((d->imm >> 23) & 1) {
-                d->imm = (d->imm | 0xff000000) << 2;
-            }
-            else {
-                d->imm = d->imm << 2;
-            }
+        // B and BL take a sign-extended immediate, multiplied by four
+        if((d->imm >> 23) & 1) {
+            d->imm = (d->imm | 0xff000000) << 2;
+        }
+        else {
+            d->imm = d->imm << 2;
         }
         return 0;
 
-    case T_ARM_BRNCHMISC:
-        // first get the real instruction label
-        d->instr = type_brnchmisc_instr_lookup[(w >> 4) & b1111];
-
-        // now we do a switch statement based on the instruction label,
-        // rather than some magic values
-        switch ((uint32_t) d->instr) {
-        case I_BKPT:
-            d->imm = (((w >> 8) & BITMSK_12) << 4) + (w & b1111);
-            d->I = B_SET;
-            return 0;
+    case H_SVC:
+        d->imm = w & BITMSK_24;
+        d->I = B_SET;
+        return 0;
 
-        case I_BX: case I_BXJ: case I_BLX:
-            d->Rm = w & b1111;
-            return 0;
+    case H_BKPT:
+        d->imm = (((w >> 8) & BITMSK_12) << 4) + (w & b1111);
+        d->I = B_SET;
+        return 0;
 
-        case I_MSR:
-            d->Rn = w & b1111;
-            d->imm = (w >> 18) & b11;
-            d->I = B_SET;
-            return 0;
+    case H_BX:
+        d->Rm = w & b1111;
+        return 0;
 
-        case I_QSUB: case I_SMLAW: case I_SMULW: default:
-            // returns -1
-            break;
-        }
-        break;
+    case H_MSR:
+        d->Rn = w & b1111;
+        d->imm = (w >> 18) & b11;
+        d->I = B_SET;
+        return 0;
 
-    case T_ARM_MOV_IMM:
+    case H_MOV_IMM:
+        // the MOV and MVN instructions have an S bit and an immediate
+        // which has to be decoded
+        d->S = (w >> 20) & 1;
         d->Rd = (w >> 12) & b1111;
-        d->imm = w & BITMSK_12;
+        d->imm = ARMExpandImm(w & BITMSK_12);
         d->I = B_SET;
+        return 0;
 
-        // the MOV and MVN instructions have an S bit
-        if(d->instr == I_MOV || d->instr == I_MVN) {
-            d->S = (w >> 20) & 1;
-
-            // the immediate values of the MOV and MVN instructions have to
-            // be decoded
-            d->imm = ARMExpandImm(d->imm);
-        }
+    case H_MOVW:
         // the MOVW and the MOVT instructions take another 4 bits of immediate
-        else {
-            d->imm |= ((w >> 16) & b1111) << 12;
-        }
+        d->Rd = (w >> 12) & b1111;
+        d->imm = (w & BITMSK_12) | (((w >> 16) & b1111) << 12);
+        d->I = B_SET;
         return 0;
 
-    case T_ARM_CMP_OP:
+    case H_CMP_OP_REG:
+        d->Rs = (w >> 8) & b1111;
         d->Rn = (w >> 16) & b1111;
         d->Rm = w & b1111;
         d->shift_type = (w >> 5) & b11;
+        return 0;
 
-        // type == 1, shift with the value of the lower bits of Rs
-        if(((w >> 4) & 1) == B_SET) {
-            d->Rs = (w >> 8) & b1111;
-        }
-        else {
-            d->shift = (w >> 7) & b11111;
-        }
+    case H_CMP_OP_IMM:
+        d->shift = (w >> 7) & b11111;
+        d->Rn = (w >> 16) & b1111;
+        d->Rm = w & b1111;
+        d->shift_type = (w >> 5) & b11;
         return 0;
 
-    case T_ARM_CMP_IMM:
+    case H_CMP_IMM:
         d->Rn = (w >> 16) & b1111;
         d->imm = ARMExpandImm(w & BITMSK_12);
         d->I = B_SET;
         return 0;
 
-    case T_ARM_OPLESS:
+    case H_OPLESS:
         d->instr = type_opless_instr_lookup[w & b111];
         return d->instr == I_INVLD ? -1 : 0;
 
-    case T_ARM_DST_SRC:
-        d->instr = type_shift_instr_lookup[(w >> 4) & b1111];
-        if(d->instr == I_INVLD) return -1;
-
+    case H_DST_SRC_REG:
         d->S = (w >> 20) & 1;
         d->Rd = (w >> 12) & b1111;
         d->shift_type = (w >> 5) & b11;
-        if((w >> 4) & 1) {
-            d->Rm = (w >> 8) & b1111;
-            d->Rn = w & b1111;
-        }
-        else {
-            d->Rm = w & b1111;
-            d->shift = (w >> 7) & b11111;
+        d->Rm = (w >> 8) & b1111;
+        d->Rn = w & b1111;
+        return 0;
 
-            // if this is a LSL instruction with a zero shift, then it's
-            // actually a MOV instruction (there's no register-shifted LSL)
-            if(d->instr == I_LSL && d->shift_type == S_LSL && d->shift == 0) {
-                d->instr = I_MOV;
-            }
+    case H_DST_SRC_IMM:
+        d->S = (w >> 20) & 1;
+        d->Rd = (w >> 12) & b1111;
+        d->shift_type = (w >> 5) & b11;
+        d->Rm = w & b1111;
+        d->shift = (w >> 7) & b11111;
 
-            // if this is a ROR instruction with a zero shift, then it's
-            // actually a RRX instruction (there's no register-shifted ROR)
-            else if(d->instr == I_ROR && d->shift_type == S_ROR &&
-                    d->shift == 0) {
-                d->instr = I_RRX;
-            }
+        // if this is a LSL instruction with a zero shift, then it's
+        // actually a MOV instruction (there's no register-shifted LSL)
+        if(d->instr == I_LSL && d->shift_type == S_LSL && d->shift == 0) {
+            d->instr = I_MOV;
         }
 
+        // if this is a ROR instruction with a zero shift, then it's
+        // actually a RRX instruction (there's no register-shifted ROR)
+        else if(d->instr == I_ROR && d->shift_type == S_ROR &&
+                d->shift == 0) {
+            d->instr = I_RRX;
+        }
         return 0;
 
-    case T_ARM_LDSTREGS:
+    case H_LDSTREGS:
         d->W = (w >> 21) & 1;
         d->Rn = (w >> 16) & b1111;
         d->reglist = w & BITMSK_16;
@@ -647,199 +533,112 @@ static int armv7_disas_cond(darm_t *d, uint32_t w)
         }
         return 0;
 
-    case T_ARM_BITREV:
+    case H_BITREV: case H_CLZ:
         d->Rd = (w >> 12) & b1111;
         d->Rm = w & b1111;
+        return 0;
 
-        // if this is the REV16 instruction and bits 4..7 are 0b0011, then
-        // this is in fact the REV instruction
-        if(d->instr == I_REV16 && ((w >> 4) & b1111) == b0011) {
-            d->instr = I_REV;
-        }
-        // if this is the REVSH instruction and bits 4..7 are 0b0011, then
-        // this is in fact the RBIT instruction
-        else if(d->instr == I_REVSH && ((w >> 4) & b1111) == b0011) {
-            d->instr = I_RBIT;
-        }
+    case H_SMUL:
+        d->Rd = (w >> 16) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->M  = (w >> 6) & 1;
+        d->N  = (w >> 5) & 1;
+        d->Rn = w & b1111;
         return 0;
 
-    case T_ARM_MISC:
-        switch ((uint32_t) d->instr) {
-        case I_MVN:
-            d->S = (w >> 20) & 1;
-            d->Rd = (w >> 12) & b1111;
-            d->shift_type = (w >> 5) & b11;
-            d->Rm = w & b1111;
-            if(((w >> 4) & 1) == B_UNSET) {
-                d->shift = (w >> 7) & b11111;
-            }
-            else {
-                d->Rs = (w >> 8) & b1111;
-            }
-            return 0;
-
-        case I_DBG:
-            d->option = w & b1111;
-            return 0;
-
-        case I_SMC:
-            switch ((w >> 4) & b1111) {
-            // if the 7th bit is 1 and the 4th bit 0, then this is
-            // the SMUL instruction
-            case b1000: case b1010: case b1100: case b1110:
-                d->instr = I_SMUL;
-                d->instr_type = T_ARM_SM;
-                d->Rd = (w >> 16) & b1111;
-                d->Rm = (w >> 8) & b1111;
-                d->M  = (w >> 6) & 1;
-                d->N  = (w >> 5) & 1;
-                d->Rn = w & b1111;
-                break;
-
-            // smc
-            case b0111:
-                d->instr = I_SMC;
-                d->imm = w & b1111;
-                d->I = B_SET;
-                break;
-
-            // clz
-            case b0001:
-                d->instr = I_CLZ;
-                d->Rm = w & b1111;
-                d->Rd = (w >> 12) & b1111;
-                break;
-
-            default:
-                return -1;
-            }
-            return 0;
+    case H_SMC:
+        d->imm = w & b1111;
+        d->I = B_SET;
+        return 0;
 
-        case I_SEL:
-            d->Rd = (w >> 12) & b1111;
-            d->Rn = (w >> 16) & b1111;
-            d->Rm = w & b1111;
+    case H_PKH:
+        d->shift_type = (w >> 5) & b10;
+        d->shift = (w >> 7) & b11111;
+        d->T = (w >> 6) & 1;
+        // fall-through
 
-            // the SEL and PKH instructions share the same 8-bit identifier,
-            // if the 5th bit is set, then this is the SEL instruction,
-            // otherwise it's the PKH instruction
-            if(((w >> 5) & 1) == 0) {
-                d->instr = I_PKH;
-                d->shift_type = (w >> 5) & b10;
-                d->shift = (w >> 7) & b11111;
-                d->T = (w >> 6) & 1;
-            }
-            return 0;
+    case H_SEL:
+        d->Rd = (w >> 12) & b1111;
+        d->Rn = (w >> 16) & b1111;
+        d->Rm = w & b1111;
+        return 0;
+
+    case H_SMMUL:
+        d->Rd = (w >> 16) & b1111;
+        d->Ra = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->R  = (w >> 5) & 1;
+        d->Rn = w & b1111;
+
+        // if it's SMMUL instruction, but Ra is not 0b1111, then this is
+        // the SMMLA instruction
+        if(d->instr == I_SMMUL && d->Ra != b1111) {
+            d->instr = I_SMMLA;
         }
+        return 0;
 
-    case T_ARM_SM:
-        switch ((uint32_t) d->instr) {
-        case I_SMMUL:
-            d->Rd = (w >> 16) & b1111;
-            d->Ra = (w >> 12) & b1111;
-            d->Rm = (w >> 8) & b1111;
-            d->R  = (w >> 5) & 1;
-            d->Rn = w & b1111;
-
-            // this can be either the SMMUL, the SMMLA, or the SMMLS
-            // instruction, depending on the 6th bit and Ra
-            if((w >> 6) & 1) {
-                d->instr = I_SMMLS;
-            }
-            // if it's SMMUL instruction, but Ra is not 0b1111, then this is
-            // the SMMLA instruction
-            else if(d->Ra != b1111) {
-                d->instr = I_SMMLA;
-            }
-            return 0;
-
-        case I_SMUSD:
-            d->Rd = (w >> 16) & b1111;
-            d->Ra = (w >> 12) & b1111;
-            d->Rm = (w >> 8) & b1111;
-            d->M  = (w >> 5) & 1;
-            d->Rn = w & b1111;
-
-            // this can be either the SMLAD, the SMLSD, the SMUAD, or the
-            // SMUSD instruction, depending on the 6th bit and Ra
-            if((w >> 6) & 1 && d->Rn != b1111) {
-                d->instr = I_SMLSD;
-            }
-            else if(((w >> 6) & 1) == 0) {
-                d->instr = d->Ra == b1111 ? I_SMUAD : I_SMLAD;
-            }
-            return 0;
-
-        case I_SMLSLD:
-            d->RdHi = (w >> 16) & b1111;
-            d->RdLo = (w >> 12) & b1111;
-            d->Rm = (w >> 8) & b1111;
-            d->M = (w >> 5) & 1;
-            d->Rn = w & b1111;
-
-            // if the 6th bit is zero, then this is in fact the SMLALD
-            // instruction
-            if(((w >> 6) & 1) == 0) {
-                d->instr = I_SMLALD;
-            }
-            return 0;
-
-        case I_SMLA:
-            d->Rd = (w >> 16) & b1111;
-            d->Ra = (w >> 12) & b1111;
-            d->Rm = (w >> 8) & b1111;
-            d->M  = (w >> 6) & 1;
-            d->N  = (w >> 5) & 1;
-            d->Rn = w & b1111;
-            return 0;
-
-        case I_SMLAL:
-            d->RdHi = (w >> 16) & b1111;
-            d->RdLo = (w >> 12) & b1111;
-            d->Rm = (w >> 8) & b1111;
-            d->M  = (w >> 6) & 1;
-            d->N  = (w >> 5) & 1;
-            d->Rn = w & b1111;
-            return 0;
-
-        case I_SMUL:
-            // SMUL overlaps with SMC, so we define SMUL in SMC..
-            break;
+    case H_SMUSD: case H_SMUAD:
+        d->Rd = (w >> 16) & b1111;
+        d->Ra = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->M  = (w >> 5) & 1;
+        d->Rn = w & b1111;
+
+        // SMUSD and SMUAD with an Ra operand are the SMLSD and SMLAD
+        // instructions, although SMUSD looks at Rn instead
+        if(e->handler == H_SMUSD && d->Rn != b1111) {
+            d->instr = I_SMLSD;
         }
+        else if(e->handler == H_SMUAD && d->Ra != b1111) {
+            d->instr = I_SMLAD;
+        }
+        return 0;
 
-    case T_ARM_PAS:
-        // we have a lookup table with size 64, for all parallel signed and
-        // unsigned addition and subtraction instructions
-        // the upper three bits are represented by bits 20..22, so we only
-        // right-shift those 17 bytes, the lower three bits are represented
-        // by bits 5..7
-        d->instr = type_pas_instr_lookup[((w >> 17) & b111000) |
-                                         ((w >> 5) & b111)];
-        if(d->instr == I_INVLD) return -1;
+    case H_SMLSLD:
+        d->RdHi = (w >> 16) & b1111;
+        d->RdLo = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->M = (w >> 5) & 1;
+        d->Rn = w & b1111;
+        return 0;
 
-        d->Rn = (w >> 16) & b1111;
-        d->Rd = (w >> 12) & b1111;
-        d->Rm = w & b1111;
+    case H_SMLA:
+        d->Rd = (w >> 16) & b1111;
+        d->Ra = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->M  = (w >> 6) & 1;
+        d->N  = (w >> 5) & 1;
+        d->Rn = w & b1111;
+        return 0;
+
+    case H_SMLAL:
+        d->RdHi = (w >> 16) & b1111;
+        d->RdLo = (w >> 12) & b1111;
+        d->Rm = (w >> 8) & b1111;
+        d->M  = (w >> 6) & 1;
+        d->N  = (w >> 5) & 1;
+        d->Rn = w & b1111;
         return 0;
 
-    case T_ARM_MVCR:
+    case H_CDP:
+        d->opc1 = (w >> 20) & b1111;
+        d->CRd = (w >> 12) & b1111;
         d->CRn = (w >> 16) & b1111;
         d->coproc = (w >> 8) & b1111;
         d->opc2 = (w >> 5) & b111;
         d->CRm = w & b1111;
+        return 0;
 
-        if(((w >> 4) & 1) == 0) {
-            d->instr = I_CDP;
-            d->opc1 = (w >> 20) & b1111;
-            d->CRd = (w >> 12) & b1111;
-        }
-        else {
-            d->opc1 = (w >> 21) & b111;
-            d->Rt = (w >> 12) & b1111;
-        }
+    case H_MCR:
+        d->opc1 = (w >> 21) & b111;
+        d->Rt = (w >> 12) & b1111;
+        d->CRn = (w >> 16) & b1111;
+        d->coproc = (w >> 8) & b1111;
+        d->opc2 = (w >> 5) & b111;
+        d->CRm = w & b1111;
         return 0;
 
-    case T_ARM_UDF:
+    case H_UDF:
         d->I = B_SET;
         d->imm = (w & b1111) | ((w >> 4) & (BITMSK_12 << 4));
         return 0;
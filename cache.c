@@ -0,0 +1,231 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include "darm.h"
+
+// cache keys consist of the instruction set in the upper 32 bits and the
+// instruction word(s) in the lower 32 bits
+#define KEY_ARMV7  0
+#define KEY_THUMB  1
+#define KEY_THUMB2 2
+#define KEY_COUNT  3
+
+// entries are referenced by their index plus one, zero means "no entry"
+#define NONE 0
+
+typedef struct _darm_cache_entry_t {
+    uint64_t    key;
+    int         ret;
+    darm_t      d;
+
+    // next entry in the hash bucket
+    uint32_t    chain;
+
+    // previous (more recently used) and next (less recently used) entry
+    uint32_t    prev, next;
+} darm_cache_entry_t;
+
+// each instruction set has its own least recently used list, and its own
+// capacity entries in the entries array, the hash buckets are shared
+typedef struct _darm_cache_lru_t {
+    uint32_t    count;
+
+    // most recently and least recently used entry
+    uint32_t    head, tail;
+} darm_cache_lru_t;
+
+struct _darm_cache_t {
+    uint32_t    capacity, mask;
+    uint32_t    *buckets;
+    darm_cache_entry_t *entries;
+
+    darm_cache_lru_t lru[KEY_COUNT];
+
+    uint64_t    hits, misses;
+};
+
+#define ENTRY(c, idx) (&(c)->entries[(idx) - 1])
+
+static uint32_t _hash(const darm_cache_t *c, uint64_t key)
+{
+    return (uint32_t)((key * 0x9e3779b97f4a7c15ULL) >> 32) & c->mask;
+}
+
+darm_cache_t *darm_cache_create(uint32_t capacity)
+{
+    if(capacity == 0 || capacity >= 0x80000000 / KEY_COUNT) return NULL;
+
+    darm_cache_t *c = (darm_cache_t *) calloc(1, sizeof(darm_cache_t));
+    if(c == NULL) return NULL;
+
+    // a power of two amount of buckets, at least as many as entries
+    uint32_t buckets = 1;
+    while (buckets < capacity * KEY_COUNT) buckets <<= 1;
+
+    c->capacity = capacity;
+    c->mask = buckets - 1;
+    c->buckets = (uint32_t *) calloc(buckets, sizeof(uint32_t));
+    c->entries = (darm_cache_entry_t *)
+        malloc(capacity * KEY_COUNT * sizeof(darm_cache_entry_t));
+
+    if(c->buckets == NULL || c->entries == NULL) {
+        darm_cache_destroy(c);
+        return NULL;
+    }
+    return c;
+}
+
+void darm_cache_destroy(darm_cache_t *c)
+{
+    if(c == NULL) return;
+
+    free(c->buckets);
+    free(c->entries);
+    free(c);
+}
+
+void darm_cache_clear(darm_cache_t *c)
+{
+    memset(c->buckets, 0, (c->mask + 1) * sizeof(uint32_t));
+    memset(c->lru, 0, sizeof(c->lru));
+    c->hits = c->misses = 0;
+}
+
+void darm_cache_stats(const darm_cache_t *c, uint64_t *hits,
+    uint64_t *misses)
+{
+    if(hits != NULL) *hits = c->hits;
+    if(misses != NULL) *misses = c->misses;
+}
+
+static void _unlink(darm_cache_t *c, darm_cache_lru_t *l, uint32_t idx)
+{
+    darm_cache_entry_t *e = ENTRY(c, idx);
+
+    if(e->prev != NONE) ENTRY(c, e->prev)->next = e->next;
+    else l->head = e->next;
+
+    if(e->next != NONE) ENTRY(c, e->next)->prev = e->prev;
+    else l->tail = e->prev;
+}
+
+static void _push_front(darm_cache_t *c, darm_cache_lru_t *l, uint32_t idx)
+{
+    darm_cache_entry_t *e = ENTRY(c, idx);
+
+    e->prev = NONE, e->next = l->head;
+    if(l->head != NONE) ENTRY(c, l->head)->prev = idx;
+    else l->tail = idx;
+    l->head = idx;
+}
+
+// looks up an entry, on a hit the decoded instruction is copied to d
+static int _lookup(darm_cache_t *c, uint64_t key, darm_t *d, int *ret)
+{
+    for (uint32_t idx = c->buckets[_hash(c, key)]; idx != NONE;
+            idx = ENTRY(c, idx)->chain) {
+        darm_cache_entry_t *e = ENTRY(c, idx);
+        if(e->key != key) continue;
+
+        darm_cache_lru_t *l = &c->lru[key >> 32];
+        if(l->head != idx) {
+            _unlink(c, l, idx);
+            _push_front(c, l, idx);
+        }
+
+        *d = e->d, *ret = e->ret;
+        c->hits++;
+        return 1;
+    }
+
+    c->misses++;
+    return 0;
+}
+
+// stores a decoded instruction, evicting the least recently used entry of
+// the same instruction set if its part of the cache is full
+static void _insert(darm_cache_t *c, uint64_t key, const darm_t *d, int ret)
+{
+    darm_cache_lru_t *l = &c->lru[key >> 32]; uint32_t idx;
+
+    if(l->count < c->capacity) {
+        idx = (uint32_t)(key >> 32) * c->capacity + ++l->count;
+    }
+    else {
+        idx = l->tail;
+        _unlink(c, l, idx);
+
+        // remove the evicted entry from its hash bucket
+        uint32_t *ptr = &c->buckets[_hash(c, ENTRY(c, idx)->key)];
+        while (*ptr != idx) ptr = &ENTRY(c, *ptr)->chain;
+        *ptr = ENTRY(c, idx)->chain;
+    }
+
+    darm_cache_entry_t *e = ENTRY(c, idx);
+    e->key = key, e->d = *d, e->ret = ret;
+
+    uint32_t *bucket = &c->buckets[_hash(c, key)];
+    e->chain = *bucket, *bucket = idx;
+    _push_front(c, l, idx);
+}
+
+int darm_cache_armv7_disasm(darm_cache_t *c, darm_t *d, uint32_t w)
+{
+    uint64_t key = ((uint64_t) KEY_ARMV7 << 32) | w; int ret;
+    if(_lookup(c, key, d, &ret) != 0) return ret;
+
+    ret = darm_armv7_disasm(d, w);
+    _insert(c, key, d, ret);
+    return ret;
+}
+
+int darm_cache_thumb_disasm(darm_cache_t *c, darm_t *d, uint16_t w)
+{
+    uint64_t key = ((uint64_t) KEY_THUMB << 32) | w; int ret;
+    if(_lookup(c, key, d, &ret) != 0) return ret;
+
+    ret = darm_thumb_disasm(d, w);
+    _insert(c, key, d, ret);
+    return ret;
+}
+
+int darm_cache_thumb2_disasm(darm_cache_t *c, darm_t *d, uint16_t w,
+    uint16_t w2)
+{
+    uint64_t key = ((uint64_t) KEY_THUMB2 << 32) | ((uint32_t) w << 16) | w2;
+    int ret;
+    if(_lookup(c, key, d, &ret) != 0) return ret;
+
+    ret = darm_thumb2_disasm(d, w, w2);
+    _insert(c, key, d, ret);
+    return ret;
+}
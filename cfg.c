@@ -0,0 +1,571 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include "darm.h"
+#include "darm-internal.h"
+
+// how an instruction, and thereby a run or block, passes on control
+#define F_NONE  0   // no known successors, e.g., a return
+#define F_FALL  1   // the next instruction only
+#define F_JUMP  2   // the destination only
+#define F_COND  3   // the destination, if taken, or the next instruction
+#define F_CALL  4   // the destination, which returns to the next instruction
+#define F_NEXT  5   // not a branch at all
+
+#define BIT_GET(map, off) (((map)[(off) >> 6] >> (((off) >> 1) & 31)) & 1)
+#define BIT_SET(map, off) ((map)[(off) >> 6] |= 1u << (((off) >> 1) & 31))
+
+// the instructions decoded from an entry point or branch destination up to
+// and including the first branch, call or return, or up to the first
+// instruction that had already been decoded - this is the expensive part
+// of building the cfg, so runs are kept around for the next darm_cfg_build
+typedef struct _run_t {
+    uint32_t    off, end;
+    uint32_t    target;     // destination, including the Thumb bit
+    uint8_t     mode, flow;
+} run_t;
+
+struct _darm_cfg_t {
+    const uint8_t *buf;
+    size_t      len;
+    uint32_t    addr;
+
+    // a bit per halfword for each mode, marking the first halfword of every
+    // decoded instruction, and the first instruction of every block
+    uint32_t    *decoded[2], *leader[2];
+
+    // offsets that still have to be decoded, with the mode in the least
+    // significant bit
+    uint32_t    *work;
+    size_t      work_count, work_max;
+
+    // the first run_sorted runs are sorted by mode and offset
+    run_t       *runs;
+    size_t      run_count, run_max, run_sorted;
+
+    darm_block_t *blocks;
+    size_t      block_count, block_max;
+
+    darm_edge_t *edges;
+    size_t      edge_count, edge_max;
+};
+
+// makes room for at least one more element
+static int _grow(void **ptr, size_t *max, size_t count, size_t size)
+{
+    if(count < *max) return 0;
+
+    size_t n = *max != 0 ? *max * 2 : 1024;
+    void *p = realloc(*ptr, n * size);
+    if(p == NULL) return -1;
+
+    *ptr = p, *max = n;
+    return 0;
+}
+
+static inline uint32_t _load16(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8);
+}
+
+static inline uint32_t _load32(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8) | (buf[2] << 16) |
+        ((uint32_t) buf[3] << 24);
+}
+
+// size of the Thumb or Thumb2 instruction at off, based on its first
+// halfword (see also darm_disasm)
+static inline uint32_t _thumb_size(const darm_cfg_t *cfg, uint32_t off)
+{
+    return (_load16(&cfg->buf[off]) >> 11) >= b11101 ? 4 : 2;
+}
+
+darm_cfg_t *darm_cfg_create(const uint8_t *buf, size_t len, uint32_t addr)
+{
+    if(len > UINT32_MAX) return NULL;
+
+    darm_cfg_t *cfg = (darm_cfg_t *) calloc(1, sizeof(darm_cfg_t));
+    if(cfg == NULL) return NULL;
+
+    cfg->buf = buf, cfg->len = len, cfg->addr = addr;
+
+    size_t words = len / 64 + 1;
+    for (uint32_t mode = M_ARMV7; mode <= M_THUMB; mode++) {
+        cfg->decoded[mode] = (uint32_t *) calloc(words, sizeof(uint32_t));
+        cfg->leader[mode] = (uint32_t *) calloc(words, sizeof(uint32_t));
+
+        if(cfg->decoded[mode] == NULL || cfg->leader[mode] == NULL) {
+            darm_cfg_destroy(cfg);
+            return NULL;
+        }
+    }
+    return cfg;
+}
+
+void darm_cfg_destroy(darm_cfg_t *cfg)
+{
+    if(cfg == NULL) return;
+
+    for (uint32_t mode = M_ARMV7; mode <= M_THUMB; mode++) {
+        free(cfg->decoded[mode]);
+        free(cfg->leader[mode]);
+    }
+    free(cfg->work);
+    free(cfg->runs);
+    free(cfg->blocks);
+    free(cfg->edges);
+    free(cfg);
+}
+
+// turns an address, including the Thumb bit, into an offset into the
+// buffer, returns -1 if it lies outside of the buffer or is misaligned
+static int64_t _offset(const darm_cfg_t *cfg, uint32_t addr)
+{
+    uint32_t mode = addr & 1, off = (addr & ~1) - cfg->addr;
+
+    if(mode == M_ARMV7 && (addr & 3) != 0) return -1;
+    if((addr & ~1) < cfg->addr || off >= cfg->len) return -1;
+    return off;
+}
+
+// marks addr as the start of a block and queues it, unless it's been
+// decoded already
+static int _queue(darm_cfg_t *cfg, uint32_t addr)
+{
+    int64_t off = _offset(cfg, addr);
+    if(off < 0) return -1;
+
+    uint32_t mode = addr & 1;
+    BIT_SET(cfg->leader[mode], off);
+    if(BIT_GET(cfg->decoded[mode], off) != 0) return 0;
+
+    if(_grow((void **) &cfg->work, &cfg->work_max, cfg->work_count,
+            sizeof(uint32_t)) < 0) {
+        return -2;
+    }
+    cfg->work[cfg->work_count++] = (uint32_t) off | mode;
+    return 0;
+}
+
+int darm_cfg_add_entry(darm_cfg_t *cfg, uint32_t addr)
+{
+    return _queue(cfg, addr) == 0 ? 0 : -1;
+}
+
+// decodes the instruction at off, returns its size, or zero if it doesn't
+// decode or has been cut off
+static uint32_t _decode(const darm_cfg_t *cfg, darm_t *d, uint32_t off,
+    uint32_t mode)
+{
+    const uint8_t *buf = &cfg->buf[off];
+
+    if(mode == M_ARMV7) {
+        if(off + 4 > cfg->len) return 0;
+        return darm_armv7_disasm(d, _load32(buf)) < 0 ? 0 : 4;
+    }
+
+    if(off + 2 > cfg->len) return 0;
+
+    uint32_t size = _thumb_size(cfg, off);
+    if(size == 2) {
+        return darm_thumb_disasm(d, _load16(buf)) < 0 ? 0 : 2;
+    }
+
+    if(off + 4 > cfg->len) return 0;
+    return darm_thumb2_disasm(d, _load16(buf), _load16(buf + 2)) < 0 ? 0 : 4;
+}
+
+// whether the instruction writes PC, other than a branch
+static int _writes_pc(const darm_t *d)
+{
+    switch ((uint32_t) d->instr) {
+    case I_POP: case I_LDM: case I_LDMDA: case I_LDMDB: case I_LDMIB:
+        return (d->reglist >> PC) & 1 || d->Rt == PC;
+
+    case I_LDR:
+        return d->Rt == PC;
+
+    // the Thumb2 encodings of these have Rd set to 0b1111
+    case I_CMP: case I_CMN: case I_TST: case I_TEQ:
+        return 0;
+
+    default:
+        return d->Rd == PC;
+    }
+}
+
+// how the instruction at addr passes on control and, for direct branches,
+// its destination
+static uint32_t _flow(const darm_cfg_t *cfg, const darm_t *d, uint32_t addr,
+    uint32_t mode, uint32_t *target)
+{
+    // the value of PC as seen by the instruction
+    uint32_t pc = addr + (mode == M_ARMV7 ? 8 : 4);
+
+    switch ((uint32_t) d->instr) {
+    case I_B:
+        *target = (pc + d->imm) | mode;
+        return F_JUMP;
+
+    case I_CBZ: case I_CBNZ:
+        *target = (pc + d->imm) | mode;
+        return F_COND;
+
+    case I_BL:
+        *target = (pc + d->imm) | mode;
+        return F_CALL;
+
+    case I_BLX:
+        // only the immediate form has a known destination, which is in the
+        // other instruction set
+        if(d->I != B_SET) return F_FALL;
+
+        *target = mode == M_ARMV7 ? (pc + d->imm) | M_THUMB :
+            (pc & ~3) + d->imm;
+        return F_CALL;
+
+    case I_BX: case I_BXJ: case I_TBB: case I_TBH:
+        return F_NONE;
+
+    case I_UDF:
+        return F_NONE;
+    }
+
+    if(_writes_pc(d) == 0) return F_NEXT;
+
+    // a load from a literal pool, e.g., the "ldr pc, [pc, #-4]" of a veneer,
+    // of which the destination is known if the literal lies within buf
+    if(d->instr == I_LDR && d->Rn == PC && d->I == B_SET &&
+            d->W != B_SET) {
+        uint32_t literal = d->U == B_SET ? (pc & ~3) + d->imm :
+            (pc & ~3) - d->imm;
+
+        int64_t off = _offset(cfg, literal);
+        if(off >= 0 && off + 4 <= (int64_t) cfg->len) {
+            *target = _load32(&cfg->buf[off]);
+            return F_JUMP;
+        }
+    }
+    return F_NONE;
+}
+
+// decodes a run of instructions starting at off
+static int _walk(darm_cfg_t *cfg, uint32_t off, uint32_t mode)
+{
+    run_t run = {off, off, 0, mode, F_NONE};
+    uint32_t it = 0, flow, size;
+    darm_t d;
+
+    while (1) {
+        // continues in a block that's been decoded already
+        if(run.end != off && BIT_GET(cfg->decoded[mode], run.end) != 0) {
+            BIT_SET(cfg->leader[mode], run.end);
+            run.flow = F_FALL;
+            break;
+        }
+
+        size = _decode(cfg, &d, run.end, mode);
+        if(size == 0) break;
+
+        BIT_SET(cfg->decoded[mode], run.end);
+        flow = _flow(cfg, &d, cfg->addr + run.end, mode, &run.target);
+        run.end += size;
+
+        // whether the instruction is executed conditionally, in Thumb
+        // that's either a conditional branch or anything in an IT block
+        int cond = mode == M_ARMV7 ?
+            d.cond != C_AL && d.cond != C_UNCOND :
+            it != 0 || (d.instr == I_B && d.cond != C_AL);
+
+        if(it != 0) it--;
+
+        // the amount of instructions in the IT block, i.e., four minus the
+        // amount of trailing zeroes of the mask
+        if(d.instr == I_IT && d.mask != 0) {
+            it = 4;
+            while ((d.mask & (1 << (4 - it))) == 0) it--;
+        }
+
+        if(flow == F_NEXT) continue;
+
+        if(cond != 0) {
+            flow = flow == F_JUMP ? F_COND : flow == F_NONE ? F_FALL : flow;
+        }
+        run.flow = flow;
+        break;
+    }
+
+    // not even the first instruction could be decoded
+    if(run.end == off) return 0;
+
+    if(_grow((void **) &cfg->runs, &cfg->run_max, cfg->run_count,
+            sizeof(run_t)) < 0) {
+        return -1;
+    }
+    cfg->runs[cfg->run_count++] = run;
+
+    if(run.flow != F_NONE && run.flow != F_FALL) {
+        if(_queue(cfg, run.target) == -2) return -1;
+    }
+    if(run.flow == F_FALL || run.flow == F_COND || run.flow == F_CALL) {
+        if(_queue(cfg, (cfg->addr + run.end) | mode) == -2) return -1;
+    }
+    return 0;
+}
+
+static int _run_cmp(const void *a, const void *b)
+{
+    const run_t *x = (const run_t *) a, *y = (const run_t *) b;
+    if(x->mode != y->mode) return x->mode < y->mode ? -1 : 1;
+    return x->off < y->off ? -1 : x->off > y->off;
+}
+
+static int _block_cmp(const void *a, const void *b)
+{
+    const darm_block_t *x = (const darm_block_t *) a;
+    const darm_block_t *y = (const darm_block_t *) b;
+    if(x->mode != y->mode) return x->mode < y->mode ? -1 : 1;
+    return x->addr < y->addr ? -1 : x->addr > y->addr;
+}
+
+// index of the block starting at addr, including the Thumb bit
+static uint32_t _block_index(const darm_cfg_t *cfg, uint32_t addr)
+{
+    darm_block_t key;
+    key.addr = addr & ~1, key.mode = (darm_mode_t)(addr & 1);
+
+    const darm_block_t *b = (const darm_block_t *) bsearch(&key,
+        cfg->blocks, cfg->block_count, sizeof(darm_block_t), _block_cmp);
+    return b != NULL ? (uint32_t)(b - cfg->blocks) : DARM_CFG_NONE;
+}
+
+static int _add_block(darm_cfg_t *cfg, const run_t *run, uint32_t off,
+    uint32_t end, uint32_t count, uint32_t flow)
+{
+    if(_grow((void **) &cfg->blocks, &cfg->block_max, cfg->block_count,
+            sizeof(darm_block_t)) < 0) {
+        return -1;
+    }
+
+    // until the edges are added, edges and edge_count hold the destination
+    // and the flow of the last instruction
+    darm_block_t *b = &cfg->blocks[cfg->block_count++];
+    b->addr = cfg->addr + off, b->size = end - off, b->count = count;
+    b->mode = (darm_mode_t) run->mode;
+    b->edges = run->target, b->edge_count = flow;
+    return 0;
+}
+
+static int _add_edge(darm_cfg_t *cfg, uint32_t src, uint32_t addr,
+    darm_edge_kind_t kind)
+{
+    if(_grow((void **) &cfg->edges, &cfg->edge_max, cfg->edge_count,
+            sizeof(darm_edge_t)) < 0) {
+        return -1;
+    }
+
+    darm_edge_t *e = &cfg->edges[cfg->edge_count++];
+    e->src = src, e->dst = DARM_CFG_NONE, e->addr = addr, e->kind = kind;
+    return 0;
+}
+
+// sorts the runs that have been added since the last call and merges them
+// with the ones that were sorted already
+static int _sort_runs(darm_cfg_t *cfg)
+{
+    size_t left = cfg->run_sorted, right = cfg->run_count - left;
+    if(right == 0) return 0;
+
+    qsort(&cfg->runs[left], right, sizeof(run_t), _run_cmp);
+
+    if(left != 0 && _run_cmp(&cfg->runs[left-1], &cfg->runs[left]) > 0) {
+        run_t *tmp = (run_t *) malloc(left * sizeof(run_t));
+        if(tmp == NULL) return -1;
+
+        memcpy(tmp, cfg->runs, left * sizeof(run_t));
+
+        // merge from the front, the output never overtakes the new runs
+        size_t x = 0, y = left, out = 0;
+        while (x < left && y < cfg->run_count) {
+            if(_run_cmp(&tmp[x], &cfg->runs[y]) <= 0) {
+                cfg->runs[out++] = tmp[x++];
+            }
+            else {
+                cfg->runs[out++] = cfg->runs[y++];
+            }
+        }
+        while (x < left) cfg->runs[out++] = tmp[x++];
+        free(tmp);
+    }
+
+    cfg->run_sorted = cfg->run_count;
+    return 0;
+}
+
+// splits the runs into blocks at every leader and connects them
+static int _link(darm_cfg_t *cfg)
+{
+    cfg->block_count = cfg->edge_count = 0;
+
+    if(_sort_runs(cfg) < 0) return -1;
+
+    for (size_t idx = 0; idx < cfg->run_count; idx++) {
+        const run_t *run = &cfg->runs[idx];
+        uint32_t start = run->off, off = run->off, count = 0;
+
+        // only the first halfword of each instruction is needed to find
+        // the next one, which is a lot cheaper than decoding it again
+        while (off != run->end) {
+            if(off != start && BIT_GET(cfg->leader[run->mode], off) != 0) {
+                if(_add_block(cfg, run, start, off, count, F_FALL) < 0) {
+                    return -1;
+                }
+                start = off, count = 0;
+            }
+
+            off += run->mode == M_ARMV7 ? 4 : _thumb_size(cfg, off);
+            count++;
+        }
+
+        if(_add_block(cfg, run, start, off, count, run->flow) < 0) {
+            return -1;
+        }
+    }
+
+    // runs don't overlap, unless code is decoded at different offsets, so
+    // the blocks are usually in order already
+    for (size_t idx = 1; idx < cfg->block_count; idx++) {
+        if(_block_cmp(&cfg->blocks[idx-1], &cfg->blocks[idx]) > 0) {
+            qsort(cfg->blocks, cfg->block_count, sizeof(darm_block_t),
+                _block_cmp);
+            break;
+        }
+    }
+
+    for (uint32_t idx = 0; idx < cfg->block_count; idx++) {
+        darm_block_t *b = &cfg->blocks[idx];
+        uint32_t target = b->edges, flow = b->edge_count;
+        uint32_t next = (b->addr + b->size) | b->mode;
+
+        b->edges = cfg->edge_count;
+
+        int ret = 0;
+        switch (flow) {
+        case F_FALL:
+            ret = _add_edge(cfg, idx, next, EDGE_FALLTHROUGH);
+            break;
+
+        case F_JUMP:
+            ret = _add_edge(cfg, idx, target, EDGE_BRANCH);
+            break;
+
+        case F_COND:
+            ret = _add_edge(cfg, idx, target, EDGE_CONDITIONAL) |
+                _add_edge(cfg, idx, next, EDGE_FALLTHROUGH);
+            break;
+
+        case F_CALL:
+            ret = _add_edge(cfg, idx, target, EDGE_CALL) |
+                _add_edge(cfg, idx, next, EDGE_FALLTHROUGH);
+            break;
+        }
+        if(ret < 0) return -1;
+
+        b->edge_count = cfg->edge_count - b->edges;
+    }
+
+    for (size_t idx = 0; idx < cfg->edge_count; idx++) {
+        darm_edge_t *e = &cfg->edges[idx];
+        const darm_block_t *next = &cfg->blocks[e->src + 1];
+
+        // most of the time, the next instruction starts the next block
+        if(e->kind == EDGE_FALLTHROUGH && e->src + 1 < cfg->block_count &&
+                (next->addr | next->mode) == e->addr) {
+            e->dst = e->src + 1;
+        }
+        else {
+            e->dst = _block_index(cfg, e->addr);
+        }
+    }
+    return 0;
+}
+
+int darm_cfg_build(darm_cfg_t *cfg)
+{
+    while (cfg->work_count != 0) {
+        uint32_t off = cfg->work[--cfg->work_count], mode = off & 1;
+
+        off &= ~1;
+        if(BIT_GET(cfg->decoded[mode], off) != 0) continue;
+
+        if(_walk(cfg, off, mode) < 0) return -1;
+    }
+    return _link(cfg);
+}
+
+const darm_block_t *darm_cfg_blocks(const darm_cfg_t *cfg, size_t *count)
+{
+    *count = cfg->block_count;
+    return cfg->blocks;
+}
+
+const darm_edge_t *darm_cfg_edges(const darm_cfg_t *cfg, size_t *count)
+{
+    *count = cfg->edge_count;
+    return cfg->edges;
+}
+
+uint32_t darm_cfg_block_at(const darm_cfg_t *cfg, uint32_t addr)
+{
+    uint32_t mode = addr & 1, lo = 0, hi = cfg->block_count;
+    addr &= ~1;
+
+    // the first block that starts after addr
+    while (lo < hi) {
+        uint32_t mid = lo + (hi - lo) / 2;
+        const darm_block_t *b = &cfg->blocks[mid];
+
+        if(b->mode < mode || (b->mode == mode && b->addr <= addr)) {
+            lo = mid + 1;
+        }
+        else {
+            hi = mid;
+        }
+    }
+
+    if(lo == 0) return DARM_CFG_NONE;
+
+    const darm_block_t *b = &cfg->blocks[lo - 1];
+    if(b->mode != mode || addr - b->addr >= b->size) return DARM_CFG_NONE;
+    return lo - 1;
+}
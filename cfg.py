@@ -0,0 +1,144 @@
+"""
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+
+Control-flow graphs of the code reachable from a set of entry points.
+
+A linear sweep (darm.disasm_buffer) decodes literal pools and jump tables
+as if they were instructions, and can't tell where ARMv7 code ends and
+Thumb code begins. CFG decodes recursively instead, following branches,
+calls and ARMv7/Thumb interworking from the entry points, and splits the
+reached code into basic blocks. All decoding is done natively (see
+darm_cfg_build in darm.h), and every instruction is decoded only once, also
+when entry points are added later on.
+
+Addresses with the least significant bit set are Thumb code, like the
+operand of BX.
+
+    from darm.cfg import CFG
+
+    cfg = CFG(data, [0x8000, reset_handler | 1], base_addr=0x8000)
+    for block in cfg.blocks:
+        print block, [cfg.blocks[e.dst] for e in cfg.successors(block)
+                      if e.dst != darm.CFG_NONE]
+
+"""
+from ctypes import byref, c_size_t, memmove, sizeof
+
+import darm
+
+
+class CFG(object):
+    """Control-flow graph of (part of) an image.
+
+    blocks is a ctypes array of darm.Block objects, sorted by mode and then
+    by address, and edges a ctypes array of darm.Edge objects, grouped by
+    the block they leave. Both are replaced by build().
+
+    """
+
+    def __init__(self, data, entries=(), base_addr=0):
+        self._cfg = None
+
+        # the native cfg references the buffer, so it has to stay around
+        self._buf = darm._buffer(data)
+        self._cfg = darm._lib.darm_cfg_create(self._buf, len(self._buf),
+                                              base_addr)
+        if not self._cfg:
+            raise MemoryError('unable to allocate the control-flow graph')
+
+        self.base_addr = base_addr
+        self.blocks, self.edges = (darm.Block * 0)(), (darm.Edge * 0)()
+        self._predecessors = None
+
+        for addr in entries:
+            self.add_entry(addr)
+        self.build()
+
+    def close(self):
+        """Releases the native control-flow graph."""
+        if self._cfg:
+            darm._lib.darm_cfg_destroy(self._cfg)
+            self._cfg = None
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add_entry(self, addr):
+        """Queues an entry point, it's decoded by the next build()."""
+        if darm._lib.darm_cfg_add_entry(self._cfg, addr) < 0:
+            raise ValueError('entry point 0x%08x is not within the image '
+                             'or misaligned' % addr)
+
+    def build(self):
+        """Decodes the code reached from the queued entry points."""
+        if darm._lib.darm_cfg_build(self._cfg) < 0:
+            raise MemoryError('unable to build the control-flow graph')
+
+        self.blocks = self._copy(darm._lib.darm_cfg_blocks, darm.Block)
+        self.edges = self._copy(darm._lib.darm_cfg_edges, darm.Edge)
+        self._predecessors = None
+
+    def _copy(self, fn, cls):
+        """Copies an array owned by the native cfg into a ctypes array."""
+        count = c_size_t()
+        ptr = fn(self._cfg, byref(count))
+
+        ret = (cls * count.value)()
+        if count.value:
+            memmove(ret, ptr, count.value * sizeof(cls))
+        return ret
+
+    def index(self, addr):
+        """Index of the block containing addr, or None."""
+        idx = darm._lib.darm_cfg_block_at(self._cfg, addr)
+        return idx if idx != darm.CFG_NONE else None
+
+    def block_at(self, addr):
+        """The block containing addr, or None."""
+        idx = self.index(addr)
+        return self.blocks[idx] if idx is not None else None
+
+    def successors(self, block):
+        """The edges leaving a block."""
+        return self.edges[block.edges:block.edges + block.edge_count]
+
+    def predecessors(self, block):
+        """The edges entering a block."""
+        if self._predecessors is None:
+            self._predecessors = [[] for _ in range(len(self.blocks))]
+            for edge in self.edges:
+                if edge.dst != darm.CFG_NONE:
+                    self._predecessors[edge.dst].append(edge)
+
+        return self._predecessors[self.index(block.addr | block.mode)]
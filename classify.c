@@ -0,0 +1,376 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <string.h>
+#include "darm.h"
+#include "darm-internal.h"
+
+// the score of an instruction is given per halfword, so that ARMv7 and
+// Thumb instructions of different sizes add up to comparable window scores
+#define SCORE_MAX       16
+#define SCORE_INVLD     (-64)
+
+// the percentage of SCORE_MAX a window has to reach to be code
+#define THRESHOLD       85
+
+// a window is only Thumb code if at least one in FLOW_RATIO instructions is
+// a branch, call, return or stack operation
+#define FLOW_RATIO      96
+
+// the amount of ARMv7 instructions decoded by darm_armv7_columns at once
+#define BLOCK           256
+
+#define CELLS_MAX       (DARM_CLASSIFY_WINDOW_MAX / DARM_CLASSIFY_STEP)
+
+// how an instruction is rated, ordinary instructions are neither common
+// nor rare
+#define P_ORDINARY      0
+#define P_COMMON        1
+#define P_RARE          2
+#define P_FLOW          4
+
+static const int32_t g_weight[] = {
+    [P_ORDINARY] = SCORE_MAX / 2,
+    [P_COMMON] = SCORE_MAX,
+    [P_RARE] = 0,
+};
+
+// the instructions a compiler emits all the time, and the ones it emits
+// hardly ever, if at all, e.g., coprocessor and ThumbEE instructions or the
+// parallel arithmetic of the media extension
+static const uint8_t g_plausible[I_INSTRCNT] = {
+    [I_B] = P_COMMON | P_FLOW, [I_BL] = P_COMMON | P_FLOW,
+    [I_BLX] = P_COMMON | P_FLOW, [I_BX] = P_COMMON | P_FLOW,
+    [I_CBZ] = P_COMMON | P_FLOW, [I_CBNZ] = P_COMMON | P_FLOW,
+    [I_PUSH] = P_COMMON | P_FLOW, [I_POP] = P_COMMON | P_FLOW,
+    [I_TBB] = P_COMMON | P_FLOW, [I_TBH] = P_COMMON | P_FLOW,
+    [I_IT] = P_COMMON | P_FLOW,
+
+    [I_ADC] = P_COMMON, [I_ADD] = P_COMMON, [I_ADDW] = P_COMMON,
+    [I_ADR] = P_COMMON, [I_AND] = P_COMMON, [I_ASR] = P_COMMON,
+    [I_BFC] = P_COMMON, [I_BFI] = P_COMMON, [I_BIC] = P_COMMON,
+    [I_CLZ] = P_COMMON, [I_CMN] = P_COMMON, [I_CMP] = P_COMMON,
+    [I_DMB] = P_COMMON, [I_EOR] = P_COMMON, [I_LDM] = P_COMMON,
+    [I_LDMDB] = P_COMMON, [I_LDR] = P_COMMON, [I_LDRB] = P_COMMON,
+    [I_LDRD] = P_COMMON, [I_LDREX] = P_COMMON, [I_LDRH] = P_COMMON,
+    [I_LDRSB] = P_COMMON, [I_LDRSH] = P_COMMON, [I_LSL] = P_COMMON,
+    [I_LSR] = P_COMMON, [I_MLA] = P_COMMON, [I_MLS] = P_COMMON,
+    [I_MOV] = P_COMMON, [I_MOVT] = P_COMMON, [I_MOVW] = P_COMMON,
+    [I_MUL] = P_COMMON, [I_MVN] = P_COMMON, [I_NEG] = P_COMMON,
+    [I_NOP] = P_COMMON, [I_ORN] = P_COMMON, [I_ORR] = P_COMMON,
+    [I_REV] = P_COMMON, [I_ROR] = P_COMMON, [I_RSB] = P_COMMON,
+    [I_SBC] = P_COMMON, [I_SBFX] = P_COMMON, [I_SDIV] = P_COMMON,
+    [I_SMULL] = P_COMMON, [I_STM] = P_COMMON, [I_STMDB] = P_COMMON,
+    [I_STR] = P_COMMON, [I_STRB] = P_COMMON, [I_STRD] = P_COMMON,
+    [I_STREX] = P_COMMON, [I_STRH] = P_COMMON, [I_SUB] = P_COMMON,
+    [I_SUBW] = P_COMMON, [I_SXTB] = P_COMMON, [I_SXTH] = P_COMMON,
+    [I_TEQ] = P_COMMON, [I_TST] = P_COMMON, [I_UBFX] = P_COMMON,
+    [I_UDIV] = P_COMMON, [I_UMLAL] = P_COMMON, [I_UMULL] = P_COMMON,
+    [I_UXTB] = P_COMMON, [I_UXTH] = P_COMMON,
+
+    [I_BKPT] = P_RARE, [I_BXJ] = P_RARE, [I_CDP] = P_RARE,
+    [I_CDP2] = P_RARE, [I_CHKA] = P_RARE, [I_CPS] = P_RARE,
+    [I_DBG] = P_RARE, [I_ENTERX] = P_RARE, [I_HB] = P_RARE,
+    [I_HBL] = P_RARE, [I_HBLP] = P_RARE, [I_HBP] = P_RARE,
+    [I_LDC] = P_RARE, [I_LDC2] = P_RARE, [I_LDRBT] = P_RARE,
+    [I_LDRHT] = P_RARE, [I_LDRSBT] = P_RARE, [I_LDRSHT] = P_RARE,
+    [I_LDRT] = P_RARE, [I_LEAVEX] = P_RARE, [I_MCR] = P_RARE,
+    [I_MCR2] = P_RARE, [I_MCRR] = P_RARE, [I_MCRR2] = P_RARE,
+    [I_MRC] = P_RARE, [I_MRC2] = P_RARE, [I_MRRC] = P_RARE,
+    [I_MRRC2] = P_RARE, [I_QADD16] = P_RARE, [I_QADD8] = P_RARE,
+    [I_QASX] = P_RARE, [I_QSAX] = P_RARE, [I_QSUB16] = P_RARE,
+    [I_QSUB8] = P_RARE, [I_RFE] = P_RARE, [I_SADD16] = P_RARE,
+    [I_SADD8] = P_RARE, [I_SASX] = P_RARE, [I_SEL] = P_RARE,
+    [I_SETEND] = P_RARE, [I_SHADD16] = P_RARE, [I_SHADD8] = P_RARE,
+    [I_SHASX] = P_RARE, [I_SHSAX] = P_RARE, [I_SHSUB16] = P_RARE,
+    [I_SHSUB8] = P_RARE, [I_SMC] = P_RARE, [I_SRS] = P_RARE,
+    [I_SSAX] = P_RARE, [I_SSUB16] = P_RARE, [I_SSUB8] = P_RARE,
+    [I_STC] = P_RARE, [I_STC2] = P_RARE, [I_STRBT] = P_RARE,
+    [I_STRHT] = P_RARE, [I_STRT] = P_RARE, [I_SWP] = P_RARE,
+    [I_SWPB] = P_RARE, [I_UADD16] = P_RARE, [I_UADD8] = P_RARE,
+    [I_UASX] = P_RARE, [I_UDF] = P_RARE, [I_UHADD16] = P_RARE,
+    [I_UHADD8] = P_RARE, [I_UHASX] = P_RARE, [I_UHSAX] = P_RARE,
+    [I_UHSUB16] = P_RARE, [I_UHSUB8] = P_RARE, [I_UQADD16] = P_RARE,
+    [I_UQADD8] = P_RARE, [I_UQASX] = P_RARE, [I_UQSAX] = P_RARE,
+    [I_UQSUB16] = P_RARE, [I_UQSUB8] = P_RARE, [I_USAD8] = P_RARE,
+    [I_USADA8] = P_RARE, [I_USAX] = P_RARE, [I_USUB16] = P_RARE,
+    [I_USUB8] = P_RARE,
+};
+
+// how much of the score of an ARMv7 instruction remains given its
+// condition, in sixteenths, the bulk of ARMv7 code is executed always
+static const int32_t g_cond[16] = {
+    [C_EQ] = 12, [C_NE] = 12, [C_CS] = 8, [C_CC] = 8, [C_MI] = 8,
+    [C_PL] = 8, [C_VS] = 8, [C_VC] = 8, [C_HI] = 8, [C_LS] = 8,
+    [C_GE] = 8, [C_LT] = 8, [C_GT] = 8, [C_LE] = 8, [C_AL] = 16,
+    [C_UNCOND] = 8,
+};
+
+// the scores of a single step of the image for either instruction set
+typedef struct _cell_t {
+    int32_t score[2];
+    uint32_t insns[2];
+    uint32_t flow[2];
+    uint32_t size;
+} cell_t;
+
+// state of the ARMv7 instructions, which are decoded a block at a time
+typedef struct _armv7_t {
+    size_t off, count;
+    uint16_t instr[BLOCK];
+    uint8_t instr_type[BLOCK], cond[BLOCK];
+    int8_t Rd[BLOCK], Rn[BLOCK], Rm[BLOCK], shift_type[BLOCK];
+    uint32_t imm[BLOCK];
+} armv7_t;
+
+// whether an undecodable ARMv7 instruction is a VFP or Advanced SIMD
+// instruction, which darm doesn't decode (yet), but which are perfectly
+// plausible, i.e., a coprocessor instruction of coprocessor 10 or 11, or
+// an instruction of the unconditional Advanced SIMD encodings
+static int _simd_armv7(uint32_t w)
+{
+    if((w >> 28) != C_UNCOND) {
+        return (w & 0x0c000e00) == 0x0c000a00;
+    }
+    return (w & 0xfe000000) == 0xf2000000 || (w & 0xff100000) == 0xf4000000;
+}
+
+// same for Thumb2, of which the Advanced SIMD encodings are those of ARMv7
+// with bits 28 and 24 swapped
+static int _simd_thumb(uint16_t w, uint16_t w2)
+{
+    if((w & 0xec00) == 0xec00 && (w & 0x0300) != 0x0300) {
+        return (w2 & 0x0e00) == 0x0a00;
+    }
+    return (w & 0xef00) == 0xef00 || (w & 0xff10) == 0xf900;
+}
+
+static int32_t _score(darm_instr_t instr, uint32_t *flow)
+{
+    if(instr == I_INVLD) return SCORE_INVLD;
+
+    *flow += (g_plausible[instr] & P_FLOW) != 0;
+    return g_weight[g_plausible[instr] & ~P_FLOW];
+}
+
+// scores the ARMv7 instructions in the step [off, off + size)
+static void _cell_armv7(cell_t *c, armv7_t *a, const uint8_t *buf,
+    size_t len, size_t off, size_t size)
+{
+    for (size_t end = off + size; off + 4 <= len && off < end; off += 4) {
+        // decode the next block of instructions
+        if(off >= a->off + a->count * 4) {
+            darm_columns_t cols = {
+                a->instr, a->instr_type, a->cond, a->Rd, a->Rn, a->Rm,
+                a->shift_type, a->imm,
+            };
+            size_t count = (len - off) / 4;
+            a->off = off;
+            a->count = darm_armv7_columns(&cols, buf + off,
+                (count < BLOCK ? count : BLOCK) * 4);
+        }
+
+        size_t idx = (off - a->off) / 4;
+        uint32_t w = buf[off] | (buf[off+1] << 8) |
+            (buf[off+2] << 16) | ((uint32_t) buf[off+3] << 24);
+
+        c->insns[M_ARMV7]++;
+
+        // zeroes and erased flash decode just fine, but aren't code
+        if(w == 0 || w == 0xffffffff) continue;
+
+        int32_t score = a->instr[idx] == I_INVLD && _simd_armv7(w) ?
+            g_weight[P_ORDINARY] : _score(a->instr[idx], &c->flow[M_ARMV7]);
+        if(score > 0) {
+            score = score * g_cond[a->cond[idx] & 15] / 16;
+        }
+        c->score[M_ARMV7] += 2 * score;
+    }
+}
+
+// scores the Thumb instructions starting in the step [*off, end), the
+// instructions are walked from the start of the image onwards, like
+// darm_disasm_buffer would
+static void _cell_thumb(cell_t *c, const uint8_t *buf, size_t len,
+    size_t *off, size_t end)
+{
+    darm_t d;
+
+    while (*off < end && *off + 2 <= len) {
+        uint16_t w = buf[*off] | (buf[*off+1] << 8), w2 = 0;
+
+        uint32_t size = (w >> 11) >= b11101 ? 2 : 1;
+        if(size == 2) {
+            // the Thumb2 instruction has been cut off
+            if(*off + 4 > len) break;
+
+            w2 = buf[*off+2] | (buf[*off+3] << 8);
+        }
+        *off += size * 2;
+
+        c->insns[M_THUMB]++;
+
+        // zeroes and erased flash decode just fine, but aren't code
+        if(w == 0 || w == 0xffff) continue;
+
+        // the unconditional 16-bit branch is also what the upper halfword
+        // of most ARMv7 instructions, those with condition C_AL, decodes to
+        // as Thumb, so it's merely an ordinary instruction in Thumb
+        if((w >> 11) == b11100) {
+            c->score[M_THUMB] += g_weight[P_ORDINARY];
+            c->flow[M_THUMB]++;
+        }
+        else if(darm_disasm(&d, w, w2, 1) != 0) {
+            c->score[M_THUMB] += size * _score(d.instr, &c->flow[M_THUMB]);
+        }
+        else if(size == 2 && _simd_thumb(w, w2) != 0) {
+            c->score[M_THUMB] += size * g_weight[P_ORDINARY];
+        }
+        else {
+            c->score[M_THUMB] += size * SCORE_INVLD;
+        }
+    }
+}
+
+// the percentage of SCORE_MAX the instructions of a window reach
+static uint32_t _percent(const cell_t *sum, darm_mode_t mode)
+{
+    if(sum->score[mode] <= 0 || (mode == M_THUMB &&
+            sum->flow[mode] * FLOW_RATIO < sum->insns[mode])) {
+        return 0;
+    }
+
+    int32_t percent = sum->score[mode] * 100 /
+        (int32_t) (SCORE_MAX * sum->size / 2);
+    return percent < 100 ? percent : 100;
+}
+
+// writes a segment to out[idx] if it fits, turning the summed up scores of
+// its steps into averages, returns the amount of segments so far
+static size_t _flush(darm_segment_t *out, size_t count, size_t idx,
+    darm_segment_t *s)
+{
+    uint32_t steps = (s->size + DARM_CLASSIFY_STEP - 1) / DARM_CLASSIFY_STEP;
+
+    s->armv7 /= steps;
+    s->thumb /= steps;
+
+    if(idx < count) {
+        out[idx] = *s;
+    }
+    return idx + 1;
+}
+
+size_t darm_classify(darm_segment_t *out, size_t count, const uint8_t *buf,
+    size_t len, uint32_t addr, uint32_t window)
+{
+    cell_t cells[CELLS_MAX], sum = {{0}};
+    darm_segment_t seg = {0};
+    size_t thumb = 0, idx = 0;
+    armv7_t armv7;
+
+    armv7.off = armv7.count = 0;
+
+    // the window is rounded to steps, and centered around each step
+    if(window > DARM_CLASSIFY_WINDOW_MAX) {
+        window = DARM_CLASSIFY_WINDOW_MAX;
+    }
+
+    size_t width = window > DARM_CLASSIFY_STEP ?
+        window / DARM_CLASSIFY_STEP : 1, half = width / 2;
+    size_t steps = (len + DARM_CLASSIFY_STEP - 1) / DARM_CLASSIFY_STEP;
+
+    for (size_t step = 0; step < steps + width - half - 1; step++) {
+        cell_t *c = &cells[step % width];
+
+        // the step which leaves the window
+        if(step >= width) {
+            for (uint32_t mode = M_ARMV7; mode <= M_THUMB; mode++) {
+                sum.score[mode] -= c->score[mode];
+                sum.insns[mode] -= c->insns[mode];
+                sum.flow[mode] -= c->flow[mode];
+            }
+            sum.size -= c->size;
+        }
+
+        // the step which enters the window
+        memset(c, 0, sizeof(*c));
+        if(step < steps) {
+            size_t off = step * DARM_CLASSIFY_STEP;
+            c->size = len - off < DARM_CLASSIFY_STEP ?
+                len - off : DARM_CLASSIFY_STEP;
+
+            _cell_armv7(c, &armv7, buf, len, off, c->size);
+            _cell_thumb(c, buf, len, &thumb, off + c->size);
+
+            for (uint32_t mode = M_ARMV7; mode <= M_THUMB; mode++) {
+                sum.score[mode] += c->score[mode];
+                sum.insns[mode] += c->insns[mode];
+                sum.flow[mode] += c->flow[mode];
+            }
+            sum.size += c->size;
+        }
+
+        // classify the step in the center of the window
+        if(step < width - half - 1) continue;
+
+        size_t center = step - (width - half - 1);
+        uint32_t score[2] = {
+            _percent(&sum, M_ARMV7), _percent(&sum, M_THUMB),
+        };
+
+        darm_region_t region = REGION_DATA;
+        if(score[M_ARMV7] >= THRESHOLD || score[M_THUMB] >= THRESHOLD) {
+            region = score[M_ARMV7] >= score[M_THUMB] ?
+                REGION_ARMV7 : REGION_THUMB;
+        }
+
+        // consecutive steps of the same region make up a segment
+        if(seg.size != 0 && seg.region != region) {
+            idx = _flush(out, count, idx, &seg);
+            seg.size = 0;
+        }
+
+        if(seg.size == 0) {
+            seg.addr = addr + center * DARM_CLASSIFY_STEP;
+            seg.region = region;
+            seg.armv7 = seg.thumb = 0;
+        }
+
+        seg.size += cells[center % width].size;
+        seg.armv7 += score[M_ARMV7];
+        seg.thumb += score[M_THUMB];
+    }
+
+    if(seg.size != 0) {
+        idx = _flush(out, count, idx, &seg);
+    }
+    return idx;
+}
@@ -0,0 +1,514 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <string.h>
+#include "darm.h"
+#include "darm-internal.h"
+#include "armv7-tbl.h"
+
+#if defined(__GNUC__) && defined(__x86_64__)
+#define DARM_X86_64
+#include <immintrin.h>
+#endif
+
+#define BITMSK_12 ((1 << 12) - 1)
+#define BITMSK_24 ((1 << 24) - 1)
+
+// what a template looks like, i.e., which columns an operand extraction
+// routine of armv7_disas_cond fills in, and how
+#define COL_VALID       (1u << 31)  // decoded without darm_armv7_disasm
+#define COL_COND        (1 << 0)    // cond, bits 28..31
+#define COL_RD          (1 << 1)    // Rd, bits 12..15
+#define COL_RN          (1 << 2)    // Rn, bits 16..19
+#define COL_RM          (1 << 3)    // Rm, bits 0..3
+#define COL_SHIFT_IMM   (1 << 4)    // shift type, bits 5..6, by immediate
+#define COL_SHIFT_REG   (1 << 5)    // shift type, bits 5..6, by register
+#define COL_IMM(kind)   ((kind) << 8)
+#define COL_CHECK(kind) ((kind) << 12)
+
+#define COL_REGULAR     (COL_VALID | COL_COND)
+
+// the different encodings of the immediate
+enum {
+    IMM_NONE, IMM_12, IMM_EXPAND, IMM_16, IMM_8, IMM_BRANCH, IMM_24,
+};
+
+// encodings which may turn out to be an alias of another instruction for
+// particular operands, e.g., ADD Rd, PC, #imm is ADR Rd, #imm, which is the
+// case only if (w & g_check_mask[kind]) == g_check_value[kind]
+enum {
+    CHK_NONE, CHK_ADR, CHK_PUSHPOP, CHK_SHIFT0, CHK_SP,
+};
+
+static const uint32_t g_check_mask[] = {
+    0, 0x001f0000, 0x000f0fff, 0x00000f80, 0x000f0000,
+};
+
+static const uint32_t g_check_value[] = {
+    1, 0x000f0000, 0x000d0004, 0x00000000, 0x000d0000,
+};
+
+// all other routines, e.g., those which take Rd from bits 16..19, have no
+// template and are always handed to darm_armv7_disasm
+static const uint32_t g_templates[H_HANDLERCNT] = {
+    [H_INVLD] = COL_VALID,
+    [H_ARITH_SHIFT_IMM] = COL_REGULAR | COL_RD | COL_RN | COL_RM |
+        COL_SHIFT_IMM,
+    [H_ARITH_SHIFT_REG] = COL_REGULAR | COL_RD | COL_RN | COL_RM |
+        COL_SHIFT_REG,
+    [H_ARITH_IMM] = COL_REGULAR | COL_RD | COL_RN | COL_IMM(IMM_EXPAND) |
+        COL_CHECK(CHK_ADR),
+    [H_CMP_OP_IMM] = COL_REGULAR | COL_RN | COL_RM | COL_SHIFT_IMM,
+    [H_CMP_OP_REG] = COL_REGULAR | COL_RN | COL_RM | COL_SHIFT_REG,
+    [H_CMP_IMM] = COL_REGULAR | COL_RN | COL_IMM(IMM_EXPAND),
+    [H_MOV_IMM] = COL_REGULAR | COL_RD | COL_IMM(IMM_EXPAND),
+    [H_MOVW] = COL_REGULAR | COL_RD | COL_IMM(IMM_16),
+    [H_MVN_IMM] = COL_REGULAR | COL_RD | COL_RM | COL_SHIFT_IMM,
+    [H_MVN_REG] = COL_REGULAR | COL_RD | COL_RM | COL_SHIFT_REG,
+    [H_DST_SRC_IMM] = COL_REGULAR | COL_RD | COL_RM | COL_SHIFT_IMM |
+        COL_CHECK(CHK_SHIFT0),
+    [H_STACK0_IMM] = COL_REGULAR | COL_RN | COL_IMM(IMM_12) |
+        COL_CHECK(CHK_PUSHPOP),
+    [H_STACK0_REG] = COL_REGULAR | COL_RN | COL_RM | COL_SHIFT_IMM,
+    [H_STACK1_IMM] = COL_REGULAR | COL_RN | COL_IMM(IMM_8),
+    [H_STACK1_REG] = COL_REGULAR | COL_RN | COL_RM,
+    [H_STACK2_IMM] = COL_REGULAR | COL_RN | COL_IMM(IMM_8),
+    [H_STACK2_REG] = COL_REGULAR | COL_RN | COL_RM,
+    [H_LDSTREGS] = COL_REGULAR | COL_RN | COL_CHECK(CHK_SP),
+    [H_SWP] = COL_REGULAR | COL_RN,
+    [H_LDREX] = COL_REGULAR | COL_RN,
+    [H_STREX] = COL_REGULAR | COL_RD | COL_RN,
+    [H_SAT] = COL_REGULAR | COL_RD | COL_RN | COL_RM,
+    [H_PAS] = COL_REGULAR | COL_RD | COL_RN | COL_RM,
+    [H_SEL] = COL_REGULAR | COL_RD | COL_RN | COL_RM,
+    [H_BITREV] = COL_REGULAR | COL_RD | COL_RM,
+    [H_CLZ] = COL_REGULAR | COL_RD | COL_RM,
+    [H_BX] = COL_REGULAR | COL_RM,
+    [H_BRANCH] = COL_REGULAR | COL_IMM(IMM_BRANCH),
+    [H_SVC] = COL_REGULAR | COL_IMM(IMM_24),
+};
+
+static int g_simd = -1;
+
+static void _columns_disasm(const darm_columns_t *out, size_t idx,
+    uint32_t w)
+{
+    darm_t d;
+    if(darm_armv7_disasm(&d, w) < 0) {
+        darm_init(&d);
+    }
+
+    out->instr[idx] = d.instr;
+    out->instr_type[idx] = d.instr_type;
+    out->cond[idx] = d.cond;
+    out->Rd[idx] = d.Rd;
+    out->Rn[idx] = d.Rn;
+    out->Rm[idx] = d.Rm;
+    out->shift_type[idx] = d.shift_type;
+    out->imm[idx] = d.imm;
+}
+
+static inline uint32_t _columns_imm(uint32_t w, uint32_t kind)
+{
+    uint32_t imm = w & 0xff, rotate = (w >> 7) & b11110;
+
+    switch (kind) {
+    case IMM_12:
+        return w & BITMSK_12;
+
+    case IMM_EXPAND:
+        return rotate == 0 ? imm : (imm >> rotate) | (imm << (32 - rotate));
+
+    case IMM_16:
+        return (w & BITMSK_12) | ((w >> 4) & 0xf000);
+
+    case IMM_8:
+        return ((w >> 4) & b11110000) | (w & b1111);
+
+    case IMM_BRANCH:
+        return (uint32_t) ((int32_t) (w << 8) >> 6);
+
+    case IMM_24:
+        return w & BITMSK_24;
+    }
+    return 0;
+}
+
+// the aliases of armv7_disas_cond, for instructions that passed the check of
+// their template, e.g., the Rn of ADD is already known to be PC
+static void _columns_alias(const darm_columns_t *out, size_t idx, uint32_t w)
+{
+    uint32_t P = (w >> 24) & 1, U = (w >> 23) & 1, W = (w >> 21) & 1;
+
+    switch (out->instr[idx]) {
+    case I_ADD: case I_SUB:
+        if(((w >> 20) & 1) == 0) {
+            out->instr[idx] = I_ADR;
+            out->Rn[idx] = R_INVLD;
+        }
+        break;
+
+    case I_STR:
+        if(P == 1 && U == 0 && W == 1) {
+            out->instr[idx] = I_PUSH;
+        }
+        break;
+
+    case I_LDR:
+        if(P == 0 && U == 1 && W == 0) {
+            out->instr[idx] = I_POP;
+        }
+        break;
+
+    case I_STMDB:
+        if(W == 1) {
+            out->instr[idx] = I_PUSH;
+        }
+        break;
+
+    case I_LDM:
+        if(W == 1) {
+            out->instr[idx] = I_POP;
+        }
+        break;
+
+    // only the LSL and ROR encodings without shift are aliases
+    case I_LSL:
+        out->instr[idx] = I_MOV;
+        break;
+
+    case I_ROR:
+        out->instr[idx] = I_RRX;
+        break;
+    }
+}
+
+static inline void _columns_word(const darm_columns_t *out, size_t idx,
+    uint32_t w)
+{
+    const armv7_dispatch_t *e =
+        &armv7_dispatch[((w >> 16) & 0xff0) | ((w >> 4) & b1111)];
+    uint32_t t = g_templates[e->handler], check = (t >> 12) & b111;
+
+    if((w >> 28) == C_UNCOND || t == 0) {
+        _columns_disasm(out, idx, w);
+        return;
+    }
+
+    out->instr[idx] = e->instr;
+    out->instr_type[idx] = e->instr_type;
+    out->cond[idx] = t & COL_COND ? w >> 28 : 0;
+    out->Rd[idx] = t & COL_RD ? (int32_t) ((w >> 12) & b1111) : R_INVLD;
+    out->Rn[idx] = t & COL_RN ? (int32_t) ((w >> 16) & b1111) : R_INVLD;
+    out->Rm[idx] = t & COL_RM ? (int32_t) (w & b1111) : R_INVLD;
+
+    // a shift by an immediate of zero with shift type LSL is no shift at
+    // all, see also darm_armv7_disasm
+    out->shift_type[idx] = S_INVLD;
+    if((t & COL_SHIFT_REG) || ((t & COL_SHIFT_IMM) && (w & 0xfe0) != 0)) {
+        out->shift_type[idx] = (w >> 5) & b11;
+    }
+
+    out->imm[idx] = _columns_imm(w, (t >> 8) & b111);
+
+    if((w & g_check_mask[check]) == g_check_value[check]) {
+        _columns_alias(out, idx, w);
+    }
+}
+
+static inline uint32_t _load32(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8) | (buf[2] << 16) |
+        ((uint32_t) buf[3] << 24);
+}
+
+static size_t _columns_scalar(const darm_columns_t *out, const uint8_t *buf,
+    size_t count)
+{
+    for (size_t idx = 0; idx < count; idx++) {
+        _columns_word(out, idx, _load32(&buf[idx * 4]));
+    }
+    return count;
+}
+
+#ifdef DARM_X86_64
+
+// lanes of t which have the given template flag(s) set
+#define FLAG4(t, flag) _mm_cmpeq_epi32(_mm_and_si128((t), \
+    _mm_set1_epi32(flag)), _mm_set1_epi32(flag))
+#define FLAG8(t, flag) _mm256_cmpeq_epi32(_mm256_and_si256((t), \
+    _mm256_set1_epi32(flag)), _mm256_set1_epi32(flag))
+
+// value in the lanes of m, and -1 (R_INVLD and S_INVLD) in the other lanes
+#define SELECT4(m, value) _mm_or_si128(_mm_and_si128((m), (value)), \
+    _mm_xor_si128((m), _mm_set1_epi32(-1)))
+#define SELECT8(m, value) _mm256_or_si256(_mm256_and_si256((m), (value)), \
+    _mm256_xor_si256((m), _mm256_set1_epi32(-1)))
+
+// stores four rows of columns, all of which fit in a signed byte, except
+// for instr and imm
+static inline void _store4(const darm_columns_t *out, size_t idx,
+    __m128i e, __m128i cond, __m128i Rd, __m128i Rn, __m128i Rm,
+    __m128i shift, __m128i imm)
+{
+    __m128i type = _mm_and_si128(_mm_srli_epi32(e, 8), _mm_set1_epi32(0xff));
+    __m128i instr = _mm_srli_epi32(e, 16);
+    uint32_t v[8];
+
+    _mm_storeu_si128((__m128i *) v, _mm_packs_epi16(
+        _mm_packs_epi32(type, cond), _mm_packs_epi32(Rd, Rn)));
+    _mm_storeu_si128((__m128i *) &v[4], _mm_packs_epi16(
+        _mm_packs_epi32(Rm, shift), _mm_setzero_si128()));
+    memcpy(&out->instr_type[idx], &v[0], 4);
+    memcpy(&out->cond[idx], &v[1], 4);
+    memcpy(&out->Rd[idx], &v[2], 4);
+    memcpy(&out->Rn[idx], &v[3], 4);
+    memcpy(&out->Rm[idx], &v[4], 4);
+    memcpy(&out->shift_type[idx], &v[5], 4);
+    _mm_storel_epi64((__m128i *) &out->instr[idx],
+        _mm_packs_epi32(instr, instr));
+    _mm_storeu_si128((__m128i *) &out->imm[idx], imm);
+}
+
+static size_t _columns_sse2(const darm_columns_t *out, const uint8_t *buf,
+    size_t count)
+{
+    const __m128i nibble = _mm_set1_epi32(b1111);
+    size_t idx = 0;
+
+    for (; idx + 4 <= count; idx += 4) {
+        __m128i w = _mm_loadu_si128((const __m128i *) &buf[idx * 4]);
+        uint32_t words[4], e[4], t[4], mask[4], value[4], expand[4];
+
+        // SSE2 has neither gathers nor shifts by a different amount per
+        // lane, so the table lookups and the rotation of the immediate are
+        // done one lane at a time
+        _mm_storeu_si128((__m128i *) words, w);
+        for (uint32_t lane = 0; lane < 4; lane++) {
+            uint32_t key = ((words[lane] >> 16) & 0xff0) |
+                ((words[lane] >> 4) & b1111);
+            memcpy(&e[lane], &armv7_dispatch[key], 4);
+            t[lane] = g_templates[e[lane] & 0xff];
+            mask[lane] = g_check_mask[(t[lane] >> 12) & b111];
+            value[lane] = g_check_value[(t[lane] >> 12) & b111];
+            expand[lane] = _columns_imm(words[lane], IMM_EXPAND);
+        }
+
+        __m128i T = _mm_loadu_si128((const __m128i *) t);
+        __m128i cond = _mm_srli_epi32(w, 28);
+        __m128i slow = _mm_or_si128(_mm_or_si128(
+            _mm_cmpeq_epi32(cond, _mm_set1_epi32(C_UNCOND)),
+            _mm_cmpeq_epi32(T, _mm_setzero_si128())),
+            _mm_cmpeq_epi32(_mm_and_si128(w,
+                _mm_loadu_si128((const __m128i *) mask)),
+                _mm_loadu_si128((const __m128i *) value)));
+
+        __m128i shifted = _mm_or_si128(FLAG4(T, COL_SHIFT_REG),
+            _mm_andnot_si128(_mm_cmpeq_epi32(_mm_and_si128(w,
+                _mm_set1_epi32(0xfe0)), _mm_setzero_si128()),
+                FLAG4(T, COL_SHIFT_IMM)));
+
+        __m128i kind = _mm_and_si128(_mm_srli_epi32(T, 8), _mm_set1_epi32(7));
+        __m128i imm = _mm_setzero_si128();
+#define IMM(k, value) imm = _mm_or_si128(imm, _mm_and_si128( \
+            _mm_cmpeq_epi32(kind, _mm_set1_epi32(k)), (value)))
+        IMM(IMM_12, _mm_and_si128(w, _mm_set1_epi32(BITMSK_12)));
+        IMM(IMM_EXPAND, _mm_loadu_si128((const __m128i *) expand));
+        IMM(IMM_16, _mm_or_si128(_mm_and_si128(w, _mm_set1_epi32(BITMSK_12)),
+            _mm_and_si128(_mm_srli_epi32(w, 4), _mm_set1_epi32(0xf000))));
+        IMM(IMM_8, _mm_or_si128(_mm_and_si128(w, nibble), _mm_and_si128(
+            _mm_srli_epi32(w, 4), _mm_set1_epi32(b11110000))));
+        IMM(IMM_BRANCH, _mm_srai_epi32(_mm_slli_epi32(w, 8), 6));
+        IMM(IMM_24, _mm_and_si128(w, _mm_set1_epi32(BITMSK_24)));
+#undef IMM
+
+        _store4(out, idx, _mm_loadu_si128((const __m128i *) e),
+            _mm_and_si128(cond, FLAG4(T, COL_COND)),
+            SELECT4(FLAG4(T, COL_RD),
+                _mm_and_si128(_mm_srli_epi32(w, 12), nibble)),
+            SELECT4(FLAG4(T, COL_RN),
+                _mm_and_si128(_mm_srli_epi32(w, 16), nibble)),
+            SELECT4(FLAG4(T, COL_RM), _mm_and_si128(w, nibble)),
+            SELECT4(shifted, _mm_and_si128(_mm_srli_epi32(w, 5),
+                _mm_set1_epi32(b11))), imm);
+
+        // redo the lanes which may be aliases, or which have no template
+        for (int lanes = _mm_movemask_ps(_mm_castsi128_ps(slow)), lane = 0;
+                lanes != 0; lanes >>= 1, lane++) {
+            if(lanes & 1) {
+                _columns_word(out, idx + lane, words[lane]);
+            }
+        }
+    }
+    return idx;
+}
+
+__attribute__((target("avx2")))
+static size_t _columns_avx2(const darm_columns_t *out, const uint8_t *buf,
+    size_t count)
+{
+    const __m256i nibble = _mm256_set1_epi32(b1111);
+    size_t idx = 0;
+
+    for (; idx + 8 <= count; idx += 8) {
+        __m256i w = _mm256_loadu_si256((const __m256i *) &buf[idx * 4]);
+
+        __m256i key = _mm256_or_si256(
+            _mm256_and_si256(_mm256_srli_epi32(w, 16),
+                _mm256_set1_epi32(0xff0)),
+            _mm256_and_si256(_mm256_srli_epi32(w, 4), nibble));
+        __m256i E = _mm256_i32gather_epi32((const int *) armv7_dispatch,
+            key, 4);
+        __m256i T = _mm256_i32gather_epi32((const int *) g_templates,
+            _mm256_and_si256(E, _mm256_set1_epi32(0xff)), 4);
+        __m256i check = _mm256_and_si256(_mm256_srli_epi32(T, 12),
+            _mm256_set1_epi32(b111));
+
+        __m256i cond = _mm256_srli_epi32(w, 28);
+        __m256i slow = _mm256_or_si256(_mm256_or_si256(
+            _mm256_cmpeq_epi32(cond, _mm256_set1_epi32(C_UNCOND)),
+            _mm256_cmpeq_epi32(T, _mm256_setzero_si256())),
+            _mm256_cmpeq_epi32(_mm256_and_si256(w,
+                _mm256_i32gather_epi32((const int *) g_check_mask, check, 4)),
+                _mm256_i32gather_epi32((const int *) g_check_value, check,
+                    4)));
+
+        __m256i shifted = _mm256_or_si256(FLAG8(T, COL_SHIFT_REG),
+            _mm256_andnot_si256(_mm256_cmpeq_epi32(_mm256_and_si256(w,
+                _mm256_set1_epi32(0xfe0)), _mm256_setzero_si256()),
+                FLAG8(T, COL_SHIFT_IMM)));
+
+        __m256i imm8 = _mm256_and_si256(w, _mm256_set1_epi32(0xff));
+        __m256i rotate = _mm256_and_si256(_mm256_srli_epi32(w, 7),
+            _mm256_set1_epi32(b11110));
+
+        // shifts by 32 or more result in zero
+        __m256i expand = _mm256_or_si256(_mm256_srlv_epi32(imm8, rotate),
+            _mm256_sllv_epi32(imm8, _mm256_sub_epi32(_mm256_set1_epi32(32),
+                rotate)));
+
+        __m256i kind = _mm256_and_si256(_mm256_srli_epi32(T, 8),
+            _mm256_set1_epi32(7));
+        __m256i imm = _mm256_setzero_si256();
+#define IMM(k, value) imm = _mm256_or_si256(imm, _mm256_and_si256( \
+            _mm256_cmpeq_epi32(kind, _mm256_set1_epi32(k)), (value)))
+        IMM(IMM_12, _mm256_and_si256(w, _mm256_set1_epi32(BITMSK_12)));
+        IMM(IMM_EXPAND, expand);
+        IMM(IMM_16, _mm256_or_si256(
+            _mm256_and_si256(w, _mm256_set1_epi32(BITMSK_12)),
+            _mm256_and_si256(_mm256_srli_epi32(w, 4),
+                _mm256_set1_epi32(0xf000))));
+        IMM(IMM_8, _mm256_or_si256(_mm256_and_si256(w, nibble),
+            _mm256_and_si256(_mm256_srli_epi32(w, 4),
+                _mm256_set1_epi32(b11110000))));
+        IMM(IMM_BRANCH, _mm256_srai_epi32(_mm256_slli_epi32(w, 8), 6));
+        IMM(IMM_24, _mm256_and_si256(w, _mm256_set1_epi32(BITMSK_24)));
+#undef IMM
+
+        __m256i col[7] = {
+            E, _mm256_and_si256(cond, FLAG8(T, COL_COND)),
+            SELECT8(FLAG8(T, COL_RD),
+                _mm256_and_si256(_mm256_srli_epi32(w, 12), nibble)),
+            SELECT8(FLAG8(T, COL_RN),
+                _mm256_and_si256(_mm256_srli_epi32(w, 16), nibble)),
+            SELECT8(FLAG8(T, COL_RM), _mm256_and_si256(w, nibble)),
+            SELECT8(shifted, _mm256_and_si256(_mm256_srli_epi32(w, 5),
+                _mm256_set1_epi32(b11))),
+            imm,
+        };
+
+        // the 128bit halves are narrowed and stored separately, as the
+        // AVX2 pack instructions don't cross them either
+        for (uint32_t half = 0; half < 2; half++) {
+            __m128i c[7];
+            for (uint32_t x = 0; x < 7; x++) {
+                c[x] = half == 0 ? _mm256_castsi256_si128(col[x]) :
+                    _mm256_extracti128_si256(col[x], 1);
+            }
+            _store4(out, idx + half * 4, c[0], c[1], c[2], c[3], c[4], c[5],
+                c[6]);
+        }
+
+        // redo the lanes which may be aliases, or which have no template
+        for (int lanes = _mm256_movemask_ps(_mm256_castsi256_ps(slow)),
+                lane = 0; lanes != 0; lanes >>= 1, lane++) {
+            if(lanes & 1) {
+                _columns_word(out, idx + lane,
+                    _load32(&buf[(idx + lane) * 4]));
+            }
+        }
+    }
+    return idx;
+}
+
+#endif
+
+darm_simd_t darm_columns_simd(darm_simd_t simd)
+{
+    darm_simd_t best = SIMD_NONE;
+
+#ifdef DARM_X86_64
+    // SSE2 is part of x86_64, AVX2 is not
+    best = __builtin_cpu_supports("avx2") ? SIMD_AVX2 : SIMD_SSE2;
+#endif
+
+    g_simd = simd < best ? simd : best;
+    return g_simd;
+}
+
+size_t darm_armv7_columns(const darm_columns_t *out, const uint8_t *buf,
+    size_t len)
+{
+    size_t count = len / 4, idx = 0;
+
+    if(g_simd < 0) {
+        darm_columns_simd(SIMD_AVX2);
+    }
+
+#ifdef DARM_X86_64
+    if(g_simd == SIMD_AVX2) {
+        idx = _columns_avx2(out, buf, count);
+    }
+    else if(g_simd == SIMD_SSE2) {
+        idx = _columns_sse2(out, buf, count);
+    }
+#endif
+
+    // the remaining instructions, or all of them
+    if(idx < count) {
+        darm_columns_t rest = {
+            &out->instr[idx], &out->instr_type[idx], &out->cond[idx],
+            &out->Rd[idx], &out->Rn[idx], &out->Rm[idx],
+            &out->shift_type[idx], &out->imm[idx],
+        };
+        _columns_scalar(&rest, &buf[idx * 4], count - idx);
+    }
+    return count;
+}
@@ -28,11 +28,11 @@ POSSIBILITY OF SUCH DAMAGE.
 */
 
 #include <stdio.h>
-#include <ctype.h>
 #include <stdint.h>
 #include <string.h>
 #include "darm.h"
 #include "darm-internal.h"
+#include "thumb2-tbl.h"
 
 #define APPEND(out, ptr) \
     do { \
@@ -107,7 +107,7 @@ int darm_disasm(darm_t *d, uint16_t w, uint16_t w2, uint32_t addr)
     }
 
     // magic table constructed based on section A6.1 of the ARM manual
-    static uint8_t is_thumb2[0x20] = {
+    static const uint8_t is_thumb2[0x20] = {
         [b11101] = 1,
         [b11110] = 1,
         [b11111] = 1,
@@ -134,7 +134,149 @@ int darm_disasm(darm_t *d, uint16_t w, uint16_t w2, uint32_t addr)
     }
 }
 
-int darm_str(const darm_t *d, darm_str_t *str)
+// decodes the instruction at offset off into d, instructions that could not
+// be disassembled are represented by their instruction word and I_INVLD,
+// returns the size of the instruction in bytes, or zero if fewer bytes
+// remain than the instruction requires
+static inline size_t _disasm_at(darm_t *d, const uint8_t *buf, size_t len,
+    size_t off, uint32_t addr, darm_mode_t mode)
+{
+    if(mode == M_ARMV7) {
+        if(off + 4 > len) return 0;
+
+        uint32_t w = buf[off] | (buf[off+1] << 8) |
+            (buf[off+2] << 16) | ((uint32_t) buf[off+3] << 24);
+
+        if(darm_armv7_disasm(d, w) < 0) {
+            darm_init(d);
+            d->w = w;
+        }
+        return 4;
+    }
+
+    if(off + 2 > len) return 0;
+
+    uint16_t w = buf[off] | (buf[off+1] << 8), w2 = 0;
+
+    // the amount of halfwords taken by this instruction, the upper five
+    // bits of a Thumb2 instruction are either 0b11101, 0b11110, or
+    // 0b11111 (see also darm_disasm)
+    uint32_t size = (w >> 11) >= b11101 ? 2 : 1;
+    if(size == 2) {
+        // the Thumb2 instruction has been cut off
+        if(off + 4 > len) return 0;
+
+        w2 = buf[off+2] | (buf[off+3] << 8);
+    }
+
+    if(darm_disasm(d, w, w2, (addr + off) | 1) == 0) {
+        darm_init(d);
+        d->w = size == 2 ? ((uint32_t) w << 16) | w2 : w;
+    }
+    return size * 2;
+}
+
+size_t darm_disasm_buffer(darm_t *out, uint32_t *addrs, size_t count,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_mode_t mode)
+{
+    size_t idx = 0, off = 0, size;
+
+    for (; idx < count; idx++, off += size) {
+        size = _disasm_at(&out[idx], buf, len, off, addr, mode);
+        if(size == 0) break;
+
+        if(addrs != NULL) {
+            addrs[idx] = addr + off;
+        }
+    }
+    return idx;
+}
+
+size_t darm_disasm_packed(darm_packed_t *out, uint32_t *addrs, size_t count,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_mode_t mode)
+{
+    size_t idx = 0, off = 0, size;
+    darm_t d;
+
+    for (; idx < count; idx++, off += size) {
+        size = _disasm_at(&d, buf, len, off, addr, mode);
+        if(size == 0) break;
+
+        // every instruction the decoders produce can be packed, but better
+        // safe than sorry
+        if(darm_pack(&out[idx], &d) < 0) {
+            uint32_t w = d.w;
+            darm_init(&d);
+            d.w = w;
+            darm_pack(&out[idx], &d);
+        }
+
+        if(addrs != NULL) {
+            addrs[idx] = addr + off;
+        }
+    }
+    return idx;
+}
+
+// whether idx is in a bitset of darm_scan
+#define BIT(set, idx) (((set)[(idx) / 32] >> ((idx) % 32)) & 1)
+
+size_t darm_scan(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, darm_scan_t callback, void *user,
+    const uint32_t *instrs, const uint32_t *types)
+{
+    size_t off = 0, size, count = 0;
+    darm_t d;
+
+    for (; (size = _disasm_at(&d, buf, len, off, addr, mode)) != 0;
+            off += size) {
+        if(instrs != NULL && BIT(instrs, d.instr) == 0) continue;
+        if(types != NULL && BIT(types, d.instr_type) == 0) continue;
+
+        count++;
+        if(callback != NULL && callback(&d, addr + off, user) != 0) break;
+    }
+    return count;
+}
+
+size_t darm_thumb_boundary(const uint8_t *buf, size_t len, size_t start,
+    size_t offset, size_t *count)
+{
+    size_t idx = 0;
+
+    while (start < offset && start + 2 <= len) {
+        uint16_t w = buf[start] | (buf[start+1] << 8);
+
+        // same instruction size logic as darm_disasm_buffer, a cut off
+        // Thumb2 instruction is not an instruction
+        size_t size = (w >> 11) >= b11101 ? 4 : 2;
+        if(start + size > len) break;
+
+        start += size, idx++;
+    }
+
+    if(count != NULL) {
+        *count = idx;
+    }
+    return start;
+}
+
+// the name of an immediate shift, see also darm_immshift_decode
+static const char *_immshift_name(const darm_t *d, int lowercase)
+{
+    // ROR #0 is RRX, which follows the four regular shift types
+    if(d->shift_type == S_ROR && d->Rs == R_INVLD && d->shift == 0) {
+        return darm_format_shifts[lowercase][4];
+    }
+    return darm_format_shifts[lowercase][d->shift_type];
+}
+
+static int _reglist(uint16_t reglist, char *out, const char **registers);
+
+// interprets the format program of an instruction, the output is produced
+// in lowercase right away if lowercase is set (to either 0 or 1), by taking
+// names from the lowercase tables and by setting the case bit of letters
+static int _darm_str(const darm_t *d, darm_str_t *str, int lowercase)
 {
     if(d->instr == I_INVLD || d->instr >= ARRAYSIZE(darm_mnemonics)) {
         return -1;
@@ -155,106 +297,118 @@ int darm_str(const darm_t *d, darm_str_t *str)
         str->arg[3], str->arg[4], str->arg[5],
     };
 
+    const char **registers = darm_format_registers[lowercase];
+    const char lc = lowercase != 0 ? 0x20 : 0;
+
+#define REGISTER(reg) \
+    ((uint32_t) (reg) < ARRAYSIZE(darm_registers) ? registers[reg] : NULL)
+
     // ptr to the output mnemonic
     char *mnemonic = str->mnemonic;
-    APPEND(mnemonic, darm_mnemonic_name(d->instr));
+    APPEND(mnemonic, darm_format_mnemonics[lowercase][d->instr]);
 
     char *shift = str->shift;
 
-    // there are a couple of instructions in the Thumb instruction set which
-    // do not have an equivalent in ARMv7, hence they'll not have an ARMv7
-    // format string - we handle these instructions in a hacky way for now..
-    switch (d->instr) {
-    case I_CPS:
-    case I_IT:
-        // TODO
-        return -1;
+    // the if-then instruction is followed by a then or else for each
+    // instruction after the first one, the amount of which is given by the
+    // lowest bit that is set in the mask
+    if(d->instr == I_IT) {
+        if(d->mask == 0 || (uint32_t) d->firstcond >= C_UNCOND) return -1;
+
+        for (uint32_t bit = 3; (d->mask & ((1 << bit) - 1)) != 0; bit--) {
+            *mnemonic++ = (((d->mask >> bit) & 1) == (d->firstcond & 1) ?
+                'T' : 'E') | lc;
+        }
 
-    case I_CBZ:
-    case I_CBNZ:
-        APPEND(args[arg], darm_register_name(d->Rn));
+        // the always condition is omitted in mnemonics, but not here
+        APPEND(args[arg], d->firstcond != C_AL ?
+            darm_format_conditions[lowercase][d->firstcond] :
+            lowercase != 0 ? "al" : "AL");
         arg++;
-        APPEND(args[arg], "#+");
-        args[arg] += _append_imm(args[arg], d->imm);
         goto finalize;
-
-    default:
-        break;
     }
 
-    const char **ptrs = armv7_format_strings[d->instr];
-    if(ptrs[0] == NULL) return -1;
+    // instructions which only exist in the Thumb and Thumb2 instruction sets
+    // have their own format programs, which are generated from the Thumb
+    // syntax of these instructions
+    const uint8_t **ptrs = armv7_format_programs[d->instr];
+    if(ptrs[0] == NULL) {
+        ptrs = thumb_format_programs[d->instr];
+        if(ptrs[0] == NULL) return -1;
+    }
 
-    for (char ch; (ch = ptrs[idx][off]) != 0; off++) {
-        switch (ch) {
-        case 's':
+    for (uint8_t op; (op = ptrs[idx][off]) != FMT_END; off++) {
+        switch ((darm_format_op_t) op) {
+        case FMT_S:
             if(d->S == B_SET) {
-                *mnemonic++ = 'S';
+                *mnemonic++ = 'S' | lc;
             }
             continue;
 
-        case 'c':
-            APPEND(mnemonic, darm_condition_name(d->cond, 1));
+        case FMT_COND:
+            if((uint32_t) d->cond < ARRAYSIZE(darm_format_conditions[0])) {
+                APPEND(mnemonic, darm_format_conditions[lowercase][d->cond]);
+            }
             continue;
 
-        case 'd':
+        case FMT_RD:
             if(d->Rd == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->Rd));
+            APPEND(args[arg], REGISTER(d->Rd));
             arg++;
             continue;
 
-        case 'n':
+        case FMT_RN:
             if(d->Rn == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->Rn));
+            APPEND(args[arg], REGISTER(d->Rn));
             arg++;
             continue;
 
-        case 'm':
+        case FMT_RM:
             if(d->Rm == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->Rm));
+            APPEND(args[arg], REGISTER(d->Rm));
             arg++;
             continue;
 
-        case 'a':
+        case FMT_RA:
             if(d->Ra == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->Ra));
+            APPEND(args[arg], REGISTER(d->Ra));
             arg++;
             continue;
 
-        case 't':
+        case FMT_RT:
             if(d->Rt == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->Rt));
+            APPEND(args[arg], REGISTER(d->Rt));
             arg++;
             continue;
 
-        case '2':
+        case FMT_RT2:
             // first check if Rt2 is actually set
             if(d->Rt2 != R_INVLD) {
-                APPEND(args[arg], darm_register_name(d->Rt2));
+                APPEND(args[arg], REGISTER(d->Rt2));
                 arg++;
                 continue;
             }
             // for some instructions, Rt2 = Rt + 1
             else if(d->Rt != R_INVLD) {
-                APPEND(args[arg], darm_register_name(d->Rt + 1));
+                APPEND(args[arg], REGISTER(d->Rt + 1));
                 arg++;
                 continue;
             }
             break;
 
-        case 'h':
+        case FMT_RDHI:
             if(d->RdHi == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->RdHi));
+            APPEND(args[arg], REGISTER(d->RdHi));
             arg++;
             continue;
 
-        case 'l':
+        case FMT_RDLO:
             if(d->RdLo == R_INVLD) break;
-            APPEND(args[arg], darm_register_name(d->RdLo));
+            APPEND(args[arg], REGISTER(d->RdLo));
             arg++;
             continue;
 
-        case 'i':
+        case FMT_IMM:
             // check if an immediate has been set
             if(d->I != B_SET) break;
 
@@ -263,7 +417,7 @@ int darm_str(const darm_t *d, darm_str_t *str)
             arg++;
             continue;
 
-        case 'S':
+        case FMT_SHIFT:
             // is there even a shift?
             if(d->shift_type == S_INVLD) continue;
 
@@ -283,7 +437,7 @@ int darm_str(const darm_t *d, darm_str_t *str)
                         break;
 
                     default:
-                        APPEND(shift, type);
+                        APPEND(shift, _immshift_name(d, lowercase));
                         *shift++ = ' ';
                     }
                     *shift++ = '#';
@@ -297,9 +451,9 @@ int darm_str(const darm_t *d, darm_str_t *str)
                 }
             }
             else {
-                APPEND(shift, darm_shift_type_name(d->shift_type));
+                APPEND(shift, darm_format_shifts[lowercase][d->shift_type]);
                 *shift++ = ' ';
-                APPEND(shift, darm_register_name(d->Rs));
+                APPEND(shift, REGISTER(d->Rs));
             }
 
             if(d->P == B_SET) {
@@ -312,73 +466,80 @@ int darm_str(const darm_t *d, darm_str_t *str)
             }
             continue;
 
-        case '!':
+        case FMT_WRITEBACK:
             if(d->W == B_SET) {
                 *args[arg-1]++ = '!';
             }
             continue;
 
-        case 'e':
+        case FMT_ENDIAN:
             args[arg] += _utoa(d->E, args[arg], 10);
             continue;
 
-        case 'x':
+        case FMT_X:
             if(d->M == B_SET) {
                 *mnemonic++ = 'x';
             }
             continue;
 
-        case 'X':
+        case FMT_XY:
             // if the flags are not set, then this instruction doesn't take
             // the (B|T)(B|T) postfix
             if(d->N == B_INVLD || d->M == B_INVLD) break;
 
-            *mnemonic++ = d->N == B_SET ? 'T' : 'B';
-            *mnemonic++ = d->M == B_SET ? 'T' : 'B';
+            *mnemonic++ = (d->N == B_SET ? 'T' : 'B') | lc;
+            *mnemonic++ = (d->M == B_SET ? 'T' : 'B') | lc;
+            continue;
+
+        case FMT_Y:
+            if(d->M == B_INVLD) break;
+
+            *mnemonic++ = (d->M == B_SET ? 'T' : 'B') | lc;
             continue;
 
-        case 'R':
+        case FMT_ROUND:
             if(d->R == B_SET) {
-                *mnemonic++ = 'R';
+                *mnemonic++ = 'R' | lc;
             }
             continue;
 
-        case 'T':
-            APPEND(mnemonic, d->T == B_SET ? "TB" : "BT");
+        case FMT_TB:
+            *mnemonic++ = (d->T == B_SET ? 'T' : 'B') | lc;
+            *mnemonic++ = (d->T == B_SET ? 'B' : 'T') | lc;
             continue;
 
-        case 'r':
+        case FMT_REGLIST:
             if(d->reglist != 0) {
-                args[arg] += darm_reglist(d->reglist, args[arg]);
+                args[arg] += _reglist(d->reglist, args[arg], registers);
             }
             else {
                 *args[arg]++ = '{';
-                APPEND(args[arg], darm_register_name(d->Rt));
+                APPEND(args[arg], REGISTER(d->Rt));
                 *args[arg]++ = '}';
             }
             continue;
 
-        case 'L':
+        case FMT_LSB:
             *args[arg]++ = '#';
             args[arg] += _utoa(d->lsb, args[arg], 10);
             arg++;
             continue;
 
-        case 'w':
+        case FMT_WIDTH:
             *args[arg]++ = '#';
             args[arg] += _utoa(d->width, args[arg], 10);
             arg++;
             continue;
 
-        case 'o':
+        case FMT_OPTION:
             *args[arg]++ = '#';
             args[arg] += _utoa(d->option, args[arg], 10);
             arg++;
             continue;
 
-        case 'B':
+        case FMT_BASE:
             *args[arg]++ = '[';
-            APPEND(args[arg], darm_register_name(d->Rn));
+            APPEND(args[arg], REGISTER(d->Rn));
 
             // if post-indexed or the index is not even set, then we close
             // the memory address
@@ -391,7 +552,7 @@ int darm_str(const darm_t *d, darm_str_t *str)
             }
             continue;
 
-        case 'O':
+        case FMT_OFFSET:
             // if the Rm operand is set, then this is about the Rm operand,
             // otherwise it's about the immediate
             if(d->Rm != R_INVLD) {
@@ -401,7 +562,7 @@ int darm_str(const darm_t *d, darm_str_t *str)
                     *args[arg]++ = '-';
                 }
 
-                APPEND(args[arg], darm_register_name(d->Rm));
+                APPEND(args[arg], REGISTER(d->Rm));
 
                 // if post-indexed this was a stand-alone operator one
                 if(d->P == B_UNSET) {
@@ -432,7 +593,7 @@ int darm_str(const darm_t *d, darm_str_t *str)
             }
             continue;
 
-        case 'b':
+        case FMT_LABEL:
             // BLX first checks for branch and only then for the conditional
             // version which takes the Rm as operand, so let's see if the
             // branch stuff has been initialized yet
@@ -453,20 +614,20 @@ int darm_str(const darm_t *d, darm_str_t *str)
             args[arg] += _append_imm(args[arg], imm);
             continue;
 
-        case 'M':
+        case FMT_MEMORY:
             *args[arg]++ = '[';
-            APPEND(args[arg], darm_register_name(d->Rn));
+            APPEND(args[arg], REGISTER(d->Rn));
 
             // if the Rm operand is defined, then we use that optionally with
             // a shift, otherwise there might be an immediate value as offset
             if(d->Rm != R_INVLD) {
                 APPEND(args[arg], ", ");
-                APPEND(args[arg], darm_register_name(d->Rm));
+                APPEND(args[arg], REGISTER(d->Rm));
 
                 const char *type; uint32_t imm;
                 if(darm_immshift_decode(d, &type, &imm) == 0) {
                     APPEND(args[arg], ", ");
-                    APPEND(args[arg], type);
+                    APPEND(args[arg], _immshift_name(d, lowercase));
                     APPEND(args[arg], " #");
                     args[arg] += _utoa(imm, args[arg], 10);
                 }
@@ -488,47 +649,49 @@ int darm_str(const darm_t *d, darm_str_t *str)
             }
             continue;
 
-        case 'A':
+        case FMT_ROTATE:
             if(d->rotate != 0) {
-                APPEND(args[arg], "ROR #");
+                APPEND(args[arg], darm_format_shifts[lowercase][S_ROR]);
+                APPEND(args[arg], " #");
                 args[arg] += _utoa(d->rotate, args[arg], 10);
             }
             continue;
 
-        case 'C':
+        case FMT_COPROC:
             args[arg] += _utoa(d->coproc, args[arg], 10);
             arg++;
             continue;
 
-        case 'p':
+        case FMT_OPC1:
             args[arg] += _utoa(d->opc1, args[arg], 10);
             arg++;
             continue;
 
-        case 'P':
+        case FMT_OPC2:
             args[arg] += _utoa(d->opc2, args[arg], 10);
             arg++;
             continue;
 
-        case 'N':
+        case FMT_CRN:
             APPEND(args[arg], "cr");
             args[arg] += _utoa(d->CRn, args[arg], 10);
             arg++;
             continue;
 
-        case 'J':
+        case FMT_CRM:
             APPEND(args[arg], "cr");
             args[arg] += _utoa(d->CRm, args[arg], 10);
             arg++;
             continue;
 
-        case 'I':
+        case FMT_CRD:
             APPEND(args[arg], "cr");
             args[arg] += _utoa(d->CRd, args[arg], 10);
             arg++;
             continue;
 
-        default:
+        case FMT_END:
+        case FMT_INVLD:
             return -1;
         }
 
@@ -560,23 +723,96 @@ finalize:
     return 0;
 }
 
+int darm_str(const darm_t *d, darm_str_t *str)
+{
+    return _darm_str(d, str, 0);
+}
+
 int darm_str2(const darm_t *d, darm_str_t *str, int lowercase)
 {
-    if(darm_str(d, str) < 0) {
-        return -1;
+    return _darm_str(d, str, lowercase != 0);
+}
+
+static char *_append_hex(char *out, uint32_t value, uint32_t digits)
+{
+    for (uint32_t idx = digits; idx != 0; idx--, value >>= 4) {
+        out[idx-1] = "0123456789abcdef"[value & 15];
     }
+    return out + digits;
+}
+
+size_t darm_render_listing(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, char *out, size_t outlen, uint32_t flags,
+    size_t *consumed)
+{
+    size_t off = 0, pos = 0;
+    darm_t d; darm_str_t str;
+
+    while (1) {
+        size_t size = _disasm_at(&d, buf, len, off, addr, mode);
+        if(size == 0) break;
+
+        const char *text = "(..)";
+        if(d.instr != I_INVLD) {
+            // some format strings read back operands which they didn't
+            // write, so the output only matches darm_str2 with a zeroed str
+            memset(&str, 0, sizeof(str));
+            if(_darm_str(&d, &str, (flags & L_LOWERCASE) != 0) == 0) {
+                text = str.total;
+            }
+        }
 
-    if(lowercase != 0) {
-        // just lowercase the entire object, including null-bytes
-        char *buf = (char *) str;
-        for (uint32_t i = 0; i < sizeof(darm_str_t); i++) {
-            buf[i] = tolower(buf[i]);
+        size_t textlen = strlen(text), linelen = textlen + 1;
+        if((flags & L_NOADDR) == 0) {
+            linelen += 9;
+        }
+        if((flags & L_NOWORDS) == 0) {
+            linelen += mode == M_ARMV7 ? 9 : 10;
+        }
+
+        // only complete lines are written
+        if(pos + linelen > outlen) break;
+
+        char *ptr = out + pos;
+        if((flags & L_NOADDR) == 0) {
+            ptr = _append_hex(ptr, addr + off, 8);
+            *ptr++ = ' ';
+        }
+        if((flags & L_NOWORDS) == 0) {
+            if(mode == M_ARMV7) {
+                ptr = _append_hex(ptr, d.w, 8);
+            }
+            else if(size == 4) {
+                ptr = _append_hex(ptr, d.w >> 16, 4);
+                *ptr++ = ' ';
+                ptr = _append_hex(ptr, d.w, 4);
+            }
+            else {
+                // pad Thumb instructions to the width of Thumb2 ones
+                ptr = _append_hex(ptr, d.w, 4);
+                memset(ptr, ' ', 5);
+                ptr += 5;
+            }
+            *ptr++ = ' ';
         }
+        memcpy(ptr, text, textlen);
+        ptr[textlen] = '\n';
+
+        pos += linelen, off += size;
     }
-    return 0;
+
+    if(consumed != NULL) {
+        *consumed = off;
+    }
+    return pos;
 }
 
 int darm_reglist(uint16_t reglist, char *out)
+{
+    return _reglist(reglist, out, darm_registers);
+}
+
+static int _reglist(uint16_t reglist, char *out, const char **registers)
 {
     char *base = out;
 
@@ -589,8 +825,8 @@ int darm_reglist(uint16_t reglist, char *out)
         int32_t reg, start = __builtin_ctz(reglist);
 
         // most registers have length two
-        *(uint16_t *) out = *(uint16_t *) darm_registers[start];
-        out[2] = darm_registers[start][2];
+        *(uint16_t *) out = *(uint16_t *) registers[start];
+        out[2] = registers[start][2];
         out += 2 + (out[2] != 0);
 
         for (reg = start; reg == __builtin_ctz(reglist); reg++) {
@@ -605,8 +841,8 @@ int darm_reglist(uint16_t reglist, char *out)
             // registers have been found, but we prefer the notation
             // {r0,r1} over {r0-r1} in that case
             *out++ = reg == start + 2 ? ',' : '-';
-            *(uint16_t *) out = *(uint16_t *) darm_registers[reg-1];
-            out[2] = darm_registers[reg-1][2];
+            *(uint16_t *) out = *(uint16_t *) registers[reg-1];
+            out[2] = registers[reg-1][2];
             out += 2 + (out[2] != 0);
         }
         *out++ = ',';
@@ -30,6 +30,7 @@ POSSIBILITY OF SUCH DAMAGE.
 #ifndef __DARM__
 #define __DARM__
 
+#include <stddef.h>
 #include "armv7-tbl.h"
 
 #ifndef ARRAYSIZE
@@ -83,6 +84,26 @@ typedef enum _darm_option_t {
     O_INVLD = -1,
 } darm_option_t;
 
+typedef enum _darm_mode_t {
+    // 32bit ARMv7 instructions
+    M_ARMV7 = 0,
+
+    // a stream of 16bit Thumb and 32bit Thumb2 instructions
+    M_THUMB = 1,
+} darm_mode_t;
+
+// flags for darm_render_listing
+typedef enum _darm_listing_t {
+    // mnemonics and registers in lowercase
+    L_LOWERCASE = 1,
+
+    // omit the address column
+    L_NOADDR = 2,
+
+    // omit the column with the instruction word(s)
+    L_NOWORDS = 4,
+} darm_listing_t;
+
 typedef struct _darm_t {
     // the original encoded instruction
     uint32_t        w;
@@ -206,6 +227,61 @@ typedef struct _darm_str_t {
     char total[64];
 } darm_str_t;
 
+//
+// Compact representation of a darm_t, e.g., to keep every instruction of a
+// large image in memory, which takes 24 rather than 180 bytes.
+//
+// Flags take two bits and registers take five bits, with -1 (i.e., R_INVLD)
+// meaning "no register". Operands that are never used by the same
+// instruction share their storage:
+//
+// - imm holds either the immediate, the reglist (PI_REGLIST), or the
+//   coprocessor operands (PI_COPROC), see imm_kind
+// - ext holds the operands named by ext_kind, from the least significant bit
+//   onwards: shift_type (3 bits), Rs (5), shift (6) and sat_imm (5) for
+//   PX_SHIFT, lsb (5), msb (5) and width (7) for PX_BITFIELD, firstcond (5)
+//   and mask (4) for PX_IT, rotate (5) for PX_ROTATE, or option (5) for
+//   PX_OPTION, signed values in two's complement
+//
+// darm_unpack turns a darm_packed_t back into the exact same darm_t.
+//
+typedef enum _darm_packed_imm_t {
+    PI_IMM, PI_REGLIST, PI_COPROC,
+} darm_packed_imm_t;
+
+typedef enum _darm_packed_ext_t {
+    PX_NONE, PX_SHIFT, PX_BITFIELD, PX_IT, PX_ROTATE, PX_OPTION,
+} darm_packed_ext_t;
+
+typedef struct _darm_packed_t {
+    uint32_t        w;
+
+    uint32_t        instr : 9;
+    uint32_t        instr_type : 7;
+    uint32_t        instr_imm_type : 7;
+    uint32_t        instr_flag_type : 7;
+    uint32_t        imm_kind : 2;
+
+    uint32_t        B : 2, S : 2, E : 2, M : 2, N : 2, U : 2, H : 2;
+    uint32_t        P : 2, R : 2, T : 2, W : 2, I : 2, D : 2;
+    int32_t         cond : 5;
+
+    int32_t         Rd : 5, Rn : 5, Rm : 5, Ra : 5, Rt : 5, Rt2 : 5;
+
+    union {
+        uint32_t    imm;
+        uint16_t    reglist;
+        struct {
+            uint32_t coproc : 4, opc1 : 4, opc2 : 3;
+            int32_t CRd : 5, CRn : 5, CRm : 5;
+        } coproc;
+    } imm;
+
+    int32_t         RdHi : 5, RdLo : 5;
+    uint32_t        ext_kind : 3;
+    uint32_t        ext : 19;
+} darm_packed_t;
+
 // reset a darm object, this function is internally called right before using
 // any of the disassemble routines, hence a user is normally not required to
 // call this function beforehand
@@ -243,6 +319,354 @@ int darm_thumb2_disasm(darm_t *d, uint16_t w, uint16_t w2);
 //
 int darm_disasm(darm_t *d, uint16_t w, uint16_t w2, uint32_t addr);
 
+//
+// Disassembles an entire buffer of little-endian instructions in one go.
+//
+// The instructions in buf are decoded according to mode, where the first
+// instruction is located at addr. At most count instructions are written to
+// out and, if addrs is not NULL, the address of each instruction is written
+// to addrs. Instructions that could not be disassembled are still written to
+// out, but with their instr member set to I_INVLD, so that the output keeps
+// describing the input buffer in its entirety.
+//
+// Decoding stops when fewer bytes remain than the next instruction requires.
+// Returns the amount of instructions that were written to out.
+//
+size_t darm_disasm_buffer(darm_t *out, uint32_t *addrs, size_t count,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_mode_t mode);
+
+// packs a darm_t, returns -1 if it can't be represented by a darm_packed_t
+int darm_pack(darm_packed_t *p, const darm_t *d);
+
+void darm_unpack(darm_t *d, const darm_packed_t *p);
+
+// darm_disasm_buffer, but writing darm_packed_t records
+size_t darm_disasm_packed(darm_packed_t *out, uint32_t *addrs, size_t count,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_mode_t mode);
+
+//
+// Calls callback for every instruction in a buffer of little-endian
+// instructions that passes the optional predicates, e.g., to find all SVC
+// instructions without materializing a darm_t per instruction.
+//
+// The instructions in buf are decoded like darm_disasm_buffer does, one at a
+// time into the same darm_t, which is passed to callback together with the
+// address of the instruction (and user). If callback returns non-zero the
+// scan is stopped.
+//
+// instrs and types are bitsets over darm_instr_t and darm_enctype_t, in
+// which bit (x % 32) of word (x / 32) represents x, i.e., instrs has to be
+// DARM_BITSET(I_INSTRCNT) and types DARM_BITSET(T_ENCTYPECNT) words long.
+// Only instructions whose instr and instr_type are in the respective bitset
+// are passed to callback, NULL passes all of them, including undecodable
+// ones (instr I_INVLD). callback may be NULL as well to merely count the
+// instructions. Returns the amount of instructions that passed.
+//
+#define DARM_BITSET(count) (((count) + 31) / 32)
+
+typedef int (*darm_scan_t)(const darm_t *d, uint32_t addr, void *user);
+
+size_t darm_scan(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, darm_scan_t callback, void *user,
+    const uint32_t *instrs, const uint32_t *types);
+
+//
+// Calls callback for every instruction in a buffer of little-endian
+// instructions that matches a pattern, e.g., to find every "ldr pc, [..]",
+// "blx rN" or "mcr p15, ..", see also darm_scan.
+//
+// Each member of the pattern that is not invalid (darm_pattern_init sets
+// all of them to I_INVLD, C_INVLD and R_INVLD) has to equal the respective
+// member of an instruction for it to match, undecodable instructions never
+// match. The pattern is compiled into the mask and value of the fixed bits
+// of each encoding of its instruction, with the constrained operand fields
+// folded in, which are compared against the raw instruction words first,
+// several words at a time on x86-64. Only the instructions that pass this
+// test are decoded, which is what makes darm_search a lot faster than
+// darm_scan for all but the most common instructions.
+//
+// callback may be NULL to merely count the matches, otherwise the search
+// is stopped if it returns non-zero. Returns the amount of matches.
+//
+typedef struct _darm_pattern_t {
+    darm_instr_t instr;
+    darm_cond_t cond;
+    darm_reg_t Rd, Rn, Rm, Ra, Rt, Rt2, RdHi, RdLo, Rs;
+} darm_pattern_t;
+
+void darm_pattern_init(darm_pattern_t *p);
+
+size_t darm_search(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, const darm_pattern_t *pattern,
+    darm_scan_t callback, void *user);
+
+//
+// Decodes a buffer of little-endian ARMv7 instructions into columns, i.e.,
+// one array per field, for statistics over large amounts of code that only
+// need the most common fields.
+//
+// Row idx of each column equals the respective field of the darm_t that
+// darm_disasm_buffer would produce for the idx'th instruction, including
+// undecodable instructions (which have instr I_INVLD and, e.g., cond 0).
+// All columns have to be at least len / 4 entries long. Returns the amount
+// of instructions that were decoded, i.e., len / 4.
+//
+// The common data-processing, load/store and branch encodings keep these
+// fields at fixed positions and are decoded straight from the dispatch
+// table of the ARMv7 decoder, four (SSE2) or eight (AVX2) instructions at a
+// time where available, all other instructions go through
+// darm_armv7_disasm.
+//
+typedef struct _darm_columns_t {
+    uint16_t    *instr;         // darm_instr_t
+    uint8_t     *instr_type;    // darm_enctype_t
+    uint8_t     *cond;          // darm_cond_t
+    int8_t      *Rd;            // darm_reg_t
+    int8_t      *Rn;            // darm_reg_t
+    int8_t      *Rm;            // darm_reg_t
+    int8_t      *shift_type;    // darm_shift_type_t
+    uint32_t    *imm;
+} darm_columns_t;
+
+typedef enum _darm_simd_t {
+    SIMD_NONE, SIMD_SSE2, SIMD_AVX2,
+} darm_simd_t;
+
+size_t darm_armv7_columns(const darm_columns_t *out, const uint8_t *buf,
+    size_t len);
+
+// limits darm_armv7_columns to the given instruction set extension, e.g.,
+// for benchmarking, by default it uses the best one the cpu supports;
+// returns the one that will actually be used
+darm_simd_t darm_columns_simd(darm_simd_t simd);
+
+//
+// Finds an instruction boundary in a buffer of Thumb/Thumb2 instructions,
+// e.g., to split a buffer into chunks which can be handed to
+// darm_disasm_buffer independently (and in parallel) without cutting a
+// Thumb2 instruction in two.
+//
+// start is the offset of a known instruction boundary, e.g., zero, from
+// which the instructions are walked up to offset. Returns the offset of the
+// first instruction boundary at or after offset, or the offset where the
+// buffer ends, or the offset of a Thumb2 instruction cut off by the end of
+// the buffer, whichever comes first. If count is not NULL, it receives the
+// amount of instructions between start and the returned offset, i.e., the
+// amount of instructions darm_disasm_buffer decodes in that range.
+//
+// The walk only looks at the first halfword of each instruction, which makes
+// it much cheaper than actually decoding the instructions.
+//
+size_t darm_thumb_boundary(const uint8_t *buf, size_t len, size_t start,
+    size_t offset, size_t *count);
+
+//
+// Classifies the contents of a raw image, e.g., a flash dump without any
+// metadata, into ranges of ARMv7 code, Thumb code and data.
+//
+// buf is decoded both as ARMv7 instructions (darm_armv7_columns, starting
+// at offset zero) and as a stream of Thumb instructions (like
+// darm_disasm_buffer). Each instruction is scored on whether it decodes at
+// all, how plausible it is in compiled code (e.g., ldr and bl rather than
+// coprocessor or ThumbEE instructions) and, for ARMv7, its condition, as
+// the bulk of ARMv7 code is executed always whereas the condition of data
+// is more or less random. Zeroes and erased flash score nothing.
+//
+// The scores are averaged over a window of window bytes (at most
+// DARM_CLASSIFY_WINDOW_MAX) around each step of DARM_CLASSIFY_STEP bytes.
+// A window only counts as code if its average score is high enough and,
+// for Thumb, which is a lot less picky about what it decodes, if enough of
+// its instructions are branches, calls or stack operations. Each step
+// becomes the region of its window with the highest score, or data if
+// neither counts as code. Consecutive steps of the same region are
+// merged into segments, which together cover the entire buffer, and which
+// carry the average score, in percent, of their steps in both modes.
+//
+// At most count segments are written to out, at most
+// len / DARM_CLASSIFY_STEP + 1 are needed. Returns the amount of segments,
+// also when that exceeds count.
+//
+#define DARM_CLASSIFY_STEP 16
+#define DARM_CLASSIFY_WINDOW_MAX 4096
+
+typedef enum _darm_region_t {
+    REGION_ARMV7 = M_ARMV7,
+    REGION_THUMB = M_THUMB,
+    REGION_DATA,
+} darm_region_t;
+
+typedef struct _darm_segment_t {
+    uint32_t        addr;
+    uint32_t        size;
+    darm_region_t   region;
+    uint32_t        armv7;      // score, in percent
+    uint32_t        thumb;      // score, in percent
+} darm_segment_t;
+
+size_t darm_classify(darm_segment_t *out, size_t count, const uint8_t *buf,
+    size_t len, uint32_t addr, uint32_t window);
+
+//
+// Control-flow graph of the code reachable from a set of entry points.
+//
+// Unlike a linear sweep, which happily decodes literal pools and jump
+// tables as instructions and can't tell where ARMv7 and Thumb code meet,
+// darm_cfg_build only decodes what is actually reached. Starting at each
+// entry point it decodes instructions until the first branch, call or
+// return, and queues the destinations of direct branches (B, BL, BLX,
+// CBZ/CBNZ and loads into PC from a literal pool) and, unless the
+// instruction always leaves, the next instruction. BLX with an immediate
+// and literal pool loads with the least significant bit of the loaded
+// address set switch between ARMv7 and Thumb. Indirect branches (e.g.,
+// BX LR, POP {..,PC} or TBB) end a block without any known successors.
+// Instructions within an IT block are conditional.
+//
+// Addresses with the least significant bit set are Thumb code, like the
+// operand of BX. The cfg refers to buf, which has to remain valid until
+// darm_cfg_destroy. Each decoded instruction is marked in a bitmap per
+// instruction set, so every instruction is decoded only once, also when
+// darm_cfg_add_entry adds more entry points to an existing cfg and
+// darm_cfg_build is called again.
+//
+// Blocks are sorted by mode, then by address. The edges of each block are
+// stored consecutively, starting at the edges index of the block. The dst
+// member of an edge is the index of the block at its destination, or
+// DARM_CFG_NONE if the destination lies outside of buf or doesn't decode.
+//
+// darm_cfg_create returns NULL if it's out of memory. darm_cfg_add_entry
+// returns -1 if addr lies outside of buf or is misaligned, and
+// darm_cfg_build returns -1 if it's out of memory.
+// The arrays returned by darm_cfg_blocks and darm_cfg_edges remain valid
+// until the next call to darm_cfg_build.
+//
+#define DARM_CFG_NONE UINT32_MAX
+
+typedef enum _darm_edge_kind_t {
+    // the next instruction, also after a call
+    EDGE_FALLTHROUGH,
+
+    // the destination of an unconditional branch
+    EDGE_BRANCH,
+
+    // the destination of a conditional branch, or CBZ/CBNZ
+    EDGE_CONDITIONAL,
+
+    // the destination of BL or BLX
+    EDGE_CALL,
+} darm_edge_kind_t;
+
+typedef struct _darm_block_t {
+    uint32_t        addr;
+    uint32_t        size;       // in bytes
+    uint32_t        count;      // amount of instructions
+    darm_mode_t     mode;
+    uint32_t        edges;      // index of the first edge
+    uint32_t        edge_count;
+} darm_block_t;
+
+typedef struct _darm_edge_t {
+    uint32_t        src;        // index of the block
+    uint32_t        dst;        // index of the block, or DARM_CFG_NONE
+    uint32_t        addr;       // destination, including the Thumb bit
+    darm_edge_kind_t kind;
+} darm_edge_t;
+
+typedef struct _darm_cfg_t darm_cfg_t;
+
+darm_cfg_t *darm_cfg_create(const uint8_t *buf, size_t len, uint32_t addr);
+void darm_cfg_destroy(darm_cfg_t *cfg);
+
+int darm_cfg_add_entry(darm_cfg_t *cfg, uint32_t addr);
+int darm_cfg_build(darm_cfg_t *cfg);
+
+const darm_block_t *darm_cfg_blocks(const darm_cfg_t *cfg, size_t *count);
+const darm_edge_t *darm_cfg_edges(const darm_cfg_t *cfg, size_t *count);
+
+// index of the block containing addr (with the Thumb bit selecting the
+// mode), or DARM_CFG_NONE
+uint32_t darm_cfg_block_at(const darm_cfg_t *cfg, uint32_t addr);
+
+//
+// Cross-reference index of an entire buffer of little-endian instructions.
+//
+// darm_xrefs_create decodes buf once, according to mode and like
+// darm_disasm_buffer, where the first instruction is located at addr. Only
+// instructions that may reference an address are decoded at all, i.e.,
+// direct branches (B, BL, BLX and CBZ/CBNZ), ADR and the PC-relative loads
+// (LDR, LDRB, LDRH, LDRSB, LDRSH and LDRD). The references are kept in two
+// sorted arrays, by instruction and by referenced address, so that lookups
+// are a binary search. The index doesn't refer to buf.
+//
+// darm_xrefs_to returns the references to the size bytes at addr (at
+// least one byte, the Thumb bit of addr is ignored), sorted by referenced
+// address and then by instruction, and darm_xrefs_from returns the
+// references made by the instructions in that range, sorted by instruction.
+// Both store the amount of references in count. darm_xrefs_all returns all
+// of them, sorted by instruction. The returned pointers remain valid until
+// darm_xrefs_destroy. darm_xrefs_create returns NULL if it's out of memory.
+//
+typedef enum _darm_xref_kind_t {
+    // B, also conditional, CBZ and CBNZ
+    XREF_BRANCH,
+
+    // BL and BLX
+    XREF_CALL,
+
+    // ADR
+    XREF_ADDRESS,
+
+    // a PC-relative load, e.g., from a literal pool
+    XREF_LOAD,
+} darm_xref_kind_t;
+
+typedef struct _darm_xref_t {
+    uint32_t        from;       // address of the instruction
+    uint32_t        to;         // referenced address, without the Thumb bit
+    darm_xref_kind_t kind;
+} darm_xref_t;
+
+typedef struct _darm_xrefs_t darm_xrefs_t;
+
+darm_xrefs_t *darm_xrefs_create(const uint8_t *buf, size_t len,
+    uint32_t addr, darm_mode_t mode);
+void darm_xrefs_destroy(darm_xrefs_t *x);
+
+const darm_xref_t *darm_xrefs_to(const darm_xrefs_t *x, uint32_t addr,
+    uint32_t size, size_t *count);
+const darm_xref_t *darm_xrefs_from(const darm_xrefs_t *x, uint32_t addr,
+    uint32_t size, size_t *count);
+const darm_xref_t *darm_xrefs_all(const darm_xrefs_t *x, size_t *count);
+
+//
+// Decode cache for repeatedly disassembled instruction words.
+//
+// Real binaries contain the same instruction words over and over again, e.g.,
+// function prologues and epilogues. A darm_cache_t remembers the results of
+// up to capacity decoded instructions per instruction set, keyed by the
+// instruction word, and evicts the least recently used instruction of the
+// same instruction set once that instruction set has capacity entries.
+// The darm_cache_*_disasm functions behave exactly like their non-caching
+// counterparts.
+//
+// darm_cache_create returns NULL if capacity is zero or if it's out of memory.
+//
+typedef struct _darm_cache_t darm_cache_t;
+
+darm_cache_t *darm_cache_create(uint32_t capacity);
+void darm_cache_destroy(darm_cache_t *c);
+
+// removes all entries and resets the hit and miss counters
+void darm_cache_clear(darm_cache_t *c);
+
+// the amount of lookups that were, and were not, served from the cache
+void darm_cache_stats(const darm_cache_t *c, uint64_t *hits,
+    uint64_t *misses);
+
+int darm_cache_armv7_disasm(darm_cache_t *c, darm_t *d, uint32_t w);
+int darm_cache_thumb_disasm(darm_cache_t *c, darm_t *d, uint16_t w);
+int darm_cache_thumb2_disasm(darm_cache_t *c, darm_t *d, uint16_t w,
+    uint16_t w2);
+
 int darm_immshift_decode(const darm_t *d, const char **type,
     uint32_t *immediate);
 
@@ -269,4 +693,30 @@ void darm_dump(const darm_t *d);
 int darm_str(const darm_t *d, darm_str_t *str);
 int darm_str2(const darm_t *d, darm_str_t *str, int lowercase);
 
+//
+// Renders a text listing of an entire buffer of little-endian instructions
+// in one go, e.g., to dump a code section to a file.
+//
+// The instructions in buf are decoded according to mode, just like
+// darm_disasm_buffer does, where the first instruction is located at addr.
+// Each instruction results in a single line in out, consisting of the
+// address, the instruction word (or, for Thumb, both halfwords) and the
+// output of darm_str2, separated by a single space, e.g.,
+//
+// 00008000 e92d4800 push {r11,lr}
+// 00008004 eb000002 bl #+8
+//
+// Columns can be omitted through flags, see darm_listing_t. Instructions
+// that could not be disassembled (or formatted) are rendered as "(..)".
+//
+// Only complete lines are written and out is not zero-terminated. Rendering
+// stops when the next line doesn't fit in outlen bytes, or when fewer bytes
+// remain than the next instruction requires. Returns the amount of bytes
+// written to out and, if consumed is not NULL, the amount of bytes of buf
+// that have been rendered, so that the listing can be continued from there.
+//
+size_t darm_render_listing(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, char *out, size_t outlen, uint32_t flags,
+    size_t *consumed);
+
 #endif
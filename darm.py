@@ -28,12 +28,75 @@ POSSIBILITY OF SUCH DAMAGE.
 """
 from ctypes import cdll, Structure, byref, POINTER, create_string_buffer
 from ctypes import c_uint8, c_uint16, c_int32, c_uint32, c_char_p, c_char
+from ctypes import c_size_t, c_void_p, sizeof, addressof, cast, CFUNCTYPE
+from collections import OrderedDict
+import itertools
 import os.path
+import struct
+import threading
 
+try:
+    import _darm
+except ImportError:
+    _darm = None
 
-class _Base:
-    def __init__(self, idx):
+# instruction sets accepted by disasm_buffer(), these mirror darm_mode_t
+M_ARMV7 = 0
+M_THUMB = 1
+
+# the region of a Segment that is neither ARMv7 nor Thumb code, see
+# classify(), these mirror darm_region_t
+REGION_DATA = 2
+
+# the kinds of Edge in a control-flow graph, these mirror darm_edge_kind_t
+EDGE_FALLTHROUGH = 0
+EDGE_BRANCH = 1
+EDGE_CONDITIONAL = 2
+EDGE_CALL = 3
+
+# the dst of an Edge of which the destination isn't part of the graph
+CFG_NONE = 0xffffffff
+
+# the kinds of Xref, these mirror darm_xref_kind_t
+XREF_BRANCH = 0
+XREF_CALL = 1
+XREF_ADDRESS = 2
+XREF_LOAD = 3
+
+
+def _str(name):
+    """Converts a string returned through ctypes into a native string."""
+    if name is None or isinstance(name, str):
+        return name
+    return name.decode('ascii')
+
+
+class _Base(object):
+    """Flyweight base class for the enumeration-like types.
+
+    Each value is created only once - the objects for all known values are
+    interned together with their name when the library is loaded, hence
+    constructing one is merely a dictionary lookup.
+
+    """
+    __slots__ = 'idx', 'name'
+
+    def __new__(cls, idx):
+        try:
+            return cls._interned[idx]
+        except KeyError:
+            return cls._create(idx)
+
+    @classmethod
+    def _create(cls, idx):
+        self = object.__new__(cls)
         self.idx = idx
+        self.name = _str(cls._lookup(idx))
+        return self
+
+    @classmethod
+    def _intern(cls, indices):
+        cls._interned = dict((idx, cls._create(idx)) for idx in indices)
 
     def __int__(self):
         return self.idx
@@ -43,42 +106,45 @@ class _Base:
 
     __bool__ = __nonzero__
 
+    def __str__(self):
+        return self.name or ''
+
 
 class Condition(_Base):
+    __slots__ = ()
     _nonzero = -1
-
-    def __str__(self):
-        return _lib.darm_condition_name(self.idx, 0)
+    _interned = {}
+    _lookup = staticmethod(lambda idx: _lib.darm_condition_name(idx, 0))
 
     def __repr__(self):
         return 'C_%s' % self.__str__()
 
 
 class Instruction(_Base):
+    __slots__ = ()
     _nonzero = 0
-
-    def __str__(self):
-        return _lib.darm_mnemonic_name(self.idx)
+    _interned = {}
+    _lookup = staticmethod(lambda idx: _lib.darm_mnemonic_name(idx))
 
     def __repr__(self):
         return 'I_%s' % self.__str__()
 
 
 class Register(_Base):
+    __slots__ = ()
     _nonzero = -1
-
-    def __str__(self):
-        return _lib.darm_register_name(self.idx)
+    _interned = {}
+    _lookup = staticmethod(lambda idx: _lib.darm_register_name(idx))
 
     def __repr__(self):
         return self.__str__()
 
 
 class Encoding(_Base):
+    __slots__ = ()
     _nonzero = 0
-
-    def __str__(self):
-        return _lib.darm_enctype_name(self.idx)
+    _interned = {}
+    _lookup = staticmethod(lambda idx: _lib.darm_enctype_name(idx))
 
     def __repr__(self):
         return 'T_%s' % self.__str__()
@@ -91,7 +157,7 @@ class Shift:
         self.shift = shift
 
     def type_name(self):
-        return 'S_' + _lib.darm_shift_type_name(self.type_)
+        return 'S_%s' % _shift_types.get(self.type_)
 
     def __str__(self):
         type_name = self.type_name()
@@ -110,6 +176,8 @@ class Shift:
     def __nonzero__(self):
         return self.type_ != -1
 
+    __bool__ = __nonzero__
+
 
 class RegisterList:
     def __init__(self, reglist):
@@ -118,7 +186,7 @@ class RegisterList:
     def __str__(self):
         buf = create_string_buffer(64)
         _lib.darm_reglist(self.reglist, buf)
-        return buf.value
+        return _str(buf.value)
 
     def __nonzero__(self):
         return self.reglist != 0
@@ -200,33 +268,64 @@ class _DarmStr(Structure):
     ]
 
 
-class Darm:
-    _flags = 'B', 'S', 'E', 'M', 'N', 'U', 'H', 'P', 'R', 'T', 'W', 'I'
-    _regs = 'Rd', 'Rn', 'Rm', 'Ra', 'Rt', 'Rt2', 'RdHi', 'RdLo'
+class PackedDarm(Structure):
+    """A decoded instruction in 24 bytes, see darm_packed_t in darm.h.
 
-    def __init__(self, d):
-        self.d = d
-        self.w = d.w
-        self.instr = Instruction(d.instr)
-        self.instr_type = Encoding(d.instr_type)
-        self.cond = Condition(d.cond)
+    The members are plain integers, with -1 meaning "no register", etc. imm
+    holds the immediate, the reglist or the coprocessor operands (depending
+    on imm_kind) and the remaining operands are packed into ext, use
+    unpack() to get hold of them.
 
-        for x in self._flags:
-            setattr(self, x, flag(getattr(d, x)))
+    """
+    _fields_ = [
+        ('w', c_uint32),
+        ('instr', c_uint32, 9),
+        ('instr_type', c_uint32, 7),
+        ('instr_imm_type', c_uint32, 7),
+        ('instr_flag_type', c_uint32, 7),
+        ('imm_kind', c_uint32, 2),
+        ('B', c_uint32, 2),
+        ('S', c_uint32, 2),
+        ('E', c_uint32, 2),
+        ('M', c_uint32, 2),
+        ('N', c_uint32, 2),
+        ('U', c_uint32, 2),
+        ('H', c_uint32, 2),
+        ('P', c_uint32, 2),
+        ('R', c_uint32, 2),
+        ('T', c_uint32, 2),
+        ('W', c_uint32, 2),
+        ('I', c_uint32, 2),
+        ('D', c_uint32, 2),
+        ('cond', c_int32, 5),
+        ('Rd', c_int32, 5),
+        ('Rn', c_int32, 5),
+        ('Rm', c_int32, 5),
+        ('Ra', c_int32, 5),
+        ('Rt', c_int32, 5),
+        ('Rt2', c_int32, 5),
+        ('imm', c_uint32),
+        ('RdHi', c_int32, 5),
+        ('RdLo', c_int32, 5),
+        ('ext_kind', c_uint32, 3),
+        ('ext', c_uint32, 19),
+    ]
 
-        for x in self._regs:
-            r = getattr(d, x)
-            setattr(self, x, Register(r) if r >= 0 else None)
+    def unpack(self):
+        """The decoded instruction as LazyDarm object, or None."""
+        if self.instr == 0:
+            return None
 
-        self.rotate = d.rotate
-        self.option = d.option
-        self.imm = d.imm
-        self.shift = Shift(d.type_,
-                           Register(d.Rs) if d.Rs >= 0 else None,
-                           d.shift)
-        self.lsb = d.lsb
-        self.width = d.width
-        self.reglist = RegisterList(d.reglist)
+        d = _Darm()
+        _lib.darm_unpack(byref(d), byref(self))
+        return LazyDarm(d)
+
+
+class _DarmBase(object):
+    __slots__ = ()
+
+    _flags = 'B', 'S', 'E', 'M', 'N', 'U', 'H', 'P', 'R', 'T', 'W', 'I'
+    _regs = 'Rd', 'Rn', 'Rm', 'Ra', 'Rt', 'Rt2', 'RdHi', 'RdLo'
 
     def __repr__(self):
         g = lambda x: getattr(self, x)
@@ -271,22 +370,872 @@ class Darm:
         return ''
 
 
-def disasm_armv7(w):
+class Darm(_DarmBase):
+    def __init__(self, d):
+        self.d = d
+        self.w = d.w
+        self.instr = Instruction(d.instr)
+        self.instr_type = Encoding(d.instr_type)
+        self.cond = Condition(d.cond)
+
+        for x in self._flags:
+            setattr(self, x, flag(getattr(d, x)))
+
+        for x in self._regs:
+            r = getattr(d, x)
+            setattr(self, x, Register(r) if r >= 0 else None)
+
+        self.rotate = d.rotate
+        self.option = d.option
+        self.imm = d.imm
+        self.shift = Shift(d.type_,
+                           Register(d.Rs) if d.Rs >= 0 else None,
+                           d.shift)
+        self.lsb = d.lsb
+        self.width = d.width
+        self.reglist = RegisterList(d.reglist)
+
+
+def _lazy(fn):
+    """Property that is evaluated on first access and cached afterwards.
+
+    The value is stored in the slot named after the property, prefixed with
+    an underscore.
+
+    """
+    slot = '_' + fn.__name__
+
+    def get(self):
+        try:
+            return getattr(self, slot)
+        except AttributeError:
+            value = fn(self)
+            setattr(self, slot, value)
+            return value
+    return property(get)
+
+
+def _lazy_flag(name):
+    def fn(self):
+        return flag(getattr(self.d, name))
+    fn.__name__ = name
+    return _lazy(fn)
+
+
+def _lazy_reg(name):
+    def fn(self):
+        r = getattr(self.d, name)
+        return Register(r) if r >= 0 else None
+    fn.__name__ = name
+    return _lazy(fn)
+
+
+def _raw(name):
+    return property(lambda self: getattr(self.d, name))
+
+
+class LazyDarm(_DarmBase):
+    """Darm object which decodes its attributes on demand.
+
+    Unlike Darm, which translates every member of the underlying _Darm
+    structure right away, LazyDarm only keeps a reference to the structure
+    and creates the Python object for an attribute when it is first accessed.
+
+    """
+    __slots__ = ('d', '_instr', '_instr_type', '_cond', '_shift',
+                 '_reglist') + \
+        tuple('_' + x for x in _DarmBase._flags + _DarmBase._regs)
+
+    def __init__(self, d):
+        self.d = d
+
+    w = _raw('w')
+    rotate = _raw('rotate')
+    option = _raw('option')
+    imm = _raw('imm')
+    lsb = _raw('lsb')
+    width = _raw('width')
+
+    @_lazy
+    def instr(self):
+        return Instruction(self.d.instr)
+
+    @_lazy
+    def instr_type(self):
+        return Encoding(self.d.instr_type)
+
+    @_lazy
+    def cond(self):
+        return Condition(self.d.cond)
+
+    @_lazy
+    def shift(self):
+        d = self.d
+        return Shift(d.type_, Register(d.Rs) if d.Rs >= 0 else None, d.shift)
+
+    @_lazy
+    def reglist(self):
+        return RegisterList(self.d.reglist)
+
+
+for _name in _DarmBase._flags:
+    setattr(LazyDarm, _name, _lazy_flag(_name))
+
+for _name in _DarmBase._regs:
+    setattr(LazyDarm, _name, _lazy_reg(_name))
+
+
+def disasm_armv7(w, lazy=False):
     d = _Darm()
     ret = _lib.darm_armv7_disasm(byref(d), w)
-    return Darm(d) if ret == 0 else None
+    if ret == 0:
+        return LazyDarm(d) if lazy else Darm(d)
 
 
-def disasm_thumb(w):
+def disasm_thumb(w, lazy=False):
     d = _Darm()
     ret = _lib.darm_thumb_disasm(byref(d), w)
-    return Darm(d) if ret == 0 else None
+    if ret == 0:
+        return LazyDarm(d) if lazy else Darm(d)
 
 
-def disasm_thumb2(w):
+def disasm_thumb2(w, lazy=False):
     d = _Darm()
     ret = _lib.darm_thumb2_disasm(byref(d), (w >> 16) & 0xffff, w & 0xffff)
-    return Darm(d) if ret == 0 else None
+    if ret == 0:
+        return LazyDarm(d) if lazy else Darm(d)
+
+
+class DecodeCache(object):
+    """Bounded LRU cache of decoded instructions.
+
+    Real code repeats the same instruction words over and over, e.g., in
+    function prologues and epilogues, so when the same regions are decoded
+    more than once it pays off to remember the decoded instructions. Each
+    instruction set has its own cache of at most capacity instructions, and
+    the least recently used instruction is evicted when it's full.
+
+    The disasm_* methods behave like their module-level counterparts, except
+    that the same (read-only) object may be returned more than once. hits
+    and misses count the lookups that were, and were not, served from the
+    cache, which helps to pick a capacity.
+
+    """
+    def __init__(self, capacity=4096, lazy=False):
+        self.capacity = capacity
+        self.lazy = lazy
+        self.clear()
+
+    def clear(self):
+        """Removes all cached instructions and resets the counters."""
+        self._caches = {
+            disasm_armv7: OrderedDict(),
+            disasm_thumb: OrderedDict(),
+            disasm_thumb2: OrderedDict(),
+        }
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return sum(len(cache) for cache in self._caches.values())
+
+    def _lookup(self, disasm, w):
+        cache = self._caches[disasm]
+        try:
+            # move the instruction to the most recently used end
+            insn = cache.pop(w)
+            self.hits += 1
+        except KeyError:
+            insn = disasm(w, self.lazy)
+            self.misses += 1
+            if len(cache) >= self.capacity:
+                cache.popitem(last=False)
+
+        cache[w] = insn
+        return insn
+
+    def disasm_armv7(self, w):
+        return self._lookup(disasm_armv7, w)
+
+    def disasm_thumb(self, w):
+        return self._lookup(disasm_thumb, w)
+
+    def disasm_thumb2(self, w):
+        return self._lookup(disasm_thumb2, w)
+
+
+class Disassembly:
+    """Instructions decoded by disasm_buffer().
+
+    The decoded instructions are kept in a single ctypes array of _Darm
+    structures, alongside an array with the address of each instruction,
+    and are only wrapped in a LazyDarm object when they're being accessed.
+
+    """
+    def __init__(self, insns, addrs, count):
+        self.insns = insns
+        self.addrs = addrs
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.count
+        if idx < 0 or idx >= self.count:
+            raise IndexError('instruction index out of range')
+
+        d = self.insns[idx]
+        return LazyDarm(d) if d.instr != 0 else None
+
+    def __iter__(self):
+        for idx in range(self.count):
+            yield self[idx]
+
+    def addr(self, idx):
+        """Address of the instruction at index idx."""
+        return self.addrs[idx if idx >= 0 else idx + self.count]
+
+    def items(self):
+        """Yields (address, instruction) for each decoded instruction."""
+        for idx in range(self.count):
+            yield self.addrs[idx], self[idx]
+
+
+def _buffer(data):
+    """Returns data in a form that can be passed as const uint8_t *.
+
+    bytes objects are passed as-is, writable buffers (bytearray, mmap, etc.)
+    are referenced without copying them, and read-only buffers, such as a
+    memoryview on a bytes object, are copied.
+
+    """
+    if isinstance(data, bytes):
+        return data
+
+    try:
+        return (c_char * len(data)).from_buffer(data)
+    except TypeError:
+        return memoryview(data).tobytes()
+
+
+def disasm_buffer(data, mode=M_ARMV7, base_addr=0):
+    """Disassemble all instructions in data in a single call.
+
+    data is a bytes-like object of little-endian instructions, mode is either
+    M_ARMV7 or M_THUMB (mixed Thumb and Thumb2), and base_addr is the address
+    of the first instruction. Undecodable instructions are represented by
+    None. Returns a Disassembly object.
+
+    """
+    buf = _buffer(data)
+    count = len(buf) // (4 if mode == M_ARMV7 else 2)
+
+    insns, addrs = (_Darm * count)(), (c_uint32 * count)()
+    count = _lib.darm_disasm_buffer(insns, addrs, count, buf, len(buf),
+                                    base_addr, mode)
+    return Disassembly(insns, addrs, int(count))
+
+
+# flags of darm_render_listing, these mirror darm_listing_t
+_L_LOWERCASE = 1
+_L_NOADDR = 2
+_L_NOWORDS = 4
+
+# size of the output buffer of render_listing(), in bytes
+LISTING_CHUNK = 0x100000
+
+
+def render_listing(data, mode=M_ARMV7, base_addr=0, lowercase=True,
+                   address=True, words=True):
+    """Render a text listing of all instructions in data.
+
+    Each instruction results in one line with its address, its instruction
+    word(s) and the instruction itself (see darm_render_listing), where the
+    address and instruction word columns may be omitted. The listing is
+    rendered natively, without creating a Darm object per instruction, and
+    returned as a single bytes object which can be written to a file as-is.
+
+    """
+    buf = _buffer(data)
+    flags = ((_L_LOWERCASE if lowercase else 0) |
+             (0 if address else _L_NOADDR) | (0 if words else _L_NOWORDS))
+
+    out, consumed = create_string_buffer(LISTING_CHUNK), c_size_t()
+    ret, offset, addr = [], 0, _address(buf)
+    while True:
+        length = _lib.darm_render_listing(
+            addr + offset, len(buf) - offset, base_addr + offset, mode,
+            out, LISTING_CHUNK, flags, byref(consumed))
+        if length == 0:
+            break
+
+        ret.append(out.raw[:length])
+        offset += consumed.value
+    return b''.join(ret)
+
+
+# minimum amount of instructions per thread of disasm_buffer_parallel()
+PARALLEL_CHUNK = 0x4000
+
+
+def _address(buf):
+    """Address of the contents of a buffer returned by _buffer()."""
+    if isinstance(buf, bytes):
+        return cast(buf, c_void_p).value
+    return addressof(buf)
+
+
+def split_buffer(data, mode, parts):
+    """Splits a buffer of instructions into parts chunks.
+
+    The chunks are of roughly equal size and are split at instruction
+    boundaries, i.e., Thumb2 instructions are never cut in two (see also
+    darm_thumb_boundary), so that every chunk can be decoded on its own.
+
+    Returns a list of (offset, index) tuples, the offset of the first
+    instruction of each chunk and the index of that instruction within the
+    entire buffer, followed by the (offset, index) right after the last
+    instruction. The latter index is thus the amount of instructions which
+    disasm_buffer() would return for data.
+
+    """
+    buf = _buffer(data)
+    size = 4 if mode == M_ARMV7 else 2
+    count = len(buf) // size
+
+    if mode == M_ARMV7:
+        return [(count * idx // parts * 4, count * idx // parts)
+                for idx in range(parts + 1)]
+
+    chunks, walked = [(0, 0)], c_size_t()
+    for idx in range(1, parts + 1):
+        start, first = chunks[-1]
+        offset = count * idx // parts * size if idx < parts else len(buf)
+        offset = _lib.darm_thumb_boundary(buf, len(buf), start, offset,
+                                          byref(walked))
+        if offset > start or idx == parts:
+            chunks.append((offset, first + walked.value))
+    return chunks
+
+
+def disasm_buffer_parallel(data, mode=M_ARMV7, base_addr=0, threads=None):
+    """Disassemble all instructions in data using multiple threads.
+
+    Takes the same arguments as disasm_buffer(), and returns the same
+    Disassembly object, but the buffer is split into one chunk per thread
+    (the amount of CPUs by default), each of which is decoded in a separate
+    thread. The library is called through ctypes, which releases the GIL
+    during the call, so the chunks are actually decoded in parallel.
+
+    Thumb chunks are split at instruction boundaries (see split_buffer), so
+    that no Thumb2 instruction is cut in two. Buffers too small to be worth
+    it are decoded by the calling thread.
+
+    """
+    buf = _buffer(data)
+    size = 4 if mode == M_ARMV7 else 2
+
+    if threads is None:
+        import multiprocessing
+        threads = multiprocessing.cpu_count()
+
+    threads = min(threads, len(buf) // size // PARALLEL_CHUNK)
+    if threads <= 1:
+        return disasm_buffer(buf, mode, base_addr)
+
+    # every chunk decodes its instructions straight into its own part of
+    # the output arrays
+    chunks = split_buffer(buf, mode, threads)
+    count = int(chunks[-1][1])
+
+    insns, addrs = (_Darm * count)(), (c_uint32 * count)()
+    address = _address(buf)
+
+    def decode(idx):
+        (offset, first), (end, last) = chunks[idx], chunks[idx + 1]
+        _lib.darm_disasm_buffer(
+            cast(addressof(insns) + first * sizeof(_Darm), POINTER(_Darm)),
+            cast(addressof(addrs) + first * sizeof(c_uint32),
+                 POINTER(c_uint32)),
+            last - first, address + offset, end - offset,
+            base_addr + offset, mode)
+
+    workers = [threading.Thread(target=decode, args=(idx,))
+               for idx in range(1, len(chunks) - 1)]
+    for worker in workers:
+        worker.start()
+
+    decode(0)
+
+    for worker in workers:
+        worker.join()
+
+    return Disassembly(insns, addrs, count)
+
+
+def _chunks(data, chunk_size):
+    """Yields the chunks of a bytes-like, file-like, or iterable object."""
+    if hasattr(data, 'read'):
+        while True:
+            chunk = data.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        yield data
+    else:
+        for chunk in data:
+            yield chunk
+
+
+def iter_disasm(data, addr=0, thumb=False, chunk_size=0x10000):
+    """Lazily disassemble a stream of instructions.
+
+    data is either a bytes-like object, a file-like object (anything with a
+    read() method, e.g., a file, a socket's makefile() or an mmap), or an
+    iterable of bytes-like chunks. Instructions are ARMv7, or mixed Thumb and
+    Thumb2 if thumb is set, starting at address addr. Instructions may be
+    split across chunk boundaries.
+
+    Yields (addr, size, insn) for each instruction, where size is the size
+    of the instruction in bytes and insn is None if it could not be decoded.
+
+    """
+    mode = M_THUMB if thumb else M_ARMV7
+    pending = b''
+
+    for chunk in _chunks(data, chunk_size):
+        buf = _buffer(pending + memoryview(chunk).tobytes()
+                      if pending else chunk)
+
+        insns = disasm_buffer(buf, mode, addr)
+        if not len(insns):
+            pending = buf[:]
+            continue
+
+        # the size of the last instruction follows from its first halfword
+        last = insns.addr(-1) - addr
+        if mode == M_ARMV7 or \
+                struct.unpack_from('<H', buf, last)[0] >> 11 >= 0x1d:
+            end = last + 4
+        else:
+            end = last + 2
+
+        for idx in range(len(insns) - 1):
+            yield (insns.addrs[idx], insns.addrs[idx + 1] - insns.addrs[idx],
+                   insns[idx])
+
+        yield addr + last, end - last, insns[-1]
+
+        # keep a partial instruction around for the next chunk
+        pending, addr = buf[end:], addr + end
+
+
+def disasm_packed(data, mode=M_ARMV7, base_addr=0):
+    """Disassemble all instructions in data into PackedDarm records.
+
+    Like disasm_buffer(), but every instruction takes 24 bytes rather than
+    180, e.g., to keep all instructions of a large image in memory. Returns
+    (addrs, insns), ctypes arrays of the address and the PackedDarm record of
+    each instruction, both of which support the buffer protocol.
+
+    """
+    buf = _buffer(data)
+    count = split_buffer(buf, mode, 1)[-1][1]
+
+    insns, addrs = (PackedDarm * count)(), (c_uint32 * count)()
+    _lib.darm_disasm_packed(insns, addrs, count, buf, len(buf), base_addr,
+                            mode)
+    return addrs, insns
+
+
+# callback of darm_scan
+_ScanCallback = CFUNCTYPE(c_int32, POINTER(_Darm), c_uint32, c_void_p)
+
+
+def _index(value, cls):
+    """Index of an object of an enumeration-like type, its name or index."""
+    if isinstance(value, _Base):
+        return value.idx
+    if isinstance(value, int):
+        return value
+
+    names = dict((x.name.upper(), idx) for idx, x in cls._interned.items()
+                 if x.name)
+    if value.upper() in names:
+        return names[value.upper()]
+    if value.isdigit():
+        return int(value)
+    raise ValueError('unknown %s: %r' % (cls.__name__, value))
+
+
+def _bitset(values, cls):
+    """Bitset for darm_scan over the indices of an enumeration-like type.
+
+    values are objects of cls, their names, or their indices.
+
+    """
+    if values is None:
+        return None
+
+    bits = (c_uint32 * ((len(cls._interned) + 31) // 32))()
+    for value in values:
+        idx = _index(value, cls)
+        bits[idx // 32] |= 1 << (idx % 32)
+    return bits
+
+
+def scan(data, fn=None, mode=M_ARMV7, base_addr=0, instrs=None, types=None):
+    """Calls fn(addr, insn) for the instructions in data which match.
+
+    instrs and types restrict the scan to the instructions of which the
+    Instruction, respectively the Encoding, is in the given collection of
+    Instruction or Encoding objects or their names, e.g., instrs=('BL',
+    'BLX'). The instructions are decoded and matched natively, so that fn is
+    only called for the matches (with None as insn for undecodable ones).
+    fn may return True to stop the scan, or may be omitted altogether to
+    merely count the matches. Returns the amount of matching instructions.
+
+    """
+    buf, errors = _buffer(data), []
+
+    def callback(d, addr, user):
+        d = d.contents
+        try:
+            insn = LazyDarm(_Darm.from_buffer_copy(d)) if d.instr else None
+            return 1 if fn(addr, insn) else 0
+        except Exception as e:
+            # exceptions can't propagate through darm_scan
+            errors.append(e)
+            return 1
+
+    count = _lib.darm_scan(buf, len(buf), base_addr, mode,
+                           _ScanCallback(callback if fn else 0), None,
+                           _bitset(instrs, Instruction),
+                           _bitset(types, Encoding))
+    if errors:
+        raise errors[0]
+    return int(count)
+
+
+class _DarmPattern(Structure):
+    _fields_ = [
+        ('instr', c_uint32),
+        ('cond', c_int32),
+        ('Rd', c_int32),
+        ('Rn', c_int32),
+        ('Rm', c_int32),
+        ('Ra', c_int32),
+        ('Rt', c_int32),
+        ('Rt2', c_int32),
+        ('RdHi', c_int32),
+        ('RdLo', c_int32),
+        ('Rs', c_int32),
+    ]
+
+
+def _pattern(pattern):
+    """Compiles a search pattern into a _DarmPattern.
+
+    Returns the _DarmPattern and a list of (name, value) tuples of the
+    remaining constraints, which darm_search doesn't support.
+
+    """
+    if not hasattr(pattern, 'items'):
+        pattern = dict(x.split('=', 1) for x in pattern.split(',')
+                       if x.strip())
+
+    p, other = _DarmPattern(), []
+    _lib.darm_pattern_init(byref(p))
+    for name, value in pattern.items():
+        name = name.strip()
+        if hasattr(value, 'strip'):
+            value = value.strip()
+
+        if name == 'instr':
+            p.instr = _index(value, Instruction)
+        elif name == 'cond':
+            p.cond = _index(value, Condition)
+        elif name in dict(p._fields_):
+            setattr(p, name, _index(value, Register))
+        elif name in dict(_Darm._fields_):
+            other.append((name, int(value, 0) if hasattr(value, 'strip')
+                          else int(value)))
+        else:
+            raise ValueError('unknown field: %r' % name)
+    return p, other
+
+
+def search(data, pattern, mode=M_ARMV7, base_addr=0):
+    """Searches data for the instructions which match a pattern.
+
+    pattern is either a dictionary or a string such as "instr=LDR, Rt=PC",
+    mapping the members of the decoded instruction onto the required value,
+    i.e., Instruction, Condition and Register objects, their names, or
+    plain integers. The instr, cond and register constraints are compiled
+    into masks over the fixed bits of the encodings of the instruction, so
+    that only a fraction of the instructions is actually decoded (see
+    darm_search in darm.h), others, e.g., coproc=15, are checked on the
+    resulting instructions. Returns a list of (addr, insn) tuples.
+
+    """
+    buf, (p, other) = _buffer(data), _pattern(pattern)
+    ret, errors = [], []
+
+    def callback(d, addr, user):
+        d = d.contents
+        try:
+            if all(getattr(d, name) == value for name, value in other):
+                ret.append((addr, LazyDarm(_Darm.from_buffer_copy(d))))
+            return 0
+        except Exception as e:
+            # exceptions can't propagate through darm_search
+            errors.append(e)
+            return 1
+
+    _lib.darm_search(buf, len(buf), base_addr, mode, byref(p),
+                     _ScanCallback(callback), None)
+    if errors:
+        raise errors[0]
+    return ret
+
+
+def _darm_dtype():
+    """NumPy dtype with the exact memory layout of the _Darm structure."""
+    global _dtype
+
+    if _dtype is None:
+        import numpy
+        _dtype = numpy.dtype({
+            'names': [name for name, _ in _Darm._fields_],
+            'formats': [numpy.dtype(typ) for _, typ in _Darm._fields_],
+            'offsets': [getattr(_Darm, name).offset
+                        for name, _ in _Darm._fields_],
+            'itemsize': sizeof(_Darm),
+        })
+    return _dtype
+
+_dtype = None
+
+
+def disasm_array(data, mode=M_ARMV7, base_addr=0):
+    """Disassemble all instructions in data into NumPy arrays.
+
+    Takes the same arguments as disasm_buffer(), but decodes straight into a
+    NumPy structured array whose fields mirror _Darm (instr, instr_type,
+    cond, Rd, Rn, Rm, imm, type_, shift, reglist, etc.), without creating any
+    Python objects per instruction. Returns a tuple (addrs, insns) of the
+    uint32 array of addresses and the structured array of instructions.
+
+    Undecodable instructions have their instr field set to zero (I_INVLD).
+    Requires NumPy.
+
+    """
+    import numpy
+
+    buf = _buffer(data)
+    count = len(buf) // (4 if mode == M_ARMV7 else 2)
+
+    insns = numpy.empty(count, dtype=_darm_dtype())
+    addrs = numpy.empty(count, dtype=numpy.uint32)
+    count = _lib.darm_disasm_buffer(insns.ctypes.data_as(POINTER(_Darm)),
+                                    addrs.ctypes.data_as(POINTER(c_uint32)),
+                                    count, buf, len(buf), base_addr, mode)
+    return addrs[:count], insns[:count]
+
+
+# the columns of darm_armv7_columns, with the names of the _Darm fields
+_COLUMNS = (
+    ('instr', 'uint16'),
+    ('instr_type', 'uint8'),
+    ('cond', 'uint8'),
+    ('Rd', 'int8'),
+    ('Rn', 'int8'),
+    ('Rm', 'int8'),
+    ('type_', 'int8'),
+    ('imm', 'uint32'),
+)
+
+
+class _DarmColumns(Structure):
+    _fields_ = [(name, c_void_p) for name, _ in _COLUMNS]
+
+
+def disasm_columns(data):
+    """Disassemble all ARMv7 instructions in data into NumPy columns.
+
+    A faster alternative to disasm_array() when only the most common fields
+    are of interest. Returns a dict with one NumPy array for each of the
+    instr, instr_type, cond, Rd, Rn, Rm, type_ and imm fields, whose values
+    are identical to the fields of the structured array of disasm_array(),
+    i.e., -1 for absent registers and shift types. Requires NumPy.
+
+    """
+    import numpy
+
+    buf = _buffer(data)
+    columns = OrderedDict((name, numpy.empty(len(buf) // 4, dtype=typ))
+                          for name, typ in _COLUMNS)
+    _lib.darm_armv7_columns(byref(_DarmColumns(*[
+        x.ctypes.data for x in columns.values()])), buf, len(buf))
+    return columns
+
+
+# granularity of classify(), DARM_CLASSIFY_STEP
+CLASSIFY_STEP = 16
+
+
+class Segment(Structure):
+    """A range of an image classified by classify().
+
+    region is M_ARMV7, M_THUMB or REGION_DATA, and armv7 and thumb are the
+    average scores, in percent, of the range as ARMv7 and Thumb code.
+
+    """
+    _fields_ = [
+        ('addr', c_uint32),
+        ('size', c_uint32),
+        ('region', c_int32),
+        ('armv7', c_uint32),
+        ('thumb', c_uint32),
+    ]
+
+    def __repr__(self):
+        region = {M_ARMV7: 'armv7', M_THUMB: 'thumb'}.get(self.region, 'data')
+        return '<Segment 0x%08x-0x%08x %s>' % (self.addr,
+                                               self.addr + self.size, region)
+
+
+def classify(data, base_addr=0, window=512):
+    """Splits a raw image, e.g., a flash dump, into code and data.
+
+    data is decoded as ARMv7 as well as Thumb code, scoring every
+    instruction on whether it decodes, how common it is in compiled code
+    and, for ARMv7, its condition. The scores are averaged over a window of
+    window bytes around every CLASSIFY_STEP bytes, which are then either
+    ARMv7 code, Thumb code or data (see darm_classify in darm.h). Returns a
+    list of Segment objects, which together cover all of data.
+
+    """
+    buf = _buffer(data)
+    count = len(buf) // CLASSIFY_STEP + 1
+
+    segments = (Segment * count)()
+    count = _lib.darm_classify(segments, count, buf, len(buf), base_addr,
+                               window)
+    return segments[:count]
+
+
+class Block(Structure):
+    """A basic block of a control-flow graph, see darm.cfg.
+
+    count is the amount of instructions in the block, and its outgoing
+    edges are the edge_count Edge objects starting at index edges.
+
+    """
+    _fields_ = [
+        ('addr', c_uint32),
+        ('size', c_uint32),
+        ('count', c_uint32),
+        ('mode', c_int32),
+        ('edges', c_uint32),
+        ('edge_count', c_uint32),
+    ]
+
+    def __repr__(self):
+        mode = 'thumb' if self.mode == M_THUMB else 'armv7'
+        return '<Block 0x%08x-0x%08x %s>' % (self.addr, self.addr + self.size,
+                                             mode)
+
+
+class Edge(Structure):
+    """An edge of a control-flow graph, see darm.cfg.
+
+    src and dst are the indices of the blocks, where dst is CFG_NONE if the
+    destination isn't part of the graph. addr is the destination, with the
+    least significant bit set for Thumb code, and kind is one of the EDGE_*
+    constants.
+
+    """
+    _fields_ = [
+        ('src', c_uint32),
+        ('dst', c_uint32),
+        ('addr', c_uint32),
+        ('kind', c_int32),
+    ]
+
+    def __repr__(self):
+        kind = ('fallthrough', 'branch', 'conditional', 'call')[self.kind]
+        return '<Edge %s 0x%08x>' % (kind, self.addr)
+
+
+class Xref(Structure):
+    """A reference from the instruction at from_ to the address to.
+
+    kind is one of the XREF_* constants, and to never has the Thumb bit
+    set.
+
+    """
+    _fields_ = [
+        ('from_', c_uint32),
+        ('to', c_uint32),
+        ('kind', c_int32),
+    ]
+
+    def __repr__(self):
+        kind = ('branch', 'call', 'address', 'load')[self.kind]
+        return '<Xref 0x%08x -> 0x%08x %s>' % (self.from_, self.to, kind)
+
+
+class XrefIndex(object):
+    """Cross-reference index of an entire image.
+
+    data is decoded once, natively, and every direct branch, call, ADR and
+    PC-relative load is indexed both by instruction and by referenced
+    address (see darm_xrefs_create in darm.h), so that "who calls this"
+    queries are a binary search rather than another pass over the image.
+
+    """
+    def __init__(self, data, mode=M_ARMV7, base_addr=0):
+        buf = _buffer(data)
+        self._xrefs = _lib.darm_xrefs_create(buf, len(buf), base_addr, mode)
+        if not self._xrefs:
+            raise MemoryError('unable to allocate the cross-reference index')
+
+    def close(self):
+        """Releases the native index."""
+        if self._xrefs:
+            _lib.darm_xrefs_destroy(self._xrefs)
+            self._xrefs = None
+
+    def __del__(self):
+        if getattr(self, '_xrefs', None):
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        count = c_size_t()
+        _lib.darm_xrefs_all(self._xrefs, byref(count))
+        return count.value
+
+    def _lookup(self, fn, addr, size):
+        count = c_size_t()
+        ptr = fn(self._xrefs, addr, size, byref(count))
+        return ptr[:count.value] if count.value else []
+
+    def xrefs_to(self, addr, size=1):
+        """References to the size bytes at addr, sorted by address."""
+        return self._lookup(_lib.darm_xrefs_to, addr, size)
+
+    def xrefs_from(self, addr, size=1):
+        """References made by the instructions in the size bytes at addr."""
+        return self._lookup(_lib.darm_xrefs_from, addr, size)
 
 
 def _set_func(name, restype, *argtypes):
@@ -305,6 +1254,40 @@ else:
 _set_func('darm_armv7_disasm', c_int32, POINTER(_Darm), c_uint32)
 _set_func('darm_thumb_disasm', c_int32, POINTER(_Darm), c_uint16)
 _set_func('darm_thumb2_disasm', c_int32, POINTER(_Darm), c_uint16, c_uint16)
+_set_func('darm_disasm', c_int32, POINTER(_Darm), c_uint16, c_uint16, c_uint32)
+_set_func('darm_disasm_buffer', c_size_t, POINTER(_Darm), POINTER(c_uint32),
+          c_size_t, c_void_p, c_size_t, c_uint32, c_int32)
+_set_func('darm_disasm_packed', c_size_t, POINTER(PackedDarm),
+          POINTER(c_uint32), c_size_t, c_void_p, c_size_t, c_uint32, c_int32)
+_set_func('darm_unpack', None, POINTER(_Darm), POINTER(PackedDarm))
+_set_func('darm_scan', c_size_t, c_void_p, c_size_t, c_uint32, c_int32,
+          _ScanCallback, c_void_p, POINTER(c_uint32), POINTER(c_uint32))
+_set_func('darm_pattern_init', None, POINTER(_DarmPattern))
+_set_func('darm_search', c_size_t, c_void_p, c_size_t, c_uint32, c_int32,
+          POINTER(_DarmPattern), _ScanCallback, c_void_p)
+_set_func('darm_armv7_columns', c_size_t, POINTER(_DarmColumns), c_void_p,
+          c_size_t)
+_set_func('darm_classify', c_size_t, POINTER(Segment), c_size_t, c_void_p,
+          c_size_t, c_uint32, c_uint32)
+_set_func('darm_cfg_create', c_void_p, c_void_p, c_size_t, c_uint32)
+_set_func('darm_cfg_destroy', None, c_void_p)
+_set_func('darm_cfg_add_entry', c_int32, c_void_p, c_uint32)
+_set_func('darm_cfg_build', c_int32, c_void_p)
+_set_func('darm_cfg_blocks', POINTER(Block), c_void_p, POINTER(c_size_t))
+_set_func('darm_cfg_edges', POINTER(Edge), c_void_p, POINTER(c_size_t))
+_set_func('darm_cfg_block_at', c_uint32, c_void_p, c_uint32)
+_set_func('darm_xrefs_create', c_void_p, c_void_p, c_size_t, c_uint32,
+          c_int32)
+_set_func('darm_xrefs_destroy', None, c_void_p)
+_set_func('darm_xrefs_to', POINTER(Xref), c_void_p, c_uint32, c_uint32,
+          POINTER(c_size_t))
+_set_func('darm_xrefs_from', POINTER(Xref), c_void_p, c_uint32, c_uint32,
+          POINTER(c_size_t))
+_set_func('darm_xrefs_all', POINTER(Xref), c_void_p, POINTER(c_size_t))
+_set_func('darm_thumb_boundary', c_size_t, c_void_p, c_size_t, c_size_t,
+          c_size_t, POINTER(c_size_t))
+_set_func('darm_render_listing', c_size_t, c_void_p, c_size_t, c_uint32,
+          c_int32, c_char_p, c_size_t, c_uint32, POINTER(c_size_t))
 _set_func('darm_mnemonic_name', c_char_p, c_uint32)
 _set_func('darm_enctype_name', c_char_p, c_uint32)
 _set_func('darm_register_name', c_char_p, c_int32)
@@ -313,3 +1296,33 @@ _set_func('darm_condition_name', c_char_p, c_int32, c_int32)
 _set_func('darm_reglist', c_int32, c_uint16, c_char_p)
 _set_func('darm_str', c_int32, POINTER(_Darm), POINTER(_DarmStr))
 _set_func('darm_str2', c_int32, POINTER(_Darm), POINTER(_DarmStr), c_int32)
+
+# intern all known values, Instruction and Encoding values are enumerated
+# until the library stops returning names for them
+Condition._intern(range(-1, 16))
+Register._intern(range(-1, 16))
+Instruction._intern(itertools.takewhile(
+    lambda idx: _lib.darm_mnemonic_name(idx) is not None, itertools.count()))
+Encoding._intern(itertools.takewhile(
+    lambda idx: _lib.darm_enctype_name(idx) is not None, itertools.count()))
+
+if _darm is not None:
+    class NativeDarm(_darm.Darm, _DarmBase):
+        """Darm object decoded by the native _darm extension module.
+
+        The decoded instruction is kept inside the object itself and, like
+        with LazyDarm, its attributes are created on demand.
+
+        """
+        __slots__ = ()
+
+    _darm.setup(NativeDarm, Instruction, Encoding, Condition, Register,
+                Shift, RegisterList)
+
+    # the native functions accept the lazy argument as well, but always
+    # return NativeDarm objects, DecodeCache picks these up automatically
+    disasm_armv7 = _darm.disasm_armv7
+    disasm_thumb = _darm.disasm_thumb
+    disasm_thumb2 = _darm.disasm_thumb2
+
+_shift_types = dict((x, _str(_lib.darm_shift_type_name(x))) for x in range(4))
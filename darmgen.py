@@ -29,6 +29,7 @@ POSSIBILITY OF SUCH DAMAGE.
 import darmtbl
 import darmtbl2
 import itertools
+import re
 import sys
 import textwrap
 import string
@@ -90,12 +91,6 @@ def instruction_names_index_table(arr, kind):
     return typed_table('darm_instr_t', '%s_instr_labels' % kind, arr)
 
 
-def instruction_names_index_table_thumb2(arr, kind):
-    """Lookup table for instruction label for each Thumb2 instruction index."""
-    barr = map(lambda x: 'I_%s' % str(x[0]), arr.values())
-    return typed_table('darm_instr_t', '%s_instr_labels' % kind, barr)
-
-
 def type_lookup_table(name, *args):
     """Create a lookup table for a certain instruction type."""
     arr = ('I_%s' % x.upper() if x else 'I_INVLD' for x in args)
@@ -114,6 +109,8 @@ def type_encoding_enum(enumname, arr):
             '\n    // '.join(textwrap.wrap(', '.join(affects), 74)) + '\n' +
             '    T_%s,' % name)
 
+    # the amount of encoding types, like I_INSTRCNT for darm_instr_t
+    text.append('    T_ENCTYPECNT,')
     return 'typedef enum _%s_t {\n%s\n} %s_t;\n' % (enumname,
                                                     '\n\n'.join(text),
                                                     enumname)
@@ -141,6 +138,7 @@ def generate_format_strings(arr):
         # memory address
         '[<Rn>,#+/-<imm12>]', 'M',
         '[<Rn>,+/-<Rm>{,<shift>}]', 'M',
+        '[<Rn>,<Rm>]', 'M',
 
         # memory address with Rn as base register and an immediate or Rm
         # operand as offset
@@ -199,6 +197,9 @@ def generate_format_strings(arr):
         # order to swap halfwords that are being used
         '<x><y>', 'X',
 
+        # the SMLAW and SMULW instructions only take the latter one
+        '<y>', 'Y',
+
         # rounding flag for various signed multiplication instructions
         '{R}', 'R',
 
@@ -248,6 +249,538 @@ def generate_format_strings(arr):
     return ret
 
 
+def thumb_format_strings(arr, instrs):
+    """Format strings of the Thumb and Thumb2 instructions.
+
+    The Thumb syntax strings are first rewritten into their ARMv7 notation,
+    i.e., without the .W suffix, with the three-bit registers as their full
+    counterparts and with SP as base register. Instructions such as
+    SMLA<x><y> are decoded into one instruction per halfword combination,
+    e.g., SMLABT, so these are expanded accordingly. The same goes for a few
+    encodings which are decoded into either one of two instructions.
+
+    """
+    aliases = {'CBZ': 'CBNZ'}
+
+    rows = []
+    for row in arr:
+        full = row[0].replace('.W', '').replace(', ', ',')
+        for reg in ('d', 'n', 'm', 't'):
+            full = full.replace('<R%s3>' % reg, '<R%s>' % reg)
+        full = full.replace(',SP,', ',<Rn>,')
+
+        instr = instruction_name(full)
+        if '<x><y>' in full and instr + 'BB' in instrs:
+            rows.extend((full.replace(instr + '<x><y>', instr + xy, 1),)
+                        for xy in ('BB', 'BT', 'TB', 'TT'))
+        else:
+            rows.append((full,))
+
+        if instr in aliases:
+            rows.append((full.replace(instr, aliases[instr], 1),))
+    return generate_format_strings(rows)
+
+
+# the opcodes of the compiled format programs, one per format string
+# character as produced by generate_format_strings(), see also darm_str
+format_opcodes = [
+    ('s', 'FMT_S'), ('c', 'FMT_COND'), ('d', 'FMT_RD'), ('n', 'FMT_RN'),
+    ('m', 'FMT_RM'), ('a', 'FMT_RA'), ('t', 'FMT_RT'), ('2', 'FMT_RT2'),
+    ('h', 'FMT_RDHI'), ('l', 'FMT_RDLO'), ('i', 'FMT_IMM'),
+    ('S', 'FMT_SHIFT'), ('!', 'FMT_WRITEBACK'), ('e', 'FMT_ENDIAN'),
+    ('x', 'FMT_X'), ('X', 'FMT_XY'), ('Y', 'FMT_Y'), ('R', 'FMT_ROUND'),
+    ('T', 'FMT_TB'), ('r', 'FMT_REGLIST'), ('L', 'FMT_LSB'), ('w', 'FMT_WIDTH'),
+    ('o', 'FMT_OPTION'), ('B', 'FMT_BASE'), ('O', 'FMT_OFFSET'),
+    ('b', 'FMT_LABEL'), ('M', 'FMT_MEMORY'), ('A', 'FMT_ROTATE'),
+    ('C', 'FMT_COPROC'), ('p', 'FMT_OPC1'), ('P', 'FMT_OPC2'),
+    ('N', 'FMT_CRN'), ('J', 'FMT_CRM'), ('I', 'FMT_CRD'),
+]
+
+# format string characters whose operand may be absent, in which case
+# darm_str continues with the next format string of the instruction
+format_optional = 'dnmat2hliXYb'
+
+
+def format_alternatives(fmtstrs):
+    """Unique format strings of an instruction, in the order of evaluation.
+
+    darm_str falls back to the next format string when an operand is absent,
+    continuing at the same offset, so a format string which may fall back
+    has to come before one which never does, e.g., SMLAL<x><y> before
+    SMLAL{S}. Where both may fall back, the operands are tried in the order
+    of format_optional, e.g., "LSL Rd, Rn, Rm" before "LSL Rd, Rm, #imm".
+    The order is fixed, so that the generated tables don't depend on the
+    Python version.
+
+    """
+    key = lambda fmtstr: [(0, format_optional.index(ch))
+                          if ch in format_optional else (1, ord(ch))
+                          for ch in fmtstr]
+    return sorted(set(fmtstrs), key=key)
+
+
+def format_program(fmtstr):
+    """Compiles a format string into a format program for darm_str."""
+    opcodes = dict(format_opcodes)
+    return [opcodes.get(ch, 'FMT_INVLD') for ch in fmtstr] + ['FMT_END']
+
+
+def format_programs_table(name, fmtstrs, instrcnt):
+    """Table of the format programs of each instruction, for darm_str."""
+    lines = []
+    for instr, fmtstr in fmtstrs.items():
+        programs = ['        (const uint8_t[]){%s},' % '\n            '.join(
+            textwrap.wrap(', '.join(format_program(x)), 56))
+            for x in format_alternatives(fmtstr)]
+        lines.append('    [I_%s] = {\n%s\n    },' % (instr,
+                                                   '\n'.join(programs)))
+    return 'const uint8_t *%s[%d][3] = {\n%s\n};' % (
+        name, instrcnt, '\n'.join(sorted(lines)))
+
+
+# the operands darm_search matches on, in the order of darm_search_field_t,
+# the Thumb encodings also have three-bit registers and a few encodings
+# share a single field between the destination and a source register
+search_fields = 'Rd', 'Rn', 'Rm', 'Ra', 'Rt', 'Rt2', 'RdHi', 'RdLo', 'Rs', \
+    'cond'
+
+# the most encodings of a single instruction per instruction size, which is
+# what darm_search compiles a pattern into
+search_max_encodings = 32
+
+search_field_aliases = {
+    'Rd3': ('Rd',), 'Rn3': ('Rn',), 'Rm3': ('Rm',), 'Rt3': ('Rt',),
+    'Rdn': ('Rd', 'Rn'), 'Rdn3': ('Rd', 'Rn'),
+    'Rdm': ('Rd', 'Rm'), 'Rdm3': ('Rd', 'Rm'),
+}
+
+
+def search_encoding(bits):
+    """Mask and value of the fixed bits of an encoding, and its operands.
+
+    The bits which should be zero or one aren't fixed, the decoders accept
+    either value.
+
+    The position of each operand of search_fields is given as
+    (width << 5) | lsb, or zero if the encoding doesn't have the operand.
+
+    """
+    mask, value, fields = 0, 0, {}
+    lsb = sum(1 if isinstance(x, int) else x.bitsize for x in bits)
+    for x in bits:
+        if isinstance(x, int):
+            lsb -= 1
+            if not isinstance(x, (darmtbl.ShouldBe, darmtbl2.ShouldBe)):
+                mask, value = mask | 1 << lsb, value | x << lsb
+            continue
+
+        lsb -= x.bitsize
+        for name in search_field_aliases.get(x.name, (x.name,)):
+            fields[name] = (x.bitsize << 5) | lsb
+    return mask, value, tuple(fields.get(x, 0) for x in search_fields)
+
+
+# the way darm decodes a few encodings differs from darmtbl.ARMv7 and
+# darmtbl2.thumbs, i.e., which other instructions an encoding may be decoded
+# into, and the fixed bits which the decoders don't look at, e.g., the
+# ARMv7 hints are told apart by their lowest three bits only
+armv7_search_aliases = {'PLD': ('PLDW',)}
+
+armv7_search_ignored = {
+    'NOP': 0xf00f8, 'YIELD': 0xf00f8, 'WFE': 0xf00f8, 'WFI': 0xf00f8,
+    'SEV': 0xf00f8, 'SMLA': 0x80, 'SMLAL': 0x80, 'SMUSD': 0xf000,
+    'UDF': 0xf0,
+}
+
+thumb_search_aliases = {'CBZ': ('CBNZ',), 'LSL': ('MOV',)}
+
+thumb_search_ignored = {
+    'NOP': 0x80, 'YIELD': 0x80, 'WFE': 0x80, 'WFI': 0x80, 'SEV': 0x80,
+}
+
+# the Thumb and Thumb2 encodings that darmtbl2.thumbs doesn't list, as the
+# generated parts of the decoders can't handle them
+thumb_search_extra = [
+    ('ADD<c> <Rdn>, <Rm>', 0, 1, 0, 0, 0, 1, 0, 0, darmtbl2.D, darmtbl2.Rm,
+     darmtbl2.Rdn3),
+    ('ADD<c> <Rdm>, SP, <Rdm>', 0, 1, 0, 0, 0, 1, 0, 0, darmtbl2.D, 1, 1, 0,
+     1, darmtbl2.Rdm3),
+]
+
+
+def search_encodings(arr, instrs, aliases, ignored, halfwords):
+    """The encodings of each instruction, as matched by darm_search.
+
+    The encodings of the aliases of an instruction are listed for each of
+    them, and so are encodings such as SMLA<x><y> if halfwords is set, i.e.,
+    if they're decoded into one instruction per halfword combination (like
+    thumb_format_strings() does).
+
+    """
+    ret = {}
+    for row in arr:
+        instr = instruction_name(row[0])
+        names = [instr] + list(aliases.get(instr, ()))
+        if halfwords and '<x><y>' in row[0] and instr + 'BB' in instrs:
+            names = [instr + xy for xy in ('BB', 'BT', 'TB', 'TT')]
+
+        mask, value, fields = search_encoding(row[1:])
+        for name in names:
+            encoding = (mask & ~ignored.get(name, 0),
+                        value & ~ignored.get(name, 0), fields)
+            if name in instrs and encoding not in ret.setdefault(name, []):
+                ret[name].append(encoding)
+    return ret
+
+
+def search_encodings_table(name, encodings, instrs):
+    """Table of encodings grouped by instruction, and its index table.
+
+    The encodings of instruction x are the entries index[x] up to index[x+1].
+    darm_search has room for search_max_encodings of them per size.
+
+    """
+    lines, index = [], []
+    for instr in instrs:
+        index.append(str(len(lines)))
+        sizes = [4 if x[0] >> 16 else 2 for x in encodings.get(instr, ())]
+        assert max(sizes.count(2), sizes.count(4)) <= search_max_encodings, \
+            instr
+
+        for mask, value, fields in encodings.get(instr, ()):
+            size = 4 if mask >> 16 else 2
+            lines.append('    {0x%08x, 0x%08x, %d, {%s}}, // %s' % (
+                mask, value, size, ', '.join(str(x) for x in fields), instr))
+    index.append(str(len(lines)))
+
+    return 'const darm_encoding_t %s[%d] = {\n%s\n};\n\n%s' % (
+        name, len(lines), '\n'.join(lines), typed_table(
+            'const uint16_t', '%s_index' % name, index))
+
+
+def case_tables(name, arr):
+    """A pair of string tables, as-is and in lowercase, for darm_str2."""
+    ret = []
+    for arr in (arr, [x.lower() for x in arr]):
+        text = ', '.join('"%s"' % x for x in arr)
+        ret.append('    {\n        %s\n    },' % '\n        '.join(
+            textwrap.wrap(text, 70)))
+    return 'const char *%s[2][%d] = {\n%s\n};\n' % (
+        name, len(arr), '\n'.join(ret))
+
+
+def bit_pattern(*halfwords):
+    """Mask and value of a bit pattern such as '111 01 00xx0xx xxxx'."""
+    bits = ''.join(halfwords).replace(' ', '')
+    mask = int(''.join('0' if x == 'x' else '1' for x in bits), 2)
+    return mask, int(bits.replace('x', '0'), 2)
+
+
+def decision_tree(entries, known=0, maxwidth=4):
+    """Compiles a list of (mask, value, action) entries into a decision tree.
+
+    The first entry matching an instruction wins. known is a mask of the
+    bits which are known to match already. Each node is either a leaf,
+    ('leaf', action), with action None if no entry matches, or a switch on a
+    field of bits, ('switch', lsb, width, children), with a child node for
+    each value of the field.
+
+    """
+    if not entries:
+        return 'leaf', None
+
+    # the first entry is the only one that's left, or at least the one that
+    # takes precedence over the others
+    if entries[0][0] & ~known == 0:
+        return 'leaf', entries[0][2]
+
+    untested = 0
+    for mask, _, _ in entries:
+        untested |= mask & ~known
+
+    bits = [x for x in range(32) if (untested >> x) & 1]
+
+    def cares(bit):
+        return [idx for idx, (mask, _, _) in enumerate(entries)
+                if (mask >> bit) & 1]
+
+    def widen(bit):
+        # extend a bit to a field with adjacent bits which are constrained
+        # by the very same entries, without crossing a halfword boundary
+        lsb = msb = bit
+        while msb - lsb + 1 < maxwidth and msb + 1 in bits and \
+                (msb + 1) % 16 != 0 and cares(msb + 1) == cares(bit):
+            msb += 1
+        while msb - lsb + 1 < maxwidth and lsb - 1 in bits and \
+                lsb % 16 != 0 and cares(lsb - 1) == cares(bit):
+            lsb -= 1
+        return lsb, msb - lsb + 1
+
+    def subsets(lsb, width):
+        field = ((1 << width) - 1) << lsb
+        for value in range(2**width):
+            value <<= lsb
+            yield [x for x in entries if (x[1] ^ value) & x[0] & field == 0]
+
+    def score(field):
+        # the most discriminating field is the one which leaves the least
+        # amount of entries on average
+        sizes = [len(x) for x in subsets(*field)]
+        return float(sum(sizes)) / len(sizes), -field[1], -field[0]
+
+    lsb, width = min((widen(x) for x in bits), key=score)
+    field = ((1 << width) - 1) << lsb
+
+    children = [decision_tree(x, known | field, maxwidth)
+                for x in subsets(lsb, width)]
+
+    # this field does not make a difference after all
+    if all(x == children[0] for x in children):
+        return children[0]
+
+    return 'switch', lsb, width, children
+
+
+def decision_tree_depth(node):
+    if node[0] == 'leaf':
+        return 0
+    return 1 + max(decision_tree_depth(x) for x in node[3])
+
+
+def decision_tree_code(node, leaf, indent='    '):
+    """Generates C code for a decision tree over the halfwords w and w2.
+
+    leaf is a function returning the C statement for an action.
+
+    """
+    if node[0] == 'leaf':
+        return [indent + leaf(node[1])]
+
+    _, lsb, width, children = node
+    if lsb >= 16:
+        expr = '(w >> %d) & %d' % (lsb - 16, 2**width - 1)
+    else:
+        expr = '(w2 >> %d) & %d' % (lsb, 2**width - 1)
+
+    # merge the cases which result in the same code, the most common one
+    # becomes the default case
+    cases = []
+    for value, child in enumerate(children):
+        code = decision_tree_code(child, leaf, indent + '    ')
+        for row in cases:
+            if row[1] == code:
+                row[0].append(value)
+                break
+        else:
+            cases.append(([value], code))
+
+    default = max(cases, key=lambda x: len(x[0]))
+
+    lines = ['%sswitch (%s) {' % (indent, expr)]
+    for values, code in cases:
+        if values is default[0]:
+            continue
+        lines += ['%scase %d:' % (indent, x) for x in values] + code
+    lines += ['%sdefault:' % indent] + default[1]
+    lines.append('%s}' % indent)
+    return lines
+
+
+# operand extraction routines of armv7_disas_cond, one of which is selected
+# by each entry of the armv7_dispatch table
+armv7_handlers = [
+    'INVLD', 'MUL', 'MUL_INVLD', 'MLA', 'MULL', 'STACK1_REG', 'STACK1_IMM',
+    'STACK2_REG', 'STACK2_IMM', 'SWP', 'LDREX', 'STREX', 'STACK0_IMM',
+    'STACK0_REG', 'SAT', 'PUSR', 'SSAT', 'SSAT16', 'ARITH_SHIFT_REG',
+    'ARITH_SHIFT_IMM', 'ARITH_IMM', 'BFI', 'BITS', 'BRANCH', 'SVC', 'BKPT',
+    'BX', 'MSR', 'MOV_IMM', 'MOVW', 'CMP_OP_REG', 'CMP_OP_IMM', 'CMP_IMM',
+    'OPLESS', 'DST_SRC_REG', 'DST_SRC_IMM', 'LDSTREGS', 'BITREV', 'MVN_REG',
+    'MVN_IMM', 'SMUL', 'SMC', 'CLZ', 'SEL', 'PKH', 'SMMUL', 'SMUSD', 'SMUAD',
+    'SMLSLD', 'SMLA', 'SMLAL', 'PAS', 'CDP', 'MCR', 'UDF',
+]
+
+
+def armv7_dispatch_entry(op, lo, table, lut):
+    """Decoding routine for bits 27..20 (op) and 7..4 (lo) of an instruction.
+
+    Narrows a conditional ARMv7 instruction down the same way a chain of
+    tests over these bits would, using the armv7_table and the lowercase
+    type_*_instr_lookup tables in lut. Returns a (handler, instruction,
+    encoding type) tuple; the handler may still refine the instruction based
+    on the remaining bits.
+
+    """
+    def bit(x):
+        return (op >> (x - 20)) & 1 if x >= 20 else (lo >> (x - 4)) & 1
+
+    invalid = 'INVLD', None, 'INVLD'
+
+    # multiplication, synchronization and the extra load/store instructions
+    if op >> 5 == 0 and bit(7) and bit(4):
+        if not bit(24) and lo == 0b1001:
+            instr = lut['mul'][(op >> 1) & 0b111]
+
+            # except for UMAAL and MLS, every variant takes the S bit
+            if instr in ('umaal', 'mls') and bit(20):
+                return 'MUL_INVLD', instr, 'ARM_MUL'
+            handler = {'mul': 'MUL', 'mla': 'MLA', 'mls': 'MLA'}
+            return handler.get(instr, 'MULL'), instr, 'ARM_MUL'
+
+        index = (lo & 0b110) | bit(20)
+        if not bit(24) and lo & 0b110 and bit(21):
+            if lut['stack1'][index] is None:
+                return invalid
+            return 'STACK1_IMM' if bit(22) else 'STACK1_REG', \
+                lut['stack1'][index], 'ARM_STACK1'
+
+        if lo & 0b110 and op & 0b10010 != 0b00010:
+            if lut['stack2'][index] is None:
+                return invalid
+            return 'STACK2_IMM' if bit(22) else 'STACK2_REG', \
+                lut['stack2'][index], 'ARM_STACK2'
+
+        if bit(24) and lo == 0b1001:
+            instr = lut['sync'][op & 0b1111]
+            if instr in ('swp', 'swpb'):
+                return 'SWP', instr, 'ARM_SYNC'
+            if instr is not None:
+                return instr[:5].upper(), instr, 'ARM_SYNC'
+
+    # the STR, STRT, LDR, LDRT, STRB, STRBT, LDRB, and LDRBT instructions,
+    # unless they are media instructions
+    elif op >> 6 == 0b01 and not (bit(25) and bit(4)):
+        return 'STACK0_REG' if bit(25) else 'STACK0_IMM', \
+            lut['stack0'][op & 0b11111], 'ARM_STACK0'
+
+    # saturating addition and subtraction instructions
+    if op & 0b11111001 == 0b00010000 and lo == 0b0101:
+        return 'SAT', lut['sat'][(op >> 1) & 0b11], 'ARM_SAT'
+
+    # packing, unpacking, saturation, and reversal instructions
+    if op >> 3 == 0b01101 and bit(4):
+        op1, op2 = op & 0b111, lo >> 1
+
+        # the (SX|UX)T(A)(B|H)(16) instructions, bits 19..16 decide between
+        # both variants, which are either both valid or both invalid
+        if op2 == 0b011 and lut['pusr'][op1 << 1] is not None:
+            assert lut['pusr'][(op1 << 1) + 1] is not None
+            return 'PUSR', lut['pusr'][op1 << 1], 'ARM_PUSR'
+
+        if op1 & 0b010 and op2 & 1 == 0:
+            return 'SSAT', 'usat' if op1 >> 2 else 'ssat', 'ARM_PUSR'
+
+        if op1 in (0b010, 0b110) and op2 == 0b001:
+            return 'SSAT16', 'ssat16' if op1 == 0b010 else 'usat16', \
+                'ARM_PUSR'
+
+    if op not in table:
+        return invalid
+
+    instr, typ = table[op][0].lower(), table[op][1][1]
+    if typ == 'ARM_ARITH_SHIFT':
+        return 'ARITH_SHIFT_REG' if bit(4) else 'ARITH_SHIFT_IMM', instr, typ
+
+    if typ in ('ARM_ARITH_IMM', 'ARM_CMP_IMM', 'ARM_OPLESS', 'ARM_LDSTREGS',
+               'ARM_PAS', 'ARM_UDF'):
+        if typ == 'ARM_PAS':
+            instr = lut['pas'][((op & 0b111) << 3) | (lo >> 1)]
+            if instr is None:
+                return invalid
+        return typ[4:], instr, typ
+
+    if typ == 'ARM_BITS':
+        instr = lut['bits'][(op >> 1) & 0b11]
+        return 'BFI' if instr == 'bfi' else 'BITS', instr, typ
+
+    if typ == 'ARM_BRNCHSC':
+        return 'SVC' if instr == 'svc' else 'BRANCH', instr, typ
+
+    if typ == 'ARM_BRNCHMISC':
+        instr = lut['brnchmisc'][lo]
+        handler = {'bkpt': 'BKPT', 'bx': 'BX', 'bxj': 'BX', 'blx': 'BX',
+                   'msr': 'MSR'}
+        if instr not in handler:
+            return invalid
+        return handler[instr], instr, typ
+
+    if typ == 'ARM_MOV_IMM':
+        return 'MOV_IMM' if instr in ('mov', 'mvn') else 'MOVW', instr, typ
+
+    if typ == 'ARM_CMP_OP':
+        return 'CMP_OP_REG' if bit(4) else 'CMP_OP_IMM', instr, typ
+
+    if typ == 'ARM_DST_SRC':
+        instr = lut['shift'][lo]
+        if instr is None:
+            return invalid
+        return 'DST_SRC_REG' if bit(4) else 'DST_SRC_IMM', instr, typ
+
+    if typ == 'ARM_BITREV':
+        if lo == 0b0011:
+            instr = {'rev16': 'rev', 'revsh': 'rbit'}.get(instr, instr)
+        return 'BITREV', instr, typ
+
+    if typ == 'ARM_MISC' and instr == 'mvn':
+        return 'MVN_REG' if bit(4) else 'MVN_IMM', instr, typ
+
+    if typ == 'ARM_MISC' and instr == 'smc':
+        if lo in (0b1000, 0b1010, 0b1100, 0b1110):
+            return 'SMUL', 'smul', 'ARM_SM'
+        if lo == 0b0111:
+            return 'SMC', 'smc', typ
+        if lo == 0b0001:
+            return 'CLZ', 'clz', typ
+        return invalid
+
+    if typ == 'ARM_MISC' and instr == 'sel':
+        return 'SEL' if bit(5) else 'PKH', 'sel' if bit(5) else 'pkh', typ
+
+    if typ == 'ARM_SM' and instr == 'smmul':
+        return 'SMMUL', 'smmls' if bit(6) else 'smmul', typ
+
+    if typ == 'ARM_SM' and instr == 'smusd':
+        return 'SMUSD' if bit(6) else 'SMUAD', \
+            'smusd' if bit(6) else 'smuad', typ
+
+    if typ == 'ARM_SM' and instr == 'smlsld':
+        return 'SMLSLD', 'smlsld' if bit(6) else 'smlald', typ
+
+    if typ == 'ARM_SM' and instr in ('smla', 'smlal'):
+        return instr.upper(), instr, typ
+
+    if typ == 'ARM_MVCR':
+        return 'MCR' if bit(4) else 'CDP', instr if bit(4) else 'cdp', typ
+
+    assert typ not in ('ARM_MISC', 'ARM_SM'), (instr, typ)
+    return invalid
+
+
+def armv7_dispatch_table(table, lut):
+    """Dispatch table over bits 27..20 and 7..4 of conditional instructions."""
+    lines = []
+    for op in range(256):
+        lines.append('    // bits 27..20 = 0x%02x' % op)
+        line = '   '
+        for lo in range(16):
+            handler, instr, typ = armv7_dispatch_entry(op, lo, table, lut)
+
+            # the unallocated synchronization primitives used to be decoded
+            # with Rn already extracted, which is fine as long as the actual
+            # handler extracts Rn as well
+            if op >> 4 == 0b0001 and lo == 0b1001 and typ != 'ARM_SYNC':
+                assert handler in ('INVLD', 'CMP_OP_REG'), (op, handler)
+
+            entry = ' {H_%s, T_%s, I_%s},' % (
+                handler, typ, instr.upper() if instr else 'INVLD')
+            if len(line) + len(entry) > 78:
+                lines.append(line)
+                line = '   '
+            line += entry
+        lines.append(line)
+    return 'const armv7_dispatch_t armv7_dispatch[4096] = {\n%s\n};\n' % (
+        '\n'.join(lines))
+
+
 def magic_open(fname):
     # python magic!
     sys.stdout = open(fname, 'w')
@@ -304,7 +837,7 @@ def thumb2_immChk(instr, hasImm):
 
 # check if instruction affects same flags as instruction type
 def thumb2_flagChk(instr, hasFlags):
-    flags = [d2.S, d2.register_list, d2.type_, d2.W, d2.P, d2.U]
+    flags = [d2.S, d2.register_list, d2.type_, d2.W, d2.P, d2.U, d2.rotate]
     instrFlags = set(filter(lambda x: x in flags, instr))
     return len(set(instrFlags).symmetric_difference(set(hasFlags))) == 0
 
@@ -569,6 +1102,243 @@ instr_types = [
                  [''], lambda x, y, z: (thumb2_flagChk(x, [d2.S, d2.type_]))),
 ]
 
+# the operand fields which are extracted for each of the Thumb2 register,
+# immediate and flag types, in this order, see also thumb2_fields_code()
+thumb2_fields = {
+    'NO_REG': [],
+    'RT_REG': ['d->Rt = (w2 >> 12) & b1111;'],
+    'RT_RT2_REG': ['d->Rt = (w2 >> 12) & b1111;',
+                   'd->Rt2 = (w2 >> 8) & b1111;'],
+    'RM_REG': ['d->Rm = w & b1111;'],
+    'RD_REG': ['d->Rd = (w2 >> 8) & b1111;'],
+    'RD_RM_REG': ['d->Rd = (w2 >> 8) & b1111;', 'd->Rm = w2 & b1111;'],
+    'RN_REG': ['d->Rn = w & b1111;'],
+    'RN_RT_REG': ['d->Rn = w & b1111;', 'd->Rt = (w2 >> 12) & b1111;'],
+    'RN_RT_RT2_REG': ['d->Rn = w & b1111;', 'd->Rt = (w2 >> 12) & b1111;',
+                      'd->Rt2 = (w2 >> 8) & b1111;'],
+    'RN_RM_REG': ['d->Rn = w & b1111;', 'd->Rm = w2 & b1111;'],
+    'RN_RM_RT_REG': ['d->Rn = w & b1111;', 'd->Rm = w2 & b1111;',
+                     'd->Rt = (w2 >> 12) & b1111;'],
+    'RN_RD_REG': ['d->Rn = w & b1111;', 'd->Rd = (w2 >> 8) & b1111;'],
+    'RN_RD_RT_REG': ['d->Rn = w & b1111;', 'd->Rd = w2 & b1111;',
+                     'd->Rt = (w2 >> 12) & b1111;'],
+    'RN_RD_RT_RT2_REG': ['d->Rn = w & b1111;', 'd->Rd = w2 & b1111;',
+                         'd->Rt = (w2 >> 12) & b1111;',
+                         'd->Rt2 = (w2 >> 8) & b1111;'],
+    'RN_RD_RM_REG': ['d->Rn = w & b1111;', 'd->Rm = w2 & b1111;',
+                     'd->Rd = (w2 >> 8) & b1111;'],
+    'RN_RD_RM_RA_REG': ['d->Rn = w & b1111;', 'd->Rm = w2 & b1111;',
+                        'd->Rd = (w2 >> 8) & b1111;',
+                        'd->Ra = (w2 >> 12) & b1111;'],
+
+    'NO_IMM': ['d->I = B_UNSET;'],
+    'IMM12': ['d->I = B_SET;', 'd->imm = w2 & 0xfff;'],
+    'IMM8': ['d->I = B_SET;', 'd->imm = w2 & 0xff;'],
+    'IMM2': ['d->I = B_SET;', 'd->imm = (w2 >> 4) & b11;',
+             'd->shift = d->imm;', 'd->shift_type = S_LSL;'],
+    # imm3:imm2
+    'IMM2_IMM3': ['d->I = B_SET;',
+                  'd->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);'],
+    # i:imm3:imm8, which is zero extended if bits 9..8 are 0b10 and
+    # thumb expanded otherwise
+    'IMM1_IMM3_IMM8': [
+        'd->I = B_SET;',
+        'd->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);',
+        'if((w & 0x300) != 0x200) {',
+        '    d->imm = thumb_expand_imm(d->imm);',
+        '}'],
+
+    'NO_FLAG': [],
+    'ROTATE_FLAG': ['d->rotate = (w2 >> 1) & b11000;'],
+    'U_FLAG': ['d->U = (w >> 7) & 1 ? B_SET : B_UNSET;'],
+    'WUP_FLAG': ['d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;',
+                 'd->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;',
+                 'd->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;'],
+    # the shift amount is always an imm3:imm2 immediate
+    'TYPE_FLAG': ['thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);'],
+    'REGLIST_FLAG': ['d->reglist = w2;'],
+    'WP_REGLIST_FLAG': ['d->reglist = w2;',
+                        'd->W = (w >> 5) & 1 ? B_SET : B_UNSET;'],
+    'S_FLAG': ['d->S = (w >> 4) & 1 ? B_SET : B_UNSET;'],
+    'S_TYPE_FLAG': ['d->S = (w >> 4) & 1 ? B_SET : B_UNSET;',
+                    'thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);'],
+}
+
+
+# the names and filter functions of the Thumb2 register, immediate and flag
+# types, respectively
+thumb2_types = [[(x[1], x[4]) for x in instr_types if x[0] == kind]
+                for kind in (3, 31, 32)]
+
+
+# the types of a few Thumb2 encodings which thumb2_types doesn't derive from
+# their operand fields, e.g., the SP and PC relative encodings have a fixed
+# Rn, which darm reports nonetheless, as (register, immediate, flag) type,
+# where None keeps the derived type
+thumb2_types_override = {
+    'ADD{S}<c>.W <Rd>, SP, #<const>': ('RN_RD_REG', None, None),
+    'ADD{S}<c>.W <Rd>, SP, <Rm>{, <shift>}': ('RN_RD_RM_REG', None, None),
+    'ADDW<c> <Rd>, SP, #<imm12>': ('RN_RD_REG', None, None),
+    'ADR<c>.W <Rd>, <label>': ('RN_RD_REG', None, None),
+    'LDR<c>.W <Rt>, <label>': ('RN_RT_REG', None, None),
+    'SUB{S}<c>.W <Rd>, SP, #<const>': ('RN_RD_REG', None, None),
+    'SUB{S}<c> <Rd>, SP, <Rm>{, <shift>}': ('RN_RD_RM_REG', None, None),
+    'SUBW<c> <Rd>, SP, #<imm12>': ('RN_RD_REG', None, None),
+
+    # the encodings with a fixed P or W flag still report all three, those of
+    # LDRD and STRD are fixed up by thumb2_parse_misc
+    'LDR<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'LDRB<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'LDRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]': (None, None, 'WUP_FLAG'),
+    'LDRD<c> <Rt>, <Rt2>, <label>': (None, None, 'WUP_FLAG'),
+    'LDRH<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'LDRSB<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'LDRSH<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'STR<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'STRB<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+    'STRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]': (None, None, 'WUP_FLAG'),
+    'STRH<c> <Rt>, [<Rn>, #-<imm8>]': (None, None, 'WUP_FLAG'),
+
+    # thumb2_parse_misc puts the 16-bit immediate together
+    'MOVT<c> <Rd>, #<imm16>': (None, 'IMM1_IMM3_IMM8', None),
+    'MOVW<c> <Rd>, #<imm16>': (None, 'IMM1_IMM3_IMM8', None),
+
+    # the writeback flag is set by thumb2_parse_misc
+    'STM<c>.W <Rn>{!}, <registers>': (None, None, 'REGLIST_FLAG'),
+    'STMDB<c> <Rn>{!}, <registers>': (None, None, 'REGLIST_FLAG'),
+
+    # the memory hints which are NOPs have no operands
+    'NOP<c>.W': ('NO_REG', 'NO_IMM', 'NO_FLAG'),
+}
+
+
+def thumb2_encoding_types(row):
+    """The register, immediate and flag type of a Thumb2 encoding.
+
+    Each type matches the operand fields of the encoding. Fields which don't
+    match any type, such as the immediates of branch instructions, are left
+    to thumb2_parse_misc, i.e., they get the first type, NO_REG, NO_IMM or
+    NO_FLAG.
+
+    """
+    bits = row[1:]
+    types = [([name for name, fn in x if fn(bits, row[0], 0)] or [x[0][0]])[0]
+             for x in thumb2_types]
+    override = thumb2_types_override.get(row[0], (None, None, None))
+    return tuple(y or x for x, y in zip(types, override))
+
+
+def thumb2_field_combinations(arr):
+    """The combinations of Thumb2 register, immediate and flag types of the
+    Thumb2 instructions in arr, see also thumb2_encoding_types()."""
+    ret = set()
+    for row in arr:
+        bits = row[1:]
+        if sum(1 if isinstance(x, int) else x.bitsize for x in bits) == 32:
+            ret.add(thumb2_encoding_types(row))
+    return sorted(ret)
+
+
+def thumb2_decoder_entries(arr, unallocated, instrs):
+    """The (mask, value, action) entries of the Thumb2 decoder.
+
+    The action of each Thumb2 encoding in arr is its instruction and its
+    register, immediate and flag type. Encodings such as SMLA<x><y> get an
+    entry per halfword combination, like thumb_format_strings() does. The
+    unallocated patterns get None as action.
+
+    Only the fixed bits of an encoding are matched, not the bits which
+    should be zero or one, and the most specific encoding takes precedence,
+    first by its first halfword and then by its second halfword, e.g., CMP
+    over SUB with Rd = 0b1111 and MOV over LSL with a zero shift.
+
+    """
+    ret = []
+    for row in arr:
+        bits = row[1:]
+        if sum(1 if isinstance(x, int) else x.bitsize for x in bits) != 32:
+            continue
+
+        instr = instruction_name(row[0])
+        mask, value, _ = search_encoding(bits)
+        types = thumb2_encoding_types(row)
+        if '<x><y>' not in row[0] or instr + 'BB' not in instrs:
+            ret.append((mask, value, (instr,) + types))
+            continue
+
+        # the N and M bits select the bottom or top halfword
+        lsb, fields = 32, {}
+        for x in bits:
+            lsb -= 1 if isinstance(x, int) else x.bitsize
+            if not isinstance(x, int):
+                fields[x.name] = lsb
+
+        n, m = 1 << fields['N'], 1 << fields['M']
+        for idx, xy in enumerate(('BB', 'BT', 'TB', 'TT')):
+            ret.append((mask | n | m,
+                        value | (n if idx & 2 else 0) | (m if idx & 1 else 0),
+                        (instr + xy,) + types))
+
+    # encodings which merely spell out a special case of another encoding
+    # with the same action, such as ADD with SP as Rn, don't take precedence
+    # over anything, e.g., CMN over ADD with SP as Rn and Rd = 0b1111
+    ret = [x for idx, x in enumerate(ret)
+           if not any(y[2] == x[2] and y[0] & x[0] == y[0] and
+                      x[1] & y[0] == y[1] and (y[0] != x[0] or jdx < idx)
+                      for jdx, y in enumerate(ret))]
+
+    ret += [bit_pattern(*x) + (None,) for x in unallocated]
+
+    # like the ARM ARM, the first halfword decides, e.g., LDR (literal) with
+    # Rn = 0b1111 takes precedence over LDRT, and ties are broken by the
+    # second halfword
+    popcount = lambda x: bin(x).count('1')
+    return sorted(ret, key=lambda x: (-popcount(x[0] >> 16),
+                                      -popcount(x[0] & 0xffff)))
+
+
+def thumb2_fields_code(types):
+    """A function which extracts the operand fields of a combination of
+    Thumb2 register, immediate and flag types in a single pass."""
+    lines = []
+    for name in types:
+        lines += ['    ' + x for x in thumb2_fields[name]]
+
+    # not every combination uses both halfwords
+    text = '\n'.join(lines)
+    unused = [x for x in ('w', 'w2') if not re.search(r'\b%s\b' % x, text)]
+    if unused:
+        text = '    %s\n%s' % (' '.join('(void) %s;' % x for x in unused),
+                              text)
+    return ('static void thumb2_fields_%s(darm_t *d,\n'
+            '    uint16_t w, uint16_t w2)\n{\n%s\n}\n' % (
+                '_'.join(types).lower(), text.rstrip()))
+
+
+def thumb2_fields_generic():
+    """The fallback for combinations of types without their own function,
+    which switches over the register, immediate and flag type in turn."""
+    text = []
+    for field, types in zip(('instr_type', 'instr_imm_type',
+                             'instr_flag_type'), thumb2_types):
+        text.append('    switch ((uint32_t) d->%s) {' % field)
+        for name, _ in types:
+            if not thumb2_fields[name]:
+                continue
+            text.append('    case T_THUMB2_%s:' % name)
+            text += ['        ' + x for x in thumb2_fields[name]]
+            text.append('        break;\n')
+
+        # unknown immediate types used to be flagged as immediates as well
+        text.append('    default:')
+        if field == 'instr_imm_type':
+            text.append('        d->I = B_SET;')
+        text.append('        break;')
+        text.append('    }\n')
+    return ('static void thumb2_fields_generic(darm_t *d, uint16_t w, '
+            'uint16_t w2)\n{\n%s\n}\n' % '\n'.join(text).rstrip())
+
+
 if __name__ == '__main__':
     armv7_table, thumb_table, thumb2_table = {}, {}, {}
 
@@ -689,6 +1459,13 @@ if __name__ == '__main__':
     magic_open('darm-tbl.h')
 
     fmtstrs = generate_format_strings(darmtbl.ARMv7)
+    armv7_encodings = search_encodings(
+        darmtbl.ARMv7, set(instruction_names(open('instructions.txt'))),
+        armv7_search_aliases, armv7_search_ignored, False)
+    thumb_encodings = search_encodings(
+        darmtbl2.thumbs + thumb_search_extra,
+        set(instruction_names(open('instructions.txt'))),
+        thumb_search_aliases, thumb_search_ignored, True)
     # until we remove all unused instructions..
     instrcnt = len(open('instructions.txt').readlines())
 
@@ -707,6 +1484,24 @@ if __name__ == '__main__':
     print('extern const char *darm_enctypes[%d];' % len(instr_types))
     print('extern const char *darm_registers[16];')
 
+    # names for darm_str2, which are indexed by the lowercase flag
+    print('extern const char *darm_format_mnemonics[2][%d];' % count)
+    print('extern const char *darm_format_registers[2][16];')
+    print('extern const char *darm_format_conditions[2][16];')
+    print('extern const char *darm_format_shifts[2][5];')
+
+    # the fixed bits and operand fields of each encoding, for darm_search
+    print(enum_table('darm_search_field', ['SF_%s' % x.upper()
+                                           for x in search_fields] +
+                     ['SF_FIELDCNT']))
+    print('typedef struct _darm_encoding_t {')
+    print('    uint32_t mask;')
+    print('    uint32_t value;')
+    print('    uint8_t size;')
+    print('    uint8_t fields[SF_FIELDCNT];')
+    print('} darm_encoding_t;')
+    print('#define SEARCH_MAX_ENCODINGS %d' % search_max_encodings)
+
     print('#endif')
 
     #
@@ -744,6 +1539,10 @@ if __name__ == '__main__':
     print('extern darm_enctype_t thumb_instr_types[256];')
     print('extern darm_instr_t thumb_instr_labels[256];')
 
+    print('extern const darm_encoding_t thumb_encodings[%d];' % len(
+        [0 for x in thumb_encodings.values() for _ in x]))
+    print('extern const uint16_t thumb_encodings_index[%d];' % (count + 1))
+
     type_lut('gpi', 4)
     type_lut('hints', 3)
     type_lut('extend', 2)
@@ -763,11 +1562,16 @@ if __name__ == '__main__':
     print('#include <stdint.h>')
     print('#include "darm-tbl.h"')
 
-    print('#define THUMB2_INSTRUCTION_COUNT %d' % len(thumb2_table))
+    print('extern const uint8_t *thumb_format_programs[%d][3];' % instrcnt)
 
-    # print some required definitions
-    print('extern darm_instr_t thumb2_instr_labels[256];')
-    print('extern const char * thumb2_instruction_strings[256];')
+    # the amount of Thumb2 register, immediate and flag types, which index
+    # the table of operand extraction functions
+    thumb2_kinds = [[name for name, _ in x] for x in thumb2_types]
+    print('#define THUMB2_REG_TYPES %d' % len(thumb2_kinds[0]))
+    print('#define THUMB2_IMM_TYPES %d' % len(thumb2_kinds[1]))
+    print('#define THUMB2_FLAG_TYPES %d' % len(thumb2_kinds[2]))
+    print('extern const uint8_t thumb2_fields_index[THUMB2_REG_TYPES]'
+          '[THUMB2_IMM_TYPES][THUMB2_FLAG_TYPES];')
 
     type_lut('immediate', 4)
     type_lut('flags', 3)
@@ -791,6 +1595,10 @@ if __name__ == '__main__':
     print('extern darm_enctype_t thumb2_instr_types[256];')
 
     print('extern darm_instr_t armv7_instr_labels[256];')
+    print('extern const darm_encoding_t armv7_encodings[%d];' % len(
+        [0 for x in armv7_encodings.values() for _ in x]))
+    print('extern const uint16_t armv7_encodings_index[%d];' % (count + 1))
+
     type_lut('shift', 4)
     type_lut('brnchmisc', 4)
     type_lut('opless', 3)
@@ -804,7 +1612,19 @@ if __name__ == '__main__':
     type_lut('sat', 2)
     type_lut('sync', 4)
     type_lut('pusr', 4)
-    print('extern const char *armv7_format_strings[%d][3];' % instrcnt)
+
+    # first-level lookup over bits 27..20 and 7..4 of ARMv7 instructions
+    print(enum_table('armv7_handler', ['H_%s' % x for x in armv7_handlers] +
+                     ['H_HANDLERCNT']))
+    print('typedef struct _armv7_dispatch_t {')
+    print('    uint8_t handler;')
+    print('    uint8_t instr_type;')
+    print('    uint16_t instr;')
+    print('} armv7_dispatch_t;')
+    print('extern const armv7_dispatch_t armv7_dispatch[4096];')
+    print(enum_table('darm_format_op', ['FMT_END'] +
+                     [x[1] for x in format_opcodes] + ['FMT_INVLD']))
+    print('extern const uint8_t *armv7_format_programs[%d][3];' % instrcnt)
 
     print('#endif')
 
@@ -822,6 +1642,14 @@ if __name__ == '__main__':
     reg = 'r0 r1 r2 r3 r4 r5 r6 r7 r8 r9 r10 r11 r12 SP LR PC'
     print(string_table('darm_registers', reg.split()))
 
+    # the condition is omitted for AL and for unconditional instructions
+    cond = 'EQ NE CS CC MI PL VS VC HI LS GE LT GT LE'.split() + ['', '']
+    print(case_tables('darm_format_mnemonics',
+                      instruction_names(open('instructions.txt'))))
+    print(case_tables('darm_format_registers', reg.split()))
+    print(case_tables('darm_format_conditions', cond))
+    print(case_tables('darm_format_shifts', 'LSL LSR ASR ROR RRX'.split()))
+
     #
     # thumb-tbl.c
     #
@@ -858,6 +1686,9 @@ if __name__ == '__main__':
     print(type_lookup_table('type_gpi',
                             *[t_gpi[x] for x in range(16)]))
 
+    print(search_encodings_table('thumb_encodings', thumb_encodings,
+                                 instruction_names(open('instructions.txt'))))
+
     print(type_lookup_table('type_hints',
                             'nop', 'yield', 'wfe', 'wfi', 'sev'))
 
@@ -874,12 +1705,89 @@ if __name__ == '__main__':
     print('#include <stdint.h>')
     print('#include "thumb2-tbl.h"')
 
-    # print a table containing the instruction label for each entry
-    print(instruction_names_index_table_thumb2(thumb2_table, 'thumb2'))
+    # the decoder of thumb2 instructions, compiled from darmtbl2.thumbs, it
+    # sets the register, immediate and flag type of the instruction, which
+    # select its operand extraction function, darm_thumb2_disasm has already
+    # checked that the upper five bits are either 0b11101, 0b11110 or 0b11111
+    entries = thumb2_decoder_entries(
+        darmtbl2.thumbs, darmtbl2.thumb2_unallocated,
+        set(instruction_names(open('instructions.txt'))))
+    decodings = sorted(set(x[2] for x in entries if x[2]))
+    tree = decision_tree([(mask, value, decodings.index(x) if x else None)
+                          for mask, value, x in entries], known=0xe0000000)
+
+    print('#include "darm.h"')
+    print('')
+    print('static const struct {')
+    print('    darm_instr_t instr;')
+    print('    darm_enctype_t instr_type;')
+    print('    darm_enctype_t instr_imm_type;')
+    print('    darm_enctype_t instr_flag_type;')
+    print('} thumb2_decodings[] = {')
+    for x in decodings:
+        print('    {I_%s, %s},' % (x[0], ', '.join('T_THUMB2_' + y
+                                                 for y in x[1:])))
+    print('};')
+    print('')
+    print('static darm_instr_t thumb2_decoded(darm_t *d, uint32_t idx)')
+    print('{')
+    print('    d->instr_type = thumb2_decodings[idx].instr_type;')
+    print('    d->instr_imm_type = thumb2_decodings[idx].instr_imm_type;')
+    print('    d->instr_flag_type = thumb2_decodings[idx].instr_flag_type;')
+    print('    return thumb2_decodings[idx].instr;')
+    print('}')
+
+    print('')
+    print('// at most %d switches deep' % decision_tree_depth(tree))
+    print('darm_instr_t thumb2_decode_instruction(darm_t *d, '
+          'uint16_t w, uint16_t w2)')
+    print('{')
+    print('\n'.join(decision_tree_code(tree, lambda x:
+                                       'return I_INVLD;' if x is None
+                                       else 'return thumb2_decoded(d, %d);' %
+                                       x)))
+    print('}')
+
+    # a function per combination of register, immediate and flag type of the
+    # Thumb2 instructions, which extracts all operand fields in one go, the
+    # first one handles the remaining combinations
+    print('#include "darm-internal.h"')
+    print('#include "thumb2.h"')
+    print('')
+    combinations = thumb2_field_combinations(darmtbl2.thumbs)
+    print(thumb2_fields_generic())
+    for types in combinations:
+        print(thumb2_fields_code(types))
+
+    print('void (*const thumb2_fields[])(darm_t *d, uint16_t w, '
+          'uint16_t w2) = {')
+    print('    &thumb2_fields_generic,')
+    for types in combinations:
+        print('    &thumb2_fields_%s,' % '_'.join(types).lower())
+    print('};')
+    print('')
+
+    print('const uint8_t thumb2_fields_index[THUMB2_REG_TYPES]'
+          '[THUMB2_IMM_TYPES][THUMB2_FLAG_TYPES] = {')
+    for reg in thumb2_kinds[0]:
+        print('    // %s' % reg)
+        print('    {')
+        for imm in thumb2_kinds[1]:
+            print('        {%s}, // %s' % (', '.join(
+                str(combinations.index((reg, imm, flag)) + 1)
+                if (reg, imm, flag) in combinations else '0'
+                for flag in thumb2_kinds[2]), imm))
+        print('    },')
+    print('};')
 
-    # print a table containing the instruction string for each entry
-    print(typed_table('const char *', 'thumb2_instruction_strings',
-                      ['"%s"' % s[0] for s in thumb2_table.values()]))
+    # the format programs of the Thumb and Thumb2 instructions which do not
+    # have an ARMv7 counterpart, darm_str looks these up by their darm_instr_t
+    print('')
+    thumb_fmtstrs = thumb_format_strings(darmtbl2.thumbs, set(
+        instruction_names(open('instructions.txt'))))
+    print(format_programs_table('thumb_format_programs', dict(
+        (k, v) for k, v in thumb_fmtstrs.items() if k not in fmtstrs),
+        instrcnt))
 
     #
     # armv7-tbl.c
@@ -920,6 +1828,9 @@ if __name__ == '__main__':
     print(type_lookup_table('type_shift',
                             *[t_shift[x] for x in range(16)]))
 
+    print(search_encodings_table('armv7_encodings', armv7_encodings,
+                                 instruction_names(open('instructions.txt'))))
+
     t4 = 'msr', 'bx', 'bxj', 'blx', None, 'qsub', None, 'bkpt', 'smlaw', \
         None, 'smulw', None, 'smlaw', None, 'smulw', None
     print(type_lookup_table('type_brnchmisc', *t4))
@@ -980,7 +1891,8 @@ if __name__ == '__main__':
         'strd', 'ldrsh'
     print(type_lookup_table('type_stack2', *t_stack2))
 
-    print(type_lookup_table('type_bits', None, 'sbfx', 'bfi', 'ubfx'))
+    t_bits = None, 'sbfx', 'bfi', 'ubfx'
+    print(type_lookup_table('type_bits', *t_bits))
 
     t_pas = {
         0b000: 'add16',
@@ -997,7 +1909,8 @@ if __name__ == '__main__':
     print(type_lookup_table('type_pas',
                             *[t_pas.get(x) for x in range(64)]))
 
-    print(type_lookup_table('type_sat', 'qadd', 'qsub', 'qdadd', 'qdsub'))
+    t_sat = 'qadd', 'qsub', 'qdadd', 'qdsub'
+    print(type_lookup_table('type_sat', *t_sat))
 
     t_sync = 'swp', None, None, None, 'swpb', None, None, None, \
         'strex', 'ldrex', 'strexd', 'ldrexd', 'strexb', 'ldrexb', \
@@ -1009,10 +1922,12 @@ if __name__ == '__main__':
         'uxtab', 'uxtb', 'uxtah', 'uxth'
     print(type_lookup_table('type_pusr', *t_pusr))
 
-    lines = []
-    for instr, fmtstr in fmtstrs.items():
-        fmtstr = ', '.join('"%s"' % x for x in set(fmtstr))
-        lines.append('    [I_%s] = {%s},' % (instr, fmtstr))
-    print('const char *armv7_format_strings[%d][3] = {' % instrcnt)
-    print('\n'.join(sorted(lines)))
-    print('};')
+    print(armv7_dispatch_table(armv7_table, {
+        'shift': [t_shift[x] for x in range(16)], 'brnchmisc': t4,
+        'mul': t_mul, 'stack0': [t_stack0[x] for x in range(32)],
+        'stack1': t_stack1, 'stack2': t_stack2, 'bits': t_bits,
+        'pas': [t_pas.get(x) for x in range(64)], 'sat': t_sat,
+        'sync': t_sync, 'pusr': t_pusr,
+    }))
+
+    print(format_programs_table('armv7_format_programs', fmtstrs, instrcnt))
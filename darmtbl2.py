@@ -38,6 +38,21 @@ class Bitsize:
         return '<%s:%d>' % (self.name, self.bitsize)
 
 
+class ShouldBe(int):
+    """A bit which is written as (0) or (1) in the ARM manual.
+
+    The instruction should have this bit cleared, respectively set, but it
+    is UNPREDICTABLE (rather than undefined) if it does not, hence decoders
+    don't necessarily check these bits.
+
+    """
+    pass
+
+
+sbz = ShouldBe(0)
+sbo = ShouldBe(1)
+
+
 cond          = Bitsize('cond', 4, 'Conditional Flags')
 Rd            = Bitsize('Rd', 4, 'Destination Register')
 Rd3           = Bitsize('Rd3', 3, 'Destination Register')
@@ -91,6 +106,9 @@ imm4L         = Bitsize('imm4L', 4, 'Low Word Register')
 op            = Bitsize('op', 1, 'Operation for CB{N}Z')
 firstcond     = Bitsize('firstcond', 4, 'First Condition for IT')
 mask          = Bitsize('mask', 4, 'Mask for IT')
+imod          = Bitsize('imod', 2, 'Interrupt Mask Modification')
+iflags        = Bitsize('iflags', 3, 'Affected Interrupt Masks')
+mode          = Bitsize('mode', 5, 'Processor Mode')
 
 i             = Bitsize('imm1', 1, 'Immediate')
 J1            = Bitsize('J1', 1, 'Immediate')
@@ -113,67 +131,69 @@ imm24         = Bitsize('imm24', 24, 'Immediate')
 thumbs = [
     ('ADC{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 0, 1, 0, S, Rn, 0, imm3, Rd, imm8),
     ('ADC{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 1, 0, 1, Rm3, Rdn3),
-    ('ADC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('ADC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('ADD{S}<c> <Rd3>, <Rn3>, #<imm3>', 0, 0, 0, 1, 1, 1, 0, imm3, Rn3, Rd3),
     ('ADD{S}<c> <Rdn3>, #<imm8>', 0, 0, 1, 1, 0, Rdn3, imm8),
     ('ADD{S}<c>.W <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 0, 0, 0, S, Rn, 0, imm3, Rd, imm8),
     ('ADDW<c> <Rd>, <Rn>, #<imm12>', 1, 1, 1, 1, 0, i, 1, 0, 0, 0, 0, 0, Rn, 0, imm3, Rd, imm8),
     ('ADD{S}<c> <Rd>, <Rn>, <Rm>', 0, 0, 0, 1, 1, 0, 0, Rm3, Rn3, Rd3),
     # ('ADD<c> <Rdn>, <Rm>', 0, 1, 0, 0, 0, 1, 0, 0, Rm, Rdn, DN),
-    ('ADD{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
-    ('ADD{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('ADD{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
+    ('ADD{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('ADD<c> <Rd3>, SP, #<imm>', 1, 0, 1, 0, 1, Rd3, imm8),
     ('ADD<c> SP, SP, #<imm>', 1, 0, 1, 1, 0, 0, 0, 0, 0, imm7),
     ('ADD{S}<c>.W <Rd>, SP, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 0, 0, 0, S, 1, 1, 0, 1, 0, imm3, Rd, imm8),
     ('ADDW<c> <Rd>, SP, #<imm12>', 1, 1, 1, 1, 0, i, 1, 0, 0, 0, 0, 0, 1, 1, 0, 1, 0, imm3, Rd, imm8),
     # ('ADD<c> <Rdm>, SP, <Rdm>', 0, 1, 0, 0, 0, 1, 0, 0, 1, 1, 0, 1, Rdm, DM),
     ('ADD<c> SP, <Rm>', 0, 1, 0, 0, 0, 1, 0, 0, 1, Rm, 1, 0, 1),
-    ('ADD{S}<c>.W <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, 1, 1, 0, 1, (0), imm3, Rd, imm2, type_, Rm),
-    ('ADD{S}<c>.W <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, 1, 1, 0, 1, (0), imm3, Rd, imm2, type_, Rm),
+    ('ADD{S}<c>.W <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, 1, 1, 0, 1, sbz, imm3, Rd, imm2, type_, Rm),
+    ('ADD{S}<c>.W <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, S, 1, 1, 0, 1, sbz, imm3, Rd, imm2, type_, Rm),
     ('ADR<c> <Rd3>, <label>', 1, 0, 1, 0, 0, Rd3, imm8),
     ('ADR<c>.W <Rd>, <label>', 1, 1, 1, 1, 0, i, 1, 0, 1, 0, 1, 0, 1, 1, 1, 1, 0, imm3, Rd, imm8),
     ('ADR<c>.W <Rd>, <label>', 1, 1, 1, 1, 0, i, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 0, imm3, Rd, imm8),
     ('AND{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 0, 0, S, Rn, 0, imm3, Rd, imm8),
     ('AND{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, Rm3, Rdn3),
-    ('AND{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('AND{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('ASR{S}<c> <Rd3>, <Rm3>, #<imm>', 0, 0, 0, 1, 0, imm5, Rm3, Rd3),
-    ('ASR{S}<c>.W <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), imm3, Rd, imm2, 1, 0, Rm),
+    ('ASR{S}<c>.W <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, imm3, Rd, imm2, 1, 0, Rm),
     ('ASR{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 1, 0, 0, Rm3, Rdn3),
     ('ASR{S}<c>.W <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, S, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('B<c> <label>', 1, 1, 0, 1, cond, imm8),
     ('B<c> <label>', 1, 1, 1, 0, 0, imm11),
     ('B<c>.W <label>', 1, 1, 1, 1, 0, S, cond, imm6, 1, 0, J1, 0, J2, imm11),
     ('B<c>.W <label>', 1, 1, 1, 1, 0, S, imm10, 1, 0, J1, 1, J2, imm11),
-    ('BFC<c> <Rd>, #<lsb>, #<width>', 1, 1, 1, 1, 0, (0), 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, imm3, Rd, imm2, (0), msb),
-    ('BFI<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, (0), 1, 1, 0, 1, 1, 0, Rn, 0, imm3, Rd, imm2, (0), msb),
+    ('BFC<c> <Rd>, #<lsb>, #<width>', 1, 1, 1, 1, 0, sbz, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 0, imm3, Rd, imm2, sbz, msb),
+    ('BFI<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, sbz, 1, 1, 0, 1, 1, 0, Rn, 0, imm3, Rd, imm2, sbz, msb),
     ('BIC{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 0, 1, S, Rn, 0, imm3, Rd, imm8),
     ('BIC{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, Rm3, Rdn3),
-    ('BIC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('BIC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('BKPT #<imm8>', 1, 0, 1, 1, 1, 1, 1, 0, imm8),
     ('BL<c> <label>', 1, 1, 1, 1, 0, S, imm10, 1, 1, J1, 1, J2, imm11),
     ('BLX<c> <label>', 1, 1, 1, 1, 0, S, imm10H, 1, 1, J1, 0, J2, imm10L, H),
-    ('BLX<c> <Rm>', 0, 1, 0, 0, 0, 1, 1, 1, 1, Rm, (0), (0), (0)),
-    ('BX<c> <Rm>', 0, 1, 0, 0, 0, 1, 1, 1, 0, Rm, (0), (0), (0)),
-    ('BXJ<c> <Rm>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0, Rm, 1, 0, (0), 0, (1), (1), (1), (1), (0), (0), (0), (0), (0), (0), (0), (0)),
+    ('BLX<c> <Rm>', 0, 1, 0, 0, 0, 1, 1, 1, 1, Rm, sbz, sbz, sbz),
+    ('BX<c> <Rm>', 0, 1, 0, 0, 0, 1, 1, 1, 0, Rm, sbz, sbz, sbz),
+    ('BXJ<c> <Rm>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 0, 0, Rm, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz),
     # CBZ or CBNZ
     ('CBZ <Rn>, <label>', 1, 0, 1, 1, op, 0, i, 1, imm5, Rn3),
-    ('CLREX<c>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, (1), (1), (1), (1), 1, 0, (0), 0, (1), (1), (1), (1), 0, 0, 1, 0, (1), (1), (1), (1)),
+    ('CLREX<c>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 0, 1, 0, sbo, sbo, sbo, sbo),
     ('CLZ<c> <Rd>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, Rm, 1, 1, 1, 1, Rd, 1, 0, 0, 0, Rm),
     ('CMN<c> <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 0, 0, 0, 1, Rn, 0, imm3, 1, 1, 1, 1, imm8),
     ('CMN<c> <Rn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 0, 1, 1, Rm3, Rn3),
-    ('CMN<c>.W', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, 1, Rn, (0), imm3, 1, 1, 1, 1, imm2, type_, Rm),
+    ('CMN<c>.W', 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, 0, 1, Rn, sbz, imm3, 1, 1, 1, 1, imm2, type_, Rm),
     ('CMP<c> <Rn3>, #<imm8>', 0, 0, 1, 0, 1, Rn3, imm8),
     ('CMP<c>.W <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 1, 0, 1, 1, Rn, 0, imm3, 1, 1, 1, 1, imm8),
     ('CMP<c> <Rn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 0, 1, 0, Rm3, Rn3),
     ('CMP<c> <Rn>, <Rm>', 0, 1, 0, 0, 0, 1, 0, 1, N, Rm, Rn3),
-    ('CMP<c>.W <Rn>, <Rm> {, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, Rn, (0), imm3, 1, 1, 1, 1, imm2, type_, Rm),
-    ('DBG<c> #<option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 1, 1, 1, 1, option),
-    ('DMB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, (1), (1), (1), (1), 1, 0, (0), 0, (1), (1), (1), (1), 0, 1, 0, 1, option),
-    ('DSB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, (1), (1), (1), (1), 1, 0, (0), 0, (1), (1), (1), (1), 0, 1, 0, 0, option),
+    ('CMP<c>.W <Rn>, <Rm> {, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, 1, Rn, sbz, imm3, 1, 1, 1, 1, imm2, type_, Rm),
+    ('CPS<effect>.W <iflags>{, #<mode>}', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, imod, M, iflags, mode),
+    ('DBG<c> #<option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 1, 1, 1, 1, option),
+    ('DMB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 1, 0, 1, option),
+    ('DSB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 1, 0, 0, option),
+    ('ENTERX', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 0, 0, 1, sbo, sbo, sbo, sbo),
     ('EOR{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 1, 0, 0, S, Rn, 0, imm3, Rd, imm8),
     ('EOR{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, Rm3, Rdn3),
-    ('EOR{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
-    ('ISB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, (1), (1), (1), (1), 1, 0, (0), 0, (1), (1), (1), (1), 0, 1, 1, 0, option),
+    ('EOR{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
+    ('ISB<c> <option>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 1, 1, 0, option),
     ('IT{<x>{<y>{<z>}}} <firstcond>', 1, 0, 1, 1, 1, 1, 1, 1, firstcond, mask),
     ('LDM<c> <Rn>{!}, <registers>', 1, 1, 0, 0, 1, Rn3, register_list8),
     ('LDM<c>.W <Rn>{!}, <registers>', 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, W, 1, Rn, register_list),
@@ -182,8 +202,8 @@ thumbs = [
     ('LDR<c> <Rt3>, [<Rn3>{, #<imm>}]', 0, 1, 1, 0, 1, imm5, Rn3, Rt3),
     ('LDR<c> <Rt3>, [SP{, #<imm>}]', 1, 0, 0, 1, 1, Rt3, imm8),
     ('LDR<c>.W <Rt>, [<Rn>{, #<imm12>}]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, imm12),
-    ('LDR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 1, P, U, W, imm8),
-    ('LDR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 1, P, U, W, imm8),
+    ('LDR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 1, 1, U, W, imm8),
+    ('LDR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 1, 0, U, 1, imm8),
     ('LDR<c> <Rt3>, <label>', 0, 1, 0, 0, 1, Rt3, imm8),
     ('LDR<c>.W <Rt>, <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 1, 0, 1, 1, 1, 1, 1, Rt, imm12),
     ('LDR<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 1, 0, 0, Rm3, Rn3, Rt3),
@@ -191,45 +211,50 @@ thumbs = [
     ('LDR<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('LDRB<c> <Rt3>, [<Rn3>{, #<imm5>}]', 0, 1, 1, 1, 1, imm5, Rn3, Rt3),
     ('LDRB<c>.W <Rt>, [<Rn>{, #<imm12>}]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1, Rn, Rt, imm12),
-    ('LDRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 1, P, U, W, imm8),
-    ('LDRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 1, P, U, W, imm8),
+    ('LDRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 1, 1, U, W, imm8),
+    ('LDRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 1, 0, U, 1, imm8),
     ('LDRB<c> <Rt>, <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 0, 0, 1, 1, 1, 1, 1, Rt, imm12),
     ('LDRB<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 1, 1, 0, Rm3, Rn3, Rt3),
     ('LDRB<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('LDRBT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, Rt, 1, 1, 1, 0, imm8),
-    ('LDRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, P, U, 1, W, 1, Rn, Rt, Rt2, imm8),
-    ('LDRD<c> <Rt>, <Rt2>, <label>', 1, 1, 1, 0, 1, 0, 0, P, U, 1, W, 1, 1, 1, 1, 1, Rt, Rt2, imm8),
-    ('LDREX<c> <Rt>, [<Rn>{, #<imm>}]', 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, (1), (1), (1), (1), imm8),
-    ('LDREXB<c> <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, (1), (1), (1), (1), 0, 1, 0, 0, (1), (1), (1), (1)),
-    ('LDREXD<c> <Rt>, <Rt2>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, Rt2, 0, 1, 1, 1, (1), (1), (1), (1)),
-    ('LDREXH<c> <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, (1), (1), (1), (1), 0, 1, 0, 1, (1), (1), (1), (1)),
+    ('LDRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, 1, U, 1, W, 1, Rn, Rt, Rt2, imm8),
+    ('LDRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, 0, U, 1, 1, 1, Rn, Rt, Rt2, imm8),
+    ('LDRD<c> <Rt>, <Rt2>, <label>', 1, 1, 1, 0, 1, 0, 0, 1, U, 1, W, 1, 1, 1, 1, 1, Rt, Rt2, imm8),
+    ('LDRD<c> <Rt>, <Rt2>, <label>', 1, 1, 1, 0, 1, 0, 0, 0, U, 1, 1, 1, 1, 1, 1, 1, Rt, Rt2, imm8),
+    ('LDREX<c> <Rt>, [<Rn>{, #<imm>}]', 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, sbo, sbo, sbo, sbo, imm8),
+    ('LDREXB<c> <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, sbo, sbo, sbo, sbo, 0, 1, 0, 0, sbo, sbo, sbo, sbo),
+    ('LDREXD<c> <Rt>, <Rt2>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, Rt2, 0, 1, 1, 1, sbo, sbo, sbo, sbo),
+    ('LDREXH<c> <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, Rt, sbo, sbo, sbo, sbo, 0, 1, 0, 1, sbo, sbo, sbo, sbo),
     ('LDRH<c> <Rt3>, [<Rn3>{, #<imm>}]', 1, 0, 0, 0, 1, imm5, Rn3, Rt3),
     ('LDRH<c>.W <Rt>, [<Rn>{, #<imm12>}]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1, 1, Rn, Rt, imm12),
-    ('LDRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 1, P, U, W, imm8),
-    ('LDRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 1, P, U, W, imm8),
+    ('LDRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 1, 1, U, W, imm8),
+    ('LDRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 1, 0, U, 1, imm8),
     ('LDRH<c> <Rt>, <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 0, 1, 1, 1, 1, 1, 1, Rt, imm12),
     ('LDRH<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 1, 0, 1, Rm3, Rn3, Rt3),
     ('LDRH<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('LDRHT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, Rt, 1, 1, 1, 0, imm8),
     ('LDRSB<c> <Rt>, [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, Rn, Rt, imm12),
-    ('LDRSB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, Rt, 1, P, U, W, imm8),
+    ('LDRSB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, Rt, 1, 1, U, W, imm8),
+    ('LDRSB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, Rt, 1, 0, U, 1, imm8),
     ('LDRSB<c> <Rt>, <label>', 1, 1, 1, 1, 1, 0, 0, 1, U, 0, 0, 1, 1, 1, 1, 1, Rt, imm12),
     ('LDRSB<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 0, 1, 1, Rm3, Rn3, Rt3),
     ('LDRSB<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('LDRSBT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, Rt, 1, 1, 1, 0, imm8),
     ('LDRSH<c> <Rt>, [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, Rn, Rt, imm12),
-    ('LDRSH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, Rt, 1, P, U, W, imm8),
+    ('LDRSH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, Rt, 1, 1, U, W, imm8),
+    ('LDRSH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, Rt, 1, 0, U, 1, imm8),
     ('LDRSH<c> <Rt>, <label>', 1, 1, 1, 1, 1, 0, 0, 1, U, 0, 1, 1, 1, 1, 1, 1, Rt, imm12),
     ('LDRSH<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 1, 1, 1, Rm3, Rn3, Rt3),
     ('LDRSH<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('LDRSHT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, Rt, 1, 1, 1, 0, imm8),
     ('LDRT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 1, Rn, Rt, 1, 1, 1, 0, imm8),
+    ('LEAVEX', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbo, sbo, sbo, sbo, 0, 0, 0, 0, sbo, sbo, sbo, sbo),
     ('LSL{S}<c> <Rd3>, <Rm3>, #<imm5>', 0, 0, 0, 0, 0, imm5, Rm3, Rd3),
-    ('LSL{S}<c>.W <Rd>, <Rm>, #<imm5>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), imm3, Rd, imm2, 0, 0, Rm),
+    ('LSL{S}<c>.W <Rd>, <Rm>, #<imm5>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, imm3, Rd, imm2, 0, 0, Rm),
     ('LSL{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 0, 1, 0, Rm3, Rdn3),
     ('LSL{S}<c>.W <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, S, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('LSR{S}<c> <Rd3>, <Rm3>, #<imm>', 0, 0, 0, 0, 1, imm5, Rm3, Rd3),
-    ('LSR{S}<c>.W <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), imm3, Rd, imm2, 0, 1, Rm),
+    ('LSR{S}<c>.W <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, imm3, Rd, imm2, 0, 1, Rm),
     ('LSR{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 0, 1, 1, Rm3, Rdn3),
     ('LSR{S}<c>.W <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, S, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('MLA<c> <Rd>, <Rn>, <Rm>, <Ra>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 0, 0, 0, Rn, Ra, Rd, 0, 0, 0, 0, Rm),
@@ -239,27 +264,35 @@ thumbs = [
     ('MOVW<c> <Rd>, #<imm16>', 1, 1, 1, 1, 0, i, 1, 0, 0, 1, 0, 0, imm4, 0, imm3, Rd, imm8),
     ('MOV<c> <Rd>, <Rm>', 0, 1, 0, 0, 0, 1, 1, 0, D, Rm, Rd3),
     # ('MOV{S} <Rd3>, <Rm3>', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, Rm3, Rd3),
-    ('MOV{S}<c>.W <Rd>, <Rm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), 0, 0, 0, Rd, 0, 0, 0, 0, Rm),
+    ('MOV{S}<c>.W <Rd>, <Rm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, 0, 0, 0, Rd, 0, 0, 0, 0, Rm),
     ('MOVT<c> <Rd>, #<imm16>', 1, 1, 1, 1, 0, i, 1, 0, 1, 1, 0, 0, imm4, 0, imm3, Rd, imm8),
-    ('MRS<c> <Rd>, <spec_reg>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, Rd, (0), (0), 0, (0), (0), (0), (0), (0)),
-    #('MSR<c> <spec_reg>, <Rn>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 0, 0, Rn, 1, 0, (0), 0, mask, 0, 0, (0), (0), 0, (0), (0), (0), (0), (0)),
+    ('MRS<c> <Rd>, <spec_reg>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, R, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, Rd, sbz, sbz, 0, sbz, sbz, sbz, sbz, sbz),
+    ('MSR<c> <spec_reg>, <Rn>', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 0, R, Rn, 1, 0, sbz, 0, mask, sbz, sbz, 0, sbz, sbz, sbz, sbz, sbz),
     ('MUL{S}<c> <Rdm3>, <Rn3>, <Rdm3>', 0, 1, 0, 0, 0, 0, 1, 1, 0, 1, Rn3, Rdm3),
     ('MUL<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('MVN{S}<c> <Rd>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 1, 1, S, 1, 1, 1, 1, 0, imm3, Rd, imm8),
     ('MVN{S}<c> <Rd3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, Rm3, Rd3),
-    ('MVN{S}<c>.W <Rd>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 1, S, 1, 1, 1, 1, (0), imm3, Rd, imm2, type_, Rm),
+    ('MVN{S}<c>.W <Rd>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 1, S, 1, 1, 1, 1, sbz, imm3, Rd, imm2, type_, Rm),
     ('NOP<c>', 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0),
-    ('NOP<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    ('NOP<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+    ('NOP<c>.W', 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 1, 1, Rn, 1, 1, 1, 1, imm12),
+    ('NOP<c>.W', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, 1, 1, 1, 1, 1, 1, 0, 0, imm8),
+    ('NOP<c>.W', 1, 1, 1, 1, 1, 0, 0, 1, U, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, imm12),
+    ('NOP<c>.W', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, Rn, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('ORN{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 1, 1, S, Rn, 0, imm3, Rd, imm8),
-    ('ORN{S}<c> <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 1, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('ORN{S}<c> <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 1, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('ORR{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 1, 0, S, Rn, 0, imm3, Rd, imm8),
     ('ORR{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 1, 0, 0, Rm3, Rdn3),
-    ('ORR{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
-    #('PKHBT<c> <Rd>, <Rn>, <Rm>{, LSL #<imm>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 0, S, Rn, (0), imm3, Rd, imm2, tb, T, Rm),
-    ('PLD{W}<c> [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, W, 1, Rn, 1, 1, 1, 1, imm12),
-    ('PLD{W}<c> [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, W, 1, Rn, 1, 1, 1, 1, 1, 1, 0, 0, imm8),
-    ('PLD<c> <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 0, (0), 1, 1, 1, 1, 1, 1, 1, 1, 1, imm12),
-    ('PLD{W}<c> [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, W, 1, Rn, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, imm2, Rm),
+    ('ORR{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
+    ('PKH<T><c> <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 1, 0, 0, Rn, sbz, imm3, Rd, imm2, tb, 0, Rm),
+    ('PLD{W}<c> [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1, Rn, 1, 1, 1, 1, imm12),
+    ('PLD{W}<c> [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1, 1, Rn, 1, 1, 1, 1, imm12),
+    ('PLD{W}<c> [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, 1, 1, 1, 1, 1, 1, 0, 0, imm8),
+    ('PLD{W}<c> [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, 1, 1, 1, 1, 1, 1, 0, 0, imm8),
+    ('PLD<c> <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, imm12),
+    ('PLD<c> <label>', 1, 1, 1, 1, 1, 0, 0, 0, U, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, imm12),
+    ('PLD{W}<c> [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 1, Rn, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, imm2, Rm),
+    ('PLD{W}<c> [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 1, Rn, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('PLI<c> [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 1, Rn, 1, 1, 1, 1, imm12),
     ('PLI<c> [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 1, Rn, 1, 1, 1, 1, 1, 1, 0, 0, imm8),
     ('PLI<c> <label>', 1, 1, 1, 1, 1, 0, 0, 1, U, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, imm12),
@@ -287,25 +320,27 @@ thumbs = [
     ('REV16<c>.W <Rd>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rm, 1, 1, 1, 1, Rd, 1, 0, 0, 1, Rm),
     ('REVSH<c> <Rd3>, <Rm3>', 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, Rm3, Rd3),
     ('REVSH<c>.W <Rd>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rm, 1, 1, 1, 1, Rd, 1, 0, 1, 1, Rm),
-    ('ROR{S}<c> <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), imm3, Rd, imm2, 1, 1, Rm),
+    ('RFE{<amode>}<c> <Rn>{!}', 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, W, 1, Rn, sbo, sbo, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz),
+    ('RFE{<amode>}<c> <Rn>{!}', 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, W, 1, Rn, sbo, sbo, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz),
+    ('ROR{S}<c> <Rd>, <Rm>, #<imm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, imm3, Rd, imm2, 1, 1, Rm),
     ('ROR{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, Rm3, Rdn3),
     ('ROR{S}<c>.W <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, S, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
-    ('RRX{S}<c> <Rd>, <Rm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, (0), 0, 0, 0, Rd, 0, 0, 1, 1, Rm),
+    ('RRX{S}<c> <Rd>, <Rm>', 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 0, S, 1, 1, 1, 1, sbz, 0, 0, 0, Rd, 0, 0, 1, 1, Rm),
     ('RSB{S} <Rd3>, <Rn3>, #0', 0, 1, 0, 0, 0, 0, 1, 0, 0, 1, Rn3, Rd3),
     ('RSB{S}<c>.W <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 1, 1, 0, S, Rn, 0, imm3, Rd, imm8),
-    ('RSB{S}<c> <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('RSB{S}<c> <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 0, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('SADD16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('SADD8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('SASX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('SBC{S}<c> <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 0, 1, 1, S, Rn, 0, imm3, Rd, imm8),
     ('SBC{S}<c> <Rdn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 0, 1, 1, 0, Rm3, Rdn3),
-    ('SBC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 1, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
-    ('SBFX<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, (0), 1, 1, 0, 1, 0, 0, Rn, 0, imm3, Rd, imm2, (0), widthm1),
-    ('SDIV<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, Rn, (1), (1), (1), (1), Rd, 1, 1, 1, 1, Rm),
+    ('SBC{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 1, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
+    ('SBFX<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, sbz, 1, 1, 0, 1, 0, 0, Rn, 0, imm3, Rd, imm2, sbz, widthm1),
+    ('SDIV<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, Rn, sbo, sbo, sbo, sbo, Rd, 1, 1, 1, 1, Rm),
     ('SEL<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 1, 0, 0, 0, Rm),
-    ('SETEND <endian_specifier>', 1, 0, 1, 1, 0, 1, 1, 0, 0, 1, 0, (1), E, (0), (0), (0)),
+    ('SETEND <endian_specifier>', 1, 0, 1, 1, 0, 1, 1, 0, 0, 1, 0, sbo, E, sbz, sbz, sbz),
     ('SEV<c>', 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0),
-    ('SEV<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0),
+    ('SEV<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0),
     ('SHADD16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 0, 1, 0, Rm),
     ('SHADD8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 1, 0, Rm),
     ('SHASX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 1, 0, Rm),
@@ -328,8 +363,10 @@ thumbs = [
     ('SMULL<c> <RdLo>, <RdHi>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0, 0, Rn, RdLo, RdHi, 0, 0, 0, 0, Rm),
     ('SMULW<y><c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 0, 1, 1, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, M, Rm),
     ('SMUSD{X}<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, M, Rm),
-    #('SSAT<c> <Rd>, #<imm>, <Rn>{, <shift>}', 1, 1, 1, 1, 0, (0), 1, 1, 0, 0, sh, 0, Rn, 0, imm3, Rd, imm2, (0), sat_imm),
-    #('SSAT16<c> <Rd>, #<imm>, <Rn>', 1, 1, 1, 1, 0, (0), 1, 1, 0, 0, 1, 0, Rn, 0, 0, 0, 0, Rd, 0, 0, (0), (0), sat_imm),
+    ('SRS{<amode>}<c> SP{!}, #<mode>', 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, W, 0, sbo, sbo, sbz, sbo, sbo, sbo, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, mode),
+    ('SRS{<amode>}<c> SP{!}, #<mode>', 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, W, 0, sbo, sbo, sbz, sbo, sbo, sbo, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, sbz, mode),
+    ('SSAT<c> <Rd>, #<imm>, <Rn>{, <shift>}', 1, 1, 1, 1, 0, sbz, 1, 1, 0, 0, sh, 0, Rn, 0, imm3, Rd, imm2, sbz, sat_imm5),
+    ('SSAT16<c> <Rd>, #<imm>, <Rn>', 1, 1, 1, 1, 0, sbz, 1, 1, 0, 0, 1, 0, Rn, 0, 0, 0, 0, Rd, 0, 0, sbz, sbz, sat_imm4),
     ('SSAX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('SSUB16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('SSUB8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
@@ -339,26 +376,27 @@ thumbs = [
     ('STR<c> <Rt3>, [<Rn3>{, #<imm>}]', 0, 1, 1, 0, 0, imm5, Rn3, Rt3),
     ('STR<c> <Rt3>, [SP, #<imm>]', 1, 0, 0, 1, 0, Rt3, imm8),
     ('STR<c>.W <Rt>, [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, imm12),
-    ('STR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, 1, P, U, W, imm8),
-    ('STR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, 1, P, U, W, imm8),
+    ('STR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, 1, 1, U, W, imm8),
+    ('STR<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, 1, 0, U, 1, imm8),
     ('STR<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 0, 0, 0, Rm3, Rn3, Rt3),
     ('STR<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('STRB<c> <Rt3>, [<Rn3>, #<imm5>]', 0, 1, 1, 1, 0, imm5, Rn3, Rt3),
     ('STRB<c>.W <Rt>, [<Rn>, #<imm12>]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 0, Rn, Rt, imm12),
-    ('STRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 1, P, U, W, imm8),
-    ('STRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 1, P, U, W, imm8),
+    ('STRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 1, 1, U, W, imm8),
+    ('STRB<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 1, 0, U, 1, imm8),
     ('STRB<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 0, 1, 0, Rm3, Rn3, Rt3),
     ('STRB<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('STRBT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, Rn, Rt, 1, 1, 1, 0, imm8),
-    ('STRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, P, U, 1, W, 0, Rn, Rt, Rt2, imm8),
+    ('STRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, 1, U, 1, W, 0, Rn, Rt, Rt2, imm8),
+    ('STRD<c> <Rt>, <Rt2>, [<Rn>{, #+/-<imm>}]', 1, 1, 1, 0, 1, 0, 0, 0, U, 1, 1, 0, Rn, Rt, Rt2, imm8),
     ('STREX<c> <Rd>, <Rt>, [<Rn>{, #<imm>}]', 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 0, 0, Rn, Rt, Rd, imm8),
-    ('STREXB<c> <Rd>, <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, (1), (1), (1), (1), 0, 1, 0, 0, Rd),
+    ('STREXB<c> <Rd>, <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, sbo, sbo, sbo, sbo, 0, 1, 0, 0, Rd),
     ('STREXD<c> <Rd>, <Rt>, <Rt2>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, Rt2, 0, 1, 1, 1, Rd),
-    ('STREXH<c> <Rd>, <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, (1), (1), (1), (1), 0, 1, 0, 1, Rd),
+    ('STREXH<c> <Rd>, <Rt>, [<Rn>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, Rn, Rt, sbo, sbo, sbo, sbo, 0, 1, 0, 1, Rd),
     ('STRH<c> <Rt3>, [<Rn3>{, #<imm>}]', 1, 0, 0, 0, 0, imm5, Rn3, Rt3),
     ('STRH<c>.W <Rt>, [<Rn>{, #<imm12>}]', 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 1, 0, Rn, Rt, imm12),
-    ('STRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 1, P, U, W, imm8),
-    ('STRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 1, P, U, W, imm8),
+    ('STRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 1, 1, U, W, imm8),
+    ('STRH<c> <Rt>, [<Rn>, #-<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 1, 0, U, 1, imm8),
     ('STRH<c> <Rt3>, [<Rn3>, <Rm3>]', 0, 1, 0, 1, 0, 0, 1, Rm3, Rn3, Rt3),
     ('STRH<c>.W <Rt>, [<Rn>, <Rm>{, LSL #<imm2>}]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 0, 0, 0, 0, 0, 0, imm2, Rm),
     ('STRHT<c> <Rt>, [<Rn>, #<imm8>]', 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 1, 0, Rn, Rt, 1, 1, 1, 0, imm8),
@@ -368,33 +406,34 @@ thumbs = [
     ('SUB{S}<c>.W <Rd>, <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 1, 0, 1, S, Rn, 0, imm3, Rd, imm8),
     ('SUBW<c> <Rd>, <Rn>, #<imm12>', 1, 1, 1, 1, 0, i, 1, 0, 1, 0, 1, 0, Rn, 0, imm3, Rd, imm8),
     ('SUB{S}<c> <Rd3>, <Rn3>, <Rm3>', 0, 0, 0, 1, 1, 0, 1, Rm3, Rn3, Rd3),
-    ('SUB{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, S, Rn, (0), imm3, Rd, imm2, type_, Rm),
+    ('SUB{S}<c>.W <Rd>, <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, S, Rn, sbz, imm3, Rd, imm2, type_, Rm),
     ('SUB<c> SP, SP, #<imm>', 1, 0, 1, 1, 0, 0, 0, 0, 1, imm7),
     ('SUB{S}<c>.W <Rd>, SP, #<const>', 1, 1, 1, 1, 0, i, 0, 1, 1, 0, 1, S, 1, 1, 0, 1, 0, imm3, Rd, imm8),
     ('SUBW<c> <Rd>, SP, #<imm12>', 1, 1, 1, 1, 0, i, 1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, imm3, Rd, imm8),
-    ('SUB{S}<c> <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, S, 1, 1, 0, 1, (0), imm3, Rd, imm2, type_, Rm),
+    ('SUB{S}<c> <Rd>, SP, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, 1, S, 1, 1, 0, 1, sbz, imm3, Rd, imm2, type_, Rm),
     ('SVC<c> #<imm8>', 1, 1, 0, 1, 1, 1, 1, 1, imm8),
-    ('SXTAB<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('SXTAB16<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('SXTAH<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
+    ('SXTAB<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('SXTAB16<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('SXTAH<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
     ('SXTB<c> <Rd3>, <Rm3>', 1, 0, 1, 1, 0, 0, 1, 0, 0, 1, Rm3, Rd3),
-    ('SXTB<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('SXTB16<c> <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
+    ('SXTB<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('SXTB16<c> <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
     ('SXTH<c> <Rd3>, <Rm3>', 1, 0, 1, 1, 0, 0, 1, 0, 0, 0, Rm3, Rd3),
-    ('SXTH<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('TBB<c> [<Rn>, <Rm>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, (1), (1), (1), (1), (0), (0), (0), (0), 0, 0, 0, H, Rm),
+    ('SXTH<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('TBB<c> [<Rn>, <Rm>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, sbo, sbo, sbo, sbo, sbz, sbz, sbz, sbz, 0, 0, 0, 0, Rm),
+    ('TBH<c> [<Rn>, <Rm>]', 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, Rn, sbo, sbo, sbo, sbo, sbz, sbz, sbz, sbz, 0, 0, 0, 1, Rm),
     ('TEQ<c> <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 1, 0, 0, 1, Rn, 0, imm3, 1, 1, 1, 1, imm8),
-    ('TEQ<c> <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, Rn, (0), imm3, 1, 1, 1, 1, imm2, type_, Rm),
+    ('TEQ<c> <Rn>, <Rm>{, <shift>}', 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, Rn, sbz, imm3, 1, 1, 1, 1, imm2, type_, Rm),
     ('TST<c> <Rn>, #<const>', 1, 1, 1, 1, 0, i, 0, 0, 0, 0, 0, 1, Rn, 0, imm3, 1, 1, 1, 1, imm8),
     ('TST<c> <Rn3>, <Rm3>', 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, Rm3, Rn3),
-    ('TST<c>.W', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 0, 1, Rn, (0), imm3, 1, 1, 1, 1, imm2, type_, Rm),
+    ('TST<c>.W', 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 0, 1, Rn, sbz, imm3, 1, 1, 1, 1, imm2, type_, Rm),
     ('UADD16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
     ('UADD8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
     ('UASX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
-    ('UBFX<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, (0), 1, 1, 1, 1, 0, 0, Rn, 0, imm3, Rd, imm2, (0), widthm1),
+    ('UBFX<c> <Rd>, <Rn>, #<lsb>, #<width>', 1, 1, 1, 1, 0, sbz, 1, 1, 1, 1, 0, 0, Rn, 0, imm3, Rd, imm2, sbz, widthm1),
     ('UDF<c> #<imm8>', 1, 1, 0, 1, 1, 1, 1, 0, imm8),
     ('UDF<c>.W #<imm16>', 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, imm4, 1, 0, 1, 0, imm12),
-    ('UDIV<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, Rn, (1), (1), (1), (1), Rd, 1, 1, 1, 1, Rm),
+    ('UDIV<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, Rn, sbo, sbo, sbo, sbo, Rd, 1, 1, 1, 1, Rm),
     ('UHADD16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 1, 1, 0, Rm),
     ('UHADD8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 1, 0, Rm),
     ('UHASX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 0, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 1, 0, Rm),
@@ -412,25 +451,37 @@ thumbs = [
     ('UQSUB8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 1, Rm),
     ('USAD8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, Rn, 1, 1, 1, 1, Rd, 0, 0, 0, 0, Rm),
     ('USADA8<c> <Rd>, <Rn>, <Rm>, <Ra>', 1, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, Rn, Ra, Rd, 0, 0, 0, 0, Rm),
-    #('USAT<c> <Rd>, #<imm5>, <Rn>{, <shift>}', 1, 1, 1, 1, 0, (0), 1, 1, 1, 0, sh, 0, Rn, 0, imm3, Rd, imm2, (0), sat_imm),
-    #('USAT16<c> <Rd>, #<imm4>, <Rn>', 1, 1, 1, 1, 0, (0), 1, 1, 1, 0, 1, 0, Rn, 0, 0, 0, 0, Rd, 0, 0, (0), (0), sat_imm),
+    ('USAT<c> <Rd>, #<imm>, <Rn>{, <shift>}', 1, 1, 1, 1, 0, sbz, 1, 1, 1, 0, sh, 0, Rn, 0, imm3, Rd, imm2, sbz, sat_imm5),
+    ('USAT16<c> <Rd>, #<imm>, <Rn>', 1, 1, 1, 1, 0, sbz, 1, 1, 1, 0, 1, 0, Rn, 0, 0, 0, 0, Rd, 0, 0, sbz, sbz, sat_imm4),
     ('USAX<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
     ('USUB16<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
     ('USUB8<c> <Rd>, <Rn>, <Rm>', 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 0, Rn, 1, 1, 1, 1, Rd, 0, 1, 0, 0, Rm),
-    ('UXTAB<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('UXTAB16<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('UXTAH<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
+    ('UXTAB<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('UXTAB16<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('UXTAH<c> <Rd>, <Rn>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, Rn, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
     ('UXTB<c> <Rd3>, <Rm3>', 1, 0, 1, 1, 0, 0, 1, 0, 1, 1, Rm3, Rd3),
-    ('UXTB<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
-    ('UXTB16<c> <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
+    ('UXTB<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
+    ('UXTB16<c> <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
     ('UXTH<c> <Rd3>, <Rm3>', 1, 0, 1, 1, 0, 0, 1, 0, 1, 0, Rm3, Rd3),
-    ('UXTH<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, (0), rotate, Rm),
+    ('UXTH<c>.W <Rd>, <Rm>{, <rotation>}', 1, 1, 1, 1, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, Rd, 1, sbz, rotate, Rm),
     ('WFE<c>', 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 0, 0),
-    ('WFE<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0),
+    ('WFE<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0),
     ('WFI<c>', 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0),
-    ('WFI<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1),
+    ('WFI<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1),
     ('YIELD<c>', 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 0, 0),
-    ('YIELD<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, (1), (1), (1), (1), 1, 0, (0), 0, (0), 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1),
+    ('YIELD<c>.W', 1, 1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, sbo, sbo, sbo, sbo, 1, 0, sbz, 0, sbz, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1),
+]
+
+# unallocated parts of the 32bit Thumb2 instruction space which overlap with
+# the encodings in thumbs, each as its first and second halfword, with x being
+# "don't care". Encodings matching these are undefined, unless a more specific
+# encoding in thumbs matches as well.
+thumb2_unallocated = [
+    # conditional branches with a condition of 0b111x are the miscellaneous
+    # control instructions instead, such as MSR and the hints
+    ('111 10 x111xxx xxxx', '10x0 xxxxxxxxxxxx'),
+    # unallocated hints, the allocated ones are listed explicitly
+    ('111 10 0111010 xxxx', '10x0 x000 xxxxxxxx'),
 ]
 
 if __name__ == '__main__':
@@ -438,6 +489,6 @@ if __name__ == '__main__':
         instr = description[0]
         bits = description[1:]
 
-        bits = [1 if type(x) == int else x.bitsize for x in bits]
+        bits = [1 if isinstance(x, int) else x.bitsize for x in bits]
         if not sum(bits) in (16, 32):
             print(instr, bits, sum(bits))
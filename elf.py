@@ -0,0 +1,301 @@
+"""
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+
+Disassembly of the code in (little-endian, 32bit) ARM ELF files.
+
+The ELF file is memory mapped, and both the headers and the code are read
+straight from the mapping, so that the memory usage does not depend on the
+size of the file - code is decoded in chunks of CHUNK_SIZE bytes at a time.
+
+The $a, $t and $d mapping symbols, if present, are used to determine which
+parts of a code section are ARMv7, Thumb or data.
+
+"""
+from ctypes import c_char
+from collections import namedtuple
+import mmap
+import struct
+import sys
+
+import darm
+
+EM_ARM = 40
+ET_REL = 1
+
+SHT_PROGBITS = 1
+SHT_SYMTAB = 2
+SHF_EXECINSTR = 1 << 2
+
+PT_LOAD = 1
+PF_X = 1 << 0
+
+# amount of bytes handed to darm.disasm_buffer() at once
+CHUNK_SIZE = 64 * 1024
+
+Section = namedtuple('Section', 'name type flags addr offset size link '
+                                'info addralign entsize')
+
+Segment = namedtuple('Segment', 'type offset vaddr paddr filesz memsz '
+                                'flags align')
+
+# a contiguous range of code (or data) within the file
+CodeRange = namedtuple('CodeRange', 'addr offset size mode')
+
+# mode of CodeRange objects which describe data rather than code
+M_DATA = -1
+
+_mapping_symbols = {'a': darm.M_ARMV7, 't': darm.M_THUMB, 'd': M_DATA}
+
+
+class ElfFile(object):
+    """A memory mapped 32bit little-endian ARM ELF file."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            # a private (copy-on-write) mapping is writable, which lets ctypes
+            # reference its contents directly, without copying them
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        self.length = len(self._map)
+
+        if self.length < 52 or self._map[:4] != b'\x7fELF':
+            self.close()
+            raise ValueError('not an ELF file')
+
+        # EI_CLASS (ELFCLASS32) and EI_DATA (ELFDATA2LSB)
+        if self._map[4:6] != b'\x01\x01':
+            self.close()
+            raise ValueError('only 32bit little-endian ELF files are '
+                             'supported')
+
+        (self.type, self.machine, _, self.entry, phoff, shoff, _, _,
+         phentsize, phnum, shentsize, shnum,
+         shstrndx) = struct.unpack_from('<HHIIIIIHHHHHH', self._map, 16)
+
+        if self.machine != EM_ARM:
+            self.close()
+            raise ValueError('not an ARM ELF file')
+
+        self.segments = []
+        for idx in range(phnum):
+            off = phoff + idx * phentsize
+            if off + 32 > self.length:
+                break
+            self.segments.append(Segment(*struct.unpack_from(
+                '<IIIIIIII', self._map, off)))
+
+        sections = []
+        for idx in range(shnum):
+            off = shoff + idx * shentsize
+            if off + 40 > self.length:
+                break
+            sections.append(struct.unpack_from('<IIIIIIIIII', self._map, off))
+
+        strtab = sections[shstrndx][4] if shstrndx < len(sections) else None
+        self.sections = [Section(self._string(strtab, s[0]), *s[1:])
+                         for s in sections]
+
+    def close(self):
+        """Unmaps the ELF file."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _string(self, offset, idx):
+        """Reads a zero-terminated string from a string table."""
+        if offset is None or offset + idx >= self.length:
+            return ''
+
+        end = self._map.find(b'\x00', offset + idx)
+        if end < 0:
+            end = self.length
+        return self._map[offset + idx:end].decode('latin-1')
+
+    def _size(self, offset, size):
+        """Clamps the size of a region to the end of the file."""
+        return max(0, min(size, self.length - offset))
+
+    def mapping_symbols(self):
+        """Returns the mapping symbols of each section.
+
+        The return value is a dictionary of section index to a sorted list of
+        (offset, mode) tuples, where offset is relative to the start of the
+        section and mode is either darm.M_ARMV7, darm.M_THUMB, or M_DATA.
+
+        """
+        ret = {}
+        for section in self.sections:
+            if section.type != SHT_SYMTAB or section.entsize < 16 or \
+                    section.link >= len(self.sections):
+                continue
+
+            strtab = self.sections[section.link].offset
+            end = section.offset + self._size(section.offset, section.size)
+            for off in range(section.offset, end - 15, section.entsize):
+                name, value, _, _, _, shndx = \
+                    struct.unpack_from('<IIIBBH', self._map, off)
+
+                # $a, $t and $d, optionally followed by ".<anything>"
+                name = self._string(strtab, name)
+                if len(name) < 2 or name[0] != '$' or \
+                        name[1] not in _mapping_symbols or \
+                        name[2:3] not in ('', '.') or \
+                        shndx >= len(self.sections):
+                    continue
+
+                # symbol values are section-relative in relocatable files
+                if self.type != ET_REL:
+                    value -= self.sections[shndx].addr
+
+                ret.setdefault(shndx, []).append(
+                    (value, _mapping_symbols[name[1]]))
+
+        for symbols in ret.values():
+            symbols.sort()
+        return ret
+
+    def code_ranges(self):
+        """Yields the CodeRange objects of all executable code.
+
+        Executable sections are split up according to their mapping symbols,
+        sections without mapping symbols are assumed to be ARMv7 code. If the
+        file has no section headers, e.g., because they have been stripped,
+        then the executable PT_LOAD segments are used instead.
+
+        """
+        sections = [(idx, section)
+                    for idx, section in enumerate(self.sections)
+                    if section.type == SHT_PROGBITS and
+                    section.flags & SHF_EXECINSTR]
+
+        if not sections:
+            for segment in self.segments:
+                if segment.type == PT_LOAD and segment.flags & PF_X:
+                    yield CodeRange(segment.vaddr, segment.offset,
+                                    self._size(segment.offset,
+                                               segment.filesz),
+                                    darm.M_ARMV7)
+            return
+
+        symbols = self.mapping_symbols()
+        for idx, section in sections:
+            size = self._size(section.offset, section.size)
+
+            # bounds of each region, the code before the first mapping
+            # symbol (if any) is assumed to be ARMv7
+            regions = [(0, darm.M_ARMV7)] + [
+                (off, mode) for off, mode in symbols.get(idx, [])
+                if 0 <= off < size]
+
+            for pos, (start, mode) in enumerate(regions):
+                end = regions[pos + 1][0] if pos + 1 < len(regions) else size
+                if end > start:
+                    yield CodeRange(section.addr + start,
+                                    section.offset + start, end - start, mode)
+
+    def chunks(self, code_range):
+        """Disassembles a CodeRange, yielding darm.Disassembly objects."""
+        addr, offset, size, mode = code_range
+        if mode == M_DATA:
+            return
+
+        end = offset + size
+        while offset < end:
+            length = min(end - offset, CHUNK_SIZE)
+            buf = (c_char * length).from_buffer(self._map, offset)
+            insns = darm.disasm_buffer(buf, mode, addr)
+            del buf
+
+            # the remainder is too short to contain another instruction
+            if not len(insns):
+                break
+
+            yield insns
+
+            # continue right after the last instruction of this chunk, a
+            # Thumb2 instruction may straddle the end of the chunk
+            last = insns.addr(-1) - addr + 2
+            if mode == darm.M_ARMV7:
+                last += 2
+            elif struct.unpack_from('<H', self._map,
+                                    offset + last - 2)[0] >> 11 >= 0x1d:
+                last += 2
+
+            offset, addr = offset + last, addr + last
+
+    def disasm(self):
+        """Yields (address, instruction) for all executable code.
+
+        Undecodable instructions are represented by None, just like with
+        darm.disasm_buffer().
+
+        """
+        for code_range in self.code_ranges():
+            for insns in self.chunks(code_range):
+                for item in insns.items():
+                    yield item
+
+
+def main(argv):
+    if len(argv) < 2:
+        sys.stderr.write(
+            'elf.py - Utility for dumping ARMv7 and Thumb ELF files\n'
+            '\n'
+            'Usage: %s <binfile>\n' % argv[0])
+        return 1
+
+    try:
+        elf = ElfFile(argv[1])
+    except (IOError, ValueError) as e:
+        sys.stderr.write('[-] Error loading %s: %s\n' % (argv[1], e))
+        return 1
+
+    with elf:
+        for code_range in elf.code_ranges():
+            sys.stdout.write('offset: 0x%08x, size: 0x%08x, vaddr: 0x%08x, '
+                             'mode: %s\n' % (code_range.offset,
+                                             code_range.size, code_range.addr,
+                                             {darm.M_ARMV7: 'arm',
+                                              darm.M_THUMB: 'thumb',
+                                              M_DATA: 'data'}
+                                             [code_range.mode]))
+
+            for insns in elf.chunks(code_range):
+                for idx, (addr, insn) in enumerate(insns.items()):
+                    sys.stdout.write('#%06x %08x %s\n' % (
+                        addr, insns.insns[idx].w,
+                        insn if insn is not None else '(..)'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
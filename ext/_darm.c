@@ -0,0 +1,526 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+//
+// Native implementation of darm.disasm_armv7, darm.disasm_thumb and
+// darm.disasm_thumb2.
+//
+// The ctypes bindings spend most of their time in the ctypes call itself and
+// in creating the Python objects of a Darm object. This module decodes
+// straight into a native object, which holds the darm_t structure and
+// converts its members into Python objects on demand, just like LazyDarm.
+//
+// The Python classes (Instruction, Register, etc.) remain defined in darm.py,
+// which registers them, together with its subclass of _darm.Darm, through
+// _darm.setup() when it's imported. darm.py falls back to ctypes if this
+// module is not available.
+//
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include "darm.h"
+
+#if PY_MAJOR_VERSION >= 3
+#define PyInt_FromLong PyLong_FromLong
+#define PyString_FromString PyUnicode_FromString
+#endif
+
+// METH_FASTCALL is part of the stable calling convention as of Python 3.7,
+// older versions (including Python 2) parse a tuple of arguments instead
+#if PY_VERSION_HEX >= 0x03070000
+#define DARM_FASTCALL 1
+#endif
+
+typedef struct _darm_object_t {
+    PyObject_HEAD
+    darm_t d;
+} darm_object_t;
+
+static PyTypeObject darm_type;
+
+// the classes registered by darm.py
+static PyTypeObject *g_cls;
+static PyObject *g_instruction, *g_encoding, *g_condition, *g_register;
+static PyObject *g_shift, *g_reglist;
+
+// the values of Instruction, Encoding, Condition and Register are interned
+// by darm.py already, these arrays merely save the dictionary lookup; the
+// condition and register arrays are indexed by their value plus one as to
+// include C_INVLD and R_INVLD
+static PyObject *g_instrs[I_INSTRCNT];
+static PyObject *g_enctypes[ARRAYSIZE(darm_enctypes)];
+static PyObject *g_conds[17], *g_regs[17];
+
+static PyObject *_interned(PyObject **table, int32_t count, PyObject *cls,
+    int32_t idx, int32_t base)
+{
+    if(cls == NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+            "_darm.setup() has not been called");
+        return NULL;
+    }
+
+    if(idx + base < 0 || idx + base >= count) {
+        return PyObject_CallFunction(cls, "i", idx);
+    }
+
+    PyObject **value = &table[idx + base];
+    if(*value == NULL) {
+        *value = PyObject_CallFunction(cls, "i", idx);
+        if(*value == NULL) return NULL;
+    }
+
+    Py_INCREF(*value);
+    return *value;
+}
+
+static void _clear(PyObject **table, int32_t count)
+{
+    for (int32_t idx = 0; idx < count; idx++) {
+        Py_CLEAR(table[idx]);
+    }
+}
+
+static PyObject *_register(int32_t reg)
+{
+    if(reg < 0) {
+        Py_RETURN_NONE;
+    }
+    return _interned(g_regs, ARRAYSIZE(g_regs), g_register, reg, 1);
+}
+
+static PyObject *_flag(uint32_t value)
+{
+    switch (value) {
+    case B_UNSET: Py_RETURN_FALSE;
+    case B_SET: Py_RETURN_TRUE;
+    default: Py_RETURN_NONE;
+    }
+}
+
+typedef enum _field_type_t {
+    F_UINT, F_INT, F_INSTR, F_ENCTYPE, F_COND, F_FLAG, F_REG,
+} field_type_t;
+
+typedef struct _field_t {
+    size_t offset;
+    field_type_t type;
+} field_t;
+
+static PyObject *darm_object_get(darm_object_t *self, void *closure)
+{
+    const field_t *f = (const field_t *) closure;
+    const char *p = (const char *) &self->d + f->offset;
+    int32_t value = *(const int32_t *) p;
+
+    switch (f->type) {
+    // Python 2 longs, just like the c_uint32 members of the ctypes bindings
+    case F_UINT:
+        return PyLong_FromUnsignedLong(*(const uint32_t *) p);
+
+    case F_INT:
+        return PyInt_FromLong(value);
+
+    case F_INSTR:
+        return _interned(g_instrs, ARRAYSIZE(g_instrs), g_instruction,
+            value, 0);
+
+    case F_ENCTYPE:
+        return _interned(g_enctypes, ARRAYSIZE(g_enctypes), g_encoding,
+            value, 0);
+
+    case F_COND:
+        return _interned(g_conds, ARRAYSIZE(g_conds), g_condition, value, 1);
+
+    case F_FLAG:
+        return _flag(*(const uint32_t *) p);
+
+    case F_REG:
+        return _register(value);
+    }
+    return NULL;
+}
+
+static PyObject *darm_object_shift(darm_object_t *self, void *closure)
+{
+    (void) closure;
+
+    if(g_shift == NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+            "_darm.setup() has not been called");
+        return NULL;
+    }
+
+    PyObject *Rs = _register(self->d.Rs);
+    if(Rs == NULL) return NULL;
+
+    PyObject *ret = PyObject_CallFunction(g_shift, "iOi",
+        (int) self->d.shift_type, Rs, (int) self->d.shift);
+    Py_DECREF(Rs);
+    return ret;
+}
+
+static PyObject *darm_object_reglist(darm_object_t *self, void *closure)
+{
+    (void) closure;
+
+    if(g_reglist == NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+            "_darm.setup() has not been called");
+        return NULL;
+    }
+    return PyObject_CallFunction(g_reglist, "i", (int) self->d.reglist);
+}
+
+#define FIELD(name, member, type) \
+    {name, (getter) &darm_object_get, NULL, NULL, \
+        (void *) &(const field_t){offsetof(darm_t, member), type}}
+
+static PyGetSetDef darm_object_getset[] = {
+    FIELD("w", w, F_UINT),
+    FIELD("instr", instr, F_INSTR),
+    FIELD("instr_type", instr_type, F_ENCTYPE),
+    FIELD("cond", cond, F_COND),
+    FIELD("B", B, F_FLAG),
+    FIELD("S", S, F_FLAG),
+    FIELD("E", E, F_FLAG),
+    FIELD("M", M, F_FLAG),
+    FIELD("N", N, F_FLAG),
+    FIELD("U", U, F_FLAG),
+    FIELD("H", H, F_FLAG),
+    FIELD("P", P, F_FLAG),
+    FIELD("R", R, F_FLAG),
+    FIELD("T", T, F_FLAG),
+    FIELD("W", W, F_FLAG),
+    FIELD("I", I, F_FLAG),
+    FIELD("Rd", Rd, F_REG),
+    FIELD("Rn", Rn, F_REG),
+    FIELD("Rm", Rm, F_REG),
+    FIELD("Ra", Ra, F_REG),
+    FIELD("Rt", Rt, F_REG),
+    FIELD("Rt2", Rt2, F_REG),
+    FIELD("RdHi", RdHi, F_REG),
+    FIELD("RdLo", RdLo, F_REG),
+    FIELD("rotate", rotate, F_INT),
+    FIELD("option", option, F_INT),
+    FIELD("imm", imm, F_UINT),
+    FIELD("lsb", lsb, F_UINT),
+    FIELD("width", width, F_UINT),
+    {"shift", (getter) &darm_object_shift, NULL, NULL, NULL},
+    {"reglist", (getter) &darm_object_reglist, NULL, NULL, NULL},
+    {NULL},
+};
+
+static PyObject *darm_object_str(darm_object_t *self)
+{
+    // zero-initialized, like the _DarmStr structure of the ctypes bindings
+    darm_str_t str = {"", {""}, "", ""};
+    if(darm_str2(&self->d, &str, 1) != 0) {
+        return PyString_FromString("");
+    }
+    return PyString_FromString(str.total);
+}
+
+static void darm_object_dealloc(darm_object_t *self)
+{
+    Py_TYPE(self)->tp_free((PyObject *) self);
+}
+
+static PyTypeObject darm_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_darm.Darm",                               // tp_name
+    sizeof(darm_object_t),                      // tp_basicsize
+    0,                                          // tp_itemsize
+    (destructor) &darm_object_dealloc,          // tp_dealloc
+    0,                                          // tp_print / vectorcall_offset
+    0,                                          // tp_getattr
+    0,                                          // tp_setattr
+    0,                                          // tp_compare / tp_as_async
+    0,                                          // tp_repr
+    0,                                          // tp_as_number
+    0,                                          // tp_as_sequence
+    0,                                          // tp_as_mapping
+    0,                                          // tp_hash
+    0,                                          // tp_call
+    (reprfunc) &darm_object_str,                // tp_str
+    0,                                          // tp_getattro
+    0,                                          // tp_setattro
+    0,                                          // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   // tp_flags
+    "Decoded instruction, created by the disasm_* functions.", // tp_doc
+    0,                                          // tp_traverse
+    0,                                          // tp_clear
+    0,                                          // tp_richcompare
+    0,                                          // tp_weaklistoffset
+    0,                                          // tp_iter
+    0,                                          // tp_iternext
+    0,                                          // tp_methods
+    0,                                          // tp_members
+    darm_object_getset,                         // tp_getset
+};
+
+// wraps a decoded instruction into an instance of the registered class
+static PyObject *_darm_object(int ret, const darm_t *d)
+{
+    if(ret < 0) {
+        Py_RETURN_NONE;
+    }
+
+    PyTypeObject *cls = g_cls != NULL ? g_cls : &darm_type;
+    darm_object_t *self = (darm_object_t *) cls->tp_alloc(cls, 0);
+    if(self != NULL) {
+        self->d = *d;
+    }
+    return (PyObject *) self;
+}
+
+static int _parse_word(const char *name, PyObject *w, uint32_t *out)
+{
+    unsigned long value = PyLong_AsUnsignedLongMask(w);
+    if(value == (unsigned long) -1 && PyErr_Occurred()) {
+        PyErr_Format(PyExc_TypeError, "%s() requires an integer", name);
+        return -1;
+    }
+    *out = (uint32_t) value;
+    return 0;
+}
+
+// the lazy argument is accepted for compatibility with the ctypes bindings,
+// and it's evaluated like any other argument, but the returned objects are
+// always lazy, i.e., they create the attributes of darm.Darm on demand
+static int _parse_lazy(PyObject *lazy)
+{
+    return lazy != NULL && PyObject_IsTrue(lazy) < 0 ? -1 : 0;
+}
+
+#ifdef DARM_FASTCALL
+
+static int _parse_args(const char *name, PyObject *const *args,
+    Py_ssize_t nargs, PyObject *kwnames, uint32_t *w)
+{
+    static const char *kwlist[] = {"w", "lazy"};
+    PyObject *values[ARRAYSIZE(kwlist)] = {NULL, NULL};
+    Py_ssize_t nkwargs = kwnames != NULL ? PyTuple_GET_SIZE(kwnames) : 0;
+
+    if(nargs > (Py_ssize_t) ARRAYSIZE(kwlist)) {
+        PyErr_Format(PyExc_TypeError,
+            "%s() takes at most 2 arguments (%zd given)", name, nargs);
+        return -1;
+    }
+
+    for (Py_ssize_t idx = 0; idx < nargs; idx++) {
+        values[idx] = args[idx];
+    }
+
+    // the values of the keyword arguments follow the positional ones
+    for (Py_ssize_t idx = 0; idx < nkwargs; idx++) {
+        PyObject *key = PyTuple_GET_ITEM(kwnames, idx);
+        uint32_t arg = 0;
+
+        while (arg < ARRAYSIZE(kwlist) &&
+                PyUnicode_CompareWithASCIIString(key, kwlist[arg]) != 0) {
+            arg++;
+        }
+
+        if(arg == ARRAYSIZE(kwlist)) {
+            PyErr_Format(PyExc_TypeError,
+                "%s() got an unexpected keyword argument '%U'", name, key);
+            return -1;
+        }
+
+        if(values[arg] != NULL) {
+            PyErr_Format(PyExc_TypeError,
+                "%s() got multiple values for argument '%s'", name,
+                kwlist[arg]);
+            return -1;
+        }
+        values[arg] = args[nargs + idx];
+    }
+
+    if(values[0] == NULL) {
+        PyErr_Format(PyExc_TypeError,
+            "%s() missing required argument 'w'", name);
+        return -1;
+    }
+
+    if(_parse_lazy(values[1]) < 0) return -1;
+    return _parse_word(name, values[0], w);
+}
+
+#define DISASM(name, body) \
+    static PyObject *name(PyObject *self, PyObject *const *args, \
+        Py_ssize_t nargs, PyObject *kwnames) \
+    { \
+        darm_t d; uint32_t w; \
+        (void) self; \
+        if(_parse_args(#name, args, nargs, kwnames, &w) < 0) { \
+            return NULL; \
+        } \
+        return _darm_object(body, &d); \
+    }
+
+#define DISASM_FLAGS (METH_FASTCALL | METH_KEYWORDS)
+
+#else
+
+static int _parse_args(const char *name, PyObject *args, PyObject *kwargs,
+    uint32_t *w)
+{
+    static char *kwlist[] = {"w", "lazy", NULL};
+    PyObject *word, *lazy = NULL;
+
+    if(PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", kwlist,
+            &word, &lazy) == 0) {
+        return -1;
+    }
+
+    if(_parse_lazy(lazy) < 0) return -1;
+    return _parse_word(name, word, w);
+}
+
+#define DISASM(name, body) \
+    static PyObject *name(PyObject *self, PyObject *args, PyObject *kwargs) \
+    { \
+        darm_t d; uint32_t w; \
+        (void) self; \
+        if(_parse_args(#name, args, kwargs, &w) < 0) { \
+            return NULL; \
+        } \
+        return _darm_object(body, &d); \
+    }
+
+#define DISASM_FLAGS (METH_VARARGS | METH_KEYWORDS)
+
+#endif
+
+DISASM(disasm_armv7, darm_armv7_disasm(&d, w))
+DISASM(disasm_thumb, darm_thumb_disasm(&d, w & 0xffff))
+DISASM(disasm_thumb2, darm_thumb2_disasm(&d, (w >> 16) & 0xffff, w & 0xffff))
+
+static PyObject *setup(PyObject *self, PyObject *args)
+{
+    PyObject *cls, *instruction, *encoding, *condition, *reg, *shift;
+    PyObject *reglist;
+    (void) self;
+
+    if(PyArg_ParseTuple(args, "O!OOOOOO:setup", &PyType_Type, &cls,
+            &instruction, &encoding, &condition, &reg, &shift,
+            &reglist) == 0) {
+        return NULL;
+    }
+
+    if(PyType_IsSubtype((PyTypeObject *) cls, &darm_type) == 0) {
+        PyErr_SetString(PyExc_TypeError,
+            "setup() requires a subclass of _darm.Darm");
+        return NULL;
+    }
+
+    PyObject *objs[] = {
+        cls, instruction, encoding, condition, reg, shift, reglist,
+    };
+    for (uint32_t idx = 0; idx < ARRAYSIZE(objs); idx++) {
+        Py_INCREF(objs[idx]);
+    }
+
+    // darm.py registers its classes every time it's imported, e.g., when
+    // it's reloaded, or imported under another name, after which the values
+    // of the previously registered classes must no longer be handed out
+    _clear(g_instrs, ARRAYSIZE(g_instrs));
+    _clear(g_enctypes, ARRAYSIZE(g_enctypes));
+    _clear(g_conds, ARRAYSIZE(g_conds));
+    _clear(g_regs, ARRAYSIZE(g_regs));
+
+    PyObject *prev[] = {
+        (PyObject *) g_cls, g_instruction, g_encoding, g_condition,
+        g_register, g_shift, g_reglist,
+    };
+    for (uint32_t idx = 0; idx < ARRAYSIZE(prev); idx++) {
+        Py_XDECREF(prev[idx]);
+    }
+
+    g_cls = (PyTypeObject *) cls;
+    g_instruction = instruction, g_encoding = encoding;
+    g_condition = condition, g_register = reg;
+    g_shift = shift, g_reglist = reglist;
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef darm_methods[] = {
+    {"disasm_armv7", (PyCFunction) &disasm_armv7, DISASM_FLAGS,
+        "Disassemble an ARMv7 instruction, returns None on failure."},
+    {"disasm_thumb", (PyCFunction) &disasm_thumb, DISASM_FLAGS,
+        "Disassemble a Thumb instruction, returns None on failure."},
+    {"disasm_thumb2", (PyCFunction) &disasm_thumb2, DISASM_FLAGS,
+        "Disassemble a Thumb2 instruction, the first halfword in the upper "
+        "16 bits, returns None on failure."},
+    {"setup", (PyCFunction) &setup, METH_VARARGS,
+        "setup(cls, Instruction, Encoding, Condition, Register, Shift, "
+        "RegisterList) registers the classes of darm.py."},
+    {NULL},
+};
+
+#define MODULE_DOC "Native disassembly functions for the darm bindings."
+
+#if PY_MAJOR_VERSION >= 3
+
+static struct PyModuleDef darm_module = {
+    PyModuleDef_HEAD_INIT, "_darm", MODULE_DOC, -1, darm_methods,
+};
+
+PyMODINIT_FUNC PyInit__darm(void)
+{
+    if(PyType_Ready(&darm_type) < 0) return NULL;
+
+    PyObject *m = PyModule_Create(&darm_module);
+    if(m == NULL) return NULL;
+
+    Py_INCREF(&darm_type);
+    if(PyModule_AddObject(m, "Darm", (PyObject *) &darm_type) < 0) {
+        Py_DECREF(&darm_type);
+        Py_DECREF(m);
+        return NULL;
+    }
+    return m;
+}
+
+#else
+
+PyMODINIT_FUNC init_darm(void)
+{
+    if(PyType_Ready(&darm_type) < 0) return;
+
+    PyObject *m = Py_InitModule3("_darm", darm_methods, MODULE_DOC);
+    if(m == NULL) return;
+
+    Py_INCREF(&darm_type);
+    PyModule_AddObject(m, "Darm", (PyObject *) &darm_type);
+}
+
+#endif
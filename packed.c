@@ -0,0 +1,190 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <stddef.h>
+#include <string.h>
+#include "darm.h"
+
+// places the lower bits of value at offset in ext
+#define EXT(value, offset, bits) \
+    (((uint32_t)(value) & ((1 << (bits)) - 1)) << (offset))
+
+// extracts an unsigned or signed value from ext
+#define UEXT(ext, offset, bits) \
+    (((ext) >> (offset)) & ((1 << (bits)) - 1))
+#define SEXT(ext, offset, bits) \
+    ((int32_t)(UEXT(ext, offset, bits) << (32 - (bits))) >> (32 - (bits)))
+
+static int _equal(const darm_t *a, const darm_t *b)
+{
+    // all members up to reglist are 32 bits, hence there's no padding
+    return memcmp(a, b, offsetof(darm_t, reglist)) == 0 &&
+        a->reglist == b->reglist && a->coproc == b->coproc &&
+        a->opc1 == b->opc1 && a->opc2 == b->opc2 && a->CRd == b->CRd &&
+        a->CRn == b->CRn && a->CRm == b->CRm && a->D == b->D &&
+        a->firstcond == b->firstcond && a->mask == b->mask;
+}
+
+int darm_pack(darm_packed_t *p, const darm_t *d)
+{
+    memset(p, 0, sizeof(darm_packed_t));
+
+    p->w = d->w;
+    p->instr = d->instr;
+    p->instr_type = d->instr_type;
+    p->instr_imm_type = d->instr_imm_type;
+    p->instr_flag_type = d->instr_flag_type;
+
+    p->B = d->B, p->S = d->S, p->E = d->E, p->M = d->M, p->N = d->N;
+    p->U = d->U, p->H = d->H, p->P = d->P, p->R = d->R, p->T = d->T;
+    p->W = d->W, p->I = d->I, p->D = d->D;
+    p->cond = d->cond;
+
+    p->Rd = d->Rd, p->Rn = d->Rn, p->Rm = d->Rm, p->Ra = d->Ra;
+    p->Rt = d->Rt, p->Rt2 = d->Rt2, p->RdHi = d->RdHi, p->RdLo = d->RdLo;
+
+    if(d->reglist != 0) {
+        p->imm_kind = PI_REGLIST;
+        p->imm.reglist = d->reglist;
+    }
+    else if(d->coproc != 0 || d->opc1 != 0 || d->opc2 != 0 ||
+            d->CRd != R_INVLD || d->CRn != R_INVLD || d->CRm != R_INVLD) {
+        p->imm_kind = PI_COPROC;
+        p->imm.coproc.coproc = d->coproc;
+        p->imm.coproc.opc1 = d->opc1;
+        p->imm.coproc.opc2 = d->opc2;
+        p->imm.coproc.CRd = d->CRd;
+        p->imm.coproc.CRn = d->CRn;
+        p->imm.coproc.CRm = d->CRm;
+    }
+    else {
+        p->imm_kind = PI_IMM;
+        p->imm.imm = d->imm;
+    }
+
+    if(d->shift_type != S_INVLD || d->Rs != R_INVLD || d->shift != 0 ||
+            d->sat_imm != 0) {
+        p->ext_kind = PX_SHIFT;
+        p->ext = EXT(d->shift_type, 0, 3) | EXT(d->Rs, 3, 5) |
+            EXT(d->shift, 8, 6) | EXT(d->sat_imm, 14, 5);
+    }
+    else if(d->lsb != 0 || d->msb != 0 || d->width != 0) {
+        p->ext_kind = PX_BITFIELD;
+        p->ext = EXT(d->lsb, 0, 5) | EXT(d->msb, 5, 5) |
+            EXT(d->width, 10, 7);
+    }
+    else if(d->firstcond != C_INVLD || d->mask != 0) {
+        p->ext_kind = PX_IT;
+        p->ext = EXT(d->firstcond, 0, 5) | EXT(d->mask, 5, 4);
+    }
+    else if(d->rotate != 0) {
+        p->ext_kind = PX_ROTATE;
+        p->ext = EXT(d->rotate, 0, 5);
+    }
+    else if(d->option != O_INVLD) {
+        p->ext_kind = PX_OPTION;
+        p->ext = EXT(d->option, 0, 5);
+    }
+
+    // rather than checking the range of every single member, and which
+    // members are used together, unpack the result and compare
+    darm_t d2;
+    darm_unpack(&d2, p);
+    return _equal(d, &d2) ? 0 : -1;
+}
+
+void darm_unpack(darm_t *d, const darm_packed_t *p)
+{
+    darm_init(d);
+
+    d->w = p->w;
+    d->instr = p->instr;
+    d->instr_type = p->instr_type;
+    d->instr_imm_type = p->instr_imm_type;
+    d->instr_flag_type = p->instr_flag_type;
+
+    d->B = p->B, d->S = p->S, d->E = p->E, d->M = p->M, d->N = p->N;
+    d->U = p->U, d->H = p->H, d->P = p->P, d->R = p->R, d->T = p->T;
+    d->W = p->W, d->I = p->I, d->D = p->D;
+    d->cond = p->cond;
+
+    d->Rd = p->Rd, d->Rn = p->Rn, d->Rm = p->Rm, d->Ra = p->Ra;
+    d->Rt = p->Rt, d->Rt2 = p->Rt2, d->RdHi = p->RdHi, d->RdLo = p->RdLo;
+
+    switch ((darm_packed_imm_t) p->imm_kind) {
+    case PI_IMM:
+        d->imm = p->imm.imm;
+        break;
+
+    case PI_REGLIST:
+        d->reglist = p->imm.reglist;
+        break;
+
+    case PI_COPROC:
+        d->coproc = p->imm.coproc.coproc;
+        d->opc1 = p->imm.coproc.opc1;
+        d->opc2 = p->imm.coproc.opc2;
+        d->CRd = p->imm.coproc.CRd;
+        d->CRn = p->imm.coproc.CRn;
+        d->CRm = p->imm.coproc.CRm;
+        break;
+    }
+
+    switch ((darm_packed_ext_t) p->ext_kind) {
+    case PX_NONE:
+        break;
+
+    case PX_SHIFT:
+        d->shift_type = SEXT(p->ext, 0, 3);
+        d->Rs = SEXT(p->ext, 3, 5);
+        d->shift = UEXT(p->ext, 8, 6);
+        d->sat_imm = UEXT(p->ext, 14, 5);
+        break;
+
+    case PX_BITFIELD:
+        d->lsb = UEXT(p->ext, 0, 5);
+        d->msb = UEXT(p->ext, 5, 5);
+        d->width = SEXT(p->ext, 10, 7);
+        break;
+
+    case PX_IT:
+        d->firstcond = SEXT(p->ext, 0, 5);
+        d->mask = UEXT(p->ext, 5, 4);
+        break;
+
+    case PX_ROTATE:
+        d->rotate = UEXT(p->ext, 0, 5);
+        break;
+
+    case PX_OPTION:
+        d->option = SEXT(p->ext, 0, 5);
+        break;
+    }
+}
@@ -0,0 +1,257 @@
+"""
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+
+
+Disassembly of large images by a pool of worker processes.
+
+Threads (see darm.disasm_buffer_parallel) only help while the library itself
+is decoding; any per-instruction work in Python, e.g., a filter on the
+decoded instructions, is serialized by the GIL. This module shards the
+image across a multiprocessing pool instead. Every worker maps the image,
+decodes its shard, optionally runs a function on each instruction, and
+writes one compact Record per instruction into a shared memory block, in
+the slots reserved for its shard. Nothing is pickled apart from the shard
+descriptions, and the parent process gets a view on all records, in order,
+without copying them.
+
+Requires Python 3.8 or newer for multiprocessing.shared_memory.
+
+"""
+from ctypes import Structure, c_char, c_int8, c_int32, c_uint8, c_uint16
+from ctypes import c_uint32, sizeof
+import mmap
+import struct
+
+import darm
+
+# amount of bytes a worker decodes at once, which bounds its memory usage
+CHUNK_SIZE = 64 * 1024
+
+
+class Record(Structure):
+    """Compact summary of a decoded instruction.
+
+    Undecodable instructions have their instr field set to zero (I_INVLD).
+    result holds the return value of the function passed to disasm_file(),
+    if any, and zero otherwise.
+
+    """
+    _fields_ = [
+        ('addr', c_uint32),
+        ('w', c_uint32),
+        ('imm', c_uint32),
+        ('result', c_int32),
+        ('instr', c_uint16),
+        ('reglist', c_uint16),
+        ('instr_type', c_uint8),
+        ('cond', c_int8),
+        ('Rd', c_int8),
+        ('Rn', c_int8),
+        ('Rm', c_int8),
+        ('Rt', c_int8),
+        ('type_', c_int8),
+        ('shift', c_uint8),
+    ]
+
+
+def _pack(record, addr, d, result):
+    """Fills out a Record from a darm._Darm structure."""
+    record.addr, record.w, record.imm, record.result = addr, d.w, d.imm, result
+    record.instr, record.reglist = d.instr, d.reglist
+    record.instr_type, record.cond = d.instr_type, d.cond
+    record.Rd, record.Rn, record.Rm, record.Rt = d.Rd, d.Rn, d.Rm, d.Rt
+    record.type_, record.shift = d.type_, d.shift
+
+
+class Records(object):
+    """The records of all instructions, backed by shared memory.
+
+    The records attribute is a ctypes array of Record structures which lives
+    directly in the shared memory block. Indexing or iterating a Records
+    object returns copies of the Record structures instead, which remain
+    valid after close() released the shared memory - close() fails as long
+    as the records array, or any element of it, is still referenced.
+
+    """
+    def __init__(self, shm, count, mode):
+        self._shm = shm
+        self.count = count
+        self.mode = mode
+        self.records = (Record * count).from_buffer(shm.buf)
+
+    def close(self):
+        """Releases and removes the shared memory block."""
+        if self._shm is not None:
+            del self.records
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.count
+        if idx < 0 or idx >= self.count:
+            raise IndexError('record index out of range')
+        return Record.from_buffer_copy(self._shm.buf, idx * sizeof(Record))
+
+    def __iter__(self):
+        for idx in range(self.count):
+            yield self[idx]
+
+    def insn(self, idx):
+        """Decodes the instruction of a record (again) into a Darm object.
+
+        Returns None if the instruction could not be decoded.
+
+        """
+        w = self[idx].w
+        if self.mode == darm.M_ARMV7:
+            return darm.disasm_armv7(w)
+
+        # 32bit Thumb2 instructions are stored as (first << 16) | second
+        if w > 0xffff:
+            return darm.disasm_thumb2(w)
+        return darm.disasm_thumb(w)
+
+
+def _map(path):
+    """Maps a file, privately, so that ctypes may reference its contents."""
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+
+def _decode_shard(args):
+    """Worker, decodes a shard and writes its records to shared memory."""
+    from multiprocessing import shared_memory
+
+    path, name, mode, base_addr, offset, end, first, fn = args
+    shm, image = shared_memory.SharedMemory(name), _map(path)
+
+    try:
+        idx = first
+        while offset < end:
+            length = min(end - offset, CHUNK_SIZE)
+            buf = (c_char * length).from_buffer(image, offset)
+            insns = darm.disasm_buffer(buf, mode, base_addr + offset)
+            del buf
+
+            # the remainder is too short to contain another instruction
+            if not len(insns):
+                break
+
+            records = (Record * len(insns)).from_buffer(
+                shm.buf, idx * sizeof(Record))
+            for pos in range(len(insns)):
+                d, addr = insns.insns[pos], insns.addrs[pos]
+                result = fn(addr, insns[pos]) if fn is not None else 0
+                _pack(records[pos], addr, d, int(result or 0))
+            del records
+
+            # continue right after the last instruction of this chunk, the
+            # chunk may have cut off a Thumb2 instruction
+            last = insns.addr(-1) - base_addr + 2
+            if mode == darm.M_ARMV7 or struct.unpack_from(
+                    '<H', image, last - 2)[0] >> 11 >= 0x1d:
+                last += 2
+
+            idx, offset = idx + len(insns), last
+        return idx - first
+    finally:
+        shm.close()
+        image.close()
+
+
+def disasm_file(path, mode=darm.M_ARMV7, base_addr=0, processes=None,
+                fn=None):
+    """Disassembles an image file using a pool of worker processes.
+
+    The file at path is decoded entirely as either darm.M_ARMV7 or
+    darm.M_THUMB (mixed Thumb and Thumb2) instructions, where the first
+    instruction is located at base_addr. processes is the size of the pool,
+    by default the amount of CPUs.
+
+    If fn is given, it's called in the workers as fn(addr, insn) for every
+    instruction, where insn is a darm object, or None if the instruction
+    could not be decoded, and its return value (an integer, or None for zero)
+    is stored in the result field of the instruction's record. fn has to be
+    picklable, e.g., a function defined at module level.
+
+    Returns a Records object, which should be closed when it's no longer
+    used in order to release the shared memory.
+
+    """
+    from multiprocessing import Pool, cpu_count, shared_memory
+
+    if processes is None:
+        processes = cpu_count()
+
+    # a few shards per process, in order to balance the load
+    image = _map(path)
+    try:
+        buf = (c_char * len(image)).from_buffer(image)
+        count = len(image) // (4 if mode == darm.M_ARMV7 else 2)
+        shards = darm.split_buffer(
+            buf, mode, max(1, min(processes * 4,
+                                  count // darm.PARALLEL_CHUNK)))
+        del buf
+    finally:
+        image.close()
+
+    count = shards[-1][1]
+    shm = shared_memory.SharedMemory(create=True,
+                                     size=max(1, count * sizeof(Record)))
+
+    try:
+        work = [(path, shm.name, mode, base_addr, offset, end, first, fn)
+                for (offset, first), (end, _) in zip(shards, shards[1:])]
+
+        pool = Pool(processes)
+        try:
+            decoded = pool.map(_decode_shard, work)
+        finally:
+            pool.close()
+            pool.join()
+
+        if sum(decoded) != count:
+            raise RuntimeError('the workers decoded %d instead of %d '
+                               'instructions' % (sum(decoded), count))
+
+        return Records(shm, count, mode)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
@@ -0,0 +1,290 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <string.h>
+#include "darm.h"
+#include "armv7-tbl.h"
+#include "thumb-tbl.h"
+
+#if defined(__GNUC__) && defined(__x86_64__)
+#define DARM_X86_64
+#include <immintrin.h>
+#endif
+
+// a compiled darm_pattern_t, the masks and values of index 0 apply to
+// 16bit Thumb instructions, those of index 1 to 32bit instructions
+typedef struct _search_t {
+    uint32_t count[2];
+    uint32_t mask[2][SEARCH_MAX_ENCODINGS];
+    uint32_t value[2][SEARCH_MAX_ENCODINGS];
+    int32_t field[SF_FIELDCNT];
+} search_t;
+
+void darm_pattern_init(darm_pattern_t *p)
+{
+    p->instr = I_INVLD;
+    p->cond = C_INVLD;
+    p->Rd = p->Rn = p->Rm = p->Ra = p->Rt = R_INVLD;
+    p->Rt2 = p->RdHi = p->RdLo = p->Rs = R_INVLD;
+}
+
+static void _fields(int32_t *out, const darm_pattern_t *p)
+{
+    out[SF_RD] = p->Rd, out[SF_RN] = p->Rn, out[SF_RM] = p->Rm;
+    out[SF_RA] = p->Ra, out[SF_RT] = p->Rt, out[SF_RT2] = p->Rt2;
+    out[SF_RDHI] = p->RdHi, out[SF_RDLO] = p->RdLo, out[SF_RS] = p->Rs;
+    out[SF_COND] = p->cond;
+}
+
+static void _compile(search_t *s, const darm_pattern_t *p, darm_mode_t mode)
+{
+    const darm_encoding_t *table = armv7_encodings;
+    const uint16_t *index = armv7_encodings_index;
+
+    if(mode == M_THUMB) {
+        table = thumb_encodings, index = thumb_encodings_index;
+    }
+
+    _fields(s->field, p);
+    s->count[0] = s->count[1] = 0;
+
+    // without an instruction, or for an instruction without any encodings
+    // in this mode, every instruction word is a candidate
+    if(p->instr == I_INVLD || index[p->instr] == index[p->instr+1]) {
+        s->count[0] = s->count[1] = 1;
+        s->mask[0][0] = s->mask[1][0] = 0;
+        s->value[0][0] = s->value[1][0] = 0;
+        return;
+    }
+
+    for (uint32_t idx = index[p->instr]; idx < index[p->instr+1]; idx++) {
+        const darm_encoding_t *e = &table[idx];
+        uint32_t mask = e->mask, value = e->value, wide = e->size == 4;
+
+        // fold the constrained operands into the fixed bits, only the lower
+        // bits of a register are known for three-bit register fields
+        for (uint32_t f = 0; f < SF_FIELDCNT; f++) {
+            if(s->field[f] < 0 || e->fields[f] == 0) continue;
+
+            uint32_t bits = (1 << (e->fields[f] >> 5)) - 1;
+            uint32_t lsb = e->fields[f] & 31;
+            mask |= bits << lsb;
+            value |= (s->field[f] & bits) << lsb;
+        }
+
+        // darmgen.py asserts that no instruction has more than
+        // SEARCH_MAX_ENCODINGS encodings of either size
+        s->mask[wide][s->count[wide]] = mask;
+        s->value[wide][s->count[wide]++] = value;
+    }
+}
+
+// whether an instruction word matches any of the masks and values
+static inline int _candidate(const search_t *s, uint32_t wide, uint32_t w)
+{
+    for (uint32_t idx = 0; idx < s->count[wide]; idx++) {
+        if((w & s->mask[wide][idx]) == s->value[wide][idx]) return 1;
+    }
+    return 0;
+}
+
+// whether a decoded instruction actually matches the pattern
+static int _matches(const search_t *s, const darm_pattern_t *p,
+    const darm_t *d)
+{
+    int32_t field[SF_FIELDCNT];
+
+    if(d->instr == I_INVLD) return 0;
+    if(p->instr != I_INVLD && d->instr != p->instr) return 0;
+
+    field[SF_RD] = d->Rd, field[SF_RN] = d->Rn, field[SF_RM] = d->Rm;
+    field[SF_RA] = d->Ra, field[SF_RT] = d->Rt, field[SF_RT2] = d->Rt2;
+    field[SF_RDHI] = d->RdHi, field[SF_RDLO] = d->RdLo, field[SF_RS] = d->Rs;
+    field[SF_COND] = d->cond;
+
+    for (uint32_t f = 0; f < SF_FIELDCNT; f++) {
+        if(s->field[f] >= 0 && field[f] != s->field[f]) return 0;
+    }
+    return 1;
+}
+
+static inline uint32_t _load16(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8);
+}
+
+static inline uint32_t _load32(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8) | (buf[2] << 16) |
+        ((uint32_t) buf[3] << 24);
+}
+
+#ifdef DARM_X86_64
+
+// bitmask of the four ARMv7 instructions at buf that are candidates
+static inline uint32_t _candidates_armv7(const search_t *s,
+    const uint8_t *buf)
+{
+    __m128i w = _mm_loadu_si128((const __m128i *) buf);
+    __m128i hit = _mm_setzero_si128();
+
+    for (uint32_t idx = 0; idx < s->count[1]; idx++) {
+        hit = _mm_or_si128(hit, _mm_cmpeq_epi32(
+            _mm_and_si128(w, _mm_set1_epi32(s->mask[1][idx])),
+            _mm_set1_epi32(s->value[1][idx])));
+    }
+    return _mm_movemask_ps(_mm_castsi128_ps(hit));
+}
+
+// bitmask of the eight halfwords at buf that start a candidate, either as
+// 16bit instruction or together with the next halfword as 32bit
+// instruction, bit (2 * idx) represents the idx'th halfword
+static inline uint32_t _candidates_thumb(const search_t *s,
+    const uint8_t *buf)
+{
+    __m128i w = _mm_loadu_si128((const __m128i *) buf);
+    __m128i w2 = _mm_loadu_si128((const __m128i *) &buf[2]);
+    __m128i hit = _mm_setzero_si128();
+
+    for (uint32_t idx = 0; idx < s->count[0]; idx++) {
+        hit = _mm_or_si128(hit, _mm_cmpeq_epi16(
+            _mm_and_si128(w, _mm_set1_epi16(s->mask[0][idx])),
+            _mm_set1_epi16(s->value[0][idx])));
+    }
+
+    for (uint32_t idx = 0; idx < s->count[1]; idx++) {
+        uint32_t mask = s->mask[1][idx], value = s->value[1][idx];
+        hit = _mm_or_si128(hit, _mm_and_si128(
+            _mm_cmpeq_epi16(_mm_and_si128(w, _mm_set1_epi16(mask >> 16)),
+                _mm_set1_epi16(value >> 16)),
+            _mm_cmpeq_epi16(_mm_and_si128(w2, _mm_set1_epi16(mask)),
+                _mm_set1_epi16(value))));
+    }
+    return _mm_movemask_epi8(hit);
+}
+
+#endif
+
+static size_t _search_armv7(const search_t *s, const darm_pattern_t *p,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_scan_t callback,
+    void *user)
+{
+    size_t off = 0, count = 0;
+    darm_t d;
+
+#ifdef DARM_X86_64
+    for (; off + 16 <= len; off += 16) {
+        uint32_t bits = _candidates_armv7(s, &buf[off]);
+
+        for (; bits != 0; bits &= bits - 1) {
+            size_t at = off + 4 * __builtin_ctz(bits);
+            if(darm_armv7_disasm(&d, _load32(&buf[at])) < 0 ||
+                    _matches(s, p, &d) == 0) continue;
+
+            count++;
+            if(callback != NULL && callback(&d, addr + at, user) != 0) {
+                return count;
+            }
+        }
+    }
+#endif
+
+    for (; off + 4 <= len; off += 4) {
+        uint32_t w = _load32(&buf[off]);
+        if(_candidate(s, 1, w) == 0 || darm_armv7_disasm(&d, w) < 0 ||
+                _matches(s, p, &d) == 0) continue;
+
+        count++;
+        if(callback != NULL && callback(&d, addr + off, user) != 0) break;
+    }
+    return count;
+}
+
+static size_t _search_thumb(const search_t *s, const darm_pattern_t *p,
+    const uint8_t *buf, size_t len, uint32_t addr, darm_scan_t callback,
+    void *user)
+{
+    size_t off = 0, end = 0, count = 0;
+    uint32_t bits = 0;
+    darm_t d;
+
+    while (off + 2 <= len) {
+        uint32_t w = _load16(&buf[off]), w2 = 0, candidate;
+
+        // the upper five bits of a Thumb2 instruction are either 0b11101,
+        // 0b11110, or 0b11111 (see also darm_disasm)
+        uint32_t wide = (w >> 11) >= 0x1d;
+        if(wide != 0) {
+            if(off + 4 > len) break;
+            w2 = _load16(&buf[off+2]);
+        }
+
+#ifdef DARM_X86_64
+        // a new block of eight halfwords, including the second halfword of
+        // a 32bit instruction at the end of the block
+        if(off >= end && off + 18 <= len) {
+            bits = _candidates_thumb(s, &buf[off]);
+            end = off + 16;
+        }
+#endif
+
+        if(off < end) {
+            candidate = (bits >> (16 - (end - off))) & 1;
+        }
+        else {
+            candidate = _candidate(s, wide, wide ? (w << 16) | w2 : w);
+        }
+
+        if(candidate != 0 && darm_disasm(&d, w, w2, (addr + off) | 1) != 0 &&
+                _matches(s, p, &d) != 0) {
+            count++;
+            if(callback != NULL && callback(&d, addr + off, user) != 0) {
+                break;
+            }
+        }
+        off += 2 + 2 * wide;
+    }
+    return count;
+}
+
+size_t darm_search(const uint8_t *buf, size_t len, uint32_t addr,
+    darm_mode_t mode, const darm_pattern_t *pattern,
+    darm_scan_t callback, void *user)
+{
+    search_t s;
+
+    if((uint32_t) pattern->instr >= I_INSTRCNT) return 0;
+
+    _compile(&s, pattern, mode);
+    if(mode == M_ARMV7) {
+        return _search_armv7(&s, pattern, buf, len, addr, callback, user);
+    }
+    return _search_thumb(&s, pattern, buf, len, addr, callback, user);
+}
@@ -0,0 +1,363 @@
+#define _POSIX_C_SOURCE 199309L
+#include <stdio.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "../darm.h"
+
+//
+// Throughput benchmarks of the various decoders.
+//
+// Each benchmark prints a single line of JSON, e.g.,
+// {"bench": "armv7", "corpus": "random", "insns": 1048576, ...}, so that the
+// output of two builds can easily be compared.
+//
+// Usage: bench [seconds]
+// where seconds is the minimum duration of each benchmark (default 0.5).
+//
+
+#define CORPUS_SIZE (1 << 20)
+
+static double g_duration = 0.5;
+
+static uint32_t g_seed = 0x12345678;
+
+// xorshift32, so that the corpora are identical across runs and platforms
+static uint32_t _rand()
+{
+    g_seed ^= g_seed << 13;
+    g_seed ^= g_seed >> 17;
+    g_seed ^= g_seed << 5;
+    return g_seed;
+}
+
+static double _now()
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static void _report(const char *bench, const char *corpus, uint64_t insns,
+    uint64_t valid, double seconds)
+{
+    printf("{\"bench\": \"%s\", \"corpus\": \"%s\", \"insns\": %llu, "
+        "\"valid\": %llu, \"seconds\": %.6f, \"insns_per_sec\": %.0f}\n",
+        bench, corpus, (unsigned long long) insns,
+        (unsigned long long) valid, seconds, insns / seconds);
+    fflush(stdout);
+}
+
+// runs a benchmark over and over until it took at least g_duration seconds
+#define BENCH(bench, corpus, count, body) \
+    do { \
+        uint64_t insns = 0, valid = 0; \
+        double start = _now(), elapsed; \
+        do { \
+            for (uint32_t idx = 0; idx < (count); idx++) { \
+                body; \
+            } \
+            insns += (count); \
+        } while ((elapsed = _now() - start) < g_duration); \
+        _report(bench, corpus, insns, valid, elapsed); \
+    } while (0)
+
+//
+// ARMv7 corpora
+//
+
+// strided sweep over the entire 32bit space
+static void _armv7_sweep(uint32_t *out)
+{
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        out[idx] = idx * 4099;
+    }
+}
+
+static void _armv7_random(uint32_t *out)
+{
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        out[idx] = _rand();
+    }
+}
+
+// the kind of instructions which make up the bulk of compiled code, with
+// random registers and immediates
+static void _armv7_synthetic(uint32_t *out)
+{
+    static const uint32_t templates[][2] = {
+        // value, mask of the randomized bits
+        {0xe92d4000, 0x00000ff0}, // push {..., lr}
+        {0xe8bd8000, 0x00000ff0}, // pop {..., pc}
+        {0xe3a00000, 0x0000ffff}, // mov rX, #imm
+        {0xe1a00000, 0x0000f00f}, // mov rX, rY
+        {0xe59d0000, 0x0000ffff}, // ldr rX, [sp, #imm]
+        {0xe58d0000, 0x0000ffff}, // str rX, [sp, #imm]
+        {0xe5900000, 0x000fffff}, // ldr rX, [rY, #imm]
+        {0xe5800000, 0x000fffff}, // str rX, [rY, #imm]
+        {0xe0800000, 0x000ff00f}, // add rX, rY, rZ
+        {0xe2800000, 0x000fffff}, // add rX, rY, #imm
+        {0xe2400000, 0x000fffff}, // sub rX, rY, #imm
+        {0xe3500000, 0x000f0fff}, // cmp rX, #imm
+        {0x0a000000, 0xf0ffffff}, // b<cond> label
+        {0xeb000000, 0x00ffffff}, // bl label
+        {0xe12fff1e, 0x00000000}, // bx lr
+        {0xe0000090, 0x000fff0f}, // mul rX, rY, rZ
+    };
+
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        uint32_t t = _rand() % ARRAYSIZE(templates);
+        out[idx] = templates[t][0] | (_rand() & templates[t][1]);
+    }
+}
+
+//
+// Thumb corpora, each entry is the first halfword in the lower 16 bits and,
+// for Thumb2 instructions, the second halfword in the upper 16 bits
+//
+
+static void _thumb_sweep(uint32_t *out)
+{
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        out[idx] = idx & 0xffff;
+    }
+}
+
+// random thumb2 instructions, i.e., a first halfword starting with 0b11101,
+// 0b11110 or 0b11111 and a random second halfword
+static void _thumb2_random(uint32_t *out)
+{
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        uint32_t w = 0xe800 + _rand() % 0x1800;
+        out[idx] = (_rand() << 16) | w;
+    }
+}
+
+static void _thumb_synthetic(uint32_t *out)
+{
+    static const uint32_t templates[][2] = {
+        // value, mask of the randomized bits
+        {0x0000b500, 0x000000ff}, // push {..., lr}
+        {0x0000bd00, 0x000000ff}, // pop {..., pc}
+        {0x00002000, 0x000007ff}, // movs rX, #imm
+        {0x00004600, 0x000000ff}, // mov rX, rY
+        {0x00009800, 0x000007ff}, // ldr rX, [sp, #imm]
+        {0x00009000, 0x000007ff}, // str rX, [sp, #imm]
+        {0x00006800, 0x000007ff}, // ldr rX, [rY, #imm]
+        {0x00006000, 0x000007ff}, // str rX, [rY, #imm]
+        {0x00001800, 0x000001ff}, // adds rX, rY, rZ
+        {0x00003000, 0x000007ff}, // adds rX, #imm
+        {0x00002800, 0x000007ff}, // cmp rX, #imm
+        {0x0000d000, 0x00000dff}, // b<cond> label
+        {0x00004770, 0x00000000}, // bx lr
+        {0xf800f000, 0x07ff07ff}, // bl label
+        {0x0000f8d0, 0x0fff000f}, // ldr.w rX, [rY, #imm]
+        {0x0000f8c0, 0x0fff000f}, // str.w rX, [rY, #imm]
+    };
+
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        uint32_t t = _rand() % ARRAYSIZE(templates);
+        out[idx] = templates[t][0] | (_rand() & templates[t][1]);
+    }
+}
+
+static void _bench_armv7(const char *corpus, const uint32_t *words)
+{
+    darm_t d;
+    BENCH("armv7", corpus, CORPUS_SIZE,
+        valid += darm_armv7_disasm(&d, words[idx]) == 0);
+}
+
+static void _bench_thumb(const char *corpus, const uint32_t *words)
+{
+    darm_t d;
+    BENCH("thumb", corpus, CORPUS_SIZE,
+        valid += darm_thumb_disasm(&d, words[idx] & 0xffff) == 0);
+}
+
+static void _bench_thumb2(const char *corpus, const uint32_t *words)
+{
+    darm_t d;
+    BENCH("thumb2", corpus, CORPUS_SIZE,
+        valid += darm_thumb2_disasm(&d, words[idx] & 0xffff,
+            words[idx] >> 16) == 0);
+}
+
+static void _bench_disasm(const char *corpus, const uint32_t *words,
+    uint32_t thumb)
+{
+    darm_t d;
+    BENCH(thumb ? "disasm-thumb" : "disasm-armv7", corpus, CORPUS_SIZE,
+        valid += darm_disasm(&d, words[idx] & 0xffff, words[idx] >> 16,
+            thumb) != 0);
+}
+
+static void _bench_str2(const char *corpus, const uint32_t *words,
+    darm_t *decoded)
+{
+    darm_str_t str; uint32_t count = 0;
+
+    // only valid instructions can be formatted
+    for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+        if(darm_armv7_disasm(&decoded[count], words[idx]) == 0) {
+            count++;
+        }
+    }
+
+    BENCH("str2", corpus, count,
+        valid += darm_str2(&decoded[idx], &str, 1) == 0);
+}
+
+// decodes the corpus into columns with each of the instruction sets that are
+// supported by the cpu, compare with "disasm-armv7"
+static void _bench_columns(const char *corpus, const uint32_t *words,
+    darm_t *decoded)
+{
+    static const char *names[] = {
+        "columns-scalar", "columns-sse2", "columns-avx2",
+    };
+    darm_columns_t c;
+
+    // the columns live in the memory set aside for decoded instructions
+    c.instr = (uint16_t *) decoded;
+    c.imm = (uint32_t *) &c.instr[CORPUS_SIZE];
+    c.instr_type = (uint8_t *) &c.imm[CORPUS_SIZE];
+    c.cond = &c.instr_type[CORPUS_SIZE];
+    c.Rd = (int8_t *) &c.cond[CORPUS_SIZE];
+    c.Rn = &c.Rd[CORPUS_SIZE];
+    c.Rm = &c.Rn[CORPUS_SIZE];
+    c.shift_type = &c.Rm[CORPUS_SIZE];
+
+    for (uint32_t simd = SIMD_NONE; simd <= SIMD_AVX2; simd++) {
+        if(darm_columns_simd((darm_simd_t) simd) != simd) break;
+
+        uint64_t insns = 0, valid = 0;
+        double start = _now(), elapsed;
+        do {
+            darm_armv7_columns(&c, (const uint8_t *) words,
+                CORPUS_SIZE * sizeof(uint32_t));
+            insns += CORPUS_SIZE;
+        } while ((elapsed = _now() - start) < g_duration);
+
+        for (uint32_t idx = 0; idx < CORPUS_SIZE; idx++) {
+            valid += c.instr[idx] != I_INVLD;
+        }
+        _report(names[simd], corpus, insns, valid * (insns / CORPUS_SIZE),
+            elapsed);
+    }
+    darm_columns_simd(SIMD_AVX2);
+}
+
+static int _ldr_pc(const darm_t *d, uint32_t addr, void *user)
+{
+    (void) addr;
+    *(uint64_t *) user += d->Rt == PC;
+    return 0;
+}
+
+// looks for every "ldr pc, [..]" by scanning and filtering all of the
+// instructions, and by searching, which only decodes the candidates
+static void _bench_search(const char *corpus, const uint32_t *words)
+{
+    static const char *names[] = {"scan-ldr-pc", "search-ldr-pc"};
+    uint32_t instrs[DARM_BITSET(I_INSTRCNT)] = {0};
+    darm_pattern_t p;
+
+    instrs[I_LDR / 32] |= 1 << (I_LDR % 32);
+    darm_pattern_init(&p);
+    p.instr = I_LDR, p.Rt = PC;
+
+    for (uint32_t search = 0; search < 2; search++) {
+        uint64_t insns = 0, valid = 0;
+        double start = _now(), elapsed;
+        do {
+            if(search != 0) {
+                valid += darm_search((const uint8_t *) words,
+                    CORPUS_SIZE * sizeof(uint32_t), 0, M_ARMV7, &p, NULL,
+                    NULL);
+            }
+            else {
+                darm_scan((const uint8_t *) words,
+                    CORPUS_SIZE * sizeof(uint32_t), 0, M_ARMV7, &_ldr_pc,
+                    &valid, instrs, NULL);
+            }
+            insns += CORPUS_SIZE;
+        } while ((elapsed = _now() - start) < g_duration);
+
+        _report(names[search], corpus, insns, valid, elapsed);
+    }
+}
+
+// classifies the corpus as a raw image, valid counts the bytes of code
+static void _bench_classify(const char *corpus, const uint32_t *words)
+{
+    size_t count = CORPUS_SIZE * sizeof(uint32_t) / DARM_CLASSIFY_STEP + 1;
+    darm_segment_t *s = (darm_segment_t *) malloc(count * sizeof(*s));
+    uint64_t insns = 0, valid = 0;
+    double start = _now(), elapsed;
+
+    do {
+        size_t segments = darm_classify(s, count, (const uint8_t *) words,
+            CORPUS_SIZE * sizeof(uint32_t), 0, 512);
+        for (size_t idx = 0; idx < segments; idx++) {
+            valid += s[idx].region != REGION_DATA ? s[idx].size : 0;
+        }
+        insns += CORPUS_SIZE;
+    } while ((elapsed = _now() - start) < g_duration);
+
+    _report("classify", corpus, insns, valid / sizeof(uint32_t), elapsed);
+    free(s);
+}
+
+int main(int argc, char *argv[])
+{
+    if(argc > 1) {
+        g_duration = atof(argv[1]);
+    }
+
+    uint32_t *words = (uint32_t *) malloc(CORPUS_SIZE * sizeof(uint32_t));
+    darm_t *decoded = (darm_t *) malloc(CORPUS_SIZE * sizeof(darm_t));
+    if(words == NULL || decoded == NULL) {
+        fprintf(stderr, "[-] Error allocating memory!\n");
+        return 1;
+    }
+
+    static const struct {
+        const char *name;
+        void (*generate)(uint32_t *out);
+    } armv7[] = {
+        {"sweep", &_armv7_sweep},
+        {"random", &_armv7_random},
+        {"synthetic", &_armv7_synthetic},
+    }, thumb[] = {
+        {"sweep", &_thumb_sweep},
+        {"random", &_armv7_random},
+        {"synthetic", &_thumb_synthetic},
+    };
+
+    for (uint32_t idx = 0; idx < ARRAYSIZE(armv7); idx++) {
+        armv7[idx].generate(words);
+        _bench_armv7(armv7[idx].name, words);
+        _bench_disasm(armv7[idx].name, words, 0);
+        _bench_str2(armv7[idx].name, words, decoded);
+        _bench_columns(armv7[idx].name, words, decoded);
+        _bench_search(armv7[idx].name, words);
+        _bench_classify(armv7[idx].name, words);
+    }
+
+    for (uint32_t idx = 0; idx < ARRAYSIZE(thumb); idx++) {
+        thumb[idx].generate(words);
+        _bench_thumb(thumb[idx].name, words);
+        _bench_disasm(thumb[idx].name, words, 1);
+        _bench_classify(thumb[idx].name, words);
+    }
+
+    _thumb2_random(words);
+    _bench_thumb2("random-thumb2", words);
+    _bench_disasm("random-thumb2", words, 1);
+
+    free(words);
+    free(decoded);
+    return 0;
+}
@@ -0,0 +1,154 @@
+"""Overhead of the Python bindings, see also tests/bench.c.
+
+Each benchmark prints a single line of JSON, just like tests/bench.c does.
+
+Usage: python tests/bench.py [seconds]
+
+"""
+import os.path
+import random
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import darm
+
+_now = getattr(time, 'perf_counter', time.time)
+
+COUNT = 0x4000
+
+# the disasm_* functions are implemented by the _darm extension, if present
+BINDINGS = 'native' if darm._darm is not None else 'ctypes'
+
+
+def report(bench, insns, seconds):
+    sys.stdout.write('{"bench": "%s", "corpus": "random", "bindings": "%s", '
+                     '"insns": %d, "seconds": %.6f, "insns_per_sec": %.0f, '
+                     '"ns_per_insn": %.1f}\n' % (
+                         bench, BINDINGS, insns, seconds, insns / seconds,
+                         seconds * 1e9 / insns))
+    sys.stdout.flush()
+
+
+def bench(name, fn, insns, duration):
+    """Runs fn over and over until it took at least duration seconds."""
+    total, start = 0, _now()
+    while True:
+        fn()
+        total += insns
+        elapsed = _now() - start
+        if elapsed >= duration:
+            break
+    report(name, total, elapsed)
+
+
+def main(duration):
+    rand = random.Random(0x12345678)
+    words = [rand.randint(0, 2**32 - 1) for _ in range(COUNT)]
+    data = struct.pack('<%dI' % COUNT, *words)
+
+    # large enough to be split up by disasm_buffer_parallel()
+    big = data * 64
+
+    d = darm._Darm()
+    lib, ref = darm._lib, darm.byref(d)
+
+    def raw():
+        for w in words:
+            lib.darm_armv7_disasm(ref, w)
+
+    def eager():
+        for w in words:
+            darm.disasm_armv7(w)
+
+    def lazy():
+        for w in words:
+            darm.disasm_armv7(w, lazy=True)
+
+    def stringify():
+        for insn in insns:
+            str(insn)
+
+    def buffer_():
+        darm.disasm_buffer(data)
+
+    def buffer_large():
+        darm.disasm_buffer(big)
+
+    def buffer_parallel():
+        darm.disasm_buffer_parallel(big)
+
+    def listing():
+        darm.render_listing(data)
+
+    def listing_str():
+        for insn in darm.disasm_buffer(data):
+            str(insn)
+
+    def packed():
+        darm.disasm_packed(data)
+
+    def scan():
+        darm.scan(data, instrs=('BL',))
+
+    def scan_callback():
+        darm.scan(data, lambda addr, insn: None, instrs=('BL',))
+
+    def scan_python():
+        for insn in darm.disasm_buffer(data):
+            if insn is not None and insn.instr.name == 'BL':
+                pass
+
+    def buffer_iter():
+        for insn in darm.disasm_buffer(data):
+            pass
+
+    def iter_disasm():
+        for addr, size, insn in darm.iter_disasm(data):
+            pass
+
+    def array():
+        darm.disasm_array(data)
+
+    def columns():
+        darm.disasm_columns(data)
+
+    cache = darm.DecodeCache(COUNT)
+
+    def cached():
+        for w in words:
+            cache.disasm_armv7(w)
+
+    insns = [x for x in (darm.disasm_armv7(w) for w in words) if x]
+
+    bench('ctypes-armv7', raw, COUNT, duration)
+    bench('disasm_armv7', eager, COUNT, duration)
+    bench('disasm_armv7-lazy', lazy, COUNT, duration)
+    bench('str', stringify, len(insns), duration)
+    bench('disasm_buffer', buffer_, COUNT, duration)
+    bench('disasm_buffer-iter', buffer_iter, COUNT, duration)
+    bench('disasm_packed', packed, COUNT, duration)
+    bench('scan', scan, COUNT, duration)
+    bench('scan-callback', scan_callback, COUNT, duration)
+    bench('scan-python', scan_python, COUNT, duration)
+    bench('disasm_buffer-large', buffer_large, len(big) // 4, duration)
+    bench('disasm_buffer_parallel', buffer_parallel, len(big) // 4, duration)
+    bench('iter_disasm', iter_disasm, COUNT, duration)
+    bench('render_listing', listing, COUNT, duration)
+    bench('render_listing-str', listing_str, COUNT, duration)
+
+    try:
+        import numpy
+        bench('disasm_array', array, COUNT, duration)
+        bench('disasm_columns', columns, COUNT, duration)
+    except ImportError:
+        pass
+
+    # warm up the cache, after which every lookup is a hit
+    cached()
+    bench('DecodeCache-hit', cached, COUNT, duration)
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.5)
@@ -0,0 +1,523 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+#include <stdio.h>
+#include <stdint.h>
+#include "thumb-tbl.h"
+darm_enctype_t thumb_instr_types[] = {
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM,
+    T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_SHIFT_IMM, T_THUMB_3REG,
+    T_THUMB_3REG, T_THUMB_3REG, T_THUMB_3REG, T_THUMB_2REG_IMM,
+    T_THUMB_2REG_IMM, T_THUMB_2REG_IMM, T_THUMB_2REG_IMM, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_GPI,
+    T_THUMB_GPI, T_THUMB_GPI, T_THUMB_GPI, T_THUMB_MOD_SP_REG, T_THUMB_CMP,
+    T_THUMB_MOV4, T_THUMB_BRANCH_REG, T_THUMB_LDR_PC, T_THUMB_LDR_PC,
+    T_THUMB_LDR_PC, T_THUMB_LDR_PC, T_THUMB_LDR_PC, T_THUMB_LDR_PC,
+    T_THUMB_LDR_PC, T_THUMB_LDR_PC, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO,
+    T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO,
+    T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO,
+    T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMO,
+    T_THUMB_RW_MEMO, T_THUMB_RW_MEMO, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_RW_MEMI,
+    T_THUMB_RW_MEMI, T_THUMB_RW_MEMI, T_THUMB_STACK, T_THUMB_STACK,
+    T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK,
+    T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK,
+    T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK, T_THUMB_STACK,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8, T_THUMB_HAS_IMM8,
+    T_THUMB_ADD_SP_IMM, T_THUMB_ADD_SP_IMM, T_THUMB_ADD_SP_IMM,
+    T_THUMB_ADD_SP_IMM, T_THUMB_ADD_SP_IMM, T_THUMB_ADD_SP_IMM,
+    T_THUMB_ADD_SP_IMM, T_THUMB_ADD_SP_IMM, T_THUMB_MOD_SP_IMM, T_THUMB_CBZ,
+    T_THUMB_EXTEND, T_THUMB_CBZ, T_THUMB_PUSHPOP, T_THUMB_PUSHPOP,
+    T_THUMB_SETEND, T_INVLD, T_INVLD, T_THUMB_CBZ, T_THUMB_REV, T_THUMB_CBZ,
+    T_THUMB_PUSHPOP, T_THUMB_PUSHPOP, T_THUMB_ONLY_IMM8, T_THUMB_IT_HINTS,
+    T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG,
+    T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG,
+    T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG,
+    T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG, T_THUMB_RW_REG,
+    T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH,
+    T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH,
+    T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH,
+    T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH,
+    T_THUMB_COND_BRANCH, T_THUMB_COND_BRANCH, T_THUMB_ONLY_IMM8,
+    T_THUMB_ONLY_IMM8, T_THUMB_UNCOND_BRANCH, T_THUMB_UNCOND_BRANCH,
+    T_THUMB_UNCOND_BRANCH, T_THUMB_UNCOND_BRANCH, T_THUMB_UNCOND_BRANCH,
+    T_THUMB_UNCOND_BRANCH, T_THUMB_UNCOND_BRANCH, T_THUMB_UNCOND_BRANCH,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD,
+    T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD, T_INVLD
+};
+
+darm_instr_t thumb_instr_labels[] = {
+    I_LSL, I_LSL, I_LSL, I_LSL, I_LSL, I_LSL, I_LSL, I_LSL, I_LSR, I_LSR,
+    I_LSR, I_LSR, I_LSR, I_LSR, I_LSR, I_LSR, I_ASR, I_ASR, I_ASR, I_ASR,
+    I_ASR, I_ASR, I_ASR, I_ASR, I_ADD, I_ADD, I_SUB, I_SUB, I_ADD, I_ADD,
+    I_SUB, I_SUB, I_MOV, I_MOV, I_MOV, I_MOV, I_MOV, I_MOV, I_MOV, I_MOV,
+    I_CMP, I_CMP, I_CMP, I_CMP, I_CMP, I_CMP, I_CMP, I_CMP, I_ADD, I_ADD,
+    I_ADD, I_ADD, I_ADD, I_ADD, I_ADD, I_ADD, I_SUB, I_SUB, I_SUB, I_SUB,
+    I_SUB, I_SUB, I_SUB, I_SUB, I_LSR, I_SBC, I_TST, I_ORR, I_ADD, I_CMP,
+    I_MOV, I_BX, I_LDR, I_LDR, I_LDR, I_LDR, I_LDR, I_LDR, I_LDR, I_LDR,
+    I_STR, I_STR, I_STRH, I_STRH, I_STRB, I_STRB, I_LDRSB, I_LDRSB, I_LDR,
+    I_LDR, I_LDRH, I_LDRH, I_LDRB, I_LDRB, I_LDRSH, I_LDRSH, I_STR, I_STR,
+    I_STR, I_STR, I_STR, I_STR, I_STR, I_STR, I_LDR, I_LDR, I_LDR, I_LDR,
+    I_LDR, I_LDR, I_LDR, I_LDR, I_STRB, I_STRB, I_STRB, I_STRB, I_STRB,
+    I_STRB, I_STRB, I_STRB, I_LDRB, I_LDRB, I_LDRB, I_LDRB, I_LDRB, I_LDRB,
+    I_LDRB, I_LDRB, I_STRH, I_STRH, I_STRH, I_STRH, I_STRH, I_STRH, I_STRH,
+    I_STRH, I_LDRH, I_LDRH, I_LDRH, I_LDRH, I_LDRH, I_LDRH, I_LDRH, I_LDRH,
+    I_STR, I_STR, I_STR, I_STR, I_STR, I_STR, I_STR, I_STR, I_LDR, I_LDR,
+    I_LDR, I_LDR, I_LDR, I_LDR, I_LDR, I_LDR, I_ADR, I_ADR, I_ADR, I_ADR,
+    I_ADR, I_ADR, I_ADR, I_ADR, I_ADD, I_ADD, I_ADD, I_ADD, I_ADD, I_ADD,
+    I_ADD, I_ADD, I_SUB, I_CBZ, I_UXTH, I_CBZ, I_PUSH, I_PUSH, I_SETEND,
+    I_INVLD, I_INVLD, I_CBZ, I_REVSH, I_CBZ, I_POP, I_POP, I_BKPT, I_YIELD,
+    I_STM, I_STM, I_STM, I_STM, I_STM, I_STM, I_STM, I_STM, I_LDM, I_LDM,
+    I_LDM, I_LDM, I_LDM, I_LDM, I_LDM, I_LDM, I_B, I_B, I_B, I_B, I_B, I_B,
+    I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_B, I_UDF, I_SVC, I_B, I_B, I_B, I_B,
+    I_B, I_B, I_B, I_B, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD, I_INVLD,
+    I_INVLD, I_INVLD
+};
+
+darm_instr_t type_gpi_instr_lookup[] = {
+    I_AND, I_EOR, I_LSL, I_LSR, I_ASR, I_ADC, I_SBC, I_ROR, I_TST, I_RSB,
+    I_CMP, I_CMN, I_ORR, I_MUL, I_BIC, I_MVN
+};
+
+const darm_encoding_t thumb_encodings[349] = {
+    {0xfbe08000, 0xf1400000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADC
+    {0x0000ffc0, 0x00004140, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // ADC
+    {0xffe00000, 0xeb400000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ADC
+    {0x0000fe00, 0x00001c00, 2, {96, 99, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000f800, 0x00003000, 2, {104, 104, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0xfbe08000, 0xf1000000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000fe00, 0x00001800, 2, {96, 99, 102, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0xffe00000, 0xeb000000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000f800, 0x0000a800, 2, {104, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000ff80, 0x0000b000, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0xfbef8000, 0xf10d0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000ff87, 0x00004485, 2, {0, 0, 131, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0xffef0000, 0xeb0d0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000ff00, 0x00004400, 2, {96, 96, 131, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0x0000ff78, 0x00004468, 2, {96, 0, 96, 0, 0, 0, 0, 0, 0, 0}}, // ADD
+    {0xfbf08000, 0xf2000000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADDW
+    {0xfbff8000, 0xf20d0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADDW
+    {0x0000f800, 0x0000a000, 2, {104, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADR
+    {0xfbff8000, 0xf2af0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADR
+    {0xfbff8000, 0xf20f0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ADR
+    {0xfbe08000, 0xf0000000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // AND
+    {0x0000ffc0, 0x00004000, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // AND
+    {0xffe00000, 0xea000000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // AND
+    {0x0000f800, 0x00001000, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // ASR
+    {0xffef0030, 0xea4f0020, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // ASR
+    {0x0000ffc0, 0x00004100, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // ASR
+    {0xffe0f0f0, 0xfa40f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ASR
+    {0x0000f000, 0x0000d000, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 136}}, // B
+    {0x0000f800, 0x0000e000, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // B
+    {0xf800d000, 0xf0008000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 150}}, // B
+    {0xf800d000, 0xf0009000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // B
+    {0xfbff8000, 0xf36f0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // BFC
+    {0xfbf08000, 0xf3600000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // BFI
+    {0xfbe08000, 0xf0200000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // BIC
+    {0x0000ffc0, 0x00004380, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // BIC
+    {0xffe00000, 0xea200000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // BIC
+    {0x0000ff00, 0x0000be00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // BKPT
+    {0xf800d000, 0xf000d000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // BL
+    {0xf800d000, 0xf000c000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // BLX
+    {0x0000ff80, 0x00004780, 2, {0, 0, 131, 0, 0, 0, 0, 0, 0, 0}}, // BLX
+    {0x0000ff80, 0x00004700, 2, {0, 0, 131, 0, 0, 0, 0, 0, 0, 0}}, // BX
+    {0xfff0d000, 0xf3c08000, 4, {0, 0, 144, 0, 0, 0, 0, 0, 0, 0}}, // BXJ
+    {0x0000f500, 0x0000b100, 2, {0, 96, 0, 0, 0, 0, 0, 0, 0, 0}}, // CBNZ
+    {0x0000f500, 0x0000b100, 2, {0, 96, 0, 0, 0, 0, 0, 0, 0, 0}}, // CBZ
+    {0xfff0d0f0, 0xf3b08020, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // CLREX
+    {0xfff0f0f0, 0xfab0f080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // CLZ
+    {0xfbf08f00, 0xf1100f00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // CMN
+    {0x0000ffc0, 0x000042c0, 2, {0, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // CMN
+    {0xfff00f00, 0xeb100f00, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // CMN
+    {0x0000f800, 0x00002800, 2, {0, 104, 0, 0, 0, 0, 0, 0, 0, 0}}, // CMP
+    {0xfbf08f00, 0xf1b00f00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // CMP
+    {0x0000ffc0, 0x00004280, 2, {0, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // CMP
+    {0x0000ff00, 0x00004500, 2, {0, 96, 131, 0, 0, 0, 0, 0, 0, 0}}, // CMP
+    {0xfff00f00, 0xebb00f00, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // CMP
+    {0xfff0d000, 0xf3a08000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // CPS
+    {0xfff0d7f0, 0xf3a080f0, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // DBG
+    {0xfff0d0f0, 0xf3b08050, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // DMB
+    {0xfff0d0f0, 0xf3b08040, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // DSB
+    {0xfff0d0f0, 0xf3b08010, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ENTERX
+    {0xfbe08000, 0xf0800000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // EOR
+    {0x0000ffc0, 0x00004040, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // EOR
+    {0xffe00000, 0xea800000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // EOR
+    {0xfff0d0f0, 0xf3b08060, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // ISB
+    {0x0000ff00, 0x0000bf00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // IT
+    {0x0000f800, 0x0000c800, 2, {0, 104, 0, 0, 0, 0, 0, 0, 0, 0}}, // LDM
+    {0xffd00000, 0xe8900000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // LDM
+    {0xffd00000, 0xe9100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // LDMDB
+    {0x0000f800, 0x00006800, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // LDR
+    {0x0000f800, 0x00009800, 2, {0, 0, 0, 0, 104, 0, 0, 0, 0, 0}}, // LDR
+    {0xfff00000, 0xf8d00000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDR
+    {0xfff00c00, 0xf8500c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDR
+    {0xfff00d00, 0xf8500900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDR
+    {0x0000f800, 0x00004800, 2, {0, 0, 0, 0, 104, 0, 0, 0, 0, 0}}, // LDR
+    {0xff7f0000, 0xf85f0000, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDR
+    {0x0000fe00, 0x00005800, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // LDR
+    {0xfff00fc0, 0xf8500000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // LDR
+    {0x0000f800, 0x00007800, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // LDRB
+    {0xfff00000, 0xf8900000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRB
+    {0xfff00c00, 0xf8100c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRB
+    {0xfff00d00, 0xf8100900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRB
+    {0xff7f0000, 0xf81f0000, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRB
+    {0x0000fe00, 0x00005c00, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // LDRB
+    {0xfff00fc0, 0xf8100000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // LDRB
+    {0xfff00f00, 0xf8100e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRBT
+    {0xff500000, 0xe9500000, 4, {0, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // LDRD
+    {0xff700000, 0xe8700000, 4, {0, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // LDRD
+    {0xff5f0000, 0xe95f0000, 4, {0, 0, 0, 0, 140, 136, 0, 0, 0, 0}}, // LDRD
+    {0xff7f0000, 0xe87f0000, 4, {0, 0, 0, 0, 140, 136, 0, 0, 0, 0}}, // LDRD
+    {0xfff00000, 0xe8500000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDREX
+    {0xfff000f0, 0xe8d00040, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDREXB
+    {0xfff000f0, 0xe8d00070, 4, {0, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // LDREXD
+    {0xfff000f0, 0xe8d00050, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDREXH
+    {0x0000f800, 0x00008800, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // LDRH
+    {0xfff00000, 0xf8b00000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRH
+    {0xfff00c00, 0xf8300c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRH
+    {0xfff00d00, 0xf8300900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRH
+    {0xff7f0000, 0xf83f0000, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRH
+    {0x0000fe00, 0x00005a00, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // LDRH
+    {0xfff00fc0, 0xf8300000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // LDRH
+    {0xfff00f00, 0xf8300e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRHT
+    {0xfff00000, 0xf9900000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSB
+    {0xfff00c00, 0xf9100c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSB
+    {0xfff00d00, 0xf9100900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSB
+    {0xff7f0000, 0xf91f0000, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSB
+    {0x0000fe00, 0x00005600, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // LDRSB
+    {0xfff00fc0, 0xf9100000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // LDRSB
+    {0xfff00f00, 0xf9100e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSBT
+    {0xfff00000, 0xf9b00000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSH
+    {0xfff00c00, 0xf9300c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSH
+    {0xfff00d00, 0xf9300900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSH
+    {0xff7f0000, 0xf93f0000, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSH
+    {0x0000fe00, 0x00005e00, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // LDRSH
+    {0xfff00fc0, 0xf9300000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // LDRSH
+    {0xfff00f00, 0xf9300e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRSHT
+    {0xfff00f00, 0xf8500e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // LDRT
+    {0xfff0d0f0, 0xf3b08000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // LEAVEX
+    {0x0000f800, 0x00000000, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // LSL
+    {0xffef0030, 0xea4f0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // LSL
+    {0x0000ffc0, 0x00004080, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // LSL
+    {0xffe0f0f0, 0xfa00f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // LSL
+    {0x0000f800, 0x00000800, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // LSR
+    {0xffef0030, 0xea4f0010, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // LSR
+    {0x0000ffc0, 0x000040c0, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // LSR
+    {0xffe0f0f0, 0xfa20f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // LSR
+    {0xfff000f0, 0xfb000000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // MLA
+    {0xfff000f0, 0xfb000010, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // MLS
+    {0x0000f800, 0x00000000, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0xffef0030, 0xea4f0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0x0000ffc0, 0x00004080, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0xffe0f0f0, 0xfa00f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0x0000f800, 0x00002000, 2, {104, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0xfbef8000, 0xf04f0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0x0000ff00, 0x00004600, 2, {96, 0, 131, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0xffef70f0, 0xea4f0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // MOV
+    {0xfbf08000, 0xf2c00000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MOVT
+    {0xfbf08000, 0xf2400000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MOVW
+    {0xffe0d020, 0xf3e08000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MRS
+    {0xffe0d020, 0xf3808000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // MSR
+    {0x0000ffc0, 0x00004340, 2, {96, 99, 96, 0, 0, 0, 0, 0, 0, 0}}, // MUL
+    {0xfff0f0f0, 0xfb00f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // MUL
+    {0xfbef8000, 0xf06f0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // MVN
+    {0x0000ffc0, 0x000043c0, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // MVN
+    {0xffef0000, 0xea6f0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // MVN
+    {0x0000ff7f, 0x0000bf00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xfff0d77f, 0xf3a08000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xfff0f000, 0xf9b0f000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xfff0ff00, 0xf930fc00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xff7ff000, 0xf93ff000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xfff0ff40, 0xf930f000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // NOP
+    {0xfbe08000, 0xf0600000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // ORN
+    {0xffe00000, 0xea600000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ORN
+    {0xfbe08000, 0xf0400000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // ORR
+    {0x0000ffc0, 0x00004300, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // ORR
+    {0xffe00000, 0xea400000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ORR
+    {0xfff00010, 0xeac00000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PKH
+    {0xfff0f000, 0xf890f000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0f000, 0xf8b0f000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0ff00, 0xf810fc00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0ff00, 0xf830fc00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xff7ff000, 0xf81ff000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xff7ff000, 0xf83ff000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0ffc0, 0xf810f000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0ffc0, 0xf830f000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLD
+    {0xfff0f000, 0xf990f000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0xfff0ff00, 0xf910fc00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0xff7ff000, 0xf91ff000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0xfff0ffc0, 0xf910f000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // PLI
+    {0x0000fe00, 0x0000bc00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // POP
+    {0xffff0000, 0xe8bd0000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // POP
+    {0xffff0fff, 0xf85d0b04, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // POP
+    {0x0000fe00, 0x0000b400, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // PUSH
+    {0xffff0000, 0xe92d0000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // PUSH
+    {0xffff0fff, 0xf84d0d04, 4, {0, 0, 0, 0, 140, 0, 0, 0, 0, 0}}, // PUSH
+    {0xfff0f0f0, 0xfa80f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QADD
+    {0xfff0f0f0, 0xfa90f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QADD16
+    {0xfff0f0f0, 0xfa80f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QADD8
+    {0xfff0f0f0, 0xfaa0f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QASX
+    {0xfff0f0f0, 0xfa80f090, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QDADD
+    {0xfff0f0f0, 0xfa80f0b0, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QDSUB
+    {0xfff0f0f0, 0xfae0f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QSAX
+    {0xfff0f0f0, 0xfa80f0a0, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QSUB
+    {0xfff0f0f0, 0xfad0f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QSUB16
+    {0xfff0f0f0, 0xfac0f010, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // QSUB8
+    {0xfff0f0f0, 0xfa90f0a0, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // RBIT
+    {0x0000ffc0, 0x0000ba00, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // REV
+    {0xfff0f0f0, 0xfa90f080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // REV
+    {0x0000ffc0, 0x0000ba40, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // REV16
+    {0xfff0f0f0, 0xfa90f090, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // REV16
+    {0x0000ffc0, 0x0000bac0, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // REVSH
+    {0xfff0f0f0, 0xfa90f0b0, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // REVSH
+    {0xffd00000, 0xe8100000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // RFE
+    {0xffd00000, 0xe9900000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // RFE
+    {0xffef0030, 0xea4f0030, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // ROR
+    {0x0000ffc0, 0x000041c0, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // ROR
+    {0xffe0f0f0, 0xfa60f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // ROR
+    {0xffef70f0, 0xea4f0030, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // RRX
+    {0x0000ffc0, 0x00004240, 2, {96, 99, 0, 0, 0, 0, 0, 0, 0, 0}}, // RSB
+    {0xfbe08000, 0xf1c00000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // RSB
+    {0xffe00000, 0xebc00000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // RSB
+    {0xfff0f0f0, 0xfa90f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SADD16
+    {0xfff0f0f0, 0xfa80f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SADD8
+    {0xfff0f0f0, 0xfaa0f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SASX
+    {0xfbe08000, 0xf1600000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SBC
+    {0x0000ffc0, 0x00004180, 2, {96, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // SBC
+    {0xffe00000, 0xeb600000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SBC
+    {0xfbf08000, 0xf3400000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SBFX
+    {0xfff000f0, 0xfb9000f0, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SDIV
+    {0xfff0f0f0, 0xfaa0f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SEL
+    {0x0000ffe0, 0x0000b640, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SETEND
+    {0x0000ff7f, 0x0000bf40, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SEV
+    {0xfff0d77f, 0xf3a08004, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SEV
+    {0xfff0f0f0, 0xfa90f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHADD16
+    {0xfff0f0f0, 0xfa80f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHADD8
+    {0xfff0f0f0, 0xfaa0f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHASX
+    {0xfff0f0f0, 0xfae0f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHSAX
+    {0xfff0f0f0, 0xfad0f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHSUB16
+    {0xfff0f0f0, 0xfac0f020, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SHSUB8
+    {0xfff000c0, 0xfb100000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLABB
+    {0xfff000c0, 0xfb100000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLABT
+    {0xfff000e0, 0xfb200000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLAD
+    {0xfff000f0, 0xfbc00000, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLAL
+    {0xfff000c0, 0xfbc00080, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLALBB
+    {0xfff000c0, 0xfbc00080, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLALBT
+    {0xfff000e0, 0xfbc000c0, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLALD
+    {0xfff000c0, 0xfbc00080, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLALTB
+    {0xfff000c0, 0xfbc00080, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLALTT
+    {0xfff000c0, 0xfb100000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLATB
+    {0xfff000c0, 0xfb100000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLATT
+    {0xfff000e0, 0xfb300000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLAW
+    {0xfff000e0, 0xfb400000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMLSD
+    {0xfff000e0, 0xfbd000c0, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMLSLD
+    {0xfff000e0, 0xfb500000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMMLA
+    {0xfff000e0, 0xfb600000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // SMMLS
+    {0xfff0f0e0, 0xfb50f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMMUL
+    {0xfff0f0e0, 0xfb20f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMUAD
+    {0xfff0f0c0, 0xfb10f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMULBB
+    {0xfff0f0c0, 0xfb10f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMULBT
+    {0xfff000f0, 0xfb800000, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // SMULL
+    {0xfff0f0c0, 0xfb10f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMULTB
+    {0xfff0f0c0, 0xfb10f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMULTT
+    {0xfff0f0e0, 0xfb30f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMULW
+    {0xfff0f0e0, 0xfb40f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SMUSD
+    {0xffd00000, 0xe8000000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SRS
+    {0xffd00000, 0xe9800000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SRS
+    {0xfbd08000, 0xf3000000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SSAT
+    {0xfbf0f0c0, 0xf3200000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SSAT16
+    {0xfff0f0f0, 0xfae0f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SSAX
+    {0xfff0f0f0, 0xfad0f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SSUB16
+    {0xfff0f0f0, 0xfac0f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SSUB8
+    {0x0000f800, 0x0000c000, 2, {0, 104, 0, 0, 0, 0, 0, 0, 0, 0}}, // STM
+    {0xffd00000, 0xe8800000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // STM
+    {0xffd00000, 0xe9000000, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // STMDB
+    {0x0000f800, 0x00006000, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // STR
+    {0x0000f800, 0x00009000, 2, {0, 0, 0, 0, 104, 0, 0, 0, 0, 0}}, // STR
+    {0xfff00000, 0xf8c00000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STR
+    {0xfff00c00, 0xf8400c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STR
+    {0xfff00d00, 0xf8400900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STR
+    {0x0000fe00, 0x00005000, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // STR
+    {0xfff00fc0, 0xf8400000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // STR
+    {0x0000f800, 0x00007000, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // STRB
+    {0xfff00000, 0xf8800000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRB
+    {0xfff00c00, 0xf8000c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRB
+    {0xfff00d00, 0xf8000900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRB
+    {0x0000fe00, 0x00005400, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // STRB
+    {0xfff00fc0, 0xf8000000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // STRB
+    {0xfff00f00, 0xf8000e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRBT
+    {0xff500000, 0xe9400000, 4, {0, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // STRD
+    {0xff700000, 0xe8600000, 4, {0, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // STRD
+    {0xfff00000, 0xe8400000, 4, {136, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STREX
+    {0xfff000f0, 0xe8c00040, 4, {128, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STREXB
+    {0xfff000f0, 0xe8c00070, 4, {128, 144, 0, 0, 140, 136, 0, 0, 0, 0}}, // STREXD
+    {0xfff000f0, 0xe8c00050, 4, {128, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STREXH
+    {0x0000f800, 0x00008000, 2, {0, 99, 0, 0, 96, 0, 0, 0, 0, 0}}, // STRH
+    {0xfff00000, 0xf8a00000, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRH
+    {0xfff00c00, 0xf8200c00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRH
+    {0xfff00d00, 0xf8200900, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRH
+    {0x0000fe00, 0x00005200, 2, {0, 99, 102, 0, 96, 0, 0, 0, 0, 0}}, // STRH
+    {0xfff00fc0, 0xf8200000, 4, {0, 144, 128, 0, 140, 0, 0, 0, 0, 0}}, // STRH
+    {0xfff00f00, 0xf8200e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRHT
+    {0xfff00f00, 0xf8400e00, 4, {0, 144, 0, 0, 140, 0, 0, 0, 0, 0}}, // STRT
+    {0x0000fe00, 0x00001e00, 2, {96, 99, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0x0000f800, 0x00003800, 2, {104, 104, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0xfbe08000, 0xf1a00000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0x0000fe00, 0x00001a00, 2, {96, 99, 102, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0xffe00000, 0xeba00000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0x0000ff80, 0x0000b080, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0xfbef8000, 0xf1ad0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0xffef0000, 0xebad0000, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // SUB
+    {0xfbf08000, 0xf2a00000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUBW
+    {0xfbff8000, 0xf2ad0000, 4, {136, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SUBW
+    {0x0000ff00, 0x0000df00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // SVC
+    {0xfff0f080, 0xfa40f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTAB
+    {0xfff0f080, 0xfa20f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTAB16
+    {0xfff0f080, 0xfa00f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTAH
+    {0x0000ffc0, 0x0000b240, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // SXTB
+    {0xfffff080, 0xfa4ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTB
+    {0xfffff080, 0xfa2ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTB16
+    {0x0000ffc0, 0x0000b200, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // SXTH
+    {0xfffff080, 0xfa0ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // SXTH
+    {0xfff000f0, 0xe8d00000, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // TBB
+    {0xfff000f0, 0xe8d00010, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // TBH
+    {0xfbf08f00, 0xf0900f00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // TEQ
+    {0xfff00f00, 0xea900f00, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // TEQ
+    {0xfbf08f00, 0xf0100f00, 4, {0, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // TST
+    {0x0000ffc0, 0x00004200, 2, {0, 96, 99, 0, 0, 0, 0, 0, 0, 0}}, // TST
+    {0xfff00f00, 0xea100f00, 4, {0, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // TST
+    {0xfff0f0f0, 0xfa90f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UADD16
+    {0xfff0f0f0, 0xfa80f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UADD8
+    {0xfff0f0f0, 0xfaa0f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UASX
+    {0xfbf08000, 0xf3c00000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // UBFX
+    {0x0000ff00, 0x0000de00, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // UDF
+    {0xfff0f000, 0xf7f0a000, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // UDF
+    {0xfff000f0, 0xfbb000f0, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UDIV
+    {0xfff0f0f0, 0xfa90f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHADD16
+    {0xfff0f0f0, 0xfa80f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHADD8
+    {0xfff0f0f0, 0xfaa0f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHASX
+    {0xfff0f0f0, 0xfae0f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHSAX
+    {0xfff0f0f0, 0xfad0f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHSUB16
+    {0xfff0f0f0, 0xfac0f060, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UHSUB8
+    {0xfff000f0, 0xfbe00060, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // UMAAL
+    {0xfff000f0, 0xfbe00000, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // UMLAL
+    {0xfff000f0, 0xfba00000, 4, {0, 144, 128, 0, 0, 0, 136, 140, 0, 0}}, // UMULL
+    {0xfff0f0f0, 0xfa90f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQADD16
+    {0xfff0f0f0, 0xfa80f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQADD8
+    {0xfff0f0f0, 0xfaa0f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQASX
+    {0xfff0f0f0, 0xfae0f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQSAX
+    {0xfff0f0f0, 0xfad0f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQSUB16
+    {0xfff0f0f0, 0xfac0f050, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UQSUB8
+    {0xfff0f0f0, 0xfb70f000, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // USAD8
+    {0xfff000f0, 0xfb700000, 4, {136, 144, 128, 140, 0, 0, 0, 0, 0, 0}}, // USADA8
+    {0xfbd08000, 0xf3800000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // USAT
+    {0xfbf0f0c0, 0xf3a00000, 4, {136, 144, 0, 0, 0, 0, 0, 0, 0, 0}}, // USAT16
+    {0xfff0f0f0, 0xfae0f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // USAX
+    {0xfff0f0f0, 0xfad0f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // USUB16
+    {0xfff0f0f0, 0xfac0f040, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // USUB8
+    {0xfff0f080, 0xfa50f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTAB
+    {0xfff0f080, 0xfa30f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTAB16
+    {0xfff0f080, 0xfa10f080, 4, {136, 144, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTAH
+    {0x0000ffc0, 0x0000b2c0, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // UXTB
+    {0xfffff080, 0xfa5ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTB
+    {0xfffff080, 0xfa3ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTB16
+    {0x0000ffc0, 0x0000b280, 2, {96, 0, 99, 0, 0, 0, 0, 0, 0, 0}}, // UXTH
+    {0xfffff080, 0xfa1ff080, 4, {136, 0, 128, 0, 0, 0, 0, 0, 0, 0}}, // UXTH
+    {0x0000ff7f, 0x0000bf20, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // WFE
+    {0xfff0d77f, 0xf3a08002, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // WFE
+    {0x0000ff7f, 0x0000bf30, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // WFI
+    {0xfff0d77f, 0xf3a08003, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // WFI
+    {0x0000ff7f, 0x0000bf10, 2, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // YIELD
+    {0xfff0d77f, 0xf3a08001, 4, {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}}, // YIELD
+};
+
+const uint16_t thumb_encodings_index[] = {
+    0, 0, 3, 15, 17, 20, 23, 27, 31, 32, 33, 36, 37, 38, 40, 41, 42, 43, 44,
+    44, 44, 44, 45, 46, 49, 54, 55, 55, 56, 57, 58, 59, 62, 62, 62, 62, 62,
+    63, 64, 64, 64, 66, 66, 67, 67, 76, 83, 84, 88, 89, 90, 91, 92, 99, 100,
+    106, 107, 113, 114, 115, 116, 120, 124, 124, 124, 124, 124, 125, 126, 134,
+    135, 136, 136, 136, 136, 136, 137, 138, 140, 143, 143, 149, 151, 154, 155,
+    163, 163, 167, 170, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183,
+    184, 186, 188, 190, 192, 195, 196, 199, 199, 200, 201, 202, 205, 206, 207,
+    208, 209, 211, 212, 213, 214, 215, 216, 217, 217, 217, 218, 219, 220, 221,
+    222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 235,
+    236, 237, 238, 239, 240, 241, 242, 244, 245, 246, 247, 248, 249, 249, 249,
+    251, 251, 252, 252, 259, 265, 266, 268, 269, 270, 271, 272, 278, 279, 280,
+    288, 290, 291, 291, 291, 292, 293, 294, 296, 297, 299, 300, 301, 303, 306,
+    307, 308, 309, 310, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322,
+    323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337,
+    338, 340, 341, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343,
+    343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 343, 345, 347, 349
+};
+
+darm_instr_t type_hints_instr_lookup[] = {
+    I_NOP, I_YIELD, I_WFE, I_WFI, I_SEV
+};
+
+darm_instr_t type_extend_instr_lookup[] = {
+    I_SXTH, I_SXTB, I_UXTH, I_UXTB
+};
+
+darm_instr_t type_rev_instr_lookup[] = {
+    I_REV, I_REV16, I_INVLD, I_REVSH
+};
+
@@ -33,6 +33,19 @@ POSSIBILITY OF SUCH DAMAGE.
 #include "darm.h"
 #include "darm-internal.h"
 #include "thumb-tbl.h"
+#include "thumb.h"
+
+#ifdef DARM_THUMB_LUT
+
+// every Thumb instruction has been decoded beforehand by utils/thumblut.c
+#include "thumb-lut-tbl.h"
+
+int darm_thumb_disasm(darm_t *d, uint16_t w)
+{
+    return thumb_lut_unpack(d, &thumb_lut[w], &thumb_lut_base.d, w);
+}
+
+#else
 
 #define BITMSK_8 ((1 << 8) - 1)
 
@@ -343,3 +356,5 @@ int darm_thumb_disasm(darm_t *d, uint16_t w)
         return thumb_disasm(d, w);
     }
 }
+
+#endif
@@ -0,0 +1,83 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#ifndef __THUMB_H__
+#define __THUMB_H__
+
+//
+// Compact representation of a decoded Thumb instruction, as used by the
+// precomputed table of all 65536 Thumb instructions (see utils/thumblut.c).
+//
+// All members of darm_t which are not represented here are left untouched
+// by the Thumb decoder, i.e., they keep the value assigned by darm_init.
+// The table is accompanied by such an initialized darm_t, thumb_lut_base.
+//
+typedef struct _darm_thumb_lut_t {
+    uint16_t        instr;
+    uint16_t        reglist;
+    int16_t         imm;
+    uint8_t         instr_type;
+
+    // return value of darm_thumb_disasm
+    int8_t          ret;
+
+    int8_t          cond;
+    int8_t          firstcond;
+    int8_t          Rd, Rn, Rm, Rt;
+    int8_t          shift_type;
+    uint8_t         shift;
+    uint8_t         mask;
+    uint8_t         E, U, P, W, I;
+} darm_thumb_lut_t;
+
+// base is a darm_t as initialized by darm_init, copying it is quite a bit
+// faster than calling darm_init
+static inline int thumb_lut_unpack(darm_t *d, const darm_thumb_lut_t *e,
+    const darm_t *base, uint16_t w)
+{
+    *d = *base;
+    d->w = w;
+    d->instr = (darm_instr_t) e->instr;
+    d->instr_type = (darm_enctype_t) e->instr_type;
+    d->cond = (darm_cond_t) e->cond;
+    d->E = e->E, d->U = e->U, d->P = e->P, d->W = e->W, d->I = e->I;
+    d->Rd = (darm_reg_t) e->Rd;
+    d->Rn = (darm_reg_t) e->Rn;
+    d->Rm = (darm_reg_t) e->Rm;
+    d->Rt = (darm_reg_t) e->Rt;
+    d->imm = (uint32_t)(int32_t) e->imm;
+    d->shift_type = (darm_shift_type_t) e->shift_type;
+    d->shift = e->shift;
+    d->reglist = e->reglist;
+    d->firstcond = (darm_cond_t) e->firstcond;
+    d->mask = e->mask;
+    return e->ret;
+}
+
+#endif
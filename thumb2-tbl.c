@@ -0,0 +1,3600 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+#include <stdio.h>
+#include <stdint.h>
+#include "thumb2-tbl.h"
+#include "darm.h"
+
+static const struct {
+    darm_instr_t instr;
+    darm_enctype_t instr_type;
+    darm_enctype_t instr_imm_type;
+    darm_enctype_t instr_flag_type;
+} thumb2_decodings[] = {
+    {I_ADC, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_ADC, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_ADD, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_ADD, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_ADDW, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_ADR, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_AND, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_AND, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_ASR, T_THUMB2_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_FLAG},
+    {I_ASR, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_B, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_BFC, T_THUMB2_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_BFI, T_THUMB2_RN_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_BIC, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_BIC, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_BL, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_BLX, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_BXJ, T_THUMB2_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_CLREX, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_CLZ, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_CMN, T_THUMB2_RN_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_CMN, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_TYPE_FLAG},
+    {I_CMP, T_THUMB2_RN_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_CMP, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_TYPE_FLAG},
+    {I_CPS, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_DBG, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_DMB, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_DSB, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_ENTERX, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_EOR, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_EOR, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_ISB, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_LDM, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_WP_REGLIST_FLAG},
+    {I_LDMDB, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_WP_REGLIST_FLAG},
+    {I_LDR, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_LDR, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_LDR, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_LDR, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRB, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_LDRB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_LDRB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRB, T_THUMB2_RT_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_LDRBT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LDRD, T_THUMB2_RN_RT_RT2_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRD, T_THUMB2_RT_RT2_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDREX, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LDREXB, T_THUMB2_RN_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_LDREXD, T_THUMB2_RN_RT_RT2_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_LDREXH, T_THUMB2_RN_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_LDRH, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_LDRH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_LDRH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRH, T_THUMB2_RT_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_LDRHT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LDRSB, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_LDRSB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_LDRSB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRSB, T_THUMB2_RT_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_LDRSBT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LDRSH, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_LDRSH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_LDRSH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_LDRSH, T_THUMB2_RT_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_LDRSHT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LDRT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_LEAVEX, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_LSL, T_THUMB2_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_FLAG},
+    {I_LSL, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_LSR, T_THUMB2_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_FLAG},
+    {I_LSR, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_MLA, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_MLS, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_MOV, T_THUMB2_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_MOV, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_MOVT, T_THUMB2_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_MOVW, T_THUMB2_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_MRS, T_THUMB2_RD_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_MSR, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_MUL, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_MVN, T_THUMB2_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_MVN, T_THUMB2_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_NOP, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_ORN, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_ORN, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_ORR, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_ORR, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_PKH, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_PLD, T_THUMB2_NO_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_PLD, T_THUMB2_RN_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_PLD, T_THUMB2_RN_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_PLD, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_PLI, T_THUMB2_NO_REG, T_THUMB2_IMM12, T_THUMB2_U_FLAG},
+    {I_PLI, T_THUMB2_RN_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_PLI, T_THUMB2_RN_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_PLI, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_POP, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_REGLIST_FLAG},
+    {I_POP, T_THUMB2_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_PUSH, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_REGLIST_FLAG},
+    {I_PUSH, T_THUMB2_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QADD, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QDADD, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QDSUB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QSAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QSUB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QSUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_QSUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_RBIT, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_REV, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_REV16, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_REVSH, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_RFE, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_ROR, T_THUMB2_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_FLAG},
+    {I_ROR, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_RRX, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_S_FLAG},
+    {I_RSB, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_RSB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_SADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SBC, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_SBC, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_SBFX, T_THUMB2_RN_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_SDIV, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SEL, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SEV, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHSAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHSUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SHSUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLABB, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLABT, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLAD, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLAL, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLALBB, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLALBT, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLALD, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLALTB, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLALTT, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLATB, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLATT, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLAW, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLSD, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMLSLD, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMMLA, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMMLS, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMMUL, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMUAD, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULBB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULBT, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULL, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULTB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULTT, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMULW, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SMUSD, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SRS, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SSAT, T_THUMB2_RN_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_SSAT16, T_THUMB2_RN_RD_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SSAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SSUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_SSUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_STM, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_REGLIST_FLAG},
+    {I_STMDB, T_THUMB2_RN_REG, T_THUMB2_NO_IMM, T_THUMB2_REGLIST_FLAG},
+    {I_STR, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_STR, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_STR, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_STRB, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_STRB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_STRB, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_STRBT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_STRD, T_THUMB2_RN_RT_RT2_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_STREX, T_THUMB2_RN_RD_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_STREXB, T_THUMB2_RN_RD_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_STREXD, T_THUMB2_RN_RD_RT_RT2_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_STREXH, T_THUMB2_RN_RD_RT_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_STRH, T_THUMB2_RN_RM_RT_REG, T_THUMB2_IMM2, T_THUMB2_NO_FLAG},
+    {I_STRH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM12, T_THUMB2_NO_FLAG},
+    {I_STRH, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_WUP_FLAG},
+    {I_STRHT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_STRT, T_THUMB2_RN_RT_REG, T_THUMB2_IMM8, T_THUMB2_NO_FLAG},
+    {I_SUB, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_S_FLAG},
+    {I_SUB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_S_TYPE_FLAG},
+    {I_SUBW, T_THUMB2_RN_RD_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_SXTAB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_SXTAB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_SXTAH, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_SXTB, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_SXTB16, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_SXTH, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_TBB, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_TBH, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_TEQ, T_THUMB2_RN_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_TEQ, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_TYPE_FLAG},
+    {I_TST, T_THUMB2_RN_REG, T_THUMB2_IMM1_IMM3_IMM8, T_THUMB2_NO_FLAG},
+    {I_TST, T_THUMB2_RN_RM_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_TYPE_FLAG},
+    {I_UADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UBFX, T_THUMB2_RN_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_UDF, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UDIV, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHSAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHSUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UHSUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UMAAL, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UMLAL, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UMULL, T_THUMB2_RN_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQADD16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQADD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQASX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQSAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQSUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UQSUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USAD8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USADA8, T_THUMB2_RN_RD_RM_RA_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USAT, T_THUMB2_RN_RD_REG, T_THUMB2_IMM2_IMM3, T_THUMB2_NO_FLAG},
+    {I_USAT16, T_THUMB2_RN_RD_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USAX, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USUB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_USUB8, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_UXTAB, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_UXTAB16, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_UXTAH, T_THUMB2_RN_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_UXTB, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_UXTB16, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_UXTH, T_THUMB2_RD_RM_REG, T_THUMB2_NO_IMM, T_THUMB2_ROTATE_FLAG},
+    {I_WFE, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_WFI, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+    {I_YIELD, T_THUMB2_NO_REG, T_THUMB2_NO_IMM, T_THUMB2_NO_FLAG},
+};
+
+static darm_instr_t thumb2_decoded(darm_t *d, uint32_t idx)
+{
+    d->instr_type = thumb2_decodings[idx].instr_type;
+    d->instr_imm_type = thumb2_decodings[idx].instr_imm_type;
+    d->instr_flag_type = thumb2_decodings[idx].instr_flag_type;
+    return thumb2_decodings[idx].instr;
+}
+
+// at most 11 switches deep
+darm_instr_t thumb2_decode_instruction(darm_t *d, uint16_t w, uint16_t w2)
+{
+    switch ((w >> 11) & 3) {
+    case 1:
+        switch ((w >> 8) & 7) {
+        case 0:
+            switch ((w >> 6) & 1) {
+            case 1:
+                switch ((w >> 4) & 3) {
+                case 1:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 193);
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    case 1:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 194);
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    case 4:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 46);
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    case 5:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 48);
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    case 7:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 47);
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 45);
+                        }
+                    }
+                case 2:
+                    return thumb2_decoded(d, 174);
+                case 3:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 44);
+                    default:
+                        return thumb2_decoded(d, 43);
+                    }
+                default:
+                    switch ((w2 >> 4) & 15) {
+                    case 4:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 176);
+                        default:
+                            return thumb2_decoded(d, 175);
+                        }
+                    case 5:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 178);
+                        default:
+                            return thumb2_decoded(d, 175);
+                        }
+                    case 7:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 177);
+                        default:
+                            return thumb2_decoded(d, 175);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 175);
+                        }
+                    }
+                }
+            default:
+                switch ((w >> 7) & 1) {
+                case 1:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        switch ((w >> 0) & 15) {
+                        case 13:
+                            switch ((w >> 5) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 95);
+                            default:
+                                return thumb2_decoded(d, 32);
+                            }
+                        default:
+                            return thumb2_decoded(d, 32);
+                        }
+                    default:
+                        return thumb2_decoded(d, 165);
+                    }
+                default:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 113);
+                    default:
+                        return thumb2_decoded(d, 159);
+                    }
+                }
+            }
+        case 1:
+            switch ((w >> 6) & 1) {
+            case 1:
+                switch ((w >> 4) & 1) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 44);
+                    default:
+                        return thumb2_decoded(d, 43);
+                    }
+                default:
+                    return thumb2_decoded(d, 174);
+                }
+            default:
+                switch ((w >> 7) & 1) {
+                case 1:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 113);
+                    default:
+                        return thumb2_decoded(d, 159);
+                    }
+                default:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 33);
+                    default:
+                        switch ((w >> 0) & 15) {
+                        case 13:
+                            switch ((w >> 5) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 97);
+                            default:
+                                return thumb2_decoded(d, 166);
+                            }
+                        default:
+                            return thumb2_decoded(d, 166);
+                        }
+                    }
+                }
+            }
+        case 2:
+            switch ((w >> 5) & 7) {
+            case 0:
+                switch ((w2 >> 8) & 15) {
+                case 15:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 198);
+                    default:
+                        return thumb2_decoded(d, 7);
+                    }
+                default:
+                    return thumb2_decoded(d, 7);
+                }
+            case 1:
+                return thumb2_decoded(d, 14);
+            case 2:
+                switch ((w >> 0) & 15) {
+                case 15:
+                    switch ((w2 >> 4) & 3) {
+                    case 1:
+                        return thumb2_decoded(d, 68);
+                    case 2:
+                        return thumb2_decoded(d, 8);
+                    case 3:
+                        switch ((w2 >> 12) & 7) {
+                        case 0:
+                            switch ((w2 >> 6) & 3) {
+                            case 0:
+                                return thumb2_decoded(d, 116);
+                            default:
+                                return thumb2_decoded(d, 114);
+                            }
+                        default:
+                            return thumb2_decoded(d, 114);
+                        }
+                    default:
+                        switch ((w2 >> 12) & 7) {
+                        case 0:
+                            switch ((w2 >> 6) & 3) {
+                            case 0:
+                                return thumb2_decoded(d, 73);
+                            default:
+                                return thumb2_decoded(d, 66);
+                            }
+                        default:
+                            return thumb2_decoded(d, 66);
+                        }
+                    }
+                default:
+                    return thumb2_decoded(d, 85);
+                }
+            case 3:
+                switch ((w >> 0) & 15) {
+                case 15:
+                    return thumb2_decoded(d, 80);
+                default:
+                    return thumb2_decoded(d, 83);
+                }
+            case 4:
+                switch ((w2 >> 8) & 15) {
+                case 15:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 196);
+                    default:
+                        return thumb2_decoded(d, 30);
+                    }
+                default:
+                    return thumb2_decoded(d, 30);
+                }
+            case 6:
+                switch ((w >> 4) & 1) {
+                case 1:
+                    return I_INVLD;
+                default:
+                    switch ((w2 >> 4) & 1) {
+                    case 1:
+                        return I_INVLD;
+                    default:
+                        return thumb2_decoded(d, 86);
+                    }
+                }
+            default:
+                return I_INVLD;
+            }
+        case 3:
+            switch ((w >> 5) & 7) {
+            case 0:
+                switch ((w2 >> 8) & 15) {
+                case 15:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 21);
+                    default:
+                        return thumb2_decoded(d, 3);
+                    }
+                default:
+                    return thumb2_decoded(d, 3);
+                }
+            case 2:
+                return thumb2_decoded(d, 1);
+            case 3:
+                return thumb2_decoded(d, 123);
+            case 5:
+                switch ((w2 >> 8) & 15) {
+                case 15:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 23);
+                    default:
+                        return thumb2_decoded(d, 185);
+                    }
+                default:
+                    return thumb2_decoded(d, 185);
+                }
+            case 6:
+                return thumb2_decoded(d, 118);
+            default:
+                return I_INVLD;
+            }
+        default:
+            return I_INVLD;
+        }
+    case 2:
+        switch ((w >> 7) & 7) {
+        case 1:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 5) & 3) {
+                case 0:
+                    switch ((w2 >> 8) & 15) {
+                    case 15:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 195);
+                        default:
+                            return thumb2_decoded(d, 29);
+                        }
+                    default:
+                        return thumb2_decoded(d, 29);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            }
+        case 2:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 5) & 3) {
+                case 1:
+                    return I_INVLD;
+                case 2:
+                    return thumb2_decoded(d, 0);
+                case 3:
+                    return thumb2_decoded(d, 122);
+                default:
+                    switch ((w2 >> 8) & 15) {
+                    case 15:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 20);
+                        default:
+                            return thumb2_decoded(d, 2);
+                        }
+                    default:
+                        return thumb2_decoded(d, 2);
+                    }
+                }
+            }
+        case 3:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 5) & 3) {
+                case 1:
+                    switch ((w2 >> 8) & 15) {
+                    case 15:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 22);
+                        default:
+                            return thumb2_decoded(d, 184);
+                        }
+                    default:
+                        return thumb2_decoded(d, 184);
+                    }
+                case 2:
+                    return thumb2_decoded(d, 117);
+                default:
+                    return I_INVLD;
+                }
+            }
+        case 4:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 4) & 7) {
+                case 0:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 5);
+                    default:
+                        return thumb2_decoded(d, 4);
+                    }
+                case 4:
+                    return thumb2_decoded(d, 75);
+                default:
+                    return I_INVLD;
+                }
+            }
+        case 5:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 4) & 7) {
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 5);
+                    default:
+                        return thumb2_decoded(d, 186);
+                    }
+                case 4:
+                    return thumb2_decoded(d, 74);
+                default:
+                    return I_INVLD;
+                }
+            }
+        case 6:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 6) & 1) {
+                case 1:
+                    switch ((w >> 4) & 3) {
+                    case 0:
+                        return thumb2_decoded(d, 124);
+                    case 2:
+                        switch ((w >> 0) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 11);
+                        default:
+                            return thumb2_decoded(d, 12);
+                        }
+                    default:
+                        return I_INVLD;
+                    }
+                default:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return I_INVLD;
+                    default:
+                        switch ((w2 >> 12) & 7) {
+                        case 0:
+                            switch ((w2 >> 6) & 3) {
+                            case 0:
+                                switch ((w >> 5) & 1) {
+                                case 1:
+                                    return thumb2_decoded(d, 161);
+                                default:
+                                    return thumb2_decoded(d, 160);
+                                }
+                            default:
+                                return thumb2_decoded(d, 160);
+                            }
+                        default:
+                            return thumb2_decoded(d, 160);
+                        }
+                    }
+                }
+            }
+        case 7:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w >> 5) & 3) {
+                case 1:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w2 >> 8) & 7) {
+                                case 0:
+                                    switch ((w2 >> 0) & 15) {
+                                    case 0:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return thumb2_decoded(d, 81);
+                                            }
+                                        }
+                                    case 1:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return thumb2_decoded(d, 235);
+                                            }
+                                        }
+                                    case 2:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return thumb2_decoded(d, 233);
+                                            }
+                                        }
+                                    case 3:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return thumb2_decoded(d, 234);
+                                            }
+                                        }
+                                    case 4:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return thumb2_decoded(d, 127);
+                                            }
+                                        }
+                                    default:
+                                        switch ((w >> 10) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            switch ((w >> 4) & 1) {
+                                            case 1:
+                                                return thumb2_decoded(d, 65);
+                                            default:
+                                                return I_INVLD;
+                                            }
+                                        }
+                                    }
+                                default:
+                                    switch ((w >> 10) & 1) {
+                                    case 1:
+                                        return I_INVLD;
+                                    default:
+                                        switch ((w >> 4) & 1) {
+                                        case 1:
+                                            return thumb2_decoded(d, 65);
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 1:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 28);
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 2:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 18);
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 4:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 27);
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 5:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 26);
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 6:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 31);
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    case 15:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w2 >> 8) & 7) {
+                                case 0:
+                                    switch ((w >> 10) & 1) {
+                                    case 1:
+                                        return I_INVLD;
+                                    default:
+                                        switch ((w >> 4) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 25);
+                                        }
+                                    }
+                                default:
+                                    switch ((w >> 10) & 1) {
+                                    case 1:
+                                        return I_INVLD;
+                                    default:
+                                        switch ((w >> 4) & 1) {
+                                        case 1:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w2 >> 14) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 15);
+                            default:
+                                return thumb2_decoded(d, 16);
+                            }
+                        default:
+                            switch ((w2 >> 12) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 10);
+                            default:
+                                switch ((w >> 10) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    switch ((w >> 4) & 1) {
+                                    case 1:
+                                        return I_INVLD;
+                                    default:
+                                        switch ((w2 >> 8) & 7) {
+                                        case 0:
+                                            return I_INVLD;
+                                        default:
+                                            return thumb2_decoded(d, 24);
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                case 2:
+                    switch ((w2 >> 14) & 1) {
+                    case 1:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 15);
+                        default:
+                            return thumb2_decoded(d, 16);
+                        }
+                    default:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 10);
+                        default:
+                            switch ((w >> 10) & 1) {
+                            case 1:
+                                return I_INVLD;
+                            default:
+                                switch ((w >> 4) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    return thumb2_decoded(d, 17);
+                                }
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 14) & 1) {
+                    case 1:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 15);
+                        default:
+                            return thumb2_decoded(d, 16);
+                        }
+                    default:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 10);
+                        default:
+                            switch ((w >> 10) & 1) {
+                            case 1:
+                                switch ((w >> 4) & 1) {
+                                case 1:
+                                    switch ((w2 >> 13) & 1) {
+                                    case 1:
+                                        return thumb2_decoded(d, 203);
+                                    default:
+                                        return I_INVLD;
+                                    }
+                                default:
+                                    return I_INVLD;
+                                }
+                            default:
+                                switch ((w2 >> 5) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    return thumb2_decoded(d, 76);
+                                }
+                            }
+                        }
+                    }
+                default:
+                    switch ((w2 >> 14) & 1) {
+                    case 1:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 15);
+                        default:
+                            return thumb2_decoded(d, 16);
+                        }
+                    default:
+                        switch ((w2 >> 12) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 10);
+                        default:
+                            switch ((w >> 10) & 1) {
+                            case 1:
+                                return I_INVLD;
+                            default:
+                                switch ((w2 >> 5) & 1) {
+                                case 1:
+                                    return I_INVLD;
+                                default:
+                                    return thumb2_decoded(d, 77);
+                                }
+                            }
+                        }
+                    }
+                }
+            default:
+                switch ((w >> 6) & 1) {
+                case 1:
+                    switch ((w >> 4) & 3) {
+                    case 0:
+                        return thumb2_decoded(d, 202);
+                    default:
+                        return I_INVLD;
+                    }
+                default:
+                    switch ((w >> 4) & 1) {
+                    case 1:
+                        return I_INVLD;
+                    default:
+                        switch ((w2 >> 12) & 7) {
+                        case 0:
+                            switch ((w2 >> 6) & 3) {
+                            case 0:
+                                switch ((w >> 5) & 1) {
+                                case 1:
+                                    return thumb2_decoded(d, 223);
+                                default:
+                                    return thumb2_decoded(d, 222);
+                                }
+                            default:
+                                return thumb2_decoded(d, 222);
+                            }
+                        default:
+                            return thumb2_decoded(d, 222);
+                        }
+                    }
+                }
+            }
+        default:
+            switch ((w2 >> 15) & 1) {
+            case 1:
+                switch ((w2 >> 14) & 1) {
+                case 1:
+                    switch ((w2 >> 12) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 15);
+                    default:
+                        return thumb2_decoded(d, 16);
+                    }
+                default:
+                    return thumb2_decoded(d, 10);
+                }
+            default:
+                switch ((w >> 5) & 3) {
+                case 1:
+                    return thumb2_decoded(d, 13);
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 72);
+                    default:
+                        return thumb2_decoded(d, 84);
+                    }
+                case 3:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 79);
+                    default:
+                        return thumb2_decoded(d, 82);
+                    }
+                default:
+                    switch ((w2 >> 8) & 15) {
+                    case 15:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 197);
+                        default:
+                            return thumb2_decoded(d, 6);
+                        }
+                    default:
+                        return thumb2_decoded(d, 6);
+                    }
+                }
+            }
+        }
+    case 3:
+        switch ((w >> 8) & 7) {
+        case 0:
+            switch ((w >> 4) & 7) {
+            case 0:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 171);
+                    default:
+                        return I_INVLD;
+                    }
+                case 2:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 171);
+                    default:
+                        switch ((w2 >> 8) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 172);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 3:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 171);
+                    default:
+                        switch ((w2 >> 8) & 3) {
+                        case 2:
+                            return thumb2_decoded(d, 173);
+                        default:
+                            return thumb2_decoded(d, 172);
+                        }
+                    }
+                default:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 171);
+                    default:
+                        switch ((w2 >> 6) & 15) {
+                        case 0:
+                            return thumb2_decoded(d, 170);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                }
+            case 1:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 87);
+                        default:
+                            return thumb2_decoded(d, 41);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 88);
+                            default:
+                                return thumb2_decoded(d, 39);
+                            }
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 87);
+                        default:
+                            return thumb2_decoded(d, 41);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 88);
+                            default:
+                                return thumb2_decoded(d, 39);
+                            }
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 40);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                return thumb2_decoded(d, 88);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 0:
+                                    return thumb2_decoded(d, 89);
+                                case 2:
+                                    return thumb2_decoded(d, 42);
+                                default:
+                                    return thumb2_decoded(d, 40);
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 41);
+                            default:
+                                return thumb2_decoded(d, 39);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 41);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 2:
+                                    return thumb2_decoded(d, 42);
+                                default:
+                                    return thumb2_decoded(d, 40);
+                                }
+                            }
+                        }
+                    }
+                default:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                return thumb2_decoded(d, 88);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 90);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 41);
+                            default:
+                                return thumb2_decoded(d, 39);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 41);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 38);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    }
+                }
+            case 2:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 180);
+                    default:
+                        return I_INVLD;
+                    }
+                case 2:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 180);
+                    default:
+                        switch ((w2 >> 8) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 181);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 3:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 180);
+                    default:
+                        switch ((w2 >> 8) & 3) {
+                        case 2:
+                            return thumb2_decoded(d, 182);
+                        default:
+                            return thumb2_decoded(d, 181);
+                        }
+                    }
+                default:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 180);
+                    default:
+                        switch ((w2 >> 6) & 15) {
+                        case 0:
+                            return thumb2_decoded(d, 179);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                }
+            case 3:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 87);
+                        default:
+                            return thumb2_decoded(d, 52);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 88);
+                            default:
+                                return thumb2_decoded(d, 50);
+                            }
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 87);
+                        default:
+                            return thumb2_decoded(d, 52);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 88);
+                            default:
+                                return thumb2_decoded(d, 50);
+                            }
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 51);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                return thumb2_decoded(d, 88);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 0:
+                                    return thumb2_decoded(d, 89);
+                                case 2:
+                                    return thumb2_decoded(d, 53);
+                                default:
+                                    return thumb2_decoded(d, 51);
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 52);
+                            default:
+                                return thumb2_decoded(d, 50);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 52);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 2:
+                                    return thumb2_decoded(d, 53);
+                                default:
+                                    return thumb2_decoded(d, 51);
+                                }
+                            }
+                        }
+                    }
+                default:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                return thumb2_decoded(d, 88);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 87);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 90);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 52);
+                            default:
+                                return thumb2_decoded(d, 50);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 52);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 49);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    }
+                }
+            case 4:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 168);
+                    default:
+                        return I_INVLD;
+                    }
+                case 2:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 168);
+                    default:
+                        switch ((w2 >> 8) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 169);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 3:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 168);
+                    default:
+                        switch ((w2 >> 8) & 3) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 13:
+                                switch ((w2 >> 4) & 15) {
+                                case 0:
+                                    switch ((w2 >> 0) & 15) {
+                                    case 4:
+                                        return thumb2_decoded(d, 98);
+                                    default:
+                                        return thumb2_decoded(d, 169);
+                                    }
+                                default:
+                                    return thumb2_decoded(d, 169);
+                                }
+                            default:
+                                return thumb2_decoded(d, 169);
+                            }
+                        case 2:
+                            return thumb2_decoded(d, 183);
+                        default:
+                            return thumb2_decoded(d, 169);
+                        }
+                    }
+                default:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 168);
+                    default:
+                        switch ((w2 >> 6) & 15) {
+                        case 0:
+                            return thumb2_decoded(d, 167);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                }
+            case 5:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 36);
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 35);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 13:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 35);
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                switch ((w2 >> 4) & 15) {
+                                case 0:
+                                    switch ((w2 >> 0) & 15) {
+                                    case 4:
+                                        switch ((w2 >> 9) & 1) {
+                                        case 1:
+                                            return thumb2_decoded(d, 96);
+                                        default:
+                                            return thumb2_decoded(d, 37);
+                                        }
+                                    default:
+                                        return thumb2_decoded(d, 37);
+                                    }
+                                default:
+                                    return thumb2_decoded(d, 37);
+                                }
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    case 15:
+                        return thumb2_decoded(d, 36);
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 35);
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 37);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        switch ((w >> 0) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 36);
+                        default:
+                            return thumb2_decoded(d, 35);
+                        }
+                    default:
+                        switch ((w >> 0) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 36);
+                        default:
+                            switch ((w2 >> 8) & 3) {
+                            case 2:
+                                return thumb2_decoded(d, 64);
+                            default:
+                                return thumb2_decoded(d, 37);
+                            }
+                        }
+                    }
+                default:
+                    switch ((w >> 7) & 1) {
+                    case 1:
+                        switch ((w >> 0) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 36);
+                        default:
+                            return thumb2_decoded(d, 35);
+                        }
+                    default:
+                        switch ((w >> 0) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 36);
+                        default:
+                            switch ((w2 >> 6) & 15) {
+                            case 0:
+                                return thumb2_decoded(d, 34);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                }
+            default:
+                return I_INVLD;
+            }
+        case 1:
+            switch ((w >> 4) & 7) {
+            case 1:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 91);
+                        default:
+                            return thumb2_decoded(d, 57);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 92);
+                            default:
+                                return thumb2_decoded(d, 55);
+                            }
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 91);
+                        default:
+                            return thumb2_decoded(d, 57);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 92);
+                            default:
+                                return thumb2_decoded(d, 55);
+                            }
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 56);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 91);
+                            default:
+                                return thumb2_decoded(d, 92);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 91);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 0:
+                                    return thumb2_decoded(d, 93);
+                                case 2:
+                                    return thumb2_decoded(d, 58);
+                                default:
+                                    return thumb2_decoded(d, 56);
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 57);
+                            default:
+                                return thumb2_decoded(d, 55);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 57);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 2:
+                                    return thumb2_decoded(d, 58);
+                                default:
+                                    return thumb2_decoded(d, 56);
+                                }
+                            }
+                        }
+                    }
+                default:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 91);
+                            default:
+                                return thumb2_decoded(d, 92);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 91);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 94);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 57);
+                            default:
+                                return thumb2_decoded(d, 55);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 57);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 54);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    }
+                }
+            case 3:
+                switch ((w2 >> 10) & 3) {
+                case 1:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 81);
+                        default:
+                            return thumb2_decoded(d, 62);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 81);
+                            default:
+                                return thumb2_decoded(d, 60);
+                            }
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w >> 0) & 15) {
+                    case 15:
+                        switch ((w2 >> 12) & 15) {
+                        case 15:
+                            return thumb2_decoded(d, 81);
+                        default:
+                            return thumb2_decoded(d, 62);
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w2 >> 12) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 81);
+                            default:
+                                return thumb2_decoded(d, 60);
+                            }
+                        default:
+                            switch ((w2 >> 8) & 1) {
+                            case 1:
+                                return thumb2_decoded(d, 61);
+                            default:
+                                return I_INVLD;
+                            }
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 81);
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 81);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 0:
+                                    return thumb2_decoded(d, 81);
+                                case 2:
+                                    return thumb2_decoded(d, 63);
+                                default:
+                                    return thumb2_decoded(d, 61);
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 62);
+                            default:
+                                return thumb2_decoded(d, 60);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 62);
+                            default:
+                                switch ((w2 >> 8) & 3) {
+                                case 2:
+                                    return thumb2_decoded(d, 63);
+                                default:
+                                    return thumb2_decoded(d, 61);
+                                }
+                            }
+                        }
+                    }
+                default:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 81);
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 81);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 81);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    default:
+                        switch ((w >> 7) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 62);
+                            default:
+                                return thumb2_decoded(d, 60);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 62);
+                            default:
+                                switch ((w2 >> 6) & 15) {
+                                case 0:
+                                    return thumb2_decoded(d, 59);
+                                default:
+                                    return I_INVLD;
+                                }
+                            }
+                        }
+                    }
+                }
+            default:
+                return I_INVLD;
+            }
+        case 2:
+            switch ((w2 >> 12) & 15) {
+            case 15:
+                switch ((w >> 5) & 7) {
+                case 1:
+                    switch ((w2 >> 7) & 1) {
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 231);
+                            default:
+                                return thumb2_decoded(d, 228);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 191);
+                            default:
+                                return thumb2_decoded(d, 188);
+                            }
+                        }
+                    default:
+                        switch ((w2 >> 4) & 7) {
+                        case 0:
+                            return thumb2_decoded(d, 69);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 2:
+                    switch ((w2 >> 7) & 1) {
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 230);
+                            default:
+                                return thumb2_decoded(d, 227);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 190);
+                            default:
+                                return thumb2_decoded(d, 187);
+                            }
+                        }
+                    default:
+                        switch ((w2 >> 4) & 7) {
+                        case 0:
+                            return thumb2_decoded(d, 9);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                case 3:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        return thumb2_decoded(d, 115);
+                    default:
+                        return I_INVLD;
+                    }
+                case 4:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 119);
+                        default:
+                            return thumb2_decoded(d, 120);
+                        }
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 100);
+                        default:
+                            return thumb2_decoded(d, 101);
+                        }
+                    case 2:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 128);
+                        default:
+                            return thumb2_decoded(d, 129);
+                        }
+                    case 4:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 199);
+                        default:
+                            return thumb2_decoded(d, 200);
+                        }
+                    case 5:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 214);
+                        default:
+                            return thumb2_decoded(d, 215);
+                        }
+                    case 6:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 205);
+                        default:
+                            return thumb2_decoded(d, 206);
+                        }
+                    case 8:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 110);
+                        default:
+                            return thumb2_decoded(d, 99);
+                        }
+                    case 9:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 111);
+                        default:
+                            return thumb2_decoded(d, 103);
+                        }
+                    case 10:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 109);
+                        default:
+                            return thumb2_decoded(d, 106);
+                        }
+                    case 11:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 112);
+                        default:
+                            return thumb2_decoded(d, 104);
+                        }
+                    default:
+                        return I_INVLD;
+                    }
+                case 5:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 121);
+                        }
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 102);
+                        }
+                    case 2:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 130);
+                        }
+                    case 4:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 201);
+                        }
+                    case 5:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 216);
+                        }
+                    case 6:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 207);
+                        }
+                    case 8:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 19);
+                        default:
+                            return thumb2_decoded(d, 126);
+                        }
+                    default:
+                        return I_INVLD;
+                    }
+                case 6:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 163);
+                        default:
+                            return thumb2_decoded(d, 164);
+                        }
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 107);
+                        default:
+                            return thumb2_decoded(d, 108);
+                        }
+                    case 2:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 132);
+                        default:
+                            return thumb2_decoded(d, 133);
+                        }
+                    case 4:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 225);
+                        default:
+                            return thumb2_decoded(d, 226);
+                        }
+                    case 5:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 218);
+                        default:
+                            return thumb2_decoded(d, 219);
+                        }
+                    case 6:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return thumb2_decoded(d, 209);
+                        default:
+                            return thumb2_decoded(d, 210);
+                        }
+                    default:
+                        return I_INVLD;
+                    }
+                case 7:
+                    switch ((w2 >> 4) & 15) {
+                    case 0:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 162);
+                        }
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 105);
+                        }
+                    case 2:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 131);
+                        }
+                    case 4:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 224);
+                        }
+                    case 5:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 217);
+                        }
+                    case 6:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            return I_INVLD;
+                        default:
+                            return thumb2_decoded(d, 208);
+                        }
+                    default:
+                        return I_INVLD;
+                    }
+                default:
+                    switch ((w2 >> 7) & 1) {
+                    case 1:
+                        switch ((w >> 4) & 1) {
+                        case 1:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 232);
+                            default:
+                                return thumb2_decoded(d, 229);
+                            }
+                        default:
+                            switch ((w >> 0) & 15) {
+                            case 15:
+                                return thumb2_decoded(d, 192);
+                            default:
+                                return thumb2_decoded(d, 189);
+                            }
+                        }
+                    default:
+                        switch ((w2 >> 4) & 7) {
+                        case 0:
+                            return thumb2_decoded(d, 67);
+                        default:
+                            return I_INVLD;
+                        }
+                    }
+                }
+            default:
+                return I_INVLD;
+            }
+        case 3:
+            switch ((w >> 4) & 15) {
+            case 1:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 152);
+                    default:
+                        return thumb2_decoded(d, 134);
+                    }
+                case 1:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 153);
+                    default:
+                        return thumb2_decoded(d, 135);
+                    }
+                case 2:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 155);
+                    default:
+                        return thumb2_decoded(d, 143);
+                    }
+                case 3:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 156);
+                    default:
+                        return thumb2_decoded(d, 144);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 2:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 151);
+                    default:
+                        return thumb2_decoded(d, 136);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 3:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 157);
+                    default:
+                        return thumb2_decoded(d, 145);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 4:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 158);
+                    default:
+                        return thumb2_decoded(d, 146);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 5:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 150);
+                    default:
+                        return thumb2_decoded(d, 148);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 6:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    return thumb2_decoded(d, 149);
+                default:
+                    return I_INVLD;
+                }
+            case 7:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 220);
+                    default:
+                        return thumb2_decoded(d, 221);
+                    }
+                default:
+                    return I_INVLD;
+                }
+            case 8:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    return thumb2_decoded(d, 154);
+                default:
+                    return I_INVLD;
+                }
+            case 9:
+                switch ((w2 >> 4) & 15) {
+                case 15:
+                    return thumb2_decoded(d, 125);
+                default:
+                    return I_INVLD;
+                }
+            case 10:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    return thumb2_decoded(d, 213);
+                default:
+                    return I_INVLD;
+                }
+            case 11:
+                switch ((w2 >> 4) & 15) {
+                case 15:
+                    return thumb2_decoded(d, 204);
+                default:
+                    return I_INVLD;
+                }
+            case 12:
+                switch ((w2 >> 5) & 7) {
+                case 0:
+                    switch ((w2 >> 4) & 1) {
+                    case 1:
+                        return I_INVLD;
+                    default:
+                        return thumb2_decoded(d, 137);
+                    }
+                case 4:
+                    switch ((w2 >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 139);
+                    default:
+                        return thumb2_decoded(d, 138);
+                    }
+                case 5:
+                    switch ((w2 >> 4) & 1) {
+                    case 1:
+                        return thumb2_decoded(d, 142);
+                    default:
+                        return thumb2_decoded(d, 141);
+                    }
+                case 6:
+                    return thumb2_decoded(d, 140);
+                default:
+                    return I_INVLD;
+                }
+            case 13:
+                switch ((w2 >> 5) & 7) {
+                case 6:
+                    return thumb2_decoded(d, 147);
+                default:
+                    return I_INVLD;
+                }
+            case 14:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    return thumb2_decoded(d, 212);
+                case 6:
+                    return thumb2_decoded(d, 211);
+                default:
+                    return I_INVLD;
+                }
+            case 15:
+                return I_INVLD;
+            default:
+                switch ((w2 >> 4) & 15) {
+                case 0:
+                    switch ((w2 >> 12) & 15) {
+                    case 15:
+                        return thumb2_decoded(d, 78);
+                    default:
+                        return thumb2_decoded(d, 70);
+                    }
+                case 1:
+                    return thumb2_decoded(d, 71);
+                default:
+                    return I_INVLD;
+                }
+            }
+        default:
+            return I_INVLD;
+        }
+    default:
+        return I_INVLD;
+    }
+}
+#include "darm-internal.h"
+#include "thumb2.h"
+
+static void thumb2_fields_generic(darm_t *d, uint16_t w, uint16_t w2)
+{
+    switch ((uint32_t) d->instr_type) {
+    case T_THUMB2_RT_REG:
+        d->Rt = (w2 >> 12) & b1111;
+        break;
+
+    case T_THUMB2_RT_RT2_REG:
+        d->Rt = (w2 >> 12) & b1111;
+        d->Rt2 = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RM_REG:
+        d->Rm = w & b1111;
+        break;
+
+    case T_THUMB2_RD_REG:
+        d->Rd = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RD_RM_REG:
+        d->Rd = (w2 >> 8) & b1111;
+        d->Rm = w2 & b1111;
+        break;
+
+    case T_THUMB2_RN_REG:
+        d->Rn = w & b1111;
+        break;
+
+    case T_THUMB2_RN_RT_REG:
+        d->Rn = w & b1111;
+        d->Rt = (w2 >> 12) & b1111;
+        break;
+
+    case T_THUMB2_RN_RT_RT2_REG:
+        d->Rn = w & b1111;
+        d->Rt = (w2 >> 12) & b1111;
+        d->Rt2 = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RN_RM_REG:
+        d->Rn = w & b1111;
+        d->Rm = w2 & b1111;
+        break;
+
+    case T_THUMB2_RN_RM_RT_REG:
+        d->Rn = w & b1111;
+        d->Rm = w2 & b1111;
+        d->Rt = (w2 >> 12) & b1111;
+        break;
+
+    case T_THUMB2_RN_RD_REG:
+        d->Rn = w & b1111;
+        d->Rd = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RN_RD_RT_REG:
+        d->Rn = w & b1111;
+        d->Rd = w2 & b1111;
+        d->Rt = (w2 >> 12) & b1111;
+        break;
+
+    case T_THUMB2_RN_RD_RT_RT2_REG:
+        d->Rn = w & b1111;
+        d->Rd = w2 & b1111;
+        d->Rt = (w2 >> 12) & b1111;
+        d->Rt2 = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RN_RD_RM_REG:
+        d->Rn = w & b1111;
+        d->Rm = w2 & b1111;
+        d->Rd = (w2 >> 8) & b1111;
+        break;
+
+    case T_THUMB2_RN_RD_RM_RA_REG:
+        d->Rn = w & b1111;
+        d->Rm = w2 & b1111;
+        d->Rd = (w2 >> 8) & b1111;
+        d->Ra = (w2 >> 12) & b1111;
+        break;
+
+    default:
+        break;
+    }
+
+    switch ((uint32_t) d->instr_imm_type) {
+    case T_THUMB2_NO_IMM:
+        d->I = B_UNSET;
+        break;
+
+    case T_THUMB2_IMM12:
+        d->I = B_SET;
+        d->imm = w2 & 0xfff;
+        break;
+
+    case T_THUMB2_IMM8:
+        d->I = B_SET;
+        d->imm = w2 & 0xff;
+        break;
+
+    case T_THUMB2_IMM2:
+        d->I = B_SET;
+        d->imm = (w2 >> 4) & b11;
+        d->shift = d->imm;
+        d->shift_type = S_LSL;
+        break;
+
+    case T_THUMB2_IMM2_IMM3:
+        d->I = B_SET;
+        d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+        break;
+
+    case T_THUMB2_IMM1_IMM3_IMM8:
+        d->I = B_SET;
+        d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+        if((w & 0x300) != 0x200) {
+            d->imm = thumb_expand_imm(d->imm);
+        }
+        break;
+
+    default:
+        d->I = B_SET;
+        break;
+    }
+
+    switch ((uint32_t) d->instr_flag_type) {
+    case T_THUMB2_ROTATE_FLAG:
+        d->rotate = (w2 >> 1) & b11000;
+        break;
+
+    case T_THUMB2_U_FLAG:
+        d->U = (w >> 7) & 1 ? B_SET : B_UNSET;
+        break;
+
+    case T_THUMB2_WUP_FLAG:
+        d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;
+        d->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;
+        d->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;
+        break;
+
+    case T_THUMB2_TYPE_FLAG:
+        thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
+        break;
+
+    case T_THUMB2_REGLIST_FLAG:
+        d->reglist = w2;
+        break;
+
+    case T_THUMB2_WP_REGLIST_FLAG:
+        d->reglist = w2;
+        d->W = (w >> 5) & 1 ? B_SET : B_UNSET;
+        break;
+
+    case T_THUMB2_S_FLAG:
+        d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+        break;
+
+    case T_THUMB2_S_TYPE_FLAG:
+        d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+        thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
+        break;
+
+    default:
+        break;
+    }
+}
+
+static void thumb2_fields_no_reg_imm12_u_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->I = B_SET;
+    d->imm = w2 & 0xfff;
+    d->U = (w >> 7) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_no_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w; (void) w2;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_no_reg_no_imm_reglist_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->I = B_UNSET;
+    d->reglist = w2;
+}
+
+static void thumb2_fields_no_reg_no_imm_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w2;
+    d->I = B_UNSET;
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rd_reg_imm1_imm3_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+    if((w & 0x300) != 0x200) {
+        d->imm = thumb_expand_imm(d->imm);
+    }
+}
+
+static void thumb2_fields_rd_reg_imm1_imm3_imm8_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+    if((w & 0x300) != 0x200) {
+        d->imm = thumb_expand_imm(d->imm);
+    }
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rd_reg_imm2_imm3_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+}
+
+static void thumb2_fields_rd_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rd_rm_reg_imm2_imm3_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rd = (w2 >> 8) & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rd_rm_reg_imm2_imm3_s_type_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rd = (w2 >> 8) & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+    thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
+}
+
+static void thumb2_fields_rd_rm_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rd = (w2 >> 8) & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rd_rm_reg_no_imm_rotate_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rd = (w2 >> 8) & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_UNSET;
+    d->rotate = (w2 >> 1) & b11000;
+}
+
+static void thumb2_fields_rd_rm_reg_no_imm_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rd = (w2 >> 8) & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_UNSET;
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rm_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w2;
+    d->Rm = w & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_reg_imm1_imm3_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+    if((w & 0x300) != 0x200) {
+        d->imm = thumb_expand_imm(d->imm);
+    }
+}
+
+static void thumb2_fields_rn_rd_reg_imm1_imm3_imm8_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+    if((w & 0x300) != 0x200) {
+        d->imm = thumb_expand_imm(d->imm);
+    }
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_reg_imm2_imm3_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+}
+
+static void thumb2_fields_rn_rd_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_rm_ra_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->Ra = (w2 >> 12) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_rm_reg_imm2_imm3_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+}
+
+static void thumb2_fields_rn_rd_rm_reg_imm2_imm3_s_type_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+    thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
+}
+
+static void thumb2_fields_rn_rd_rm_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_rm_reg_no_imm_rotate_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+    d->rotate = (w2 >> 1) & b11000;
+}
+
+static void thumb2_fields_rn_rd_rm_reg_no_imm_s_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rd = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+    d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_rt_reg_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = w2 & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+}
+
+static void thumb2_fields_rn_rd_rt_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = w2 & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rd_rt_rt2_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rd = w2 & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->Rt2 = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_reg_imm12_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xfff;
+}
+
+static void thumb2_fields_rn_reg_imm1_imm3_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->I = B_SET;
+    d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
+    if((w & 0x300) != 0x200) {
+        d->imm = thumb_expand_imm(d->imm);
+    }
+}
+
+static void thumb2_fields_rn_reg_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+}
+
+static void thumb2_fields_rn_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w2;
+    d->Rn = w & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_reg_no_imm_reglist_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->I = B_UNSET;
+    d->reglist = w2;
+}
+
+static void thumb2_fields_rn_reg_no_imm_wp_reglist_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->I = B_UNSET;
+    d->reglist = w2;
+    d->W = (w >> 5) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rm_reg_imm2_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_SET;
+    d->imm = (w2 >> 4) & b11;
+    d->shift = d->imm;
+    d->shift_type = S_LSL;
+}
+
+static void thumb2_fields_rn_rm_reg_imm2_imm3_type_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_SET;
+    d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
+    thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
+}
+
+static void thumb2_fields_rn_rm_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rm_rt_reg_imm2_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rm = w2 & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = (w2 >> 4) & b11;
+    d->shift = d->imm;
+    d->shift_type = S_LSL;
+}
+
+static void thumb2_fields_rn_rt_reg_imm12_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xfff;
+}
+
+static void thumb2_fields_rn_rt_reg_imm12_u_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xfff;
+    d->U = (w >> 7) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rt_reg_imm8_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+}
+
+static void thumb2_fields_rn_rt_reg_imm8_wup_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+    d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;
+    d->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;
+    d->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rt_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rn_rt_rt2_reg_imm8_wup_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->Rt2 = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+    d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;
+    d->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;
+    d->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rn_rt_rt2_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rn = w & b1111;
+    d->Rt = (w2 >> 12) & b1111;
+    d->Rt2 = (w2 >> 8) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rt_reg_imm12_u_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xfff;
+    d->U = (w >> 7) & 1 ? B_SET : B_UNSET;
+}
+
+static void thumb2_fields_rt_reg_no_imm_no_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rt = (w2 >> 12) & b1111;
+    d->I = B_UNSET;
+}
+
+static void thumb2_fields_rt_rt2_reg_imm8_wup_flag(darm_t *d,
+    uint16_t w, uint16_t w2)
+{
+    (void) w;
+    d->Rt = (w2 >> 12) & b1111;
+    d->Rt2 = (w2 >> 8) & b1111;
+    d->I = B_SET;
+    d->imm = w2 & 0xff;
+    d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;
+    d->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;
+    d->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;
+}
+
+void (*const thumb2_fields[])(darm_t *d, uint16_t w, uint16_t w2) = {
+    &thumb2_fields_generic,
+    &thumb2_fields_no_reg_imm12_u_flag,
+    &thumb2_fields_no_reg_no_imm_no_flag,
+    &thumb2_fields_no_reg_no_imm_reglist_flag,
+    &thumb2_fields_no_reg_no_imm_s_flag,
+    &thumb2_fields_rd_reg_imm1_imm3_imm8_no_flag,
+    &thumb2_fields_rd_reg_imm1_imm3_imm8_s_flag,
+    &thumb2_fields_rd_reg_imm2_imm3_no_flag,
+    &thumb2_fields_rd_reg_no_imm_no_flag,
+    &thumb2_fields_rd_rm_reg_imm2_imm3_s_flag,
+    &thumb2_fields_rd_rm_reg_imm2_imm3_s_type_flag,
+    &thumb2_fields_rd_rm_reg_no_imm_no_flag,
+    &thumb2_fields_rd_rm_reg_no_imm_rotate_flag,
+    &thumb2_fields_rd_rm_reg_no_imm_s_flag,
+    &thumb2_fields_rm_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rd_reg_imm1_imm3_imm8_no_flag,
+    &thumb2_fields_rn_rd_reg_imm1_imm3_imm8_s_flag,
+    &thumb2_fields_rn_rd_reg_imm2_imm3_no_flag,
+    &thumb2_fields_rn_rd_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rd_rm_ra_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rd_rm_reg_imm2_imm3_no_flag,
+    &thumb2_fields_rn_rd_rm_reg_imm2_imm3_s_type_flag,
+    &thumb2_fields_rn_rd_rm_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rd_rm_reg_no_imm_rotate_flag,
+    &thumb2_fields_rn_rd_rm_reg_no_imm_s_flag,
+    &thumb2_fields_rn_rd_rt_reg_imm8_no_flag,
+    &thumb2_fields_rn_rd_rt_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rd_rt_rt2_reg_no_imm_no_flag,
+    &thumb2_fields_rn_reg_imm12_no_flag,
+    &thumb2_fields_rn_reg_imm1_imm3_imm8_no_flag,
+    &thumb2_fields_rn_reg_imm8_no_flag,
+    &thumb2_fields_rn_reg_no_imm_no_flag,
+    &thumb2_fields_rn_reg_no_imm_reglist_flag,
+    &thumb2_fields_rn_reg_no_imm_wp_reglist_flag,
+    &thumb2_fields_rn_rm_reg_imm2_no_flag,
+    &thumb2_fields_rn_rm_reg_imm2_imm3_type_flag,
+    &thumb2_fields_rn_rm_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rm_rt_reg_imm2_no_flag,
+    &thumb2_fields_rn_rt_reg_imm12_no_flag,
+    &thumb2_fields_rn_rt_reg_imm12_u_flag,
+    &thumb2_fields_rn_rt_reg_imm8_no_flag,
+    &thumb2_fields_rn_rt_reg_imm8_wup_flag,
+    &thumb2_fields_rn_rt_reg_no_imm_no_flag,
+    &thumb2_fields_rn_rt_rt2_reg_imm8_wup_flag,
+    &thumb2_fields_rn_rt_rt2_reg_no_imm_no_flag,
+    &thumb2_fields_rt_reg_imm12_u_flag,
+    &thumb2_fields_rt_reg_no_imm_no_flag,
+    &thumb2_fields_rt_rt2_reg_imm8_wup_flag,
+};
+
+const uint8_t thumb2_fields_index[THUMB2_REG_TYPES][THUMB2_IMM_TYPES][THUMB2_FLAG_TYPES] = {
+    // NO_REG
+    {
+        {2, 0, 0, 0, 0, 3, 0, 4, 0}, // NO_IMM
+        {0, 0, 1, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RT_REG
+    {
+        {46, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 45, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RT_RT2_REG
+    {
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 47, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RM_REG
+    {
+        {14, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RD_REG
+    {
+        {8, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {7, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {5, 0, 0, 0, 0, 0, 0, 6, 0}, // IMM1_IMM3_IMM8
+    },
+    // RD_RM_REG
+    {
+        {11, 12, 0, 0, 0, 0, 0, 13, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 9, 10}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_REG
+    {
+        {31, 0, 0, 0, 0, 32, 33, 0, 0}, // NO_IMM
+        {28, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {30, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {29, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RT_REG
+    {
+        {42, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {38, 0, 39, 0, 0, 0, 0, 0, 0}, // IMM12
+        {40, 0, 0, 41, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RT_RT2_REG
+    {
+        {44, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 43, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RM_REG
+    {
+        {36, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {34, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 35, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RM_RT_REG
+    {
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {37, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RD_REG
+    {
+        {18, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {17, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {15, 0, 0, 0, 0, 0, 0, 16, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RD_RT_REG
+    {
+        {26, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {25, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RD_RT_RT2_REG
+    {
+        {27, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RD_RM_REG
+    {
+        {22, 23, 0, 0, 0, 0, 0, 24, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {20, 0, 0, 0, 0, 0, 0, 0, 21}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+    // RN_RD_RM_RA_REG
+    {
+        {19, 0, 0, 0, 0, 0, 0, 0, 0}, // NO_IMM
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM12
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM8
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM2_IMM3
+        {0, 0, 0, 0, 0, 0, 0, 0, 0}, // IMM1_IMM3_IMM8
+    },
+};
+
+const uint8_t *thumb_format_programs[479][3] = {
+    [I_ADDW] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_CBNZ] = {
+        (const uint8_t[]){FMT_RN, FMT_LABEL, FMT_END},
+    },
+    [I_CBZ] = {
+        (const uint8_t[]){FMT_RN, FMT_LABEL, FMT_END},
+    },
+    [I_CPS] = {
+        (const uint8_t[]){FMT_INVLD, FMT_ENDIAN, FMT_INVLD, FMT_INVLD, FMT_ENDIAN,
+            FMT_COND, FMT_RT, FMT_INVLD, FMT_INVLD, FMT_IMM,
+            FMT_INVLD, FMT_RDLO, FMT_RA, FMT_INVLD, FMT_S,
+            FMT_INVLD, FMT_INVLD, FMT_INVLD, FMT_INVLD, FMT_RM,
+            FMT_OPTION, FMT_RD, FMT_ENDIAN, FMT_INVLD, FMT_INVLD,
+            FMT_END},
+    },
+    [I_ENTERX] = {
+        (const uint8_t[]){FMT_END},
+    },
+    [I_IT] = {
+        (const uint8_t[]){FMT_INVLD, FMT_INVLD, FMT_X, FMT_INVLD, FMT_INVLD,
+            FMT_Y, FMT_INVLD, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_INVLD, FMT_INVLD, FMT_INVLD, FMT_INVLD, FMT_INVLD,
+            FMT_IMM, FMT_REGLIST, FMT_S, FMT_RT, FMT_COND,
+            FMT_OPTION, FMT_RN, FMT_RD, FMT_INVLD, FMT_END},
+    },
+    [I_LEAVEX] = {
+        (const uint8_t[]){FMT_END},
+    },
+    [I_ORN] = {
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_SHIFT,
+            FMT_END},
+        (const uint8_t[]){FMT_S, FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_RFE] = {
+        (const uint8_t[]){FMT_INVLD, FMT_INVLD, FMT_RA, FMT_RM, FMT_OPTION,
+            FMT_RD, FMT_ENDIAN, FMT_INVLD, FMT_INVLD, FMT_COND,
+            FMT_RN, FMT_WRITEBACK, FMT_END},
+    },
+    [I_SDIV] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMLABB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLABT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLALBB] = {
+        (const uint8_t[]){FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMLALBT] = {
+        (const uint8_t[]){FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMLALTB] = {
+        (const uint8_t[]){FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMLALTT] = {
+        (const uint8_t[]){FMT_COND, FMT_RDLO, FMT_RDHI, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMLATB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMLATT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_RA, FMT_END},
+    },
+    [I_SMULBB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMULBT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMULTB] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SMULTT] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+    [I_SRS] = {
+        (const uint8_t[]){FMT_INVLD, FMT_INVLD, FMT_RA, FMT_RM, FMT_OPTION,
+            FMT_RD, FMT_ENDIAN, FMT_INVLD, FMT_INVLD, FMT_COND,
+            FMT_SHIFT, FMT_OPC2, FMT_WRITEBACK, FMT_INVLD,
+            FMT_INVLD, FMT_RM, FMT_OPTION, FMT_RD, FMT_ENDIAN,
+            FMT_INVLD, FMT_END},
+    },
+    [I_SUBW] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_IMM, FMT_END},
+    },
+    [I_TBB] = {
+        (const uint8_t[]){FMT_COND, FMT_MEMORY, FMT_END},
+    },
+    [I_TBH] = {
+        (const uint8_t[]){FMT_COND, FMT_MEMORY, FMT_END},
+    },
+    [I_UDIV] = {
+        (const uint8_t[]){FMT_COND, FMT_RD, FMT_RN, FMT_RM, FMT_END},
+    },
+};
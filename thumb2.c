@@ -40,9 +40,6 @@ POSSIBILITY OF SUCH DAMAGE.
 #define ROR(val, rotate) (((val) >> (rotate)) | ((val) << (32 - (rotate))))
 #define SIGN_EXTEND32(v, len) (((int32_t)(v) << (32 - len)) >> (32 - len))
 
-void thumb2_parse_reg(darm_t *d, uint16_t w, uint16_t w2);
-void thumb2_parse_imm(darm_t *d, uint16_t w, uint16_t w2);
-void thumb2_parse_flag(darm_t *d, uint16_t w, uint16_t w2);
 void thumb2_parse_misc(darm_t *d, uint16_t w, uint16_t w2);
 
 // 12 -> 32 bit expansion function
@@ -111,205 +108,6 @@ void thumb2_decode_immshift(darm_t *d, uint8_t type, uint8_t imm5)
     }
 }
 
-// Parse the register instruction type
-void thumb2_parse_reg(darm_t *d, uint16_t w, uint16_t w2)
-{
-    switch (d->instr_type) {
-    case T_THUMB2_NO_REG:
-        break;
-
-    case T_THUMB2_RT_REG:
-        d->Rt = (w2 >> 12) & b1111;
-        break;
-
-    case T_THUMB2_RT_RT2_REG:
-        d->Rt = (w2 >> 12) & b1111;
-        d->Rt2 = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RM_REG:
-        d->Rm = (w & b1111);
-        break;
-
-    case T_THUMB2_RD_REG:
-        d->Rd = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RD_RM_REG:
-        d->Rd = (w2 >> 8) & b1111;
-        d->Rm = w2 & b1111;
-        break;
-
-    case T_THUMB2_RN_REG:
-        d->Rn = w & b1111;
-        break;
-
-    case T_THUMB2_RN_RT_REG:
-        d->Rn = w & b1111;
-        d->Rt = (w2 >> 12) & b1111;
-        break;
-
-    case T_THUMB2_RN_RT_RT2_REG:
-        d->Rn = w & b1111;
-        d->Rt = (w2 >> 12) & b1111;
-        d->Rt2 = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RN_RM_REG:
-        d->Rn = w & b1111;
-        d->Rm = w2 & b1111;
-        break;
-
-    case T_THUMB2_RN_RM_RT_REG:
-        d->Rn = w & b1111;
-        d->Rm = w2 & b1111;
-        d->Rt = (w2 >> 12) & b1111;
-        break;
-
-    case T_THUMB2_RN_RD_REG:
-        d->Rn = w & b1111;
-        d->Rd = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RN_RD_RT_REG:
-        d->Rn = (w & b1111);
-        d->Rd = (w2 & b1111);
-        d->Rt = (w2 >> 12) & b1111;
-        break;
-
-    case T_THUMB2_RN_RD_RT_RT2_REG:
-        d->Rn = (w & b1111);
-        d->Rd = (w2 & b1111);
-        d->Rt = (w2 >> 12) & b1111;
-        d->Rt2 = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RN_RD_RM_REG:
-        d->Rn = w & b1111;
-        d->Rm = w2 & b1111;
-        d->Rd = (w2 >> 8) & b1111;
-        break;
-
-    case T_THUMB2_RN_RD_RM_RA_REG:
-        d->Rn = w & b1111;
-        d->Rm = w2 & b1111;
-        d->Rd = (w2 >> 8) & b1111;
-        d->Ra = (w2 >> 12) & b1111;
-        break;
-
-    default:
-        break;
-    }
-}
-
-// Parse the immediate instruction type
-void thumb2_parse_imm(darm_t *d, uint16_t w, uint16_t w2)
-{
-    d->I = B_SET;
-
-    switch (d->instr_imm_type) {
-    case T_THUMB2_NO_IMM:
-        d->I = B_UNSET;
-        break;
-
-    case T_THUMB2_IMM12:
-        d->imm = w2 & 0xfff;
-        break;
-
-    case T_THUMB2_IMM8:
-        d->imm = w2 & 0xff;
-        break;
-
-    case T_THUMB2_IMM2:
-        // 2 bit immediate
-        d->imm = (w2 >> 4) & b11;
-        d->shift = d->imm;
-        d->shift_type = S_LSL;
-        break;
-
-    case T_THUMB2_IMM2_IMM3:
-        // 2 and 3 bit immediates
-        // (imm3:imm2)
-        d->imm = ((w2 >> 10) & b11100) | ((w2 >> 6) & b11);
-        break;
-
-    case T_THUMB2_IMM1_IMM3_IMM8:
-        // 1, 3 and 8 bit immediates
-        // i:imm3:imm8 -> imm12 -> imm32
-
-        // if bits 9:8 == '10' then zero extend, otherwise thumb expand
-        if((w & 0x300) == 0x200) {
-            d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
-        }
-        else {
-            d->imm = ((w & 0x400) << 1) | ((w2 & 0x7000) >> 4) | (w2 & 0xff);
-            d->imm = thumb_expand_imm(d->imm);
-        }
-        break;
-
-    default:
-        break;
-    }
-}
-
-// Parse the flag instruction type
-void thumb2_parse_flag(darm_t *d, uint16_t w, uint16_t w2)
-{
-    switch (d->instr_flag_type) {
-    case T_THUMB2_NO_FLAG:
-        break;
-
-    case T_THUMB2_ROTATE_FLAG:
-        // Rotate field
-        d->rotate = (w2 >> 1) & b11000;
-        break;
-
-    case T_THUMB2_U_FLAG:
-        // U flag
-        d->U = (w >> 7) & 1 ? B_SET : B_UNSET;
-        break;
-
-    case T_THUMB2_WUP_FLAG:
-        // W, U and P flags
-        d->W = (w2 >> 8) & 1 ? B_SET : B_UNSET;
-        d->U = (w2 >> 9) & 1 ? B_SET : B_UNSET;
-        d->P = (w2 >> 10) & 1 ? B_SET : B_UNSET;
-        break;
-
-    case T_THUMB2_TYPE_FLAG:
-        // Type field
-        // This is always a T_THUMB2_IMM2_IMM3 type
-        thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
-        break;
-
-    case T_THUMB2_REGLIST_FLAG:
-        // Reglist field
-        d->reglist = w2 & 0xffff;
-        break;
-
-    case T_THUMB2_WP_REGLIST_FLAG:
-        // Reglist field and W, P flags
-        d->reglist = w2 & 0xffff;
-        d->W = (w >> 5) & 1 ? B_SET : B_UNSET;
-        //d->P = (w >> 15) & 1 ? B_SET : B_UNSET;
-        break;
-
-    case T_THUMB2_S_FLAG:
-        // S flag
-        d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
-        break;
-
-    case T_THUMB2_S_TYPE_FLAG:
-        // S flag and type field
-        d->S = (w >> 4) & 1 ? B_SET : B_UNSET;
-        thumb2_decode_immshift(d, (w2 >> 4) & 3, d->imm);
-        break;
-
-    default:
-        break;
-    }
-}
-
 // Parse misc instruction cases
 void thumb2_parse_misc(darm_t *d, uint16_t w, uint16_t w2)
 {
@@ -482,8 +280,8 @@ void thumb2_parse_misc(darm_t *d, uint16_t w, uint16_t w2)
         break;
 
     case I_PKH:
-        // S flag and immediate already set
-        d->T = (w2 >> 4) & 1;
+        // immediate already set, tb selects the TB form
+        d->T = (w2 >> 5) & 1;
         thumb2_decode_immshift(d, (w2 >> 4) & 2, d->imm);
         break;
 
@@ -580,57 +378,22 @@ static int thumb2_disasm(darm_t *d, uint16_t w, uint16_t w2)
         return -1;
     }
 
-    thumb2_parse_reg(d, w, w2);
-    thumb2_parse_imm(d, w, w2);
-    thumb2_parse_flag(d, w, w2);
-    thumb2_parse_misc(d, w, w2);
-    d->instr_type = T_INVLD;
-    return 0;
-}
+    // the operand fields are extracted by a function which is generated for
+    // the register, immediate and flag type of the instruction
+    uint32_t reg = d->instr_type - T_THUMB2_NO_REG;
+    uint32_t imm = d->instr_imm_type - T_THUMB2_NO_IMM;
+    uint32_t flag = d->instr_flag_type - T_THUMB2_NO_FLAG;
+    uint32_t idx = 0;
 
-// placeholder function for printing out thumb2 instructions
-// This is here until the format string problem is resolved
-// TODO: This lacks a lot of functionality, for debug only, replace with better function
-char *darm_thumb2_str(darm_t *d)
-{
-    int index=0, offset=0;
-    static char stringbuf[512];
-
-    for (int i = 0; i < THUMB2_INSTRUCTION_COUNT; i++) {
-        if(d->instr == thumb2_instr_labels[i]) {
-            index = i;
-            break;
-        }
+    if(reg < THUMB2_REG_TYPES && imm < THUMB2_IMM_TYPES &&
+            flag < THUMB2_FLAG_TYPES) {
+        idx = thumb2_fields_index[reg][imm][flag];
     }
 
-    offset += sprintf(stringbuf + offset, "%s",
-        thumb2_instruction_strings[index]);
-
-    if(d->Rd != R_INVLD) {
-        offset += sprintf(stringbuf+offset, "rd%i,", d->Rd);
-    }
-
-    if(d->Rt != R_INVLD) {
-        offset += sprintf(stringbuf+offset, "rt%i,", d->Rt2);
-    }
-
-    if(d->Rt2 != R_INVLD) {
-        offset += sprintf(stringbuf+offset, "rt2%i,", d->Rt);
-    }
-
-    if(d->Rn != R_INVLD) {
-        offset += sprintf(stringbuf+offset, "rn%i,", d->Rn);
-    }
-
-    if(d->Rm != R_INVLD) {
-        offset += sprintf(stringbuf+offset, "rm%i ", d->Rm);
-    }
-
-    if(d->I == B_SET) {
-        offset += sprintf(stringbuf+offset, "#0x%x", d->imm);
-    }
-
-    return stringbuf;
+    thumb2_fields[idx](d, w, w2);
+    thumb2_parse_misc(d, w, w2);
+    d->instr_type = T_INVLD;
+    return 0;
 }
 
 int darm_thumb2_disasm(darm_t *d, uint16_t w, uint16_t w2)
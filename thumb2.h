@@ -34,4 +34,7 @@ uint32_t thumb_expand_imm(uint16_t imm12_r);
 void thumb2_decode_immshift(darm_t *d, uint8_t type, uint8_t imm5);
 darm_instr_t thumb2_decode_instruction(darm_t *d, uint16_t w, uint16_t w2);
 
+// operand extraction functions, indexed through thumb2_fields_index
+extern void (*const thumb2_fields[])(darm_t *d, uint16_t w, uint16_t w2);
+
 #endif
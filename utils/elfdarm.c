@@ -55,25 +55,29 @@ static uint32_t g_len;
 
 static int parse_code_section(uint32_t vaddr, uint32_t offset, uint32_t size)
 {
-    // TODO improve this, big time :')
+    // renders the listing in chunks, every chunk in a single write
+    static char out[0x10000];
 
-    const uint32_t *code = (const uint32_t *) &g_buf[offset];
+    const uint8_t *code = &g_buf[offset];
 
-    darm_t d; darm_str_t str;
-    for (uint32_t idx = 0; idx < size / sizeof(uint32_t);
-            idx++, vaddr += sizeof(uint32_t)) {
+    while (size != 0) {
+        size_t consumed, length = darm_render_listing(code, size, vaddr,
+            M_ARMV7, out, sizeof(out), L_LOWERCASE | L_NOADDR, &consumed);
+        if(length == 0) break;
 
-        if(darm_armv7_disasm(&d, code[idx]) < 0) {
-            printf("#%06x %08x (..)\n", vaddr, code[idx]);
-            continue;
-        }
+        // every line is prefixed with its address, in the "#%06x" format
+        // that elfdarm has always used
+        for (size_t off = 0; off < length; vaddr += sizeof(uint32_t)) {
+            const char *end = memchr(&out[off], '\n', length - off);
+            size_t line = end - &out[off] + 1;
 
-        if(darm_str2(&d, &str, 1) < 0) {
-            printf("#%06x %08x (..)\n", vaddr, code[idx]);
-            continue;
+            printf("#%06x ", vaddr);
+            fwrite(&out[off], 1, line, stdout);
+            off += line;
         }
 
-        printf("#%06x %08x %s\n", vaddr, code[idx], str.total);
+        code += consumed;
+        size -= consumed;
     }
     return 0;
 }
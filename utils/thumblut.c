@@ -0,0 +1,100 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+
+
+thumblut generates thumb-lut-tbl.h, the precomputed table of all 65536 Thumb
+instructions which is used by darm_thumb_disasm when darm is built with
+DARM_THUMB_LUT defined (i.e., "make THUMB_LUT=1").
+
+This utility itself has to be linked against a darm build without the table.
+Every entry is checked to unpack to exactly the same darm_t as the one that
+is returned by the regular decoder.
+
+*/
+
+#include <stdio.h>
+#include <stdint.h>
+#include <string.h>
+#include "darm.h"
+#include "thumb.h"
+
+int main()
+{
+    darm_t base, d, d2; darm_thumb_lut_t e;
+
+    // the raw bytes of an initialized darm_t, utils/thumblut is compiled by
+    // the same compiler as darm, so the layout of darm_t is identical
+    darm_init(&base);
+
+    printf("// generated by utils/thumblut.c, do not edit\n"
+        "static const union {\n"
+        "    uint8_t raw[%d];\n"
+        "    darm_t d;\n"
+        "} thumb_lut_base = {{", (int) sizeof(darm_t));
+
+    for (uint32_t idx = 0; idx < sizeof(darm_t); idx++) {
+        printf("%s0x%02x", idx % 12 == 0 ? "\n    " : " ",
+            ((const uint8_t *) &base)[idx]);
+        if(idx != sizeof(darm_t) - 1) printf(",");
+    }
+
+    printf("\n}};\n\nstatic const darm_thumb_lut_t thumb_lut[65536] = {\n");
+
+    for (uint32_t w = 0; w < 65536; w++) {
+        int ret = darm_thumb_disasm(&d, w);
+
+        e.instr = d.instr;
+        e.reglist = d.reglist;
+        e.imm = (int16_t) d.imm;
+        e.instr_type = d.instr_type;
+        e.ret = ret;
+        e.cond = d.cond;
+        e.firstcond = d.firstcond;
+        e.Rd = d.Rd, e.Rn = d.Rn, e.Rm = d.Rm, e.Rt = d.Rt;
+        e.shift_type = d.shift_type;
+        e.shift = d.shift;
+        e.mask = d.mask;
+        e.E = d.E, e.U = d.U, e.P = d.P, e.W = d.W, e.I = d.I;
+
+        memset(&d2, 0, sizeof(d2));
+        if(thumb_lut_unpack(&d2, &e, &base, w) != ret ||
+                memcmp(&d, &d2, sizeof(darm_t)) != 0) {
+            fprintf(stderr, "[-] Thumb instruction 0x%04x can't be "
+                "represented in the lookup table!\n", w);
+            return 1;
+        }
+
+        printf("    {%d, %d, %d, %d, %d, %d, %d, %d, %d, %d, %d, %d, %d, "
+            "%d, %d, %d, %d, %d, %d},\n", e.instr, e.reglist, e.imm,
+            e.instr_type, e.ret, e.cond, e.firstcond, e.Rd, e.Rn, e.Rm,
+            e.Rt, e.shift_type, e.shift, e.mask, e.E, e.U, e.P, e.W, e.I);
+    }
+
+    printf("};\n");
+    return 0;
+}
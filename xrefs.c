@@ -0,0 +1,284 @@
+/*
+Copyright (c) 2013, Jurriaan Bremer
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+* Redistributions of source code must retain the above copyright notice,
+  this list of conditions and the following disclaimer.
+* Redistributions in binary form must reproduce the above copyright notice,
+  this list of conditions and the following disclaimer in the documentation
+  and/or other materials provided with the distribution.
+* Neither the name of the darm developer(s) nor the names of its
+  contributors may be used to endorse or promote products derived from this
+  software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+*/
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include "darm.h"
+#include "darm-internal.h"
+
+struct _darm_xrefs_t {
+    // the same references, sorted by the referencing instruction and by
+    // the referenced address
+    darm_xref_t *by_from, *by_to;
+    size_t      count;
+};
+
+static inline uint32_t _load16(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8);
+}
+
+static inline uint32_t _load32(const uint8_t *buf)
+{
+    return buf[0] | (buf[1] << 8) | (buf[2] << 16) |
+        ((uint32_t) buf[3] << 24);
+}
+
+// whether an ARMv7 instruction may reference an address, which is true for
+// B, BL and BLX (0b101 in bits 27..25) and for anything with PC in the Rn
+// field, which includes ADR and the PC-relative loads
+static inline int _candidate_armv7(uint32_t w)
+{
+    return ((w >> 25) & b111) == b101 || ((w >> 16) & b1111) == b1111;
+}
+
+// the same for Thumb, B (conditional and not), CBZ/CBNZ, ADR and LDR
+static inline int _candidate_thumb(uint32_t w)
+{
+    return (w >> 12) == b1101 || (w >> 11) == b11100 ||
+        (w & 0xf500) == 0xb100 || (w >> 11) == b10100 ||
+        (w >> 11) == b01001;
+}
+
+// the same for Thumb2, B, BL and BLX (0b11110 followed by a halfword with
+// its upper bit set) and, as for ARMv7, anything with PC in the Rn field
+static inline int _candidate_thumb2(uint32_t w, uint32_t w2)
+{
+    return ((w >> 11) == b11110 && (w2 >> 15) != 0) ||
+        (w & b1111) == b1111;
+}
+
+// the address referenced by an instruction at addr, if any
+static int _reference(const darm_t *d, uint32_t addr, darm_mode_t mode,
+    darm_xref_t *x)
+{
+    // the value of PC as seen by the instruction, and aligned to four
+    // bytes, as used by ADR and the loads
+    uint32_t pc = addr + (mode == M_ARMV7 ? 8 : 4), base = pc & ~3;
+
+    switch ((uint32_t) d->instr) {
+    case I_B: case I_CBZ: case I_CBNZ:
+        x->to = pc + d->imm, x->kind = XREF_BRANCH;
+        break;
+
+    case I_BL:
+        x->to = pc + d->imm, x->kind = XREF_CALL;
+        break;
+
+    case I_BLX:
+        if(d->I != B_SET) return 0;
+
+        // a Thumb BLX switches to ARMv7, i.e., a four-byte aligned address
+        x->to = (mode == M_ARMV7 ? pc : base) + d->imm, x->kind = XREF_CALL;
+        break;
+
+    case I_ADR:
+        // the Thumb2 decoder doesn't tell the ADD and SUB encodings apart,
+        // the latter has bit 23 set
+        if(d->U == B_INVLD) {
+            x->to = (d->w >> 23) & 1 ? base - d->imm : base + d->imm;
+        }
+        else {
+            x->to = d->U == B_SET ? base + d->imm : base - d->imm;
+        }
+        x->kind = XREF_ADDRESS;
+        break;
+
+    case I_LDR: case I_LDRB: case I_LDRH: case I_LDRSB: case I_LDRSH:
+    case I_LDRD:
+        // the Thumb2 literal encodings, apart from LDR, come without Rn
+        if(d->I != B_SET || (d->Rn != PC &&
+                (mode == M_ARMV7 || d->Rn != R_INVLD))) {
+            return 0;
+        }
+
+        x->to = d->U == B_SET ? base + d->imm : base - d->imm;
+        x->kind = XREF_LOAD;
+        break;
+
+    default:
+        return 0;
+    }
+
+    x->from = addr, x->to &= ~1;
+    return 1;
+}
+
+static int _append(darm_xref_t **xrefs, size_t *count, size_t *max,
+    const darm_xref_t *x)
+{
+    if(*count == *max) {
+        size_t n = *max != 0 ? *max * 2 : 1024;
+        darm_xref_t *p = (darm_xref_t *) realloc(*xrefs,
+            n * sizeof(darm_xref_t));
+        if(p == NULL) return -1;
+
+        *xrefs = p, *max = n;
+    }
+    (*xrefs)[(*count)++] = *x;
+    return 0;
+}
+
+static int _to_cmp(const void *a, const void *b)
+{
+    const darm_xref_t *x = (const darm_xref_t *) a;
+    const darm_xref_t *y = (const darm_xref_t *) b;
+    if(x->to != y->to) return x->to < y->to ? -1 : 1;
+    return x->from < y->from ? -1 : x->from > y->from;
+}
+
+darm_xrefs_t *darm_xrefs_create(const uint8_t *buf, size_t len,
+    uint32_t addr, darm_mode_t mode)
+{
+    darm_xrefs_t *x = (darm_xrefs_t *) calloc(1, sizeof(darm_xrefs_t));
+    if(x == NULL) return NULL;
+
+    size_t max = 0, off = 0, size;
+    darm_xref_t xref; darm_t d;
+
+    // a linear sweep, like darm_disasm_buffer, but only the instructions
+    // that may reference an address are decoded at all
+    for (; off < len; off += size) {
+        int ret = -1;
+
+        if(mode == M_ARMV7) {
+            if(off + 4 > len) break;
+
+            uint32_t w = _load32(&buf[off]);
+            size = 4;
+
+            if(_candidate_armv7(w) != 0) {
+                ret = darm_armv7_disasm(&d, w);
+            }
+        }
+        else {
+            if(off + 2 > len) break;
+
+            uint32_t w = _load16(&buf[off]), w2;
+            size = (w >> 11) >= b11101 ? 4 : 2;
+
+            if(size == 2) {
+                if(_candidate_thumb(w) != 0) {
+                    ret = darm_thumb_disasm(&d, w);
+                }
+            }
+            else {
+                if(off + 4 > len) break;
+
+                w2 = _load16(&buf[off+2]);
+                if(_candidate_thumb2(w, w2) != 0) {
+                    ret = darm_thumb2_disasm(&d, w, w2);
+                }
+            }
+        }
+
+        if(ret == 0 && _reference(&d, addr + off, mode, &xref) != 0 &&
+                _append(&x->by_from, &x->count, &max, &xref) < 0) {
+            darm_xrefs_destroy(x);
+            return NULL;
+        }
+    }
+
+    if(x->count != 0) {
+        x->by_to = (darm_xref_t *) malloc(x->count * sizeof(darm_xref_t));
+        if(x->by_to == NULL) {
+            darm_xrefs_destroy(x);
+            return NULL;
+        }
+
+        memcpy(x->by_to, x->by_from, x->count * sizeof(darm_xref_t));
+        qsort(x->by_to, x->count, sizeof(darm_xref_t), _to_cmp);
+    }
+    return x;
+}
+
+void darm_xrefs_destroy(darm_xrefs_t *x)
+{
+    if(x == NULL) return;
+
+    free(x->by_from);
+    free(x->by_to);
+    free(x);
+}
+
+// the address by which the references in an array are sorted
+static inline uint32_t _key(const darm_xref_t *x, int by_to)
+{
+    return by_to != 0 ? x->to : x->from;
+}
+
+// index of the first reference of which the key is at least addr
+static size_t _lower_bound(const darm_xref_t *xrefs, size_t count,
+    int by_to, uint64_t addr)
+{
+    size_t lo = 0, hi = count;
+
+    while (lo < hi) {
+        size_t mid = lo + (hi - lo) / 2;
+
+        if(_key(&xrefs[mid], by_to) < addr) {
+            lo = mid + 1;
+        }
+        else {
+            hi = mid;
+        }
+    }
+    return lo;
+}
+
+static const darm_xref_t *_range(const darm_xref_t *xrefs, size_t count,
+    int by_to, uint32_t addr, uint32_t size, size_t *out)
+{
+    uint64_t start = addr & ~1, end = start + (size != 0 ? size : 1);
+
+    size_t lo = _lower_bound(xrefs, count, by_to, start);
+    size_t hi = _lower_bound(xrefs, count, by_to, end);
+
+    *out = hi - lo;
+    return xrefs != NULL ? &xrefs[lo] : NULL;
+}
+
+const darm_xref_t *darm_xrefs_to(const darm_xrefs_t *x, uint32_t addr,
+    uint32_t size, size_t *count)
+{
+    return _range(x->by_to, x->count, 1, addr, size, count);
+}
+
+const darm_xref_t *darm_xrefs_from(const darm_xrefs_t *x, uint32_t addr,
+    uint32_t size, size_t *count)
+{
+    return _range(x->by_from, x->count, 0, addr, size, count);
+}
+
+const darm_xref_t *darm_xrefs_all(const darm_xrefs_t *x, size_t *count)
+{
+    *count = x->count;
+    return x->by_from;
+}